@@ -71,6 +71,8 @@ From least precedence to highest precedence.
         #    '--any-valid-sops-cmd-arg-here=value',
         #    '--aws-profile=FOO'
         #  ]
+        #  # decrypt each config file with a single sops invocation
+        #  bulk_decrypt: true
 
       # Dictionary of configuration options which will be used in step configuration if that
       # step does not have a specific value for that configuration already or one is not
@@ -120,6 +122,14 @@ From least precedence to highest precedence.
           SAMPLE-ENV-2:
             sample-config-option-4: 'value for use in this step in SAMPLE-ENV-1 environment'
 
+      # Sample step config for step named SAMPLE-STEP-2 whose sub steps do not depend on
+      # each others results and so can be run at the same time, each with its own output.
+      SAMPLE-STEP-2:
+        parallel: true
+        sub-steps:
+        - implementer: SampleStep2Implementer1
+        - implementer: SampleStep2Implementer2
+
 ### Example Configuration Files
 
 .. Note::
@@ -138,6 +148,8 @@ From least precedence to highest precedence.
         #    '--any-valid-sops-cmd-arg-here=value',
         #    '--aws-profile=FOO'
         #  ]
+        #  # decrypt each config file with a single sops invocation
+        #  bulk_decrypt: true
 
       # Optional
       # Dictionary of configuration options which will be used in step configuration if that
@@ -511,6 +523,8 @@ From least precedence to highest precedence.
         #    '--any-valid-sops-cmd-arg-here=value',
         #    '--aws-profile=FOO'
         #  ]
+        #  # decrypt each config file with a single sops invocation
+        #  bulk_decrypt: true
 
       # Optional
       # Dictionary of configuration options which will be used in step configuration if that
@@ -820,8 +834,41 @@ Example Running the 'generate-metadata' step
 
 """
 
+from typing import TYPE_CHECKING
+
 import __main__
-from ploigos_step_runner.exceptions import StepRunnerException
-from ploigos_step_runner.results import StepResult, WorkflowResult
-from ploigos_step_runner.step_implementer import DefaultSteps, StepImplementer
-from ploigos_step_runner.step_runner import StepRunner
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.exceptions import StepRunnerException
+    from ploigos_step_runner.results import StepResult, WorkflowResult
+    from ploigos_step_runner.step_implementer import DefaultSteps, StepImplementer
+    from ploigos_step_runner.step_runner import StepRunner
+
+# NOTE: only imported when used so that importing any module of this package, or running a
+#       single step, does not import everything this package provides
+_LAZY_ATTRIBUTES = {
+    'StepRunnerException': 'ploigos_step_runner.exceptions',
+    'StepResult': 'ploigos_step_runner.results',
+    'WorkflowResult': 'ploigos_step_runner.results',
+    'DefaultSteps': 'ploigos_step_runner.step_implementer',
+    'StepImplementer': 'ploigos_step_runner.step_implementer',
+    'StepRunner': 'ploigos_step_runner.step_runner'
+}
+
+__all__ = [
+    'StepRunnerException',
+    'StepResult',
+    'WorkflowResult',
+    'DefaultSteps',
+    'StepImplementer',
+    'StepRunner'
+]
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
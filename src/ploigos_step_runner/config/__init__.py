@@ -1,8 +1,33 @@
 """Configuration for Ploigos workflow.
 """
 
-from ploigos_step_runner.config.config import Config
-from ploigos_step_runner.config.config_value import ConfigValue
-from ploigos_step_runner.config.config_value_decryptor import ConfigValueDecryptor
-from ploigos_step_runner.config.step_config import StepConfig
-from ploigos_step_runner.config.sub_step_config import SubStepConfig
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.config.config import Config
+    from ploigos_step_runner.config.config_value import ConfigValue
+    from ploigos_step_runner.config.config_value_decryptor import ConfigValueDecryptor
+    from ploigos_step_runner.config.step_config import StepConfig
+    from ploigos_step_runner.config.sub_step_config import SubStepConfig
+
+# NOTE: only imported when used so that importing one of these modules does not import
+#       the others, which import ploigos_step_runner.decryption_utils which imports
+#       ploigos_step_runner.config.config_value_decryptor
+_LAZY_ATTRIBUTES = {
+    'Config': 'ploigos_step_runner.config.config',
+    'ConfigValue': 'ploigos_step_runner.config.config_value',
+    'ConfigValueDecryptor': 'ploigos_step_runner.config.config_value_decryptor',
+    'StepConfig': 'ploigos_step_runner.config.step_config',
+    'SubStepConfig': 'ploigos_step_runner.config.sub_step_config'
+}
+
+__all__ = ['Config', 'ConfigValue', 'ConfigValueDecryptor', 'StepConfig', 'SubStepConfig']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
@@ -4,12 +4,14 @@
 import copy
 import glob
 import os.path
+from collections.abc import Mapping
 
 from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.config.config_cache import ConfigCache
 from ploigos_step_runner.config.step_config import StepConfig
 from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner.utils.file import parse_yaml_or_json_file
-from ploigos_step_runner.utils.dict import deep_merge
+from ploigos_step_runner.utils.dict import FrozenDict, freeze, frozen_deep_merge
 
 class Config:
     """Representation of configuration for Ploigos workflow.
@@ -24,12 +26,24 @@ class Config:
         files that are valid YAML or JSON files that are valid
         configurations,
         or a list of any of the former.
+    cache_dir : str, optional
+        Path to a directory to persistently cache parsed configuration files in.
+        If not given configuration files are always parsed.
 
     Attributes
     ----------
-    __global_defaults : dict
-    __global_environment_defaults : dict
+    __config_cache : ConfigCache or None
+    __global_defaults : FrozenDict
+    __global_environment_defaults : dict of str (environment names) to FrozenDict
     __step_configs : dict of str (step names) to StepConfig
+    __config_values : list of ConfigValue
+        Every leaf ConfigValue of every configuration added to this Config.
+    __encrypted_config_values : list of ConfigValue
+        Index of the leaf ConfigValues that one of the registered ConfigValueDecryptors
+        can decrypt.
+    __encrypted_config_values_version : int or None
+        Version of the registered ConfigValueDecryptors that __encrypted_config_values was
+        built for, see DecryptionUtils.get_config_value_decryptors_version.
 
     Raises
     ------
@@ -46,39 +60,45 @@ class Config:
     CONFIG_KEY_SUB_STEP_NAME = 'name'
     CONFIG_KEY_SUB_STEP_CONFIG = 'config'
     CONFIG_KEY_SUB_STEP_ENVIRONMENT_CONFIG = 'environment-config'
+    CONFIG_KEY_SUB_STEPS = 'sub-steps'
+    CONFIG_KEY_PARALLEL = 'parallel'
     CONFIG_KEY_DECRYPTORS = 'config-decryptors'
     CONFIG_KEY_DECRYPTOR_IMPLEMENTER = 'implementer'
     CONFIG_KEY_DECRYPTOR_CONFIG = 'config'
 
-    def __init__(self, config=None):
-        self.__global_defaults = {}
+    def __init__(self, config=None, cache_dir=None):
+        self.__config_cache = ConfigCache(cache_dir) if cache_dir is not None else None
+        self.__global_defaults = FrozenDict()
         self.__global_environment_defaults = {}
         self.__step_configs = {}
+        self.__config_values = []
+        self.__encrypted_config_values = []
+        self.__encrypted_config_values_version = None
 
         if config is not None:
             self.add_config(config)
 
     @property
     def global_defaults(self):
-        """Get a deep copy of the global defaults.
+        """Get a read only view of the global defaults.
 
         Returns
         -------
-        dict
-            Deep copy of the global defaults.
+        FrozenDict
+            Read only view of the global defaults.
         """
-        return copy.deepcopy(self.__global_defaults)
+        return self.__global_defaults
 
     @property
     def global_environment_defaults(self):
-        """Deep copy of all global environment defaults for all environments.
+        """Read only view of all global environment defaults for all environments.
 
         Returns
         -------
-        dict
-            deep copy of all global environment defaults.
+        FrozenDict
+            Read only view of all global environment defaults.
         """
-        return copy.deepcopy(self.__global_environment_defaults)
+        return FrozenDict(self.__global_environment_defaults)
 
     @property
     def step_configs(self):
@@ -90,7 +110,7 @@ class Config:
         return self.__step_configs
 
     def get_global_environment_defaults_for_environment(self, env):
-        """Get a deep copy of all of the global environment defaults or for a given an environment.
+        """Get a read only view of all of the global environment defaults for a given environment.
 
         Parameters
         ----------
@@ -100,17 +120,14 @@ class Config:
 
         Returns
         -------
-        dict
-            Deep copy of the global environment defaults for the given environment
-            or empty dict if no environment given or environment does not exist in the defaults
+        FrozenDict
+            Read only view of the global environment defaults for the given environment
+            or empty if no environment given or environment does not exist in the defaults
         """
-        if env is not None:
-            if env in self.__global_environment_defaults:
-                global_environment_defaults = copy.deepcopy(self.__global_environment_defaults[env])
-            else:
-                global_environment_defaults = {}
+        if env is not None and env in self.__global_environment_defaults:
+            global_environment_defaults = self.__global_environment_defaults[env]
         else:
-            global_environment_defaults = {}
+            global_environment_defaults = FrozenDict()
 
         return global_environment_defaults
 
@@ -134,6 +151,25 @@ class Config:
 
         return step_config
 
+    @property
+    def encrypted_config_values(self):
+        """Index of every leaf ConfigValue of the added configuration that one of the
+        registered ConfigValueDecryptors can decrypt.
+
+        Notes
+        -----
+        Every leaf is checked once when its configuration is added, so getting the value of
+        any leaf that is not in this index never needs to ask the decryptors anything.
+        Every leaf is checked again if more ConfigValueDecryptors have been registered since.
+
+        Returns
+        -------
+        tuple of ConfigValue
+            Leaf ConfigValues that can be decrypted, in the order they were added.
+        """
+        self.__index_encrypted_config_values()
+        return tuple(self.__encrypted_config_values)
+
     def get_sub_step_configs(self, step_name):
         """Gets lit of configured sub step configurations for a step with the given name.
 
@@ -249,7 +285,10 @@ class Config:
         """
         # parse the configuration file
         try:
-            parsed_config_file = parse_yaml_or_json_file(config_file)
+            if self.__config_cache is not None:
+                parsed_config_file = self.__config_cache.parse_yaml_or_json_file(config_file)
+            else:
+                parsed_config_file = parse_yaml_or_json_file(config_file)
         except ValueError as error:
             raise ValueError(
                 f"Error parsing config file ({config_file}) as json or yaml"
@@ -296,16 +335,22 @@ class Config:
             f"{config_dict}"
 
         # if file path given use that as the source when creating ConfigValue objects
-        # else use a copy of the given configuration dictionary
+        # else use the given configuration dictionary, which ConfigValue freezes a copy of
         if source_file_path is not None:
             parent_source = source_file_path
         else:
-            parent_source = copy.deepcopy(config_dict)
+            parent_source = config_dict
 
         # convert all the leaves of the configuration dictionary under
         # the Config.CONFIG_KEY to ConfigValue objects
+        #
+        # NOTE: the conversion is done in place so only copy the given configuration dictionary
+        #       if it did not come from a file, in which case it was parsed just for this
         config_values = ConfigValue.convert_leaves_to_config_values(
-            values=copy.deepcopy(config_dict[Config.CONFIG_KEY]),
+            values=(
+                config_dict[Config.CONFIG_KEY] if source_file_path is not None
+                else copy.deepcopy(config_dict[Config.CONFIG_KEY])
+            ),
             parent_source=parent_source,
             path_parts=[Config.CONFIG_KEY]
         )
@@ -316,30 +361,31 @@ class Config:
             # else assume step config
             if key == Config.CONFIG_KEY_GLOBAL_DEFAULTS:
                 try:
-                    self.__global_defaults = deep_merge(
-                        copy.deepcopy(self.__global_defaults),
-                        copy.deepcopy(value)
-                    )
+                    self.__global_defaults = frozen_deep_merge(self.__global_defaults, value)
                 except ValueError as error:
                     raise ValueError(
                         f"Error merging global defaults: {error}"
                     ) from error
+
+                self.__clear_runtime_step_config_caches()
             elif key == Config.CONFIG_KEY_GLOBAL_ENVIRONMENT_DEFAULTS:
                 for env, env_config in value.items():
                     if env not in self.__global_environment_defaults:
-                        self.__global_environment_defaults[env] = {
+                        self.__global_environment_defaults[env] = FrozenDict({
                             Config.CONFIG_KEY_ENVIRONMENT_NAME: env
-                        }
+                        })
 
                     try:
-                        self.__global_environment_defaults[env] = deep_merge(
-                            copy.deepcopy(self.__global_environment_defaults[env]),
-                            copy.deepcopy(env_config)
+                        self.__global_environment_defaults[env] = frozen_deep_merge(
+                            self.__global_environment_defaults[env],
+                            env_config
                         )
                     except ValueError as error:
                         raise ValueError(
                             f"Error merging global environment ({env}) defaults: {error}"
                         ) from error
+
+                self.__clear_runtime_step_config_caches()
             elif key == Config.CONFIG_KEY_DECRYPTORS:
                 config_decryptor_definitions = ConfigValue.convert_leaves_to_values(value)
                 Config.parse_and_register_decryptors_definitions(config_decryptor_definitions)
@@ -347,16 +393,7 @@ class Config:
                 step_name = key
                 step_config = value
 
-                # if step_config is dict then assume step with single sub step
-                if isinstance(step_config, dict):
-                    sub_steps = [step_config]
-                elif isinstance(step_config, list):
-                    sub_steps = step_config
-                else:
-                    raise ValueError(
-                        f"Expected step ({step_name}) to have have step config ({step_config})" +
-                        f" of type dict or list but got: {type(step_config)}"
-                    )
+                sub_steps, parallel = Config.__get_sub_steps_and_parallel(step_name, step_config)
 
                 for sub_step in sub_steps:
                     assert Config.CONFIG_KEY_STEP_IMPLEMENTER in sub_step, \
@@ -375,16 +412,16 @@ class Config:
                         sub_step_name = sub_step_implementer_name
 
                     if Config.CONFIG_KEY_SUB_STEP_CONFIG in sub_step:
-                        sub_step_config_dict = copy.deepcopy(
+                        sub_step_config_dict = freeze(
                             sub_step[Config.CONFIG_KEY_SUB_STEP_CONFIG])
                     else:
-                        sub_step_config_dict = {}
+                        sub_step_config_dict = FrozenDict()
 
                     if Config.CONFIG_KEY_SUB_STEP_ENVIRONMENT_CONFIG in sub_step:
-                        sub_step_env_config = copy.deepcopy(
+                        sub_step_env_config = freeze(
                             sub_step[Config.CONFIG_KEY_SUB_STEP_ENVIRONMENT_CONFIG])
                     else:
-                        sub_step_env_config = {}
+                        sub_step_env_config = FrozenDict()
 
                     self.add_or_update_step_config(
                         step_name=step_name,
@@ -394,6 +431,118 @@ class Config:
                         sub_step_env_config=sub_step_env_config
                     )
 
+                if parallel and step_name in self.step_configs:
+                    self.step_configs[step_name].parallel = True
+
+        # NOTE: index after registering any decryptors defined by this configuration so that
+        #       the leaves are checked against them
+        new_config_values = Config.__get_leaf_config_values(config_values)
+        self.__config_values.extend(new_config_values)
+        self.__index_encrypted_config_values(new_config_values)
+
+    def __index_encrypted_config_values(self, new_config_values=()):
+        """Add the given leaf ConfigValues to the index of encrypted ConfigValues if they can
+        be decrypted, or rebuild the whole index if more ConfigValueDecryptors have been
+        registered since it was built.
+
+        Parameters
+        ----------
+        new_config_values : list of ConfigValue, optional
+            Leaf ConfigValues just added to this Config.
+        """
+        decryptors_version = DecryptionUtils.get_config_value_decryptors_version()
+        if self.__encrypted_config_values_version != decryptors_version:
+            self.__encrypted_config_values = []
+            self.__encrypted_config_values_version = decryptors_version
+            new_config_values = self.__config_values
+
+        self.__encrypted_config_values.extend(
+            config_value for config_value in new_config_values if config_value.is_encrypted
+        )
+
+    @staticmethod
+    def __get_leaf_config_values(values):
+        """
+        Parameters
+        ----------
+        values : dict, list, or ConfigValue
+            Values to get the leaf ConfigValues of.
+
+        Returns
+        -------
+        list of ConfigValue
+            Every ConfigValue in the given values, depth first.
+        """
+        leaves = []
+        stack = [values]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, ConfigValue):
+                leaves.append(value)
+            elif isinstance(value, Mapping):
+                stack.extend(reversed(list(value.values())))
+            elif isinstance(value, (list, tuple)):
+                stack.extend(reversed(value))
+
+        return leaves
+
+    @staticmethod
+    def __get_sub_steps_and_parallel(step_name, step_config):
+        """Gets the sub steps and whether they can be run in parallel from a step configuration.
+
+        Parameters
+        ----------
+        step_name : str
+            Name of the step the given step configuration is for.
+        step_config : dict or list
+            Either a dict with a list of sub steps under the sub steps key and optionally the
+            parallel key, or a dict that is a single sub step, or a list of sub steps.
+
+        Returns
+        -------
+        tuple of (list of dict, bool)
+            Sub steps and whether they can be run in parallel.
+
+        Raises
+        ------
+        ValueError
+            If given step configuration or its sub steps are not of expected type.
+        """
+        # if step_config is dict with sub steps key then assume step with step
+        #   level settings and list of sub steps
+        # else if step_config is dict then assume step with single sub step
+        # else if step_config is list then assume step with multiple sub steps
+        parallel = False
+        if isinstance(step_config, dict) and Config.CONFIG_KEY_SUB_STEPS in step_config:
+            sub_steps = step_config[Config.CONFIG_KEY_SUB_STEPS]
+            if Config.CONFIG_KEY_PARALLEL in step_config:
+                parallel = bool(step_config[Config.CONFIG_KEY_PARALLEL].value)
+
+            if not isinstance(sub_steps, list):
+                raise ValueError(
+                    f"Expected step ({step_name}) to have sub steps ({sub_steps})" +
+                    f" of type list but got: {type(sub_steps)}"
+                )
+        elif isinstance(step_config, dict):
+            sub_steps = [step_config]
+        elif isinstance(step_config, list):
+            sub_steps = step_config
+        else:
+            raise ValueError(
+                f"Expected step ({step_name}) to have have step config ({step_config})" +
+                f" of type dict or list but got: {type(step_config)}"
+            )
+
+        return sub_steps, parallel
+
+    def __clear_runtime_step_config_caches(self):
+        """Clear the cached merged runtime step configuration of every sub step
+        so that changes to the global defaults are picked up.
+        """
+        for step_config in self.step_configs.values():
+            for sub_step_config in step_config.sub_steps:
+                sub_step_config.clear_runtime_step_config_cache()
+
     @staticmethod
     def parse_and_register_decryptors_definitions(decryptors_definitions):
         """Parse decryptor definitions from a list and then register them with the DecryptionUtils.
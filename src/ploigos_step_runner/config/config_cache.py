@@ -0,0 +1,181 @@
+"""Persistent cache of parsed configuration files.
+"""
+
+import hashlib
+import json
+import os
+
+from ploigos_step_runner.utils.file import create_parent_dir, parse_yaml_or_json_file
+
+
+class ConfigCache:
+    """Persistent, on disk, cache of parsed YAML or JSON configuration files so that each
+    invocation of the step runner does not have to parse every configuration file again.
+
+    Notes
+    -----
+    Each cache entry is a JSON file, named after the hash of the absolute path of the
+    configuration file it is for, containing the size, modification time, and content hash
+    of that configuration file along with the parsed configuration and a hash of it.
+
+    An entry is only used if the path, size, modification time, and content hash of the
+    configuration file all still match the entry and the parsed configuration still matches
+    its hash, otherwise the configuration file is parsed again and the entry replaced.
+    So entries never need to be invalidated by hand and a corrupted entry is never used.
+
+    Entries are JSON rather than pickled so that reading an entry can never execute
+    arbitrary code. Parsed configuration that can not be losslessly stored as JSON,
+    such as YAML dates, is never cached.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Path to the directory to store the cache entries in.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir):
+        self.__cache_dir = cache_dir
+
+    @property
+    def cache_dir(self):
+        """
+        Returns
+        -------
+        str
+            Path to the directory to store the cache entries in.
+        """
+        return self.__cache_dir
+
+    def parse_yaml_or_json_file(self, yaml_or_json_file):
+        """Parse a YAML or JSON config file, using the cached parsed config if it is still valid.
+
+        Parameters
+        ----------
+        yaml_or_json_file : str
+            Path to YAML or JSON file to parse.
+
+        Returns
+        -------
+        dict
+            Dictionary parsed from given YAML or JSON file.
+
+        Raises
+        ------
+        ValueError
+            If the given file can not be parsed as YAML or JSON.
+        """
+        file_path = os.path.abspath(yaml_or_json_file)
+        file_stat = os.stat(file_path)
+        with open(file_path, 'rb') as file:
+            content_hash = hashlib.sha256(file.read()).hexdigest()
+
+        entry_key = {
+            'format-version': ConfigCache.FORMAT_VERSION,
+            'path': file_path,
+            'size': file_stat.st_size,
+            'mtime-ns': file_stat.st_mtime_ns,
+            'content-sha256': content_hash
+        }
+        entry_path = self.__get_entry_path(file_path)
+
+        parsed_file = self.__read_entry(entry_path, entry_key)
+        if parsed_file is not None:
+            return parsed_file
+
+        parsed_file = parse_yaml_or_json_file(file_path)
+        self.__write_entry(entry_path, entry_key, parsed_file)
+
+        return parsed_file
+
+    def __get_entry_path(self, file_path):
+        """
+        Parameters
+        ----------
+        file_path : str
+            Absolute path to the configuration file to get the cache entry path for.
+
+        Returns
+        -------
+        str
+            Path to the cache entry for the given configuration file.
+        """
+        path_hash = hashlib.sha256(file_path.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{path_hash}.json')
+
+    @staticmethod
+    def __read_entry(entry_path, entry_key):
+        """Read the parsed configuration from a cache entry if the entry is valid.
+
+        Parameters
+        ----------
+        entry_path : str
+            Path to the cache entry to read.
+        entry_key : dict
+            Values that the cache entry must match to be valid.
+
+        Returns
+        -------
+        object or None
+            Parsed configuration from the cache entry.
+            None if the entry does not exist, does not match the given key,
+            or fails its integrity check.
+        """
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as entry_file:
+                entry = json.load(entry_file)
+
+            for key, value in entry_key.items():
+                if entry[key] != value:
+                    return None
+
+            payload = entry['payload']
+            if hashlib.sha256(payload.encode('utf-8')).hexdigest() != entry['payload-sha256']:
+                return None
+
+            return json.loads(payload)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    @staticmethod
+    def __write_entry(entry_path, entry_key, parsed_file):
+        """Write a cache entry for the given parsed configuration.
+
+        Notes
+        -----
+        The entry is written to a temporary file which then replaces any existing entry so that
+        concurrent readers never see a partially written entry. Failing to write the entry
+        is not an error since the cache is only an optimization.
+
+        Parameters
+        ----------
+        entry_path : str
+            Path to the cache entry to write.
+        entry_key : dict
+            Values that the cache entry must match to be valid.
+        parsed_file : object
+            Parsed configuration to cache.
+        """
+        try:
+            payload = json.dumps(parsed_file)
+            if json.loads(payload) != parsed_file:
+                return
+        except (ValueError, TypeError):
+            return
+
+        entry = dict(entry_key)
+        entry['payload-sha256'] = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        entry['payload'] = payload
+
+        tmp_entry_path = f'{entry_path}.{os.getpid()}.tmp'
+        try:
+            create_parent_dir(entry_path)
+            with open(tmp_entry_path, 'w', encoding='utf-8') as entry_file:
+                json.dump(entry, entry_file)
+            os.replace(tmp_entry_path, entry_path)
+        except OSError:
+            try:
+                os.remove(tmp_entry_path)
+            except OSError:
+                pass
@@ -1,40 +1,140 @@
 """Representation of a configuration value.
 """
 
-import copy
+import hashlib
+import json
+import sys
+from collections.abc import Mapping
+
 from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.utils.dict import freeze, thaw
+
+
+class ConfigValueParentSource:
+    """Immutable handle to the source that configuration values came from, shared by all of the
+    ConfigValues from the same source so that the source is never copied per value.
+
+    Parameters
+    ----------
+    source : str file path or dict
+        Path to the YML or JSON file that the values are found in or
+        the dict that the values are found in.
+
+    Attributes
+    ----------
+    __source : str file path or FrozenDict
+    __key : str or None
+        Lazily computed hashable key that uniquely identifies the source.
+    """
+
+    __slots__ = ('__source', '__key', '__key_computed')
+
+    def __init__(self, source):
+        self.__source = freeze(source)
+        self.__key = None
+        self.__key_computed = False
+
+    @property
+    def source(self):
+        """
+        Returns
+        -------
+        str file path or FrozenDict
+            Path to the YML or JSON file that the values are found in or
+            a read only view of the dict that the values are found in.
+        """
+        return self.__source
+
+    @property
+    def key(self):
+        """
+        Returns
+        -------
+        str or None
+            If the source is a file path then the file path,
+            else if the source is a dict then a hash of that dict,
+            else None.
+        """
+        if not self.__key_computed:
+            if self.__source is None or isinstance(self.__source, str):
+                self.__key = self.__source
+            else:
+                self.__key = hashlib.sha256(
+                    json.dumps(thaw(self.__source), sort_keys=True, default=str).encode('utf-8')
+                ).hexdigest()
+            self.__key_computed = True
+
+        return self.__key
 
 class ConfigValue:
     """Representation of a configuration value.
 
+    Notes
+    -----
+    ConfigValues are immutable, they have no setters and can not be given new attributes,
+    so none of their accessors need to copy anything and copying a ConfigValue,
+    shallow or deep, returns the same ConfigValue.
+
+    Which, if any, of the registered ConfigValueDecryptors can decrypt a ConfigValue is only
+    worked out once per version of the registered ConfigValueDecryptors,
+    see DecryptionUtils.get_config_value_decryptors_version, and remembered, so getting the
+    value of a ConfigValue that is not encrypted does not ask every decryptor every time.
+
     Parameters
     ----------
     value : any
         The value of the config option this is the value for.
-    parent_source : str file path or dict
+        Frozen, see utils.dict.freeze, if it is a dict or list.
+    parent_source : str file path, dict, or ConfigValueParentSource
         Path to the YML or JSON file that this value is found in or
-        the dict that this value is found in.
-    path_parts : list
+        the dict that this value is found in, or a handle to either shared with other
+        ConfigValues from the same source.
+    path_parts : list or tuple
         List of path to the element that this is the value for.
 
     Attributes
     ----------
     __value : any
         The value of the config option this is the value for.
-    __parent_source : str file path or dict
-        Path to the YML or JSON file that this value is found in or
-        the dict that this value is found in.
-    __path_parts : list
-        List of path to the element that this is the value for.
+    __parent_source : ConfigValueParentSource
+        Handle to the source that this value is found in.
+    __path_parts : tuple
+        Path to the element that this is the value for.
+    __decryptor : ConfigValueDecryptor or None
+        ConfigValueDecryptor that can decrypt this value, or None if none can.
+    __decryptors_version : int or None
+        Version of the registered ConfigValueDecryptors that __decryptor was worked out for,
+        or None if it has not been worked out yet.
     """
 
+    __slots__ = (
+        '__value',
+        '__parent_source',
+        '__path_parts',
+        '__decryptor',
+        '__decryptors_version'
+    )
+
+    ENCRYPTED_VALUE_PLACEHOLDER = '<encrypted>'
+
     def __init__(self, value, parent_source=None, path_parts=None):
-        self.__value = value
+        if not isinstance(parent_source, ConfigValueParentSource):
+            parent_source = ConfigValueParentSource(parent_source)
+
+        self.__value = freeze(value)
         self.__parent_source = parent_source
-        self.__path_parts = path_parts
+        self.__path_parts = ConfigValue.__intern_path_parts(path_parts)
+        self.__decryptor = None
+        self.__decryptors_version = None
+
+    def __copy__(self):
+        return self
 
-        if self.__path_parts is None:
-            self.__path_parts = []
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return ConfigValue, (self.__value, self.__parent_source.source, self.__path_parts)
 
     @property
     def value(self):
@@ -51,8 +151,12 @@ class ConfigValue:
         --------
         raw_value
         """
-        # attemp tto decrypt the value
-        decrypted_value = DecryptionUtils.decrypt(self)
+        decryptor = self.decryptor
+        if decryptor is None:
+            return self.__value
+
+        # attempt to decrypt the value
+        decrypted_value = DecryptionUtils.decrypt(self, decryptor)
 
         # If this value was able to be decrypted, return the decrypted result
         # else return the raw value
@@ -63,6 +167,49 @@ class ConfigValue:
 
         return value
 
+    @property
+    def is_encrypted(self):
+        """Whether or not this configuration value can be decrypted by any of the registered
+        decryptors.
+
+        Returns
+        -------
+        bool
+            True if this configuration value is encrypted and can be decrypted.
+            False otherwise.
+        """
+        return self.decryptor is not None
+
+    @property
+    def decryptor(self):
+        """The registered decryptor that can decrypt this configuration value.
+
+        Returns
+        -------
+        ConfigValueDecryptor or None
+            First registered ConfigValueDecryptor that can decrypt this configuration value.
+            None if this configuration value is not encrypted.
+        """
+        decryptors_version = DecryptionUtils.get_config_value_decryptors_version()
+        if self.__decryptors_version != decryptors_version:
+            self.__decryptor = DecryptionUtils.get_config_value_decryptor(self)
+            self.__decryptors_version = decryptors_version
+
+        return self.__decryptor
+
+    @property
+    def is_decrypted(self):
+        """Whether or not this configuration value has already been decrypted.
+
+        Returns
+        -------
+        bool
+            True if this configuration value was previously decrypted and
+            accessing its value will not decrypt it again.
+            False otherwise.
+        """
+        return DecryptionUtils.is_decrypted(self)
+
     @property
     def raw_value(self):
         """Get the value of this configuration value as originally given.
@@ -74,35 +221,50 @@ class ConfigValue:
         -------
         obj
             Value of this configuration value as originally given.
+            If originally given a dict or list then a read only FrozenDict or tuple.
 
         See Also
         --------
         value
         """
-        return copy.deepcopy(self.__value)
+        return self.__value
 
     @property
     def path_parts(self):
-        """Gets copy of the list of path to the element that this is the value for.
+        """Gets the path to the element that this is the value for.
 
         Returns
         -------
-        list
-            Copy of the list of path to the element that this is the value for.
+        tuple
+            Path to the element that this is the value for.
         """
-        return copy.deepcopy(self.__path_parts)
+        return self.__path_parts
 
     @property
     def parent_source(self):
-        """Get a copy of the source that this configuration value came from.
+        """Get the source that this configuration value came from.
 
         Returns
         -------
-        str file path or dict
+        str file path or FrozenDict
             Path to the YML or JSON file that this value is found in or
-            the dict that this value is found in.
+            a read only view of the dict that this value is found in.
         """
-        return copy.deepcopy(self.__parent_source)
+        return self.__parent_source.source
+
+    @property
+    def parent_source_key(self):
+        """Get a hashable key that uniquely identifies the source this configuration
+        value came from.
+
+        Returns
+        -------
+        str or None
+            If the parent source is a file path then the file path,
+            else if the parent source is a dict then a hash of that dict,
+            else None.
+        """
+        return self.__parent_source.key
 
     def __eq__(self, other):
         """Equality for this object.
@@ -135,7 +297,29 @@ class ConfigValue:
         str
             Human readable representation of the object.
         """
-        return f"ConfigValue(value={self.raw_value}, value_path='{self.path_parts}')"
+        return f"ConfigValue(value={self.raw_value}, value_path='{list(self.path_parts)}')"
+
+    @staticmethod
+    def __intern_path_parts(path_parts):
+        """
+        Parameters
+        ----------
+        path_parts : list, tuple, or None
+            Path to an element.
+
+        Returns
+        -------
+        tuple
+            Given path with every str part interned so that the many ConfigValues with
+            paths through the same keys share the same str objects.
+        """
+        if not path_parts:
+            return ()
+
+        return tuple(
+            sys.intern(path_part) if isinstance(path_part, str) else path_part
+            for path_part in path_parts
+        )
 
     @staticmethod
     def convert_leaves_to_config_values(values, parent_source=None, path_parts=None):
@@ -146,9 +330,10 @@ class ConfigValue:
         ----------
         values : dict, list, tuple, ConfigValue, None, obj
             Change all the leaves of the given object to ConfigValue objects.
-        parent_source : str file path or dict
+        parent_source : str file path, dict, or ConfigValueParentSource
             Path to the YML or JSON file that this value is found in or
             the dict that this value is found in.
+            A single ConfigValueParentSource for it is shared by all of the created ConfigValues.
         path_parts : list
             List of path to the element that this is the value for.
 
@@ -169,12 +354,16 @@ class ConfigValue:
         if path_parts is None:
             path_parts = []
 
+        # NOTE: create a single handle to the parent source shared by all of the leaves
+        if not isinstance(parent_source, ConfigValueParentSource):
+            parent_source = ConfigValueParentSource(parent_source)
+
         if isinstance(values, dict): # pylint: disable=no-else-return
             for child_key in values:
                 values[child_key] = ConfigValue.convert_leaves_to_config_values(
                     values=values[child_key],
                     parent_source=parent_source,
-                    path_parts=(path_parts + [child_key])
+                    path_parts=(list(path_parts) + [child_key])
                 )
 
             return values
@@ -183,7 +372,7 @@ class ConfigValue:
                 values[child_key] = ConfigValue.convert_leaves_to_config_values(
                     values=child_value,
                     parent_source=parent_source,
-                    path_parts=(path_parts + [child_key])
+                    path_parts=(list(path_parts) + [child_key])
                 )
 
             return values
@@ -199,7 +388,7 @@ class ConfigValue:
             )
 
     @staticmethod
-    def convert_leaves_to_values(values):
+    def convert_leaves_to_values(values, lazy=False): # pylint: disable=too-many-return-statements
         """Recursively transforms all leaves of type ConfigValue to ConfigValue.value
 
         Parameters
@@ -207,6 +396,10 @@ class ConfigValue:
         values : dict, list, ConfigValue, or obj
             A collection where the leaves contain ConfigValue to transform back to
             ConfigValue.value
+        lazy : bool, optional
+            False to decrypt any encrypted ConfigValue leaves.
+            True to transform any encrypted ConfigValue leaves that have not already been
+            decrypted to ConfigValue.ENCRYPTED_VALUE_PLACEHOLDER rather then decrypting them.
 
         Returns
         -------
@@ -215,6 +408,9 @@ class ConfigValue:
                 ConfigValue to ConfigValue.value.
             If given a list returns that dictionary with all leaves transformed from
                 ConfigValue to ConfigValue.value.
+            If given a read only mapping, such as a FrozenDict, or a tuple returns a new
+                dictionary or list with all leaves transformed from ConfigValue to
+                ConfigValue.value.
             If given a ConfigValue returns ConfigValue.value
             If any other object returns that object
 
@@ -224,15 +420,27 @@ class ConfigValue:
         """
         if isinstance(values, dict): # pylint: disable=no-else-return
             for child_key in values:
-                values[child_key] = ConfigValue.convert_leaves_to_values(values[child_key])
+                values[child_key] = ConfigValue.convert_leaves_to_values(values[child_key], lazy)
 
             return values
-        elif isinstance(values, (list, tuple)):
+        elif isinstance(values, list):
             for child_key, child_value in enumerate(values):
-                values[child_key] = ConfigValue.convert_leaves_to_values(child_value)
+                values[child_key] = ConfigValue.convert_leaves_to_values(child_value, lazy)
 
             return values
+        elif isinstance(values, Mapping):
+            return {
+                child_key: ConfigValue.convert_leaves_to_values(child_value, lazy)
+                for child_key, child_value in values.items()
+            }
+        elif isinstance(values, tuple):
+            return [
+                ConfigValue.convert_leaves_to_values(child_value, lazy) for child_value in values
+            ]
         elif isinstance(values, ConfigValue):
+            if lazy and values.is_encrypted and not values.is_decrypted:
+                return ConfigValue.ENCRYPTED_VALUE_PLACEHOLDER
+
             return values.value
         else:
             return values
@@ -38,3 +38,11 @@ class ConfigValueDecryptor(ABC):
             Decrypted value of the ConfigValue
             None if this decryptor can't decrypt the given ConfigValue
         """
+
+    def clear_cache(self):
+        """Clear any in memory cache of decrypted values held by this decryptor.
+
+        Notes
+        -----
+        Default implementation does nothing since by default decryptors do not cache anything.
+        """
@@ -5,6 +5,7 @@ Also See
 https://github.com/mozilla/sops
 """
 
+from collections.abc import Mapping
 from io import StringIO
 import json
 import os.path
@@ -13,6 +14,8 @@ import sys
 import sh
 
 from ploigos_step_runner.config.config_value_decryptor import ConfigValueDecryptor
+from ploigos_step_runner.utils.dict import thaw
+from ploigos_step_runner.utils.io import get_current_stream
 
 class SOPS(ConfigValueDecryptor):
     """ConfigValueDecryptor that uses SOPS to decyrpt ConfigValues
@@ -21,6 +24,19 @@ class SOPS(ConfigValueDecryptor):
     ----------
     additional_sops_args : list
         Additional arguments to pass to the SOPS command
+    bulk_decrypt : bool, optional
+        False to invoke SOPS once per decrypted value, extracting just that value.
+        True to invoke SOPS once per parent source, decrypting the entire parent source the
+        first time any value from it is decrypted and then serving all subsequent values from
+        that same parent source from the decrypted parent source held in memory.
+
+    Attributes
+    ----------
+    __additional_sops_args : list
+    __bulk_decrypt : bool
+    __decrypted_parent_sources : dict
+        Key is ConfigValue.parent_source_key, value is the decrypted parent source.
+        Only used if bulk_decrypt is True.
 
     Also See
     --------
@@ -29,14 +45,28 @@ class SOPS(ConfigValueDecryptor):
 
     SOPS_ENCRYPTED_VALUE_REGEX = r'^ENC\[.*\]$'
 
-    def __init__(self, additional_sops_args=None):
+    def __init__(self, additional_sops_args=None, bulk_decrypt=False):
         self.__additional_sops_args = additional_sops_args
 
         if not self.__additional_sops_args:
             self.__additional_sops_args = []
 
+        self.__bulk_decrypt = bulk_decrypt
+        self.__decrypted_parent_sources = {}
+
         super().__init__()
 
+    @property
+    def bulk_decrypt(self):
+        """
+        Returns
+        -------
+        bool
+            True if decrypting entire parent sources with one SOPS invocation each.
+            False if invoking SOPS once per decrypted value.
+        """
+        return self.__bulk_decrypt
+
     def can_decrypt(self, config_value):
         """Determine if a given config value can be decrypted by this decryptor.
 
@@ -79,8 +109,92 @@ class SOPS(ConfigValueDecryptor):
                 that exists
             If config_value#parent_source is not of type dict or str
         """
-        decrypted_value = None
+        if self.bulk_decrypt:
+            return self.__decrypt_from_decrypted_parent_source(config_value)
+
         sops_path = SOPS.get_sops_value_path(config_value)
+        return self.__run_sops(config_value, f'--extract={sops_path}')
+
+    def clear_cache(self):
+        """Clear all of the in memory decrypted parent sources.
+        """
+        self.__decrypted_parent_sources = {}
+
+    def __decrypt_from_decrypted_parent_source(self, config_value):
+        """Decrypt the value of the given ConfigValue by decrypting its entire parent source,
+        if not already decrypted, and then getting the value from the decrypted parent source.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            Decrypt the value of this ConfigValue.
+
+        Returns
+        -------
+        str or None
+            Decrypted value of the ConfigValue.
+            None if the given ConfigValue path parts do not exist in the decrypted parent source.
+
+        Raises
+        ------
+        RuntimeError
+            If error attempting to run 'sops' command
+            If the output of the 'sops' command could not be parsed as JSON
+        ValueError
+            If given config_value#parent_source is of type string but is not a path to a file
+                that exists
+            If config_value#parent_source is not of type dict or str
+        """
+        parent_source_key = config_value.parent_source_key
+        if parent_source_key not in self.__decrypted_parent_sources:
+            decrypted_parent_source = self.__run_sops(config_value, '--output-type=json')
+            try:
+                self.__decrypted_parent_sources[parent_source_key] = \
+                    json.loads(decrypted_parent_source)
+            except ValueError as error:
+                raise RuntimeError(
+                    "Error parsing sops output as json when trying to decrypt" +
+                    f" config value ({config_value}): {error}"
+                ) from error
+
+        decrypted_value = self.__decrypted_parent_sources[parent_source_key]
+        for path_part in config_value.path_parts:
+            try:
+                decrypted_value = decrypted_value[path_part]
+            except (KeyError, IndexError, TypeError):
+                return None
+
+        # keep consistent with the output of 'sops --decrypt --extract'
+        if not isinstance(decrypted_value, str):
+            decrypted_value = json.dumps(decrypted_value)
+
+        return decrypted_value
+
+    def __run_sops(self, config_value, sops_decrypt_arg):
+        """Run 'sops --decrypt' against the parent source of the given ConfigValue.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            ConfigValue whose parent source to decrypt.
+        sops_decrypt_arg : str
+            Argument to pass to 'sops --decrypt' controlling what is output.
+
+        Returns
+        -------
+        str
+            Output of the 'sops' command.
+
+        Raises
+        ------
+        RuntimeError
+            If error attempting to run 'sops' command
+        ValueError
+            If given config_value#parent_source is of type string but is not a path to a file
+                that exists
+            If config_value#parent_source is not of type dict or str
+        """
+        decrypted_value = None
 
         # if source is a string assume it is a file path and decrypt from that
         # else if source is a dict then dump to json and decrypt from that
@@ -98,9 +212,9 @@ class SOPS(ConfigValueDecryptor):
                     f"Given config value ({config_value}) parent source ({parent_source}) " +
                     "is of type (str) but is not a path to a file that exists"
                 )
-        elif isinstance(parent_source, dict):
+        elif isinstance(parent_source, Mapping):
             target_file = '/dev/stdin'
-            stdin = json.dumps(parent_source)
+            stdin = json.dumps(thaw(parent_source))
             input_type_arg = '--input-type=json'
         else:
             raise ValueError(
@@ -113,12 +227,12 @@ class SOPS(ConfigValueDecryptor):
             out = StringIO()
             sh.sops( # pylint: disable=no-member
                 '--decrypt',
-                f'--extract={sops_path}',
+                sops_decrypt_arg,
                 input_type_arg,
                 target_file,
                 _in=stdin,
                 _out=out,
-                _err=sys.stderr,
+                _err=get_current_stream(sys.stderr),
                 *self.__additional_sops_args
             )
             decrypted_value = out.getvalue()
@@ -1,9 +1,8 @@
 """Representation of an individual step's step configuration.
 """
 
-import copy
-
 from ploigos_step_runner.config.sub_step_config import SubStepConfig
+from ploigos_step_runner.utils.dict import FrozenDict, freeze
 
 
 class StepConfig:
@@ -21,14 +20,16 @@ class StepConfig:
     __parent_config : Config
     __step_name : str
     __sub_steps : list of SubStepConfig
-    __sub_step_config_overrides : dict
+    __sub_step_config_overrides : FrozenDict
+    __parallel : bool
     """
 
     def __init__(self, parent_config, step_name):
         self.__parent_config = parent_config
         self.__step_name = step_name
         self.__sub_steps = []
-        self.__step_config_overrides = {}
+        self.__step_config_overrides = FrozenDict()
+        self.__parallel = False
 
     @property
     def parent_config(self):
@@ -59,6 +60,28 @@ class StepConfig:
         """
         return self.__sub_steps
 
+    @property
+    def parallel(self):
+        """
+        Returns
+        -------
+        bool
+            True if the sub steps of this step can be run in parallel with each other.
+            False if the sub steps of this step must be run one after the other.
+        """
+        return self.__parallel
+
+    @parallel.setter
+    def parallel(self, parallel):
+        """
+        Parameters
+        ----------
+        parallel : bool
+            True if the sub steps of this step can be run in parallel with each other.
+            False if the sub steps of this step must be run one after the other.
+        """
+        self.__parallel = parallel
+
     def get_sub_step(self, sub_step_name):
         """Get sub step of this step with a given name if one exists.
 
@@ -81,14 +104,14 @@ class StepConfig:
 
     @property
     def step_config_overrides(self):
-        """Gets a deep copy of the step configuration overrides.
+        """Gets a read only view of the step configuration overrides.
 
         Returns
         -------
-        dict
-            Deep copy of the step configuration overrides.
+        FrozenDict
+            Read only view of the step configuration overrides.
         """
-        return copy.deepcopy(self.__step_config_overrides)
+        return self.__step_config_overrides
 
     @step_config_overrides.setter
     def step_config_overrides(self, step_config_overrides):
@@ -99,7 +122,12 @@ class StepConfig:
         step_config_overrides : dict
             New step configuration overrides.
         """
-        self.__step_config_overrides = step_config_overrides if step_config_overrides else {}
+        self.__step_config_overrides = freeze(
+            step_config_overrides if step_config_overrides else {}
+        )
+
+        for sub_step in self.sub_steps:
+            sub_step.clear_runtime_step_config_cache()
 
     def add_or_update_sub_step_config(
             self,
@@ -1,10 +1,8 @@
 """Representation of a sub step configuration.
 """
 
-import copy
-
 from ploigos_step_runner.config.config_value import ConfigValue
-from ploigos_step_runner.utils.dict import deep_merge
+from ploigos_step_runner.utils.dict import FrozenDict, freeze, frozen_deep_merge, thaw
 
 
 class SubStepConfig:
@@ -28,8 +26,16 @@ class SubStepConfig:
     __parent_step_config : StepConfig
     __sub_step_name : str
     __sub_step_implementer_name : str
-    __sub_step_config_dict : dict
-    __sub_step_env_config : dict
+    __sub_step_config_dict : FrozenDict
+    __sub_step_env_config : FrozenDict
+    __runtime_step_config_cache : dict
+        Key is environment name, value is tuple of the defaults the merged runtime step
+        configuration was created with and the merged runtime step configuration.
+
+    Notes
+    -----
+    All of the configuration is stored as FrozenDict trees, so that it can be handed out as
+    read only views and merged without ever being deep copied.
     """
 
     def __init__( # pylint: disable=too-many-arguments
@@ -46,11 +52,13 @@ class SubStepConfig:
 
         if sub_step_config_dict is None:
             sub_step_config_dict = {}
-        self.__sub_step_config_dict = sub_step_config_dict
+        self.__sub_step_config_dict = freeze(sub_step_config_dict)
 
         if sub_step_env_config is None:
             sub_step_env_config = {}
-        self.__sub_step_env_config = sub_step_env_config
+        self.__sub_step_env_config = freeze(sub_step_env_config)
+
+        self.__runtime_step_config_cache = {}
 
     @property
     def parent_config(self):
@@ -116,14 +124,14 @@ class SubStepConfig:
 
     @property
     def sub_step_config(self):
-        """Get a deep copy of the sub step configuration.
+        """Get a read only view of the sub step configuration.
 
         Returns
         -------
-        dict
-            Deep copy of the sub step configuration.
+        FrozenDict
+            Read only view of the sub step configuration.
         """
-        return copy.deepcopy(self.__sub_step_config_dict)
+        return self.__sub_step_config_dict
 
     @property
     def global_defaults(self):
@@ -131,8 +139,8 @@ class SubStepConfig:
 
         Returns
         -------
-        dict
-            Deep copy of the global defaults
+        FrozenDict
+            Read only view of the global defaults
         """
         return self.parent_config.global_defaults
 
@@ -142,10 +150,11 @@ class SubStepConfig:
 
         Returns
         -------
-        dict
-            The environment specific configuration for all environments for this sub step.
+        FrozenDict
+            Read only view of the environment specific configuration for all environments
+            for this sub step.
         """
-        return copy.deepcopy(self.__sub_step_env_config)
+        return self.__sub_step_env_config
 
     def get_global_environment_defaults(self, env):
         """Convince function for getting the global environment defaults from the parent config.
@@ -157,8 +166,8 @@ class SubStepConfig:
 
         Returns
         -------
-        dict
-            Deep copy of the global defaults for a given environment
+        FrozenDict
+            Read only view of the global defaults for a given environment
         """
         return self.parent_config.get_global_environment_defaults_for_environment(env)
 
@@ -172,16 +181,11 @@ class SubStepConfig:
 
         Returns
         -------
-        dict
-            Environment specific sub step configuration.
-            Empty dict if no environment specific sub step configuration.
+        FrozenDict
+            Read only view of the environment specific sub step configuration.
+            Empty if no environment specific sub step configuration.
         """
-        if env in self.sub_step_env_config:
-            sub_step_env_config = self.sub_step_env_config[env]
-        else:
-            sub_step_env_config = {}
-
-        return sub_step_env_config
+        return self.__sub_step_env_config.get(env, FrozenDict())
 
     def merge_sub_step_config(self, new_sub_step_config):
         """Merge new sub step configuration into the existing sub step configuration.
@@ -200,10 +204,11 @@ class SubStepConfig:
 
         if new_sub_step_config is not None:
             try:
-                self.__sub_step_config_dict = deep_merge(
-                    self.sub_step_config,
-                    copy.deepcopy(new_sub_step_config)
+                self.__sub_step_config_dict = frozen_deep_merge(
+                    self.__sub_step_config_dict,
+                    new_sub_step_config
                 )
+                self.clear_runtime_step_config_cache()
             except ValueError as error:
                 raise ValueError(
                     "Error merging new sub step configuration" +
@@ -230,10 +235,11 @@ class SubStepConfig:
 
         if new_sub_step_env_config is not None:
             try:
-                self.__sub_step_env_config = deep_merge(
+                self.__sub_step_env_config = frozen_deep_merge(
                     self.__sub_step_env_config,
-                    copy.deepcopy(new_sub_step_env_config)
+                    new_sub_step_env_config
                 )
+                self.clear_runtime_step_config_cache()
             except ValueError as error:
                 raise ValueError(
                     "Error merging new sub step environment configuration" +
@@ -241,6 +247,18 @@ class SubStepConfig:
                     f" for sub step ({self.sub_step_name}) of step ({self.step_name}): {error}"
                 ) from error
 
+    def clear_runtime_step_config_cache(self):
+        """Clear the cached merged runtime step configurations so that they are re-merged
+        from all of the configuration sources the next time they are needed.
+
+        Notes
+        -----
+        This needs to be called any time any of the configuration sources for this sub step
+        change, including the global defaults, global environment defaults,
+        and step configuration overrides.
+        """
+        self.__runtime_step_config_cache = {}
+
     def get_config_value(self, key, environment=None, defaults=None):
         """Get the configuration value for a given configuration key from the
         merged set of configuration sources.
@@ -256,6 +274,7 @@ class SubStepConfig:
 
         Also See
         --------
+        get_runtime_step_config
         get_copy_of_runtime_step_config
 
         Parameters
@@ -281,13 +300,13 @@ class SubStepConfig:
             if isinstance(runtime_step_config[key], ConfigValue):
                 value = runtime_step_config[key].value
             else:
-                value = copy.deepcopy(runtime_step_config[key])
+                value = thaw(runtime_step_config[key])
         else:
             value = None
 
         return value
 
-    def get_copy_of_runtime_step_config(self, environment=None, defaults=None):
+    def get_runtime_step_config(self, environment=None, defaults=None):
         """Take all of the context about this sub step merges together a single dictionary
         with all of the configuration for a given step.
 
@@ -303,6 +322,7 @@ class SubStepConfig:
         Also See
         --------
         get_config_value
+        get_copy_of_runtime_step_config
 
         Parameters
         ----------
@@ -314,12 +334,36 @@ class SubStepConfig:
 
         Returns
         -------
-        dict
-            A deep copy of the merged runtime step configuration
+        FrozenDict
+            A read only view of the merged runtime step configuration,
+            shared by every caller, for when the configuration does not need to be changed.
         """
-        defaults = defaults if defaults else {}
+        return self.__merge_runtime_step_config(environment, defaults)
 
-        return copy.deepcopy(self.__merge_runtime_step_config(environment, defaults))
+    def get_copy_of_runtime_step_config(self, environment=None, defaults=None):
+        """Get a deep copy of the runtime step configuration which the caller is free
+        to change, see get_runtime_step_config.
+
+        Also See
+        --------
+        get_config_value
+        get_runtime_step_config
+
+        Parameters
+        ----------
+        environment : str, optional
+            Environment to get the runtime step configuration for
+        defaults : dict, optional
+            Defaults to use if no other configuration specified from any other source
+            for each given key.
+
+        Returns
+        -------
+        dict
+            A deep copy of the merged runtime step configuration.
+            The ConfigValue leaves are not copied since they are immutable.
+        """
+        return thaw(self.get_runtime_step_config(environment, defaults))
 
     def __merge_runtime_step_config(self, environment=None, defaults=None):
         """Take all of the context about this sub step merges together a single dictionary
@@ -336,9 +380,9 @@ class SubStepConfig:
 
         Notes
         -----
-        This is not intended to be accessed outside of this class since it gives direct access
-        to the underlying dictionaries which could in theory be changed, which would not be the
-        intended use.
+        The merged runtime step configuration is cached per environment for the given
+        defaults object, so given defaults should not be modified after being given.
+        Callers looking up many keys should keep passing the same defaults object.
 
         Parameters
         ----------
@@ -350,16 +394,26 @@ class SubStepConfig:
 
         Returns
         -------
-        dict
+        FrozenDict
             Merged runtime step configuration
         """
-        defaults = defaults if defaults else {}
+        defaults = defaults if defaults else None
 
-        return {
-            **defaults,
+        if environment in self.__runtime_step_config_cache:
+            cached_defaults, runtime_step_config = self.__runtime_step_config_cache[environment]
+            if cached_defaults is defaults:
+                return runtime_step_config
+
+        # NOTE: only the top level is merged so the merged runtime step configuration
+        #       shares every value with the configuration sources
+        runtime_step_config = FrozenDict({
+            **freeze(defaults if defaults else {}),
             **self.global_defaults,
             **self.get_global_environment_defaults(environment),
             **self.sub_step_config,
             **self.get_sub_step_env_config(environment),
             **self.step_config_overrides,
-        }
+        })
+        self.__runtime_step_config_cache[environment] = (defaults, runtime_step_config)
+
+        return runtime_step_config
@@ -2,6 +2,7 @@
 """
 
 from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.implementer_registry import ImplementerRegistry
 from ploigos_step_runner.utils.io import TextIOSelectiveObfuscator
 from ploigos_step_runner.utils.reflection import import_and_get_class
 from ploigos_step_runner.config.config_value_decryptor import ConfigValueDecryptor
@@ -12,6 +13,9 @@ class DecryptionUtils:
     Any values that are decrypted are added to the given list of TextIOSelectiveObfuscator
     of strings to obfuscate.
 
+    Decrypted values are cached for the life of the process so that any given encrypted
+    value is only ever decrypted once, regardless of how many times it is accessed.
+
     Attributes
     ----------
     __obfuscation_streams : list of TextIOSelectiveObfuscator
@@ -19,12 +23,23 @@ class DecryptionUtils:
         on those streams.
     __config_value_decryptors : list of ConfigValueDecryptor
         ConfigValueDecryptors that can be used to decrypt given ConfigValue.
+    __config_value_decryptors_version : int
+        Incremented every time a ConfigValueDecryptor is registered so that anything caching
+        which decryptor can decrypt a ConfigValue knows when to check again.
+    __decryption_cache_enabled : bool
+        True to cache decrypted values, False to decrypt on every request.
+    __decryption_cache : dict
+        Key is tuple of (parent source key, path parts, raw value) for a decrypted ConfigValue,
+        value is the decrypted value.
     """
 
     __DEFAULT_DECRYPTORS_MODULE = 'ploigos_step_runner.config.decryptors'
 
     __obfuscation_streams = []
     __config_value_decryptors = []
+    __config_value_decryptors_version = 0
+    __decryption_cache_enabled = True
+    __decryption_cache = {}
 
     @staticmethod
     def register_obfuscation_stream(obfuscator_stream):
@@ -43,6 +58,23 @@ class DecryptionUtils:
         assert isinstance(obfuscator_stream, TextIOSelectiveObfuscator)
         DecryptionUtils.__obfuscation_streams.append(obfuscator_stream)
 
+        # be sure any values decrypted before this stream was registered are obfuscated on it
+        for decrypted_value in DecryptionUtils.__decryption_cache.values():
+            obfuscator_stream.add_obfuscation_targets(decrypted_value)
+
+    @staticmethod
+    def unregister_obfuscation_stream(obfuscator_stream):
+        """Remove a previously registered TextIOSelectiveObfuscator so that decrypted values are
+        no longer added to it.
+
+        Parameters
+        ----------
+        obfuscator_stream : TextIOSelectiveObfuscator
+            TextIOSelectiveObfuscator to remove. Ignored if not registered.
+        """
+        if obfuscator_stream in DecryptionUtils.__obfuscation_streams:
+            DecryptionUtils.__obfuscation_streams.remove(obfuscator_stream)
+
     @staticmethod
     def register_config_value_decryptor(config_value_decryptor):
         """Add a ConfigValueDecryptor that can be used to decrypt ConfigValues.
@@ -60,6 +92,41 @@ class DecryptionUtils:
         """
         assert isinstance(config_value_decryptor, ConfigValueDecryptor)
         DecryptionUtils.__config_value_decryptors.append(config_value_decryptor)
+        DecryptionUtils.__config_value_decryptors_version += 1
+
+    @staticmethod
+    def get_config_value_decryptors_version():
+        """Get the version of the registered ConfigValueDecryptors.
+
+        Returns
+        -------
+        int
+            Version of the registered ConfigValueDecryptors, which changes every time a
+            ConfigValueDecryptor is registered. Anything caching the result of
+            get_config_value_decryptor should check again if this changes.
+        """
+        return DecryptionUtils.__config_value_decryptors_version
+
+    @staticmethod
+    def get_config_value_decryptor(config_value):
+        """Get the first registered ConfigValueDecryptor that can decrypt the given ConfigValue.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            ConfigValue to get the ConfigValueDecryptor for.
+
+        Returns
+        -------
+        ConfigValueDecryptor or None
+            First registered ConfigValueDecryptor that can decrypt the given ConfigValue or
+            None if none of the registered ConfigValueDecryptors can decrypt it.
+        """
+        for config_value_decryptor in DecryptionUtils.__config_value_decryptors:
+            if config_value_decryptor.can_decrypt(config_value):
+                return config_value_decryptor
+
+        return None
 
     @staticmethod
     def create_and_register_config_value_decryptor(
@@ -102,7 +169,7 @@ class DecryptionUtils:
             ) from error
 
     @staticmethod
-    def decrypt(config_value):
+    def decrypt(config_value, config_value_decryptor=None):
         """If possible decrypt the given ConfigValue using one of the
         registered ConfigValueDecryptors.
 
@@ -111,6 +178,10 @@ class DecryptionUtils:
         config_value : ConfigValue
             ConfigValue to decrypt the value of with one of the
             registered ConfigValueDecryptors if possible.
+        config_value_decryptor : ConfigValueDecryptor, optional
+            ConfigValueDecryptor already known to be able to decrypt the given ConfigValue,
+            see get_config_value_decryptor.
+            If not given the registered ConfigValueDecryptors are checked in turn.
 
         Returns
         -------
@@ -119,17 +190,138 @@ class DecryptionUtils:
             None if none of the registered ConfigValueDecryptors can decrypt the given
             ConfigValue.
         """
+        if config_value_decryptor is None:
+            config_value_decryptor = DecryptionUtils.get_config_value_decryptor(config_value)
+            if config_value_decryptor is None:
+                return None
 
-        decrypted_value = None
-        for config_value_decryptor in DecryptionUtils.__config_value_decryptors:
-            if config_value_decryptor.can_decrypt(config_value):
-                decrypted_value = config_value_decryptor.decrypt(config_value)
-                break
+        if not DecryptionUtils.__decryption_cache_enabled:
+            decrypted_value = config_value_decryptor.decrypt(config_value)
+            DecryptionUtils.__add_obfuscation_targets(decrypted_value)
+            return decrypted_value
 
-        DecryptionUtils.__add_obfuscation_targets(decrypted_value)
+        cache_key = DecryptionUtils.__get_decryption_cache_key(config_value)
+        if cache_key in DecryptionUtils.__decryption_cache:
+            decrypted_value = DecryptionUtils.__decryption_cache[cache_key]
+        else:
+            decrypted_value = config_value_decryptor.decrypt(config_value)
+            if decrypted_value is not None:
+                DecryptionUtils.__decryption_cache[cache_key] = decrypted_value
+                DecryptionUtils.__add_obfuscation_targets(decrypted_value)
 
         return decrypted_value
 
+    @staticmethod
+    def can_decrypt(config_value):
+        """Determine if any of the registered ConfigValueDecryptors can decrypt the given
+        ConfigValue without actually decrypting it.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            ConfigValue to determine if can be decrypted.
+
+        Returns
+        -------
+        bool
+            True if one of the registered ConfigValueDecryptors can decrypt the given ConfigValue.
+            False otherwise.
+        """
+        return DecryptionUtils.get_config_value_decryptor(config_value) is not None
+
+    @staticmethod
+    def is_decrypted(config_value):
+        """Determine if the given ConfigValue has already been decrypted and its decrypted
+        value cached.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            ConfigValue to determine if already decrypted.
+
+        Returns
+        -------
+        bool
+            True if the decrypted value of the given ConfigValue is cached.
+            False otherwise, including if the decryption cache is disabled.
+        """
+        return DecryptionUtils.__get_decryption_cache_key(config_value) \
+            in DecryptionUtils.__decryption_cache
+
+    @staticmethod
+    def is_decryption_cache_enabled():
+        """Whether or not decrypted values are being cached.
+
+        Returns
+        -------
+        bool
+            True if decrypted values are cached so that each encrypted value is only
+            decrypted once per process.
+            False if every request to decrypt a value will invoke a decryptor.
+        """
+        return DecryptionUtils.__decryption_cache_enabled
+
+    @staticmethod
+    def set_decryption_cache_enabled(enabled):
+        """Enable or disable the caching of decrypted values.
+
+        Notes
+        -----
+        Disabling the cache also clears it.
+
+        Parameters
+        ----------
+        enabled : bool
+            True to cache decrypted values so that each encrypted value is only
+            decrypted once per process.
+            False to invoke a decryptor on every request to decrypt a value.
+        """
+        DecryptionUtils.__decryption_cache_enabled = enabled
+
+        if not enabled:
+            DecryptionUtils.clear_decryption_cache()
+
+    @staticmethod
+    def clear_decryption_cache():
+        """Removes all previously decrypted values from the cache so that the next request
+        for any encrypted value will invoke a decryptor again.
+
+        Notes
+        -----
+        Previously decrypted values are NOT removed as obfuscation targets from any
+        registered obfuscation streams.
+
+        Any in memory caches held by the registered ConfigValueDecryptors are also cleared.
+        """
+        DecryptionUtils.__decryption_cache = {}
+
+        for config_value_decryptor in DecryptionUtils.__config_value_decryptors:
+            config_value_decryptor.clear_cache()
+
+    @staticmethod
+    def __get_decryption_cache_key(config_value):
+        """Gets the key to cache the decrypted value of the given ConfigValue under.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            ConfigValue to get the decryption cache key for.
+
+        Returns
+        -------
+        tuple
+            Tuple of (parent source key, path parts, raw value).
+
+        See Also
+        --------
+        ConfigValue.parent_source_key
+        """
+        return (
+            config_value.parent_source_key,
+            tuple(config_value.path_parts),
+            str(config_value.raw_value)
+        )
+
     @staticmethod
     def __add_obfuscation_targets(targets):
         if targets is not None:
@@ -143,7 +335,8 @@ class DecryptionUtils:
         Parameters
         ----------
         decryptor_implementer_name : str
-            Either the short name of a ConfigValueDecryptor class which will be dynamically
+            Either the short name of a ConfigValueDecryptor class registered in the
+            ImplementerRegistry or, if not registered, which will be dynamically
             loaded from the 'ploigos_step_runner.config.decryptors' module or
             A class name that includes a dot seperated module name to load the Class from.
 
@@ -158,12 +351,18 @@ class DecryptionUtils:
             If could not find class to load
             If loaded class is not a subclass of ConfigValueDecryptor
         """
-        parts = decryptor_implementer_name.split('.')
-        class_name = parts.pop()
-        module_name = '.'.join(parts)
+        registered_decryptor = ImplementerRegistry.resolve_config_value_decryptor(
+            decryptor_implementer_name
+        )
+        if registered_decryptor is not None:
+            module_name, class_name = registered_decryptor
+        else:
+            parts = decryptor_implementer_name.split('.')
+            class_name = parts.pop()
+            module_name = '.'.join(parts)
 
-        if not module_name:
-            module_name = DecryptionUtils.__DEFAULT_DECRYPTORS_MODULE
+            if not module_name:
+                module_name = DecryptionUtils.__DEFAULT_DECRYPTORS_MODULE
 
         clazz = import_and_get_class(module_name, class_name)
         if not clazz:
@@ -0,0 +1,307 @@
+"""Registry of the StepImplementers and ConfigValueDecryptors provided by installed packages.
+"""
+
+import json
+import os
+import sys
+
+from ploigos_step_runner.utils.file import create_parent_dir
+
+
+class ImplementerRegistry:
+    """Registry of the StepImplementers and ConfigValueDecryptors provided by installed packages
+    as entry points, so that they can be listed and resolved without importing any of them.
+
+    Notes
+    -----
+    StepImplementers are provided as entry points in the
+    STEP_IMPLEMENTERS_ENTRY_POINT_GROUP group named `{step name}/{short name}`, for example
+    `generate-metadata/SemanticVersion`, and ConfigValueDecryptors as entry points in the
+    CONFIG_VALUE_DECRYPTORS_ENTRY_POINT_GROUP group named by their short name,
+    for example `SOPS`. Entry point values are the `module:Class` to load.
+
+    Finding the entry points of every installed package is only done once per process and,
+    if a cache directory is set, the result is stored in a manifest in that directory that
+    later processes use for as long as none of the sys.path entries have been modified.
+
+    Attributes
+    ----------
+    __cache_dir : str or None
+        Directory to store the manifest of discovered entry points in.
+    __manifest : dict or None
+        Discovered entry points, by entry point group, or None if not discovered yet.
+    """
+
+    STEP_IMPLEMENTERS_ENTRY_POINT_GROUP = 'ploigos_step_runner.step_implementers'
+    CONFIG_VALUE_DECRYPTORS_ENTRY_POINT_GROUP = 'ploigos_step_runner.config_value_decryptors'
+    MANIFEST_FILE_NAME = 'implementer-registry.json'
+    FORMAT_VERSION = 1
+
+    __cache_dir = None
+    __manifest = None
+
+    @staticmethod
+    def set_cache_dir(cache_dir):
+        """Sets the directory to store the manifest of discovered entry points in.
+
+        Parameters
+        ----------
+        cache_dir : str or None
+            Directory to store the manifest of discovered entry points in,
+            or None to not store it.
+        """
+        ImplementerRegistry.__cache_dir = cache_dir
+        ImplementerRegistry.__manifest = None
+
+    @staticmethod
+    def get_step_implementers():
+        """Gets all of the registered StepImplementers without importing any of them.
+
+        Returns
+        -------
+        dict of str to str
+            `{step name}/{short name}` of every registered StepImplementer to the
+            `module:Class` that implements it.
+        """
+        return dict(
+            ImplementerRegistry.__get_manifest()[
+                ImplementerRegistry.STEP_IMPLEMENTERS_ENTRY_POINT_GROUP
+            ]
+        )
+
+    @staticmethod
+    def get_config_value_decryptors():
+        """Gets all of the registered ConfigValueDecryptors without importing any of them.
+
+        Returns
+        -------
+        dict of str to str
+            Short name of every registered ConfigValueDecryptor to the
+            `module:Class` that implements it.
+        """
+        return dict(
+            ImplementerRegistry.__get_manifest()[
+                ImplementerRegistry.CONFIG_VALUE_DECRYPTORS_ENTRY_POINT_GROUP
+            ]
+        )
+
+    @staticmethod
+    def resolve_step_implementer(step_name, step_implementer_name):
+        """Resolves the module and class of a registered StepImplementer without importing it.
+
+        Parameters
+        ----------
+        step_name : str
+            Name of the step to resolve the StepImplementer for.
+        step_implementer_name : str
+            Short name of the StepImplementer to resolve.
+
+        Returns
+        -------
+        tuple of (str, str) or None
+            Module name and class name of the StepImplementer
+            or None if no such StepImplementer is registered.
+        """
+        return ImplementerRegistry.__resolve(
+            ImplementerRegistry.STEP_IMPLEMENTERS_ENTRY_POINT_GROUP,
+            f'{step_name}/{step_implementer_name}'
+        )
+
+    @staticmethod
+    def resolve_config_value_decryptor(decryptor_implementer_name):
+        """Resolves the module and class of a registered ConfigValueDecryptor
+        without importing it.
+
+        Parameters
+        ----------
+        decryptor_implementer_name : str
+            Short name of the ConfigValueDecryptor to resolve.
+
+        Returns
+        -------
+        tuple of (str, str) or None
+            Module name and class name of the ConfigValueDecryptor
+            or None if no such ConfigValueDecryptor is registered.
+        """
+        return ImplementerRegistry.__resolve(
+            ImplementerRegistry.CONFIG_VALUE_DECRYPTORS_ENTRY_POINT_GROUP,
+            decryptor_implementer_name
+        )
+
+    @staticmethod
+    def __resolve(group, name):
+        """
+        Parameters
+        ----------
+        group : str
+            Entry point group to resolve the given entry point name in.
+        name : str
+            Name of the entry point to resolve.
+
+        Returns
+        -------
+        tuple of (str, str) or None
+            Module name and class name the entry point refers to
+            or None if there is no such entry point.
+        """
+        value = ImplementerRegistry.__get_manifest()[group].get(name)
+        if value is None:
+            return None
+
+        module_name, _, class_name = value.partition(':')
+        return module_name.strip(), class_name.strip()
+
+    @staticmethod
+    def __get_manifest():
+        """
+        Returns
+        -------
+        dict
+            Discovered entry points, by entry point group,
+            from the manifest if it is still valid, else discovered from the installed packages.
+        """
+        if ImplementerRegistry.__manifest is not None:
+            return ImplementerRegistry.__manifest
+
+        manifest_key = ImplementerRegistry.__get_manifest_key()
+        manifest = None
+        manifest_path = None
+        if ImplementerRegistry.__cache_dir is not None:
+            manifest_path = os.path.join(
+                ImplementerRegistry.__cache_dir,
+                ImplementerRegistry.MANIFEST_FILE_NAME
+            )
+            manifest = ImplementerRegistry.__read_manifest(manifest_path, manifest_key)
+
+        if manifest is None:
+            manifest = ImplementerRegistry.__discover_entry_points()
+            if manifest_path is not None:
+                ImplementerRegistry.__write_manifest(manifest_path, manifest_key, manifest)
+
+        ImplementerRegistry.__manifest = manifest
+        return manifest
+
+    @staticmethod
+    def __get_manifest_key():
+        """
+        Notes
+        -----
+        Installing, upgrading, or removing a package modifies the sys.path entry it is in,
+        which invalidates the manifest.
+
+        Returns
+        -------
+        dict
+            Values that the manifest must match to be valid.
+        """
+        sys_path_mtimes = []
+        for path in sys.path:
+            try:
+                sys_path_mtimes.append([path, os.stat(path or os.curdir).st_mtime_ns])
+            except OSError:
+                sys_path_mtimes.append([path, None])
+
+        return {
+            'format-version': ImplementerRegistry.FORMAT_VERSION,
+            'python-version': list(sys.version_info[:3]),
+            'sys-path-mtimes': sys_path_mtimes
+        }
+
+    @staticmethod
+    def __discover_entry_points():
+        """
+        Returns
+        -------
+        dict of str to dict of str to str
+            Entry point group to the name to value of every entry point in that group.
+        """
+        manifest = {
+            ImplementerRegistry.STEP_IMPLEMENTERS_ENTRY_POINT_GROUP: {},
+            ImplementerRegistry.CONFIG_VALUE_DECRYPTORS_ENTRY_POINT_GROUP: {}
+        }
+        # NOTE: imported here since importlib.metadata is slow to import and only needed when
+        #       there is no valid manifest, python < 3.8 has no entry point discovery
+        try:
+            from importlib import metadata as importlib_metadata # pylint: disable=import-outside-toplevel
+        except ImportError: # pragma: no cover
+            return manifest
+
+        entry_points = importlib_metadata.entry_points()
+        for group, group_entry_points in manifest.items():
+            if hasattr(entry_points, 'select'):
+                found_entry_points = entry_points.select(group=group)
+            else: # pragma: no cover
+                # NOTE: python < 3.10 returns a dict of group to entry points
+                found_entry_points = entry_points.get(group, ())
+
+            # NOTE: the first found wins, the same as for imports, if a package is on
+            #       sys.path more than once
+            for entry_point in found_entry_points:
+                group_entry_points.setdefault(entry_point.name, entry_point.value)
+
+        return manifest
+
+    @staticmethod
+    def __read_manifest(manifest_path, manifest_key):
+        """
+        Parameters
+        ----------
+        manifest_path : str
+            Path to the manifest to read.
+        manifest_key : dict
+            Values that the manifest must match to be valid.
+
+        Returns
+        -------
+        dict or None
+            Discovered entry points from the manifest
+            or None if the manifest does not exist, is not valid, or is for a different key.
+        """
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+                manifest_entry = json.load(manifest_file)
+
+            if manifest_entry['key'] != manifest_key:
+                return None
+
+            manifest = manifest_entry['entry-points']
+            for group in (
+                ImplementerRegistry.STEP_IMPLEMENTERS_ENTRY_POINT_GROUP,
+                ImplementerRegistry.CONFIG_VALUE_DECRYPTORS_ENTRY_POINT_GROUP
+            ):
+                if not isinstance(manifest[group], dict):
+                    return None
+
+            return manifest
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    @staticmethod
+    def __write_manifest(manifest_path, manifest_key, manifest):
+        """
+        Notes
+        -----
+        Written to a temporary file which then replaces any existing manifest so that
+        concurrent readers never see a partially written manifest. Failing to write the manifest
+        is not an error since it is only an optimization.
+
+        Parameters
+        ----------
+        manifest_path : str
+            Path to write the manifest to.
+        manifest_key : dict
+            Values that the manifest must match to be valid.
+        manifest : dict
+            Discovered entry points to write.
+        """
+        tmp_manifest_path = f'{manifest_path}.{os.getpid()}.tmp'
+        try:
+            create_parent_dir(manifest_path)
+            with open(tmp_manifest_path, 'w', encoding='utf-8') as manifest_file:
+                json.dump({'key': manifest_key, 'entry-points': manifest}, manifest_file)
+            os.replace(tmp_manifest_path, manifest_path)
+        except OSError:
+            try:
+                os.remove(tmp_manifest_path)
+            except OSError:
+                pass
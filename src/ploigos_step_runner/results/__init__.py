@@ -3,5 +3,8 @@
 
 from ploigos_step_runner.results.step_result import StepResult
 from ploigos_step_runner.results.step_result_artifact import StepResultArtifact
+from ploigos_step_runner.results.step_result_cache import StepResultCache
+from ploigos_step_runner.results.step_result_cache_backend import StepResultCacheBackend
 from ploigos_step_runner.results.step_result_evidence import StepResultEvidence
+from ploigos_step_runner.results.step_result_store import StepResultStore
 from ploigos_step_runner.results.workflow_result import WorkflowResult
@@ -0,0 +1,5 @@
+"""Backends for storing step result caches.
+"""
+
+from ploigos_step_runner.results.cache_backends.http import HTTPBackend
+from ploigos_step_runner.results.cache_backends.local_directory import LocalDirectoryBackend
@@ -0,0 +1,159 @@
+"""StepResultCacheBackend that stores data on an HTTP server.
+"""
+
+from urllib.parse import urlsplit, urlunsplit
+
+from ploigos_step_runner.results.step_result_cache_backend import StepResultCacheBackend
+
+
+class HTTPBackend(StepResultCacheBackend):
+    """StepResultCacheBackend that stores data on an HTTP server so that CI agents on different
+    machines can share it.
+
+    Notes
+    -----
+    Data is stored at `{url}/{namespace}/{key}`, with a PUT to store it, a GET to get it,
+    and a HEAD to check it exists. The server must respond with 404 for keys with no data and
+    must only make data available once all of it has been received, which servers such as
+    nginx with WebDAV enabled do.
+
+    Parameters
+    ----------
+    url : str
+        URL to store the data under.
+        May include a user name and password, `http(s)://user:password@host/path`, if not
+        given separately.
+    username : str, optional
+        User name to authenticate to the server with.
+    password : str, optional
+        Password to authenticate to the server with.
+    timeout : float, optional
+        Seconds to wait for the server to respond.
+    """
+
+    DEFAULT_TIMEOUT = 30
+
+    def __init__(self, url, username=None, password=None, timeout=DEFAULT_TIMEOUT):
+        split_url = urlsplit(url)
+        if username is None and split_url.username is not None:
+            username = split_url.username
+            password = split_url.password
+
+        netloc = split_url.hostname or ''
+        if ':' in netloc:
+            netloc = f'[{netloc}]'
+        if split_url.port is not None:
+            netloc = f'{netloc}:{split_url.port}'
+
+        self.__url = urlunsplit(
+            (split_url.scheme, netloc, split_url.path.rstrip('/'), split_url.query, '')
+        )
+        self.__username = username
+        self.__password = password
+        self.__timeout = timeout
+        self.__opener = None
+
+    @property
+    def url(self):
+        """
+        Returns
+        -------
+        str
+            URL the data is stored under, without any user name or password.
+        """
+        return self.__url
+
+    def get(self, namespace, key):
+        """Gets the data stored under the given key.
+
+        See Also
+        --------
+        StepResultCacheBackend.get
+        """
+        return self.__request('GET', namespace, key)
+
+    def contains(self, namespace, key):
+        """Determines if there is data stored under the given key without getting the data.
+
+        See Also
+        --------
+        StepResultCacheBackend.contains
+        """
+        return self.__request('HEAD', namespace, key) is not None
+
+    def put(self, namespace, key, data):
+        """Stores the given data under the given key.
+
+        See Also
+        --------
+        StepResultCacheBackend.put
+        """
+        self.__request('PUT', namespace, key, data)
+
+    def __request(self, method, namespace, key, data=None):
+        """
+        Parameters
+        ----------
+        method : str
+            HTTP method of the request.
+        namespace : str
+            Namespace of the key to make the request for.
+        key : str
+            Key to make the request for.
+        data : bytes, optional
+            Body of the request.
+
+        Returns
+        -------
+        bytes or None
+            Body of the response or None if the server responded with 404.
+
+        Raises
+        ------
+        OSError
+            If the request fails, including urllib.error.URLError and urllib.error.HTTPError.
+        """
+        # NOTE: imported here since urllib.request is slow to import and only needed if
+        #       using this backend
+        import urllib.error # pylint: disable=import-outside-toplevel
+        import urllib.request # pylint: disable=import-outside-toplevel
+
+        StepResultCacheBackend.validate_key(namespace, key)
+        request = urllib.request.Request(
+            url=f'{self.url}/{namespace}/{key}',
+            data=data,
+            method=method,
+            headers={'Content-Type': 'application/octet-stream'} if data is not None else {}
+        )
+
+        try:
+            with self.__get_opener().open(request, timeout=self.__timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as error:
+            if error.code == 404:
+                return None
+            raise
+
+    def __get_opener(self):
+        """
+        Returns
+        -------
+        urllib.request.OpenerDirector
+            Opener to make requests with, authenticating with the user name and password if
+            given.
+        """
+        # NOTE: imported here since urllib.request is slow to import and only needed if
+        #       using this backend
+        import urllib.request # pylint: disable=import-outside-toplevel
+
+        if self.__opener is None:
+            if self.__username:
+                password_mgr = urllib.request.HTTPPasswordMgrWithDefaultRealm()
+                password_mgr.add_password(None, self.url, self.__username, self.__password)
+                self.__opener = urllib.request.build_opener(
+                    urllib.request.HTTPBasicAuthHandler(password_mgr)
+                )
+            else:
+                self.__opener = urllib.request.build_opener()
+
+        return self.__opener
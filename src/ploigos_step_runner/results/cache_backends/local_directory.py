@@ -0,0 +1,193 @@
+"""StepResultCacheBackend that stores data in a local directory.
+"""
+
+import os
+import tempfile
+
+from ploigos_step_runner.results.step_result_cache_backend import StepResultCacheBackend
+
+
+class LocalDirectoryBackend(StepResultCacheBackend):
+    """StepResultCacheBackend that stores data as files in a local directory, which can be
+    shared by any number of processes, such as CI agents on the same machine or with the
+    directory on a shared volume.
+
+    Notes
+    -----
+    Data is stored in `{cache dir}/{namespace}/{first two characters of key}/{key}`.
+
+    Data is written to a temporary file in the same directory which then replaces any existing
+    file, so that readers never see a partially written file.
+
+    If a maximum size is given then, after storing data, the least recently used files are
+    removed until the directory is no larger than that size. Getting data, or checking that
+    it exists, marks it as used.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory to store the data in.
+    max_size : int, optional
+        Maximum size, in bytes, of the stored data.
+        Default: None, no maximum.
+    """
+
+    __TMP_FILE_PREFIX = '.tmp-'
+
+    def __init__(self, cache_dir, max_size=None):
+        self.__cache_dir = cache_dir
+        self.__max_size = max_size
+
+    @property
+    def cache_dir(self):
+        """
+        Returns
+        -------
+        str
+            Directory the data is stored in.
+        """
+        return self.__cache_dir
+
+    @property
+    def max_size(self):
+        """
+        Returns
+        -------
+        int or None
+            Maximum size, in bytes, of the stored data, or None if there is no maximum.
+        """
+        return self.__max_size
+
+    def get(self, namespace, key):
+        """Gets the data stored under the given key, marking it as used.
+
+        See Also
+        --------
+        StepResultCacheBackend.get
+        """
+        path = self.__get_path(namespace, key)
+        try:
+            with open(path, 'rb') as data_file:
+                data = data_file.read()
+        except FileNotFoundError:
+            return None
+
+        LocalDirectoryBackend.__mark_used(path)
+        return data
+
+    def contains(self, namespace, key):
+        """Determines if there is data stored under the given key, marking it as used.
+
+        See Also
+        --------
+        StepResultCacheBackend.contains
+        """
+        path = self.__get_path(namespace, key)
+        if not os.path.isfile(path):
+            return False
+
+        LocalDirectoryBackend.__mark_used(path)
+        return True
+
+    def put(self, namespace, key, data):
+        """Atomically stores the given data under the given key, then removes the least recently
+        used data if over the maximum size.
+
+        See Also
+        --------
+        StepResultCacheBackend.put
+        """
+        path = self.__get_path(namespace, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_file_descriptor, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path),
+            prefix=LocalDirectoryBackend.__TMP_FILE_PREFIX
+        )
+        try:
+            with os.fdopen(tmp_file_descriptor, 'wb') as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        if self.max_size is not None:
+            self.__evict_least_recently_used()
+
+    def __get_path(self, namespace, key):
+        """
+        Parameters
+        ----------
+        namespace : str
+            Namespace of the key to get the path for.
+        key : str
+            Key to get the path for.
+
+        Returns
+        -------
+        str
+            Path to the file to store the data for the given key in.
+
+        Raises
+        ------
+        ValueError
+            If the given namespace or key is not valid.
+        """
+        StepResultCacheBackend.validate_key(namespace, key)
+        return os.path.join(self.cache_dir, namespace, key[:2], key)
+
+    @staticmethod
+    def __mark_used(path):
+        """
+        Parameters
+        ----------
+        path : str
+            Path to the file to mark as the most recently used, by updating its modified time,
+            since access times are often not updated.
+        """
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def __evict_least_recently_used(self):
+        """Removes the least recently used files until the stored data is no larger than the
+        maximum size.
+
+        Notes
+        -----
+        Other processes may be removing the same files at the same time, which is fine.
+        """
+        stored_files = []
+        total_size = 0
+        for dir_path, _, file_names in os.walk(self.cache_dir):
+            for file_name in file_names:
+                if file_name.startswith(LocalDirectoryBackend.__TMP_FILE_PREFIX):
+                    continue
+
+                path = os.path.join(dir_path, file_name)
+                try:
+                    file_stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+
+                stored_files.append((file_stat.st_mtime_ns, file_stat.st_size, path))
+                total_size += file_stat.st_size
+
+        if total_size <= self.max_size:
+            return
+
+        stored_files.sort()
+        for _, size, path in stored_files:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            total_size -= size
+            if total_size <= self.max_size:
+                break
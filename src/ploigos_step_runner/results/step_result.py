@@ -7,7 +7,7 @@ from ploigos_step_runner.results.step_result_artifact import StepResultArtifact
 from ploigos_step_runner.results.step_result_evidence import StepResultEvidence
 
 
-class StepResult: # pylint: disable=too-many-instance-attributes
+class StepResult: # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Defines a StepResult object which represents the results of a invocation
     of a StepImplementer#run.
 
@@ -23,6 +23,17 @@ class StepResult: # pylint: disable=too-many-instance-attributes
         Optional. Environment that this step result is for
         if step was run against a specific environment.
     """
+    __DICT_SCHEMA = {
+        'step-name': str,
+        'sub-step-name': str,
+        'sub-step-implementer-name': str,
+        'environment': (str, type(None)),
+        'success': bool,
+        'message': str,
+        'artifacts': list,
+        'evidence': list
+    }
+
     def __init__(self, step_name, sub_step_name, sub_step_implementer_name, environment=None):
         self.__step_name = step_name
         self.__sub_step_name = sub_step_name
@@ -47,6 +58,68 @@ class StepResult: # pylint: disable=too-many-instance-attributes
             environment=step_implementer.environment
         )
 
+    @classmethod
+    def from_dict(cls, step_result_dict):
+        """Create a StepResult from its dictionary representation.
+
+        Parameters
+        ----------
+        step_result_dict : dict
+            Dictionary representation of a StepResult as returned by as_dict.
+
+        Returns
+        -------
+        StepResult
+            StepResult created from the given dictionary.
+
+        Raises
+        ------
+        StepRunnerException
+            If the given dictionary is not a valid StepResult representation.
+
+        See Also
+        --------
+        as_dict
+        """
+        if not isinstance(step_result_dict, dict):
+            raise StepRunnerException(
+                f'expected StepResult dictionary but got ({type(step_result_dict).__name__})'
+            )
+
+        for key, expected_types in StepResult.__DICT_SCHEMA.items():
+            if key not in step_result_dict:
+                raise StepRunnerException(f'StepResult dictionary missing key ({key})')
+            if not isinstance(step_result_dict[key], expected_types):
+                raise StepRunnerException(
+                    f'StepResult dictionary key ({key}) has invalid type'
+                    f' ({type(step_result_dict[key]).__name__})'
+                )
+
+        step_result = cls(
+            step_name=step_result_dict['step-name'],
+            sub_step_name=step_result_dict['sub-step-name'],
+            sub_step_implementer_name=step_result_dict['sub-step-implementer-name'],
+            environment=step_result_dict['environment']
+        )
+        step_result.success = step_result_dict['success']
+        step_result.message = step_result_dict['message']
+        for artifact_dict in step_result_dict['artifacts']:
+            artifact = StepResultArtifact.from_dict(artifact_dict)
+            step_result.add_artifact(
+                name=artifact.name,
+                value=artifact.value,
+                description=artifact.description
+            )
+        for evidence_dict in step_result_dict['evidence']:
+            evidence = StepResultEvidence.from_dict(evidence_dict)
+            step_result.add_evidence(
+                name=evidence.name,
+                value=evidence.value,
+                description=evidence.description
+            )
+
+        return step_result
+
     @property
     def step_name(self):
         """
@@ -359,10 +432,19 @@ class StepResult: # pylint: disable=too-many-instance-attributes
             }
         return result
 
-    def __str__(self):
-        """Get string representation of the step result.
+    def as_dict(self):
+        """Dictionary representation of this step result.
+
+        Returns
+        -------
+        dict
+            Representation of this step result.
+
+        See Also
+        --------
+        from_dict
         """
-        return str({
+        return {
             'step-name': self.step_name,
             'sub-step-name': self.sub_step_name,
             'sub-step-implementer-name': self.sub_step_implementer_name,
@@ -371,7 +453,12 @@ class StepResult: # pylint: disable=too-many-instance-attributes
             'message': self.message,
             'artifacts': self.artifacts_dicts,
             'evidence': self.evidence_dicts
-        })
+        }
+
+    def __str__(self):
+        """Get string representation of the step result.
+        """
+        return str(self.as_dict())
 
     def __repr__(self):
         """Get representation of the step result.
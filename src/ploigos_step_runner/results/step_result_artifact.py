@@ -20,6 +20,43 @@ class StepResultArtifact:
         self.__value = value
         self.__description = description
 
+    @classmethod
+    def from_dict(cls, artifact_dict):
+        """Create a StepResultArtifact from its dictionary representation.
+
+        Parameters
+        ----------
+        artifact_dict : dict
+            Dictionary representation of a StepResultArtifact as returned by as_dict.
+
+        Returns
+        -------
+        StepResultArtifact
+            StepResultArtifact created from the given dictionary.
+
+        Raises
+        ------
+        ValueError
+            If the given dictionary is not a valid StepResultArtifact representation.
+        """
+        if not isinstance(artifact_dict, dict):
+            raise ValueError(
+                f'expected StepResultArtifact dictionary but got ({type(artifact_dict).__name__})'
+            )
+
+        for key in ['name', 'value', 'description']:
+            if key not in artifact_dict:
+                raise ValueError(f'StepResultArtifact dictionary missing key ({key})')
+
+        if not isinstance(artifact_dict['name'], str):
+            raise ValueError('StepResultArtifact dictionary key (name) must be a str')
+
+        return cls(
+            name=artifact_dict['name'],
+            value=artifact_dict['value'],
+            description=artifact_dict['description']
+        )
+
     @property
     def name(self):
         """Getter for name step result artifact name.
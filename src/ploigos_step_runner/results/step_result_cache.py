@@ -0,0 +1,386 @@
+"""Defines a StepResultCache which stores the successful StepResults of sub steps, and the files
+their artifacts refer to, by the fingerprint of their inputs so that running a sub step again
+with the same inputs can reuse its previous StepResult rather than running it again.
+
+Cache Format
+------------
+Data is stored in a StepResultCacheBackend, zlib compressed, in two namespaces.
+
+    entries : cache entry for each fingerprint, keyed by the fingerprint
+    blobs   : contents of artifact files, keyed by the sha256 hash of the contents
+
+Each cache entry is JSON,
+
+    {
+        "format-version": 2,
+        "fingerprint": "...",
+        "consumed-result-values": [
+            {
+                "artifact": "version",
+                "step-name": null,
+                "sub-step-name": null,
+                "environment": null,
+                "value-hash": "..."
+            }
+        ],
+        "artifact-paths": ["/opt/tools/outside/the/workspace"],
+        "artifact-files": [
+            {"path": "/workspace/target/app.jar", "digest": "...", "executable": false},
+            {"path": "/workspace/target/reports", "digest": null, "executable": false}
+        ],
+        "step-result": {... StepResult.as_dict ...}
+    }
+
+where consumed-result-values are the previous step result artifacts the sub step looked up while
+it ran, which must still have the same values for the entry to be reused. The files and
+directories referred to by the StepResult artifacts are artifact-files, with the digest of their
+contents or null for directories, if they are in the workspace, and are restored from the cache
+if missing, otherwise they are artifact-paths, which must still exist.
+
+Since the blobs an entry refers to are stored before the entry, and the backend stores each
+atomically, readers never see an entry whose blobs have not been stored.
+"""
+
+import hashlib
+import json
+import os
+import zlib
+
+from ploigos_step_runner.results.step_result import StepResult
+from ploigos_step_runner.utils.file import create_parent_dir, get_file_hash
+
+
+class StepResultCache:
+    """Stores the successful StepResults of sub steps, and the files their artifacts refer to,
+    by the fingerprint of their inputs, see StepImplementer.get_step_result_fingerprint.
+
+    Notes
+    -----
+    A cache entry is only reused if every previous step result artifact the sub step looked up
+    when it ran still has the same value, every file or directory its StepResult artifacts
+    refer to outside of the workspace still exists, and every such file in the workspace
+    either still exists or can be restored from the cache. Otherwise the sub step is run
+    again and its entry replaced.
+
+    Failing to read or write the cache is never an error since the cache is only an
+    optimization, the sub step is just run again.
+
+    Parameters
+    ----------
+    backend : StepResultCacheBackend
+        Backend to store the cache in.
+    workspace_path : str, optional
+        Directory that files referred to by StepResult artifacts must be in to be stored in,
+        and restored from, the cache.
+        Default: the current working directory.
+    """
+
+    FORMAT_VERSION = 2
+    ENTRIES_NAMESPACE = 'entries'
+    BLOBS_NAMESPACE = 'blobs'
+
+    def __init__(self, backend, workspace_path=None):
+        self.__backend = backend
+        self.__workspace_path = os.path.realpath(workspace_path or os.getcwd())
+
+    @property
+    def backend(self):
+        """
+        Returns
+        -------
+        StepResultCacheBackend
+            Backend the cache is stored in.
+        """
+        return self.__backend
+
+    @property
+    def workspace_path(self):
+        """
+        Returns
+        -------
+        str
+            Directory that files referred to by StepResult artifacts must be in to be stored in,
+            and restored from, the cache.
+        """
+        return self.__workspace_path
+
+    def get_step_result(self, fingerprint, workflow_result):
+        """Gets the cached StepResult for the given fingerprint if it can be reused, restoring
+        any of the files its artifacts refer to that are missing.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Fingerprint of the inputs of the sub step to get the cached StepResult for.
+        workflow_result : WorkflowResult
+            Results of the previous steps to check the consumed result values against.
+
+        Returns
+        -------
+        StepResult or None
+            The cached StepResult for the given fingerprint
+            or None if there is none or it can not be reused.
+        """
+        try:
+            data = self.backend.get(StepResultCache.ENTRIES_NAMESPACE, fingerprint)
+            if data is None:
+                return None
+
+            entry = json.loads(zlib.decompress(data))
+            if not self.__is_entry_reusable(entry, fingerprint, workflow_result):
+                return None
+
+            return StepResult.from_dict(entry['step-result'])
+        except (OSError, ValueError, TypeError, KeyError, AttributeError, zlib.error):
+            return None
+
+    def add_step_result(self, fingerprint, step_result, consumed_result_values):
+        """Caches the given StepResult, and the files in the workspace its artifacts refer to,
+        for the given fingerprint, replacing any existing entry.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Fingerprint of the inputs of the sub step the StepResult is for.
+        step_result : StepResult
+            Successful StepResult to cache.
+        consumed_result_values : dict
+            (artifact name, step name, sub step name, environment) of every previous step result
+            artifact the sub step looked up to the value it got,
+            see StepImplementer.consumed_result_values.
+        """
+        try:
+            artifact_paths = []
+            artifact_files = []
+            for artifact_path in StepResultCache.__get_artifact_paths(step_result):
+                if self.__is_in_workspace(artifact_path):
+                    artifact_files.extend(self.__add_artifact_files(artifact_path))
+                else:
+                    artifact_paths.append(artifact_path)
+
+            entry = {
+                'format-version': StepResultCache.FORMAT_VERSION,
+                'fingerprint': fingerprint,
+                'consumed-result-values': [
+                    {
+                        'artifact': artifact,
+                        'step-name': step_name,
+                        'sub-step-name': sub_step_name,
+                        'environment': environment,
+                        'value-hash': StepResultCache.hash_value(value)
+                    }
+                    for (artifact, step_name, sub_step_name, environment), value
+                    in consumed_result_values.items()
+                ],
+                'artifact-paths': artifact_paths,
+                'artifact-files': artifact_files,
+                'step-result': step_result.as_dict()
+            }
+
+            self.backend.put(
+                StepResultCache.ENTRIES_NAMESPACE,
+                fingerprint,
+                zlib.compress(json.dumps(entry).encode('utf-8'))
+            )
+        except (OSError, ValueError, TypeError):
+            pass
+
+    @staticmethod
+    def hash_value(value):
+        """Hashes a value such that equal values, including dicts with keys in a different order,
+        have the same hash.
+
+        Parameters
+        ----------
+        value : str, int, bool, dict, list, or None
+            Value to hash.
+
+        Returns
+        -------
+        str
+            Hex encoded sha256 hash of the given value.
+        """
+        return hashlib.sha256(
+            json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+
+    def __is_entry_reusable(self, entry, fingerprint, workflow_result):
+        """Determines if the given cache entry can be reused, restoring any of the files its
+        StepResult artifacts refer to that are missing.
+
+        Parameters
+        ----------
+        entry : dict
+            Cache entry to check.
+        fingerprint : str
+            Fingerprint the cache entry was gotten for.
+        workflow_result : WorkflowResult
+            Results of the previous steps to check the consumed result values against.
+
+        Returns
+        -------
+        bool
+            True if the given cache entry can be reused.
+            False otherwise.
+        """
+        if entry['format-version'] != StepResultCache.FORMAT_VERSION or \
+                entry['fingerprint'] != fingerprint:
+            return False
+
+        for consumed_result_value in entry['consumed-result-values']:
+            value = workflow_result.get_artifact_value(
+                artifact=consumed_result_value['artifact'],
+                step_name=consumed_result_value['step-name'],
+                sub_step_name=consumed_result_value['sub-step-name'],
+                environment=consumed_result_value['environment']
+            )
+            if StepResultCache.hash_value(value) != consumed_result_value['value-hash']:
+                return False
+
+        if not all(os.path.exists(artifact_path) for artifact_path in entry['artifact-paths']):
+            return False
+
+        return all(
+            self.__restore_artifact_file(artifact_file)
+            for artifact_file in entry['artifact-files']
+        )
+
+    def __is_in_workspace(self, path):
+        """
+        Parameters
+        ----------
+        path : str
+            Absolute path to check.
+
+        Returns
+        -------
+        bool
+            True if the given path is in the workspace.
+            False otherwise.
+        """
+        real_path = os.path.realpath(path)
+        return real_path != self.workspace_path and \
+            os.path.commonpath([real_path, self.workspace_path]) == self.workspace_path
+
+    def __add_artifact_files(self, artifact_path):
+        """Stores the contents of the given file, or of every file in the given directory,
+        in the cache.
+
+        Parameters
+        ----------
+        artifact_path : str
+            File or directory to store.
+
+        Returns
+        -------
+        list of dict
+            Artifact file entry for the given file, or for the given directory and every
+            directory and file in it.
+        """
+        if not os.path.isdir(artifact_path):
+            return [self.__add_artifact_file(artifact_path)]
+
+        artifact_files = []
+        for dir_path, dir_names, file_names in os.walk(artifact_path):
+            dir_names.sort()
+            artifact_files.append({'path': dir_path, 'digest': None, 'executable': False})
+            for file_name in sorted(file_names):
+                artifact_files.append(
+                    self.__add_artifact_file(os.path.join(dir_path, file_name))
+                )
+
+        return artifact_files
+
+    def __add_artifact_file(self, artifact_file_path):
+        """Stores the contents of the given file in the cache, unless already stored.
+
+        Parameters
+        ----------
+        artifact_file_path : str
+            File to store.
+
+        Returns
+        -------
+        dict
+            Artifact file entry for the given file.
+        """
+        with open(artifact_file_path, 'rb') as artifact_file:
+            contents = artifact_file.read()
+
+        digest = hashlib.sha256(contents).hexdigest()
+        if not self.backend.contains(StepResultCache.BLOBS_NAMESPACE, digest):
+            self.backend.put(StepResultCache.BLOBS_NAMESPACE, digest, zlib.compress(contents))
+
+        return {
+            'path': artifact_file_path,
+            'digest': digest,
+            'executable': os.access(artifact_file_path, os.X_OK)
+        }
+
+    def __restore_artifact_file(self, artifact_file):
+        """Restores the given file, or directory, from the cache if it is missing or changed.
+
+        Parameters
+        ----------
+        artifact_file : dict
+            Artifact file entry of the file or directory to restore.
+
+        Returns
+        -------
+        bool
+            True if the file or directory exists, with the cached contents, or was restored.
+            False if it is not in the workspace or its contents are not in the cache.
+        """
+        path = artifact_file['path']
+        digest = artifact_file['digest']
+        if not os.path.isabs(path) or not self.__is_in_workspace(path):
+            return False
+
+        if digest is None:
+            os.makedirs(path, exist_ok=True)
+            return True
+
+        if os.path.isfile(path) and get_file_hash(path) == digest:
+            return True
+
+        data = self.backend.get(StepResultCache.BLOBS_NAMESPACE, digest)
+        contents = zlib.decompress(data) if data is not None else None
+        if contents is None or hashlib.sha256(contents).hexdigest() != digest:
+            return False
+
+        create_parent_dir(path)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as restored_file:
+            restored_file.write(contents)
+        if artifact_file['executable']:
+            os.chmod(tmp_path, os.stat(tmp_path).st_mode | 0o111)
+        os.replace(tmp_path, path)
+
+        return True
+
+    @staticmethod
+    def __get_artifact_paths(step_result):
+        """
+        Parameters
+        ----------
+        step_result : StepResult
+            StepResult to get the paths referred to by the artifacts of.
+
+        Returns
+        -------
+        list of str
+            Every absolute path to an existing file or directory in the artifact values,
+            including nested in dicts and lists, of the given StepResult.
+        """
+        artifact_paths = []
+        values = [artifact.value for artifact in step_result.artifacts.values()]
+        while values:
+            value = values.pop()
+            if isinstance(value, dict):
+                values.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                values.extend(value)
+            elif isinstance(value, str) and os.path.isabs(value) and os.path.exists(value):
+                artifact_paths.append(value)
+
+        return sorted(set(artifact_paths))
@@ -0,0 +1,115 @@
+"""Abstract class for step result cache backend implementers.
+"""
+
+import re
+from abc import ABC, abstractmethod
+
+
+class StepResultCacheBackend(ABC):
+    """Abstract class for step result cache backend implementers, which store the data of a
+    StepResultCache, such as its entries and the contents of artifact files, by namespace and key.
+
+    Notes
+    -----
+    Data is only ever stored under keys that are hex encoded sha256 hashes, either the
+    fingerprint of the inputs of a sub step or the hash of the contents of a file, so a backend
+    can use keys as file names or URL paths as is.
+
+    Backends must publish data atomically, so that concurrent readers, including other
+    processes or machines sharing the backend, only ever get all of the data or none of it.
+    """
+
+    __KEY_PATTERN = re.compile(r'[0-9a-f]{64}')
+    __NAMESPACE_PATTERN = re.compile(r'[a-z]+')
+
+    @abstractmethod
+    def get(self, namespace, key):
+        """Gets the data stored under the given key.
+
+        Parameters
+        ----------
+        namespace : str
+            Namespace of the key to get the data for.
+        key : str
+            Key to get the data for.
+
+        Returns
+        -------
+        bytes or None
+            Data stored under the given key or None if there is none.
+
+        Raises
+        ------
+        OSError
+            If the backend can not be read from.
+        """
+
+    @abstractmethod
+    def put(self, namespace, key, data):
+        """Atomically stores the given data under the given key, replacing any existing data.
+
+        Parameters
+        ----------
+        namespace : str
+            Namespace of the key to store the data under.
+        key : str
+            Key to store the data under.
+        data : bytes
+            Data to store.
+
+        Raises
+        ------
+        OSError
+            If the backend can not be written to.
+        """
+
+    def contains(self, namespace, key):
+        """Determines if there is data stored under the given key.
+
+        Notes
+        -----
+        Default implementation gets the data, backends that can check for data without getting
+        it should override this.
+
+        Parameters
+        ----------
+        namespace : str
+            Namespace of the key to check for.
+        key : str
+            Key to check for.
+
+        Returns
+        -------
+        bool
+            True if there is data stored under the given key.
+            False otherwise.
+
+        Raises
+        ------
+        OSError
+            If the backend can not be read from.
+        """
+        return self.get(namespace, key) is not None
+
+    @staticmethod
+    def validate_key(namespace, key):
+        """Validates that the given namespace and key are safe to use as path segments.
+
+        Parameters
+        ----------
+        namespace : str
+            Namespace to validate.
+        key : str
+            Key to validate.
+
+        Raises
+        ------
+        ValueError
+            If the namespace is not lower case letters or the key is not a hex encoded
+            sha256 hash.
+        """
+        if not isinstance(namespace, str) or \
+                not StepResultCacheBackend.__NAMESPACE_PATTERN.fullmatch(namespace):
+            raise ValueError(f"Invalid step result cache namespace ({namespace})")
+        if not isinstance(key, str) or not StepResultCacheBackend.__KEY_PATTERN.fullmatch(key):
+            raise ValueError(f"Invalid step result cache key ({key})")
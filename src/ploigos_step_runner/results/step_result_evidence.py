@@ -20,6 +20,43 @@ class StepResultEvidence:
         self.__value = value
         self.__description = description
 
+    @classmethod
+    def from_dict(cls, evidence_dict):
+        """Create a StepResultEvidence from its dictionary representation.
+
+        Parameters
+        ----------
+        evidence_dict : dict
+            Dictionary representation of a StepResultEvidence as returned by as_dict.
+
+        Returns
+        -------
+        StepResultEvidence
+            StepResultEvidence created from the given dictionary.
+
+        Raises
+        ------
+        ValueError
+            If the given dictionary is not a valid StepResultEvidence representation.
+        """
+        if not isinstance(evidence_dict, dict):
+            raise ValueError(
+                f'expected StepResultEvidence dictionary but got ({type(evidence_dict).__name__})'
+            )
+
+        for key in ['name', 'value', 'description']:
+            if key not in evidence_dict:
+                raise ValueError(f'StepResultEvidence dictionary missing key ({key})')
+
+        if not isinstance(evidence_dict['name'], str):
+            raise ValueError('StepResultEvidence dictionary key (name) must be a str')
+
+        return cls(
+            name=evidence_dict['name'],
+            value=evidence_dict['value'],
+            description=evidence_dict['description']
+        )
+
     @property
     def name(self):
         """Getter for name step result evidence name.
@@ -0,0 +1,431 @@
+"""Defines a StepResultStore object which reads and writes StepResults to and from a versioned,
+schema checked, binary file.
+
+File Format
+-----------
+All integers are big endian.
+
+    header      : magic (4 bytes, 'PSRR') + format version (unsigned short)
+    record *    : length (unsigned int) + UTF-8 encoded JSON of StepResult.as_dict
+    index       : UTF-8 encoded JSON list of index entries, one per record, each with the
+                  offset and length of the record and the step name, sub step name,
+                  environment, artifact names, and evidence names of the StepResult
+                  in the record
+    trailer     : index offset (unsigned long long) + index length (unsigned int)
+                  + magic (4 bytes, 'PSRX')
+
+The index and trailer are optional. Files written all at once by write_step_results have them,
+allowing individual StepResults to be read without reading every record. Files appended to one
+StepResult at a time by append_step_result, such as journals, do not.
+"""
+
+import json
+import os
+import struct
+
+from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.results.step_result import StepResult
+from ploigos_step_runner.utils.file import create_parent_dir
+
+
+class StepResultStore:
+    """Reads and writes StepResults to and from a versioned, schema checked, binary file.
+
+    Unlike pickle, reading a file only ever creates StepResult, StepResultArtifact,
+    and StepResultEvidence objects from plain JSON data, so reading a file from an untrusted
+    source can not execute arbitrary code.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file to read and write StepResults from and to.
+    """
+
+    FORMAT_VERSION = 1
+
+    __HEADER_MAGIC = b'PSRR'
+    __HEADER_STRUCT = struct.Struct('>4sH')
+    __RECORD_LENGTH_STRUCT = struct.Struct('>I')
+    __TRAILER_MAGIC = b'PSRX'
+    __TRAILER_STRUCT = struct.Struct('>QI4s')
+    __INDEX_ENTRY_KEYS = [
+        'offset',
+        'length',
+        'step-name',
+        'sub-step-name',
+        'environment',
+        'artifact-names',
+        'evidence-names'
+    ]
+
+    def __init__(self, file_path):
+        self.__file_path = file_path
+        self.__indexed_file_stat = None
+
+    @property
+    def file_path(self):
+        """
+        Returns
+        -------
+        str
+            Path to the file to read and write StepResults from and to.
+        """
+        return self.__file_path
+
+    def exists(self):
+        """Determine if this store's file exists and is not empty.
+
+        Returns
+        -------
+        bool
+            True if this store's file exists and is not empty.
+            False otherwise.
+        """
+        return os.path.isfile(self.file_path) and os.path.getsize(self.file_path) > 0
+
+    def write_step_results(self, step_results):
+        """Write all the given StepResults, along with an index, to this store's file replacing
+        any existing content.
+
+        Notes
+        -----
+        The StepResults are written to a temporary file which then replaces this store's file
+        so that the file is never left partially written.
+
+        Parameters
+        ----------
+        step_results : list of StepResult
+            StepResults to write.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be written, including if a StepResult contains values that
+            can not be encoded as JSON.
+        """
+        try:
+            create_parent_dir(self.file_path)
+            tmp_file_path = f'{self.file_path}.tmp'
+            with open(tmp_file_path, 'wb') as file:
+                file.write(StepResultStore.__encode_header())
+
+                index = []
+                for step_result in step_results:
+                    offset = file.tell()
+                    record = StepResultStore.__encode_record(step_result)
+                    file.write(record)
+                    index.append({
+                        'offset': offset,
+                        'length': len(record),
+                        'step-name': step_result.step_name,
+                        'sub-step-name': step_result.sub_step_name,
+                        'environment': step_result.environment,
+                        'artifact-names': list(step_result.artifacts),
+                        'evidence-names': list(step_result.evidence)
+                    })
+
+                index_offset = file.tell()
+                encoded_index = json.dumps(index).encode('utf-8')
+                file.write(encoded_index)
+                file.write(StepResultStore.__TRAILER_STRUCT.pack(
+                    index_offset,
+                    len(encoded_index),
+                    StepResultStore.__TRAILER_MAGIC
+                ))
+            os.replace(tmp_file_path, self.file_path)
+        except Exception as error:
+            raise RuntimeError(f'error writing {self.file_path}: {error}') from error
+
+    def append_step_result(self, step_result):
+        """Append a single StepResult record to this store's file, creating it if needed.
+
+        Notes
+        -----
+        Should only be used on files that are only ever appended to, such as journals,
+        never on files written by write_step_results.
+
+        Parameters
+        ----------
+        step_result : StepResult
+            StepResult to append.
+
+        Raises
+        ------
+        RuntimeError
+            If the StepResult can not be appended to the file.
+        """
+        try:
+            record = StepResultStore.__encode_record(step_result)
+
+            create_parent_dir(self.file_path)
+            with open(self.file_path, 'ab') as file:
+                if file.tell() == 0:
+                    file.write(StepResultStore.__encode_header())
+                file.write(record)
+        except Exception as error:
+            raise RuntimeError(f'error appending to {self.file_path}: {error}') from error
+
+    def read_step_results(self):
+        """Read all of the StepResults from this store's file.
+
+        Notes
+        -----
+        A partially written trailing record, which can happen if a process appending to the
+        file was killed, is ignored.
+
+        Returns
+        -------
+        list of StepResult
+            All of the StepResults in this store's file in the order they were written.
+            Empty list if the file does not exist or is empty.
+
+        Raises
+        ------
+        StepRunnerException
+            If the file is not a valid StepResultStore file or contains invalid records.
+        """
+        if not self.exists():
+            return []
+
+        with open(self.file_path, 'rb') as file:
+            data = file.read()
+
+        records_end = len(data)
+        trailer = self.__decode_trailer(data)
+        if trailer is not None:
+            records_end = trailer[0]
+
+        step_results = []
+        offset = self.__decode_header(data)
+        record_length_size = StepResultStore.__RECORD_LENGTH_STRUCT.size
+        while offset + record_length_size <= records_end:
+            (record_length,) = StepResultStore.__RECORD_LENGTH_STRUCT.unpack_from(data, offset)
+            record_start = offset + record_length_size
+            record_end = record_start + record_length
+            if record_end > records_end:
+                break
+
+            step_results.append(self.__decode_record(data[record_start:record_end]))
+            offset = record_end
+
+        return step_results
+
+    def read_index(self):
+        """Read the index of this store's file without reading any of the StepResults.
+
+        Returns
+        -------
+        list of dict
+            Index entry for each StepResult in the file in the order they were written.
+            Each entry has the 'step-name', 'sub-step-name', 'environment', 'artifact-names',
+            and 'evidence-names' of its StepResult, and can be passed to read_step_result
+            to read that StepResult.
+            None if the file does not exist or has no index.
+
+        Raises
+        ------
+        StepRunnerException
+            If the file is not a valid StepResultStore file or has an invalid index.
+        """
+        if not self.exists():
+            return None
+
+        with open(self.file_path, 'rb') as file:
+            file_stat = os.fstat(file.fileno())
+            header = file.read(StepResultStore.__HEADER_STRUCT.size)
+            self.__decode_header(header)
+
+            file.seek(0, os.SEEK_END)
+            file_size = file.tell()
+            if file_size < StepResultStore.__HEADER_STRUCT.size + \
+                    StepResultStore.__TRAILER_STRUCT.size:
+                return None
+
+            file.seek(file_size - StepResultStore.__TRAILER_STRUCT.size)
+            trailer = self.__decode_trailer(file.read())
+            if trailer is None:
+                return None
+
+            index_offset, index_length = trailer
+            file.seek(index_offset)
+            encoded_index = file.read(index_length)
+
+        try:
+            index = json.loads(encoded_index.decode('utf-8'))
+            for entry in index:
+                for key in StepResultStore.__INDEX_ENTRY_KEYS:
+                    if key not in entry:
+                        raise ValueError(f'index entry missing key ({key})')
+        except (ValueError, TypeError) as error:
+            raise StepRunnerException(
+                f'error {self.file_path} has invalid index: {error}'
+            ) from error
+
+        self.__indexed_file_stat = StepResultStore.__get_file_identity(file_stat)
+        return index
+
+    def read_step_result(self, index_entry):
+        """Read a single StepResult from this store's file without reading any other StepResults.
+
+        Parameters
+        ----------
+        index_entry : dict
+            Index entry, as returned by read_index, of the StepResult to read.
+
+        Returns
+        -------
+        StepResult
+            The StepResult for the given index entry.
+
+        Raises
+        ------
+        StepRunnerException
+            If the file has been replaced or changed since its index was read by read_index
+            or the record is not a valid StepResult.
+        """
+        try:
+            with open(self.file_path, 'rb') as file:
+                file_stat = os.fstat(file.fileno())
+                if self.__indexed_file_stat is None or \
+                        StepResultStore.__get_file_identity(file_stat) != self.__indexed_file_stat:
+                    raise StepRunnerException(
+                        f'error {self.file_path} has changed since its index was read'
+                    )
+
+                file.seek(index_entry['offset'])
+                record = file.read(index_entry['length'])
+        except OSError as error:
+            raise StepRunnerException(f'error reading {self.file_path}: {error}') from error
+
+        return self.__decode_record(record[StepResultStore.__RECORD_LENGTH_STRUCT.size:])
+
+    @staticmethod
+    def __get_file_identity(file_stat):
+        """
+        Parameters
+        ----------
+        file_stat : os.stat_result
+            Status of an open file.
+
+        Returns
+        -------
+        tuple
+            Values which change if the file is replaced or written to.
+        """
+        return (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+    @staticmethod
+    def __encode_header():
+        """
+        Returns
+        -------
+        bytes
+            Encoded file header.
+        """
+        return StepResultStore.__HEADER_STRUCT.pack(
+            StepResultStore.__HEADER_MAGIC,
+            StepResultStore.FORMAT_VERSION
+        )
+
+    def __decode_header(self, data):
+        """Validate the file header at the start of the given data.
+
+        Parameters
+        ----------
+        data : bytes
+            Data starting with a file header.
+
+        Returns
+        -------
+        int
+            Offset of the first byte after the header.
+
+        Raises
+        ------
+        StepRunnerException
+            If the header is not a valid StepResultStore header for a supported version.
+        """
+        if len(data) < StepResultStore.__HEADER_STRUCT.size:
+            raise StepRunnerException(f'error {self.file_path} has invalid data')
+
+        magic, version = StepResultStore.__HEADER_STRUCT.unpack_from(data, 0)
+        if magic != StepResultStore.__HEADER_MAGIC:
+            raise StepRunnerException(f'error {self.file_path} has invalid data')
+        if version != StepResultStore.FORMAT_VERSION:
+            raise StepRunnerException(
+                f'error {self.file_path} has unsupported format version ({version}),'
+                f' expected ({StepResultStore.FORMAT_VERSION})'
+            )
+
+        return StepResultStore.__HEADER_STRUCT.size
+
+    @staticmethod
+    def __decode_trailer(data):
+        """Decode the trailer at the end of the given data if there is one.
+
+        Parameters
+        ----------
+        data : bytes
+            Data possibly ending with a trailer.
+
+        Returns
+        -------
+        tuple or None
+            Tuple of (index offset, index length) or None if the given data has no trailer.
+        """
+        if len(data) < StepResultStore.__TRAILER_STRUCT.size:
+            return None
+
+        index_offset, index_length, magic = StepResultStore.__TRAILER_STRUCT.unpack_from(
+            data,
+            len(data) - StepResultStore.__TRAILER_STRUCT.size
+        )
+        if magic != StepResultStore.__TRAILER_MAGIC:
+            return None
+
+        return index_offset, index_length
+
+    @staticmethod
+    def __encode_record(step_result):
+        """
+        Parameters
+        ----------
+        step_result : StepResult
+            StepResult to encode.
+
+        Returns
+        -------
+        bytes
+            Length prefixed encoded record for the given StepResult.
+
+        Raises
+        ------
+        TypeError
+            If the StepResult contains values that can not be encoded as JSON.
+        """
+        encoded = json.dumps(step_result.as_dict()).encode('utf-8')
+        return StepResultStore.__RECORD_LENGTH_STRUCT.pack(len(encoded)) + encoded
+
+    def __decode_record(self, encoded):
+        """
+        Parameters
+        ----------
+        encoded : bytes
+            Encoded record, without the length prefix.
+
+        Returns
+        -------
+        StepResult
+            Decoded StepResult.
+
+        Raises
+        ------
+        StepRunnerException
+            If the record is not a valid StepResult.
+        """
+        try:
+            return StepResult.from_dict(json.loads(encoded.decode('utf-8')))
+        except (ValueError, TypeError, StepRunnerException) as error:
+            raise StepRunnerException(
+                f'error {self.file_path} has invalid step result record: {error}'
+            ) from error
@@ -3,27 +3,132 @@
 import json
 import os
 import pickle
+import threading
 
 import yaml
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.results import StepResult
+from ploigos_step_runner.results.step_result_store import StepResultStore
 from ploigos_step_runner.utils.dict import deep_merge
-from ploigos_step_runner.utils.file import create_parent_dir
+from ploigos_step_runner.utils.file import YamlDumper, create_parent_dir
 
 
-class WorkflowResult:
+class WorkflowResult: # pylint: disable=too-many-instance-attributes
     """
     Class to manage a list of StepResults.
     The WorkflowResult represents ALL previous results.
+
+    Notes
+    -----
+    StepResults are indexed when they are added via add_step_result, therefor StepResults
+    should not have artifacts or evidence added to them after being added, and StepResults
+    should never be appended directly to workflow_list.
+
+    StepResults loaded by load_from_file from a file with an index are only read from the
+    file the first time they are needed, either because they match a get_step_result,
+    get_artifact_value, or get_evidence_value search, or because workflow_list is accessed.
+
+    Parameters
+    ----------
+    step_result_store : StepResultStore, optional
+        Store to load StepResults from. If the store's file has an index only the index is
+        read, and each StepResult is read from the file the first time it is needed.
+
+    Attributes
+    ----------
+    __workflow_list : list of StepResult
+        All StepResults in the order they were added.
+        None for StepResults not yet read from __step_result_store.
+    __step_result_keys : list of tuple
+        Tuple of (step name, sub step name, environment) for each StepResult in
+        __workflow_list.
+    __unread_index_entries : dict
+        Key is position in __workflow_list, value is the __step_result_store index entry
+        of the StepResult not yet read for that position.
+    __step_result_store : StepResultStore
+        Store to read the StepResults in __unread_index_entries from.
+    __step_result_store_lock : threading.Lock
+        Lock held while reading StepResults from __step_result_store.
+    __step_result_positions_by_key : dict
+        Key is tuple of (step name, sub step name, environment), value is position
+        in __workflow_list.
+    __step_result_positions_by_step_name : dict
+        Key is step name, value is list of positions in __workflow_list of StepResults for
+        that step in the order they were added.
+    __step_result_positions_by_artifact_name : dict
+        Key is artifact name, value is list of positions in __workflow_list of StepResults
+        with that artifact in the order they were added.
+    __step_result_positions_by_evidence_name : dict
+        Key is evidence name, value is list of positions in __workflow_list of StepResults
+        with that evidence in the order they were added.
     """
 
-    def __init__(self):
+    def __init__(self, step_result_store=None):
         self.__workflow_list = []
+        self.__step_result_store = step_result_store
+        self.__step_result_store_lock = threading.Lock()
+        self.__build_indexes()
+
+        if step_result_store is not None:
+            index = step_result_store.read_index()
+            if index is None:
+                for step_result in step_result_store.read_step_results():
+                    self.add_step_result(step_result)
+            else:
+                for index_entry in index:
+                    self.__add_step_result(
+                        step_result=None,
+                        step_result_key=(
+                            index_entry['step-name'],
+                            index_entry['sub-step-name'],
+                            index_entry['environment']
+                        ),
+                        artifact_names=index_entry['artifact-names'],
+                        evidence_names=index_entry['evidence-names'],
+                        index_entry=index_entry
+                    )
+
+    def __getstate__(self):
+        """Get the state to pickle, which excludes the indexes since they can be rebuilt.
+
+        Notes
+        -----
+        Any StepResults not yet read from the file this WorkflowResult was loaded from
+        are read so that they are pickled.
+
+        Returns
+        -------
+        dict
+            State to pickle.
+        """
+        return {
+            '_WorkflowResult__workflow_list': self.workflow_list
+        }
+
+    def __setstate__(self, state):
+        """Restore pickled state and rebuild the indexes.
+
+        Parameters
+        ----------
+        state : dict
+            Pickled state.
+        """
+        self.__workflow_list = state['_WorkflowResult__workflow_list']
+        self.__step_result_store = None
+        self.__step_result_store_lock = threading.Lock()
+        self.__build_indexes()
 
     @property
     def workflow_list(self):
         """Return workflow_list
+
+        Notes
+        -----
+        Reads any StepResults not yet read from the file this WorkflowResult was loaded from.
         """
+        for position in list(self.__unread_index_entries):
+            self.__get_step_result(position)
+
         return self.__workflow_list
 
     def get_artifact_value(
@@ -60,13 +165,14 @@ class WorkflowResult:
         """
 
         value = None
-        for step_result in self.workflow_list:
-            if ( \
-                (not step_name or step_result.step_name == step_name) and \
-                (not sub_step_name or step_result.sub_step_name == sub_step_name) and \
-                (not environment or step_result.environment == environment)
+        for position in self.__step_result_positions_by_artifact_name.get(artifact, []):
+            if WorkflowResult.__step_result_key_matches(
+                self.__step_result_keys[position],
+                step_name,
+                sub_step_name,
+                environment
             ):
-                value = step_result.get_artifact_value(name=artifact)
+                value = self.__get_step_result(position).get_artifact_value(name=artifact)
                 if value is not None:
                     break
 
@@ -106,13 +212,14 @@ class WorkflowResult:
         """
 
         value = None
-        for step_result in self.workflow_list:
-            if ( \
-                (not step_name or step_result.step_name == step_name) and \
-                (not sub_step_name or step_result.sub_step_name == sub_step_name) and \
-                (not environment or step_result.environment == environment)
+        for position in self.__step_result_positions_by_evidence_name.get(evidence, []):
+            if WorkflowResult.__step_result_key_matches(
+                self.__step_result_keys[position],
+                step_name,
+                sub_step_name,
+                environment
             ):
-                value = step_result.get_evidence_value(name=evidence)
+                value = self.__get_step_result(position).get_evidence_value(name=evidence)
                 if value is not None:
                     break
 
@@ -142,19 +249,16 @@ class WorkflowResult:
         """
 
         if isinstance(step_result, StepResult):
-            existing_step_result = self.get_step_result(
-                step_name=step_result.step_name,
-                sub_step_name=step_result.sub_step_name,
-                environment=step_result.environment
+            self.__add_step_result(
+                step_result=step_result,
+                step_result_key=(
+                    step_result.step_name,
+                    step_result.sub_step_name,
+                    step_result.environment
+                ),
+                artifact_names=step_result.artifacts,
+                evidence_names=step_result.evidence
             )
-            if existing_step_result:
-                raise StepRunnerException(
-                    f'Can not add duplicate StepResult for step ({step_result.step_name}),'
-                    f' sub step ({step_result.sub_step_name}),'
-                    f' and environment ({step_result.environment}).'
-                )
-
-            self.workflow_list.append(step_result)
 
         else:
             raise StepRunnerException('expect StepResult instance type')
@@ -176,7 +280,7 @@ class WorkflowResult:
             create_parent_dir(yml_filename)
             with open(yml_filename, 'w') as file:
                 results = self.__get_all_step_results_dict()
-                yaml.dump(results, file, indent=4)
+                yaml.dump(results, file, Dumper=YamlDumper, indent=4)
         except Exception as error:
             raise RuntimeError(f'error dumping {yml_filename}: {error}') from error
 
@@ -203,45 +307,118 @@ class WorkflowResult:
     # File handlers
 
     @staticmethod
-    def load_from_pickle_file(pickle_filename):
+    def load_from_file(filename, journal_filename=None):
+        """Load a WorkflowResult from a StepResultStore file.
+
+        If the file has an index only the index is read, and each StepResult is read from
+        the file the first time it is needed.
+
+        Parameters
+        ----------
+        filename: str
+           Name of the file to load (eg: step-runner-results.psr)
+        journal_filename: str, optional
+           Name of the journal file, if any, whose StepResult records to add to the
+           loaded WorkflowResult.
+
+        Raises
+        ------
+        Raises a StepRunnerException if the file cannot be loaded
+        Raises a StepRunnerException if the file contains invalid StepResult records
+
+        See Also
+        --------
+        write_to_file
+        write_step_result_to_journal_file
+        """
+        try:
+            create_parent_dir(filename)
+
+            # if the file does not exist or is empty start with an empty object
+            workflow_result = WorkflowResult(StepResultStore(filename))
+        except Exception as error:
+            raise StepRunnerException(f'error loading {filename}: {error}') from error
+
+        if journal_filename is not None:
+            workflow_result.add_step_results_from_journal_file(journal_filename)
+
+        return workflow_result
+
+    def write_to_file(self, filename):
+        """Write the workflow list to a StepResultStore file.
+
+        Parameters
+        ----------
+        filename : str
+             Name of file to write (eg: step-runner-results.psr)
+
+        Raises
+        ------
+        Raises a RuntimeError if the file cannot be written
+
+        See Also
+        --------
+        load_from_file
+        """
+        StepResultStore(filename).write_step_results(self.workflow_list)
+
+    @staticmethod
+    def load_from_pickle_file(pickle_filename, journal_filename=None):
         """Return the contents of a pickled file.
 
         The file is expected to contain WorkflowResult instances
 
+        Notes
+        -----
+        Only kept to migrate existing pickle files to StepResultStore files,
+        never load pickle files from untrusted sources.
+
         Parameters
         ----------
         pickle_filename: str
            Name of the file to load
+        journal_filename: str, optional
+           Name of the journal file, if any, whose StepResult records to add to the
+           loaded WorkflowResult.
 
         Raises
         ------
         Raises a StepRunnerException if the file cannot be loaded
         Raises a StepRunnerException if the file contains non WorkflowResult instances
+
+        See Also
+        --------
+        load_from_file
         """
         try:
             create_parent_dir(pickle_filename)
 
-            # if the file does not exist return empty object
-            if not os.path.isfile(pickle_filename):
-                return WorkflowResult()
-
-            # if the file is empty return empty object
-            if os.path.getsize(pickle_filename) == 0:
-                return WorkflowResult()
-
-            # check that the file has Workflow object
-            with open(pickle_filename, 'rb') as file:
-                workflow_result = pickle.load(file)
-                if not isinstance(workflow_result, WorkflowResult):
-                    raise StepRunnerException(f'error {pickle_filename} has invalid data')
-                return workflow_result
+            # if the file does not exist or is empty start with an empty object
+            # else check that the file has Workflow object
+            if not os.path.isfile(pickle_filename) or os.path.getsize(pickle_filename) == 0:
+                workflow_result = WorkflowResult()
+            else:
+                with open(pickle_filename, 'rb') as file:
+                    workflow_result = pickle.load(file)
+                    if not isinstance(workflow_result, WorkflowResult):
+                        raise StepRunnerException(f'error {pickle_filename} has invalid data')
 
         except Exception as error:
             raise StepRunnerException(f'error loading {pickle_filename}: {error}') from error
 
+        if journal_filename is not None:
+            workflow_result.add_step_results_from_journal_file(journal_filename)
+
+        return workflow_result
+
     def write_to_pickle_file(self, pickle_filename):
         """Write the workflow list in a pickle format to file
 
+        Notes
+        -----
+        The pickle is written to a temporary file which then replaces the given file so that
+        the given file is never left partially written.
+
         Parameters
         ----------
         pickle_filename : str
@@ -250,14 +427,98 @@ class WorkflowResult:
         Raises
         ------
         Raises a RuntimeError if the file cannot be dumped
+
+        See Also
+        --------
+        write_to_file
         """
         try:
             create_parent_dir(pickle_filename)
-            with open(pickle_filename, 'wb') as file:
+            tmp_pickle_filename = f'{pickle_filename}.tmp'
+            with open(tmp_pickle_filename, 'wb') as file:
                 pickle.dump(self, file)
+            os.replace(tmp_pickle_filename, pickle_filename)
         except Exception as error:
             raise RuntimeError(f'error dumping {pickle_filename}: {error}') from error
 
+    @staticmethod
+    def write_step_result_to_journal_file(step_result, journal_filename):
+        """Append a single StepResult record to a journal file.
+
+        Rather then rewriting the entire WorkflowResult every time a StepResult is added,
+        each StepResult can be appended to a journal file, and then the journal compacted
+        into the results file once at the end.
+
+        Parameters
+        ----------
+        step_result : StepResult
+            StepResult to append to the journal file.
+        journal_filename : str
+            Name of the journal file to append to (eg: step-runner-results.journal)
+
+        Raises
+        ------
+        Raises a RuntimeError if the StepResult cannot be appended to the journal file
+
+        See Also
+        --------
+        load_from_file
+        compact_journal_file
+        """
+        StepResultStore(journal_filename).append_step_result(step_result)
+
+    def compact_journal_file(self, filename, journal_filename):
+        """Write this WorkflowResult, which is expected to include all of the StepResults in
+        the given journal file, to the given file and then remove the journal file.
+
+        Parameters
+        ----------
+        filename : str
+             Name of file to write (eg: step-runner-results.psr)
+        journal_filename : str
+            Name of the journal file to remove (eg: step-runner-results.journal)
+
+        Raises
+        ------
+        Raises a RuntimeError if the file cannot be written or the journal removed
+        """
+        self.write_to_file(filename)
+
+        try:
+            if os.path.exists(journal_filename):
+                os.remove(journal_filename)
+        except Exception as error:
+            raise RuntimeError(f'error removing {journal_filename}: {error}') from error
+
+    def add_step_results_from_journal_file(self, journal_filename):
+        """Add all of the StepResult records from a journal file to this WorkflowResult.
+
+        Notes
+        -----
+        StepResults already in this WorkflowResult are skipped, which can happen if
+        compaction wrote the results file but did not remove the journal file.
+
+        A partially written trailing record, which can happen if the writing process was
+        killed, is ignored.
+
+        Parameters
+        ----------
+        journal_filename : str
+            Name of the journal file to replay.
+
+        Raises
+        ------
+        Raises a StepRunnerException if the journal contains a record that is not a StepResult
+        """
+        for step_result in StepResultStore(journal_filename).read_step_results():
+            step_result_key = (
+                step_result.step_name,
+                step_result.sub_step_name,
+                step_result.environment
+            )
+            if step_result_key not in self.__step_result_positions_by_key:
+                self.add_step_result(step_result)
+
     def __get_all_step_results_dict(self):
         """Get a dictionary of all of the recorded StepResults.
 
@@ -300,12 +561,202 @@ class WorkflowResult:
         StepResult
         """
 
-        for step_result in self.workflow_list:
-            if ( \
-                (not step_name or step_result.step_name == step_name) and \
-                (not sub_step_name or step_result.sub_step_name == sub_step_name) and \
-                (not environment or step_result.environment == environment)
+        position = self.__find_step_result_position(step_name, sub_step_name, environment)
+        if position is None:
+            return None
+
+        return self.__get_step_result(position)
+
+    def __find_step_result_position(
+        self,
+        step_name,
+        sub_step_name=None,
+        environment=None
+    ): # pylint: disable=too-many-boolean-expressions
+        """Find the position in the workflow list of the first StepResult matching the given
+        search criteria without reading any StepResults.
+
+        Parameters
+        ----------
+        step_name: str
+            Name of step to search for
+        sub_step_name: str
+            Name of sub step to search for
+        environment : str
+            Optional. Environment to get the step result for.
+
+        Returns
+        -------
+        int or None
+            Position of the first matching StepResult, or None if there is no match.
+        """
+        if step_name and sub_step_name and environment:
+            return self.__step_result_positions_by_key.get((step_name, sub_step_name, environment))
+
+        if step_name:
+            positions = self.__step_result_positions_by_step_name.get(step_name, [])
+        else:
+            positions = range(len(self.__step_result_keys))
+
+        for position in positions:
+            if WorkflowResult.__step_result_key_matches(
+                self.__step_result_keys[position],
+                step_name,
+                sub_step_name,
+                environment
             ):
-                return step_result
+                return position
 
         return None
+
+    def __get_step_result(self, position):
+        """Get the StepResult at the given position in the workflow list, reading it from the
+        file this WorkflowResult was loaded from if it has not been read yet.
+
+        Parameters
+        ----------
+        position : int
+            Position in the workflow list of the StepResult to get.
+
+        Returns
+        -------
+        StepResult
+
+        Raises
+        ------
+        Raises a StepRunnerException if the StepResult can not be read
+        """
+        step_result = self.__workflow_list[position]
+        if step_result is None:
+            with self.__step_result_store_lock:
+                step_result = self.__workflow_list[position]
+                if step_result is None:
+                    step_result = self.__step_result_store.read_step_result(
+                        self.__unread_index_entries[position]
+                    )
+                    self.__workflow_list[position] = step_result
+                    del self.__unread_index_entries[position]
+
+        return step_result
+
+    @staticmethod
+    def __step_result_key_matches(
+        step_result_key,
+        step_name=None,
+        sub_step_name=None,
+        environment=None
+    ): # pylint: disable=too-many-boolean-expressions
+        """Determines if a given StepResult key matches the given search criteria.
+
+        Parameters
+        ----------
+        step_result_key : tuple
+            Tuple of (step name, sub step name, environment) of the StepResult to check.
+        step_name: str optional
+            If given the StepResult must be for this step.
+        sub_step_name: str optional
+            If given the StepResult must be for this sub step.
+        environment : str
+            If given the StepResult must be for this environment.
+
+        Returns
+        -------
+        bool
+            True if the given StepResult key matches all of the given criteria.
+            False otherwise.
+        """
+        key_step_name, key_sub_step_name, key_environment = step_result_key
+        return (
+            (not step_name or key_step_name == step_name) and \
+            (not sub_step_name or key_sub_step_name == sub_step_name) and \
+            (not environment or key_environment == environment)
+        )
+
+    def __add_step_result(
+        self,
+        step_result,
+        step_result_key,
+        artifact_names,
+        evidence_names,
+        index_entry=None
+    ):
+        """Add a StepResult, or the index entry of a StepResult not yet read, to the workflow
+        list and all of the StepResult indexes.
+
+        Parameters
+        ----------
+        step_result : StepResult or None
+            StepResult to add, or None if the StepResult has not been read yet.
+        step_result_key : tuple
+            Tuple of (step name, sub step name, environment) of the StepResult.
+        artifact_names : iterable of str
+            Names of the artifacts of the StepResult.
+        evidence_names : iterable of str
+            Names of the evidence of the StepResult.
+        index_entry : dict, optional
+            Index entry to read the StepResult from if step_result is None.
+
+        Raises
+        ------
+        Raises a StepRunnerException if there is already a matching StepResult
+        """
+        step_name, sub_step_name, environment = step_result_key
+        if self.__find_step_result_position(step_name, sub_step_name, environment) is not None:
+            raise StepRunnerException(
+                f'Can not add duplicate StepResult for step ({step_name}),'
+                f' sub step ({sub_step_name}),'
+                f' and environment ({environment}).'
+            )
+
+        position = len(self.__workflow_list)
+        self.__workflow_list.append(step_result)
+        if step_result is None:
+            self.__unread_index_entries[position] = index_entry
+        self.__index_step_result(position, step_result_key, artifact_names, evidence_names)
+
+    def __build_indexes(self):
+        """(Re)builds all of the StepResult indexes from the workflow list.
+        """
+        self.__step_result_keys = []
+        self.__unread_index_entries = {}
+        self.__step_result_positions_by_key = {}
+        self.__step_result_positions_by_step_name = {}
+        self.__step_result_positions_by_artifact_name = {}
+        self.__step_result_positions_by_evidence_name = {}
+
+        for position, step_result in enumerate(self.__workflow_list):
+            self.__index_step_result(
+                position,
+                (step_result.step_name, step_result.sub_step_name, step_result.environment),
+                step_result.artifacts,
+                step_result.evidence
+            )
+
+    def __index_step_result(self, position, step_result_key, artifact_names, evidence_names):
+        """Adds the StepResult at the given position in the workflow list to all of the
+        StepResult indexes.
+
+        Parameters
+        ----------
+        position : int
+            Position in the workflow list of the StepResult to index.
+        step_result_key : tuple
+            Tuple of (step name, sub step name, environment) of the StepResult.
+        artifact_names : iterable of str
+            Names of the artifacts of the StepResult.
+        evidence_names : iterable of str
+            Names of the evidence of the StepResult.
+        """
+        self.__step_result_keys.append(step_result_key)
+        self.__step_result_positions_by_key.setdefault(step_result_key, position)
+        self.__step_result_positions_by_step_name.setdefault(step_result_key[0], []).append(
+            position
+        )
+        for artifact_name in artifact_names:
+            self.__step_result_positions_by_artifact_name.setdefault(artifact_name, []).append(
+                position
+            )
+        for evidence_name in evidence_names:
+            self.__step_result_positions_by_evidence_name.setdefault(evidence_name, []).append(
+                position
+            )
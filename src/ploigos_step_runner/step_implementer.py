@@ -1,17 +1,22 @@
 """Abstract class and helper constants for StepImplementer.
 """
+import hashlib
 import json
 import os
 import pprint
 import sys
 import textwrap
 from abc import ABC, abstractmethod
-from contextlib import redirect_stderr, redirect_stdout
+from collections.abc import Mapping
 from pathlib import Path
 
 from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner import StepResult
-from ploigos_step_runner.utils.io import TextIOIndenter
+from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.utils.file import get_file_hash, get_file_tree_hash
+from ploigos_step_runner.utils.io import (TextIOIndenter, TextIOSelectiveObfuscator,
+                                          TextIOTee, get_current_stream,
+                                          redirect_sys_output)
 
 
 class DefaultSteps:  # pylint: disable=too-few-public-methods
@@ -57,11 +62,22 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
     Attributes
     __config : SubStepConfig
     __environment : str
+    __step_implementer_config_defaults : dict
+        Cached result of step_implementer_config_defaults so the same defaults object is
+        used for every configuration lookup.
+    __consumed_result_values : dict
+        Every previous step result artifact looked up by this step to the value it got.
     """
 
     __TITLE_LENGTH = 80
     __INDENT_SIZE   = 4
 
+    STEP_RESULT_FINGERPRINT_IGNORED_NAMES = ['.git']
+    """Names of files and directories under the step result fingerprint input paths,
+    see _get_step_result_fingerprint_input_paths, to not include in the fingerprint."""
+
+    __implementer_versions = {}
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         workflow_result,
@@ -76,6 +92,10 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
 
         self.__workflow_result = workflow_result
 
+        self.__step_implementer_config_defaults = None
+
+        self.__consumed_result_values = {}
+
         super().__init__()
 
     @property
@@ -248,6 +268,40 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
             that are required before running the step.
         """
 
+    @staticmethod
+    def is_step_result_cacheable():
+        """Getter for whether the StepResult of this step can be reused, rather than running
+        this step again, when it is run again with the same inputs, see
+        get_step_result_fingerprint.
+
+        Notes
+        -----
+        Only steps whose results depend on nothing but their inputs, and which have no side
+        effects that later steps depend on, such as deploying or pushing, should be cacheable.
+
+        Returns
+        -------
+        bool
+            True if the StepResult of this step can be reused.
+            False otherwise.
+        """
+        return False
+
+    def _get_step_result_fingerprint_input_paths(self):
+        """Getter for the files and directories this step reads, such as the project to build,
+        whose contents are included in the step result fingerprint.
+
+        See Also
+        --------
+        get_step_result_fingerprint
+
+        Returns
+        -------
+        list of str
+            Files and directories this step reads.
+        """
+        return []
+
     @abstractmethod
     def _run_step(self):
         """Runs the step implemented by this StepImplementer.
@@ -278,9 +332,16 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
             'Missing required step configuration or previous step result artifact keys: ' + \
             f'{invalid_required_keys}'
 
-    def run_step(self):
+    def run_step(self, step_result_cache=None):
         """Wrapper for running the implemented step.
 
+        Parameters
+        ----------
+        step_result_cache : StepResultCache, optional
+            Cache to reuse a previous StepResult of this step from, if this step is cacheable
+            and was previously run successfully with the same inputs, and to add a successful
+            StepResult of this step to.
+
         Returns
         -------
         StepResult
@@ -297,34 +358,40 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         )
         StepImplementer.__print_data(
             "Step Implementer Configuration Defaults",
-            ConfigValue.convert_leaves_to_values(self.step_implementer_config_defaults())
+            ConfigValue.convert_leaves_to_values(
+                self.step_implementer_config_defaults(),
+                lazy=True
+            )
         )
         StepImplementer.__print_data(
             "Global Configuration Defaults",
-            ConfigValue.convert_leaves_to_values(self.global_config_defaults)
+            ConfigValue.convert_leaves_to_values(self.global_config_defaults, lazy=True)
         )
         StepImplementer.__print_data(
             "Global Environment Configuration Defaults",
-            ConfigValue.convert_leaves_to_values(self.global_environment_config_defaults)
+            ConfigValue.convert_leaves_to_values(
+                self.global_environment_config_defaults,
+                lazy=True
+            )
         )
         StepImplementer.__print_data(
             "Step Configuration",
-            ConfigValue.convert_leaves_to_values(self.step_config)
+            ConfigValue.convert_leaves_to_values(self.step_config, lazy=True)
         )
         StepImplementer.__print_data(
             "Step Environment Configuration",
-            ConfigValue.convert_leaves_to_values(self.step_environment_config)
+            ConfigValue.convert_leaves_to_values(self.step_environment_config, lazy=True)
         )
         StepImplementer.__print_data(
             "Step Configuration Runtime Overrides",
-            ConfigValue.convert_leaves_to_values(self.step_config_overrides)
+            ConfigValue.convert_leaves_to_values(self.step_config_overrides, lazy=True)
         )
 
         # create the munged runtime step configuration and print
-        copy_of_runtime_step_config = self.get_copy_of_runtime_step_config()
+        runtime_step_config = self.get_runtime_step_config()
         StepImplementer.__print_data(
             "Runtime Step Configuration",
-            ConfigValue.convert_leaves_to_values(copy_of_runtime_step_config)
+            ConfigValue.convert_leaves_to_values(runtime_step_config, lazy=True)
         )
 
         step_result = None
@@ -339,17 +406,7 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
                 indent=1
             )
 
-            indented_stdout = TextIOIndenter(
-                parent_stream=sys.stdout,
-                indent_level=2
-            )
-            indented_stderr = TextIOIndenter(
-                parent_stream=sys.stderr,
-                indent_level=2
-            )
-
-            with redirect_stdout(indented_stdout), redirect_stderr(indented_stderr):
-                step_result = self._run_step()
+            step_result = self.__run_step_or_reuse_cached_step_result(step_result_cache)
         except AssertionError as invalid_error:
             step_result = StepResult.from_step_implementer(self)
             step_result.success = False
@@ -374,6 +431,209 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
 
         return step_result
 
+    def __run_step_or_reuse_cached_step_result(self, step_result_cache):
+        """Reuses the cached StepResult of this step for its current inputs, if there is one,
+        otherwise runs the step and caches its StepResult if successful.
+
+        Parameters
+        ----------
+        step_result_cache : StepResultCache or None
+            Cache to reuse a previous StepResult of this step from and add its StepResult to.
+
+        Returns
+        -------
+        StepResult
+            Results of running this step.
+        """
+        if step_result_cache is None or not self.is_step_result_cacheable():
+            return self.__run_step_with_routed_output()
+
+        try:
+            fingerprint = self.get_step_result_fingerprint()
+        except OSError as error:
+            print(f"Not using step result cache, could not fingerprint step inputs: {error}")
+            return self.__run_step_with_routed_output()
+
+        step_result = step_result_cache.get_step_result(fingerprint, self.workflow_result)
+        if step_result is not None:
+            print(f"Reusing cached step result for unchanged step inputs ({fingerprint})")
+            return step_result
+
+        step_result = self.__run_step_with_routed_output()
+        if step_result.success:
+            step_result_cache.add_step_result(
+                fingerprint,
+                step_result,
+                self.consumed_result_values
+            )
+
+        return step_result
+
+    def get_step_result_fingerprint(self):
+        """Gets the fingerprint of the inputs of this step, used to find a cached StepResult of
+        this step that can be reused rather than running this step again.
+
+        Notes
+        -----
+        Fingerprints the step, sub step, environment, the StepImplementer class and version,
+        the runtime step configuration, with encrypted values as given rather than decrypted,
+        and the contents of the files and directories read by this step,
+        see _get_step_result_fingerprint_input_paths.
+
+        Previous step result artifacts are not part of the fingerprint since which ones are used
+        is only known once the step has run, see consumed_result_values.
+
+        Returns
+        -------
+        str
+            Hex encoded sha256 fingerprint of the inputs of this step.
+
+        Raises
+        ------
+        OSError
+            If any of the files read by this step can not be read.
+        """
+        input_path_hashes = {}
+        for input_path in self._get_step_result_fingerprint_input_paths():
+            if input_path is not None:
+                input_path_hashes[input_path] = get_file_tree_hash(
+                    input_path,
+                    ignored_names=self.STEP_RESULT_FINGERPRINT_IGNORED_NAMES,
+                    ignored_paths=[self.__parent_work_dir_path]
+                )
+
+        fingerprint_inputs = {
+            'step-name': self.step_name,
+            'sub-step-name': self.sub_step_name,
+            'sub-step-implementer-name': self.sub_step_implementer_name,
+            'environment': self.environment,
+            'implementer': f'{type(self).__module__}.{type(self).__qualname__}',
+            'implementer-version': self.__get_implementer_version(),
+            'runtime-step-config': StepImplementer.__to_fingerprint_input(
+                self.get_runtime_step_config()
+            ),
+            'input-paths': input_path_hashes
+        }
+
+        return hashlib.sha256(
+            json.dumps(fingerprint_inputs, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+
+    @property
+    def consumed_result_values(self):
+        """
+        Returns
+        -------
+        dict
+            (artifact name, step name, sub step name, environment) of every previous step result
+            artifact this step has looked up, see get_result_value, to the value it got.
+        """
+        return dict(self.__consumed_result_values)
+
+    def __get_implementer_version(self):
+        """
+        Notes
+        -----
+        The version is a hash of the source of the modules defining this StepImplementer class
+        and every StepImplementer class it extends, so changing any of them changes the version.
+        Computed once per class.
+
+        Returns
+        -------
+        str
+            Version of this StepImplementer class.
+        """
+        implementer_class = type(self)
+        implementer_version = StepImplementer.__implementer_versions.get(implementer_class)
+        if implementer_version is None:
+            version_hash = hashlib.sha256()
+            for mro_class in implementer_class.__mro__:
+                if not issubclass(mro_class, StepImplementer):
+                    continue
+
+                module_file = getattr(sys.modules.get(mro_class.__module__), '__file__', None)
+                module_hash = get_file_hash(module_file) if module_file else None
+                version_hash.update(
+                    f'{mro_class.__module__}.{mro_class.__qualname__}:{module_hash}'.encode('utf-8')
+                )
+                version_hash.update(b'\0')
+
+            implementer_version = version_hash.hexdigest()
+            StepImplementer.__implementer_versions[implementer_class] = implementer_version
+
+        return implementer_version
+
+    @staticmethod
+    def __to_fingerprint_input(value):
+        """
+        Parameters
+        ----------
+        value : ConfigValue, dict, FrozenDict, list, tuple, or other
+            Configuration value to convert.
+
+        Returns
+        -------
+        dict, list, or other
+            The given configuration value with every ConfigValue replaced by its value as
+            originally given, so that encrypted values are not decrypted.
+        """
+        if isinstance(value, ConfigValue):
+            value = value.raw_value
+
+        if isinstance(value, Mapping):
+            return {
+                str(key): StepImplementer.__to_fingerprint_input(child_value)
+                for key, child_value in value.items()
+            }
+        if isinstance(value, (list, tuple)):
+            return [StepImplementer.__to_fingerprint_input(child_value) for child_value in value]
+
+        return value
+
+    def __run_step_with_routed_output(self):
+        """Runs the implemented step with its stdout and stderr indented and written to the
+        current stdout and stderr, as well as obfuscated and written to the output log file.
+
+        Returns
+        -------
+        StepResult
+            Results of running this step.
+        """
+        with open(self.output_log_file_path, 'w', encoding='utf-8') as output_log_file:
+            obfuscated_output_log = TextIOSelectiveObfuscator(output_log_file, streaming=True)
+            DecryptionUtils.register_obfuscation_stream(obfuscated_output_log)
+            try:
+                step_stdout = TextIOTee([
+                    TextIOIndenter(
+                        parent_stream=get_current_stream(sys.stdout),
+                        indent_level=2
+                    ),
+                    obfuscated_output_log
+                ])
+                step_stderr = TextIOTee([
+                    TextIOIndenter(
+                        parent_stream=get_current_stream(sys.stderr),
+                        indent_level=2
+                    ),
+                    obfuscated_output_log
+                ])
+
+                with redirect_sys_output(step_stdout, step_stderr):
+                    return self._run_step()
+            finally:
+                obfuscated_output_log.flush()
+                DecryptionUtils.unregister_obfuscation_stream(obfuscated_output_log)
+
+    @property
+    def output_log_file_path(self):
+        """
+        Returns
+        -------
+        str
+            Path to the file the stdout and stderr of running this sub step is logged to.
+        """
+        return os.path.join(self.work_dir_path, f'{self.sub_step_name}.output.log')
+
     def get_value(self, key):
         """Get the value for a given key, either from given configuration or from the result
         of any previous step.
@@ -440,6 +700,7 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         Also See
         --------
         SubStepConfig.get_config_value
+        get_runtime_step_config
         get_copy_of_runtime_step_config
 
         Parameters
@@ -456,7 +717,24 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         return self.config.get_config_value(
             key,
             self.environment,
-            self.step_implementer_config_defaults())
+            self.__get_step_implementer_config_defaults())
+
+    def get_runtime_step_config(self):
+        """Convenience function for self.config.get_runtime_step_config
+
+        See Also
+        --------
+        SubStepConfig.get_runtime_step_config
+        get_copy_of_runtime_step_config
+
+        Returns
+        -------
+        FrozenDict
+            A read only view of the merged runtime step configuration
+        """
+        return self.config.get_runtime_step_config(
+            self.environment,
+            self.__get_step_implementer_config_defaults())
 
     def get_copy_of_runtime_step_config(self):
         """Convenience function for self.config.get_copy_of_runtime_step_config
@@ -465,6 +743,7 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         --------
         SubStepConfig.get_copy_of_runtime_step_config
         get_config_value
+        get_runtime_step_config
 
         Returns
         -------
@@ -473,7 +752,24 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         """
         return self.config.get_copy_of_runtime_step_config(
             self.environment,
-            self.step_implementer_config_defaults())
+            self.__get_step_implementer_config_defaults())
+
+    def __get_step_implementer_config_defaults(self):
+        """Get the step implementer configuration defaults, only creating them once.
+
+        Returns
+        -------
+        dict
+            Default values to use for step configuration values.
+
+        See Also
+        --------
+        step_implementer_config_defaults
+        """
+        if self.__step_implementer_config_defaults is None:
+            self.__step_implementer_config_defaults = self.step_implementer_config_defaults()
+
+        return self.__step_implementer_config_defaults
 
     def has_config_value(self, keys, match_any=False):
         """Determines if step has values for any of the given keys.
@@ -537,15 +833,19 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         str
            Contents of the value for the specified result artifact_name.
         """
-        return (
-            self.workflow_result.get_artifact_value(
-                artifact=artifact_name,
-                step_name=step_name,
-                sub_step_name=sub_step_name,
-                environment=environment
-            )
+        value = self.workflow_result.get_artifact_value(
+            artifact=artifact_name,
+            step_name=step_name,
+            sub_step_name=sub_step_name,
+            environment=environment
         )
 
+        self.__consumed_result_values[
+            (artifact_name, step_name, sub_step_name, environment)
+        ] = value
+
+        return value
+
     def create_working_dir_sub_dir(self, sub_dir_relative_path=""):
         """Create a folder under the working/stepname folder.
 
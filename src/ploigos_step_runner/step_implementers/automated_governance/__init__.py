@@ -1,3 +1,23 @@
 """`StepImplementers` for the `rekor` step.
 """
-from ploigos_step_runner.step_implementers.automated_governance.rekor import Rekor
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.automated_governance.rekor import Rekor
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'Rekor': 'ploigos_step_runner.step_implementers.automated_governance.rekor'
+}
+
+__all__ = ['Rekor']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
@@ -42,8 +42,8 @@ from pathlib import Path
 import sh
 from ploigos_step_runner import StepImplementer, StepResult
 from ploigos_step_runner.utils.file import base64_encode, get_file_hash
-from ploigos_step_runner.utils.io import \
-    create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.io import (
+    TextIOBufferedTee, create_sh_redirect_to_multiple_streams_fn_callback)
 from ploigos_step_runner.utils.pgp import detach_sign_with_pgp_key
 
 
@@ -154,20 +154,23 @@ class Rekor(StepImplementer):  # pylint: disable=too-few-public-methods
         )
 
         rekor_upload_stdout_result = StringIO()
-        rekor_upload_stdout_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-            sys.stdout,
-            rekor_upload_stdout_result
-        ])
-        rekor = sh.rekor( # pylint: disable=no-member
-            'upload',
-            '--rekor_server',
-            rekor_server,
-            '--entry',
-            rekor_entry_path,
-            _out=rekor_upload_stdout_callback,
-            _err_to_out=True,
-            _tee='out'
-        )
+        with TextIOBufferedTee(
+            [sys.stdout, rekor_upload_stdout_result],
+            background=True
+        ) as rekor_upload_stdout_tee:
+            rekor_upload_stdout_callback = create_sh_redirect_to_multiple_streams_fn_callback([
+                rekor_upload_stdout_tee
+            ])
+            rekor = sh.rekor( # pylint: disable=no-member
+                'upload',
+                '--rekor_server',
+                rekor_server,
+                '--entry',
+                rekor_entry_path,
+                _out=rekor_upload_stdout_callback,
+                _err_to_out=True,
+                _tee='out'
+            )
         rekor_uuid = str(rekor).split('/')[-1].strip(' \n')
         return rekor_entry, rekor_uuid
 
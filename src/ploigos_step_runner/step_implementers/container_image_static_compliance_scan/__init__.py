@@ -1,5 +1,27 @@
 """`StepImplementers` for the `container-image-static-compliance-scan` step.
 """
 
-from ploigos_step_runner.step_implementers.container_image_static_compliance_scan.\
-    openscap import OpenSCAP
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.container_image_static_compliance_scan.\
+        openscap import OpenSCAP
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'OpenSCAP':
+        'ploigos_step_runner.step_implementers.container_image_static_compliance_scan.'
+        'openscap'
+}
+
+__all__ = ['OpenSCAP']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
@@ -1,4 +1,24 @@
 """`StepImplementers` for the `create-container-image` step.
 """
 
-from ploigos_step_runner.step_implementers.create_container_image.buildah import Buildah
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.create_container_image.buildah import Buildah
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'Buildah': 'ploigos_step_runner.step_implementers.create_container_image.buildah'
+}
+
+__all__ = ['Buildah']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
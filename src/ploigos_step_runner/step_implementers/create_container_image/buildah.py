@@ -19,6 +19,10 @@ Configuration Key | Required? | Default        | Description
                                                  Path to the container registry authentication \
                                                  file to use for container registry authentication.
 `container-image-version`     | True |         | Version to use when building the container image
+`output-passthrough`          | False | `False` | True to have `buildah bud` write its output \
+                                                 directly to a file in the working directory \
+                                                 which is tailed to show it, rather than \
+                                                 through this process.
 
 Result Artifacts
 ----------------
@@ -31,11 +35,14 @@ Result Artifact Key | Description
 """
 import os
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 
 import sh
 from ploigos_step_runner import StepImplementer, StepResult
 from ploigos_step_runner.utils.containers import container_registries_login
+from ploigos_step_runner.utils.io import get_current_stream
+from ploigos_step_runner.utils.sh_output import sh_output_to_file
 
 DEFAULT_CONFIG = {
     # Path to the container registry authentication file to read and write to/from.
@@ -51,7 +58,10 @@ DEFAULT_CONFIG = {
     'tls-verify': True,
 
     # Format of the produced image
-    'format': 'oci'
+    'format': 'oci',
+
+    # Have buildah bud write its output directly to a file rather than through this process?
+    'output-passthrough': False
 }
 
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
@@ -100,7 +110,7 @@ class Buildah(StepImplementer):
         """
         return REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS
 
-    def _run_step(self):
+    def _run_step(self): # pylint: disable=too-many-locals
         """Runs the step implemented by this StepImplementer.
 
         Returns
@@ -153,18 +163,33 @@ class Buildah(StepImplementer):
             # NOTE: using --storage-driver=vfs so that container does not need escalated privileges
             #       vfs is less efficient then fuse (which would require host mounts),
             #       but such is the price we pay for security.
-            sh.buildah.bud(  # pylint: disable=no-member
-                '--storage-driver=vfs',
-                '--format=' + self.get_value('format'),
-                '--tls-verify=' + str(tls_verify).lower(),
-                '--layers', '-f', image_spec_file,
-                '-t', tag,
-                '--authfile', containers_config_auth_file,
-                context,
-                _out=sys.stdout,
-                _err=sys.stderr,
-                _tee='err'
-            )
+            with ExitStack() as buildah_bud_sh_output_stack:
+                if self.get_value('output-passthrough'):
+                    buildah_bud_sh_kwargs = buildah_bud_sh_output_stack.enter_context(
+                        sh_output_to_file(
+                            output_file_path=self.write_working_file('buildah_bud_output.txt'),
+                            stdout=sys.stdout,
+                            stderr=sys.stderr,
+                            passthrough=True
+                        )
+                    )
+                else:
+                    buildah_bud_sh_kwargs = {
+                        '_out': get_current_stream(sys.stdout),
+                        '_err': get_current_stream(sys.stderr),
+                        '_tee': 'err'
+                    }
+
+                sh.buildah.bud(  # pylint: disable=no-member
+                    '--storage-driver=vfs',
+                    '--format=' + self.get_value('format'),
+                    '--tls-verify=' + str(tls_verify).lower(),
+                    '--layers', '-f', image_spec_file,
+                    '-t', tag,
+                    '--authfile', containers_config_auth_file,
+                    context,
+                    **buildah_bud_sh_kwargs
+                )
 
             step_result.add_artifact(
                 name='container-image-version',
@@ -192,8 +217,8 @@ class Buildah(StepImplementer):
                 '--storage-driver=vfs',
                 tag,
                 "docker-archive:" + image_tar_path,
-                _out=sys.stdout,
-                _err=sys.stderr,
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr),
                 _tee='err'
             )
 
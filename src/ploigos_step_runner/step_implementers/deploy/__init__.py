@@ -1,4 +1,24 @@
 """`StepImplementers` for the `deploy` step.
 """
 
-from ploigos_step_runner.step_implementers.deploy.argocd import ArgoCD
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.deploy.argocd import ArgoCD
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'ArgoCD': 'ploigos_step_runner.step_implementers.deploy.argocd'
+}
+
+__all__ = ['ArgoCD']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
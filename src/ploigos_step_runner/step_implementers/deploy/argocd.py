@@ -111,6 +111,8 @@ import yaml
 from ploigos_step_runner import StepImplementer
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner import StepResult
+from ploigos_step_runner.utils.file import YamlSafeLoader
+from ploigos_step_runner.utils.io import get_current_stream
 
 DEFAULT_CONFIG = {
     'argocd-sync-timeout-seconds': 60,
@@ -563,7 +565,7 @@ class ArgoCD(StepImplementer):
         manifest_resources = {}
         # load the manifest
         with open(manifest_path) as file:
-            manifest_resources = yaml.load_all(file, Loader=yaml.FullLoader)
+            manifest_resources = yaml.load_all(file, Loader=YamlSafeLoader)
 
             # for each resource in the manfest,
             # determine if its a known type and then attempt to get host and TLS config from it
@@ -663,8 +665,8 @@ class ArgoCD(StepImplementer):
             sh.git.clone( # pylint: disable=no-member
                 repo_url,
                 repo_dir,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
@@ -678,16 +680,16 @@ class ArgoCD(StepImplementer):
                 sh.git.checkout(  # pylint: disable=no-member
                     repo_branch,
                     _cwd=repo_dir,
-                    _out=sys.stdout,
-                    _err=sys.stderr
+                    _out=get_current_stream(sys.stdout),
+                    _err=get_current_stream(sys.stderr)
                 )
             except sh.ErrorReturnCode:
                 sh.git.checkout(
                     '-b',
                     repo_branch,
                     _cwd=repo_dir,
-                    _out=sys.stdout,
-                    _err=sys.stderr
+                    _out=get_current_stream(sys.stdout),
+                    _err=get_current_stream(sys.stderr)
                 )
         except sh.ErrorReturnCode as error:
             # NOTE: this should never happen
@@ -701,15 +703,15 @@ class ArgoCD(StepImplementer):
                 'user.email',
                 user_email,
                 _cwd=repo_dir,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
             sh.git.config( # pylint: disable=no-member
                 'user.name',
                 user_name,
                 _cwd=repo_dir,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             # NOTE: this should never happen
@@ -753,7 +755,7 @@ class ArgoCD(StepImplementer):
         try:
             git_push(
                 _cwd=repo_dir,
-                _out=sys.stdout
+                _out=get_current_stream(sys.stdout)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
@@ -773,8 +775,8 @@ class ArgoCD(StepImplementer):
                 tag,
                 '-f',
                 _cwd=repo_dir,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
@@ -791,7 +793,7 @@ class ArgoCD(StepImplementer):
                 '--tag',
                 *git_push_additional_arguments,
                 _cwd=repo_dir,
-                _out=sys.stdout
+                _out=get_current_stream(sys.stdout)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
@@ -805,8 +807,8 @@ class ArgoCD(StepImplementer):
             sh.git.add( # pylint: disable=no-member
                 file_path,
                 _cwd=repo_dir,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             # NOTE: this should never happen
@@ -821,8 +823,8 @@ class ArgoCD(StepImplementer):
                 '--all',
                 '--message', git_commit_message,
                 _cwd=repo_dir,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             # NOTE: this should never happen
@@ -855,8 +857,8 @@ class ArgoCD(StepImplementer):
                 f'--username={username}',
                 f'--password={password}',
                 insecure_flag,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(f"Error logging in to ArgoCD: {error}") from error
@@ -910,8 +912,8 @@ users:
                 sh.argocd.cluster.add(  # pylint: disable=no-member
                     '--kubeconfig', config_argocd_cluster_context_file,
                     context_name,
-                    _out=sys.stdout,
-                    _err=sys.stderr
+                    _out=get_current_stream(sys.stdout),
+                    _err=get_current_stream(sys.stderr)
                 )
             except sh.ErrorReturnCode as error:
                 raise StepRunnerException(
@@ -957,8 +959,8 @@ users:
                 f'--sync-policy={sync_policy}',
                 values_params,
                 '--upsert',
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
@@ -975,8 +977,8 @@ users:
                 '--prune',
                 '--timeout', argocd_sync_timeout_seconds,
                 argocd_app_name,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
@@ -988,8 +990,8 @@ users:
                 '--timeout', argocd_sync_timeout_seconds,
                 '--health',
                 argocd_app_name,
-                _out=sys.stdout,
-                _err=sys.stderr
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
@@ -1026,7 +1028,7 @@ users:
                 f'--source={source}',
                 argocd_app_name,
                 _out=arogcd_app_manifest_file,
-                _err=sys.stderr
+                _err=get_current_stream(sys.stderr)
             )
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
@@ -1,7 +1,31 @@
 """`StepImplementers` for the `generate-metadata` step.
 """
 
-from ploigos_step_runner.step_implementers.generate_metadata.git import Git
-from ploigos_step_runner.step_implementers.generate_metadata.maven import Maven
-from ploigos_step_runner.step_implementers.generate_metadata.npm import Npm
-from ploigos_step_runner.step_implementers.generate_metadata.semantic_version import SemanticVersion
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.generate_metadata.git import Git
+    from ploigos_step_runner.step_implementers.generate_metadata.maven import Maven
+    from ploigos_step_runner.step_implementers.generate_metadata.npm import Npm
+    from ploigos_step_runner.step_implementers.generate_metadata.semantic_version import \
+        SemanticVersion
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'Git': 'ploigos_step_runner.step_implementers.generate_metadata.git',
+    'Maven': 'ploigos_step_runner.step_implementers.generate_metadata.maven',
+    'Npm': 'ploigos_step_runner.step_implementers.generate_metadata.npm',
+    'SemanticVersion': 'ploigos_step_runner.step_implementers.generate_metadata.semantic_version'
+}
+
+__all__ = ['Git', 'Maven', 'Npm', 'SemanticVersion']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
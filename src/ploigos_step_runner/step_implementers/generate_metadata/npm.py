@@ -74,6 +74,28 @@ class Npm(StepImplementer): # pylint: disable=too-few-public-methods
         """
         return REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS
 
+    @staticmethod
+    def is_step_result_cacheable():
+        """Getter for whether the StepResult of this step can be reused when this step is run
+        again with the same inputs.
+
+        Returns
+        -------
+        bool
+            True since the version is only read from the package file.
+        """
+        return True
+
+    def _get_step_result_fingerprint_input_paths(self):
+        """Getter for the files and directories this step reads.
+
+        Returns
+        -------
+        list of str
+            The package file to read the version from.
+        """
+        return [self.get_value('package-file')]
+
     def _validate_required_config_or_previous_step_result_artifact_keys(self):
         """Validates that the required configuration keys or previous step result artifacts
         are set and have valid values.
@@ -108,6 +108,18 @@ class SemanticVersion(StepImplementer):  # pylint: disable=too-few-public-method
         """
         return REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS
 
+    @staticmethod
+    def is_step_result_cacheable():
+        """Getter for whether the StepResult of this step can be reused when this step is run
+        again with the same inputs.
+
+        Returns
+        -------
+        bool
+            True since the version is only built from configuration and previous step results.
+        """
+        return True
+
     def _run_step(self):
         """Runs the step implemented by this StepImplementer.
 
@@ -33,6 +33,10 @@ Configuration Key     | Required? | Default                 | Description
                                                               `artifact-extensions`.
 `tls-verify`          | No        | True                    | Disables TLS Verification if set to \
                                                               False
+`output-passthrough`  | No        | False                   | True to have `mvn` write its output \
+                                                              directly to the `maven-output` file \
+                                                              which is tailed to show it, rather \
+                                                              than through this process.
 
 Result Artifacts
 ----------------
@@ -95,14 +99,15 @@ import sys
 import sh
 from ploigos_step_runner import StepResult
 from ploigos_step_runner.step_implementers.shared.maven_generic import MavenGeneric
-from ploigos_step_runner.utils.io import create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.sh_output import sh_output_to_file
 from ploigos_step_runner.utils.xml import get_xml_element
 
 DEFAULT_CONFIG = {
     'tls-verify': True,
     'pom-file': 'pom.xml',
     'artifact-extensions': ["jar", "war", "ear"],
-    'artifact-parent-dir': 'target'
+    'artifact-parent-dir': 'target',
+    'output-passthrough': False
 }
 
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
@@ -147,6 +152,18 @@ class Maven(MavenGeneric):
         """
         return REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS
 
+    @staticmethod
+    def is_step_result_cacheable():
+        """Getter for whether the StepResult of this step can be reused when this step is run
+        again with the same inputs.
+
+        Returns
+        -------
+        bool
+            True since the built artifacts only depend on the project and configuration.
+        """
+        return True
+
     def _run_step(self): # pylint: disable=too-many-locals
         """Runs the step implemented by this StepImplementer.
 
@@ -178,15 +195,12 @@ class Maven(MavenGeneric):
         settings_file = self._generate_maven_settings()
         mvn_output_file_path = self.write_working_file('mvn_test_output.txt')
         try:
-            with open(mvn_output_file_path, 'w') as mvn_output_file:
-                out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    sys.stdout,
-                    mvn_output_file
-                ])
-                err_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    sys.stderr,
-                    mvn_output_file
-                ])
+            with sh_output_to_file(
+                output_file_path=mvn_output_file_path,
+                stdout=sys.stdout,
+                stderr=sys.stderr,
+                passthrough=self.get_value('output-passthrough')
+            ) as mvn_sh_output:
 
                 sh.mvn(  # pylint: disable=no-member
                     'clean',
@@ -194,8 +208,7 @@ class Maven(MavenGeneric):
                     '-f', pom_file,
                     '-s', settings_file,
                     *mvn_additional_options,
-                    _out=out_callback,
-                    _err=err_callback
+                    **mvn_sh_output
                 )
         except sh.ErrorReturnCode as error:
             step_result.success = False
@@ -22,6 +22,10 @@ Configuration Key              | Required | Default | Description
                                                         * artifact.path <br/>\
                                                         * artifact.package-type
 `tls-verify`                   | No       | True    | Disables TLS Verification if set to False
+`output-passthrough`           | No       | False   | True to have `mvn` write its output \
+                                                      directly to the `maven-output` file which \
+                                                      is tailed to show it, rather than through \
+                                                      this process.
 
 Result Artifacts
 ----------------
@@ -71,10 +75,11 @@ import sys
 import sh
 from ploigos_step_runner import StepResult
 from ploigos_step_runner.step_implementers.shared.maven_generic import MavenGeneric
-from ploigos_step_runner.utils.io import create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.sh_output import sh_output_to_file
 
 DEFAULT_CONFIG = {
-    'tls-verify': True
+    'tls-verify': True,
+    'output-passthrough': False
 }
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
     'maven-push-artifact-repo-url',
@@ -160,15 +165,13 @@ class Maven(MavenGeneric):
                 package_type = package['package-type']
 
                 # push the artifact
-                with open(mvn_output_file_path, 'a') as mvn_output_file:
-                    out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                        sys.stdout,
-                        mvn_output_file
-                    ])
-                    err_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                        sys.stderr,
-                        mvn_output_file
-                    ])
+                with sh_output_to_file(
+                    output_file_path=mvn_output_file_path,
+                    stdout=sys.stdout,
+                    stderr=sys.stderr,
+                    passthrough=self.get_value('output-passthrough'),
+                    append=True
+                ) as mvn_sh_output:
                     sh.mvn(  # pylint: disable=no-member
                         'deploy:deploy-file',
                         '-Dversion=' + version,
@@ -180,8 +183,7 @@ class Maven(MavenGeneric):
                         '-DrepositoryId=' + maven_push_artifact_repo_id,
                         '-s' + settings_file,
                         *mvn_additional_options,
-                        _out=out_callback,
-                        _err=err_callback
+                        **mvn_sh_output
                     )
 
                 # record the pushed artifact
@@ -1,4 +1,24 @@
 """`StepImplementers` for the `push-container-image` step.
 """
 
-from ploigos_step_runner.step_implementers.push_container_image.skopeo import Skopeo
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.push_container_image.skopeo import Skopeo
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'Skopeo': 'ploigos_step_runner.step_implementers.push_container_image.skopeo'
+}
+
+__all__ = ['Skopeo']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
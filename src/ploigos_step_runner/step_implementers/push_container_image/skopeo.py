@@ -52,6 +52,7 @@ from pathlib import Path
 import sh
 from ploigos_step_runner import StepImplementer, StepResult
 from ploigos_step_runner.utils.containers import container_registries_login
+from ploigos_step_runner.utils.io import get_current_stream
 
 DEFAULT_CONFIG = {
     'src-tls-verify': 'true',
@@ -149,8 +150,8 @@ class Skopeo(StepImplementer):
                 f"--authfile={containers_config_auth_file}",
                 f'docker-archive:{image_tar_file}',
                 f'docker://{image_tag}',
-                _out=sys.stdout,
-                _err=sys.stderr,
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr),
                 _tee='err'
             )
         except sh.ErrorReturnCode as error:
@@ -1,5 +1,27 @@
 """`StepImplementers` for the `report` step.
 """
 
-from ploigos_step_runner.step_implementers.report.result_artifacts_archive import \
-    ResultArtifactsArchive
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.report.result_artifacts_archive import \
+        ResultArtifactsArchive
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'ResultArtifactsArchive':
+        'ploigos_step_runner.step_implementers.report.'
+        'result_artifacts_archive'
+}
+
+__all__ = ['ResultArtifactsArchive']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
@@ -1,5 +1,26 @@
 """StepImplementer parent classes that are shared accross multiple steps.
 """
 
-from ploigos_step_runner.step_implementers.shared.maven_generic import MavenGeneric
-from ploigos_step_runner.step_implementers.shared.openscap_generic import OpenSCAPGeneric
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.shared.maven_generic import MavenGeneric
+    from ploigos_step_runner.step_implementers.shared.openscap_generic import OpenSCAPGeneric
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'MavenGeneric': 'ploigos_step_runner.step_implementers.shared.maven_generic',
+    'OpenSCAPGeneric': 'ploigos_step_runner.step_implementers.shared.openscap_generic'
+}
+
+__all__ = ['MavenGeneric', 'OpenSCAPGeneric']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
@@ -19,6 +19,23 @@ class MavenGeneric(StepImplementer):
         f'{SUREFIRE_PLUGIN_XML_ELEMENT_PATH}/mvn:configuration/mvn:reportsDirectory'
     DEFAULT_SUREFIRE_PLUGIN_REPORTS_DIR = 'target/surefire-reports'
 
+    # NOTE: target directories are Maven output, written by the steps themselves
+    STEP_RESULT_FINGERPRINT_IGNORED_NAMES = ['.git', 'target']
+
+    def _get_step_result_fingerprint_input_paths(self):
+        """Getter for the files and directories this step reads.
+
+        Returns
+        -------
+        list of str
+            The project directory, containing the pom file, to build.
+        """
+        pom_file = self.get_value('pom-file')
+        if pom_file is None:
+            return []
+
+        return [os.path.dirname(pom_file) or os.curdir]
+
     def _validate_required_config_or_previous_step_result_artifact_keys(self):
         """Validates that the required configuration keys or previous step result artifacts
         are set and have valid values.
@@ -28,6 +28,10 @@ from runtime configuration.
                                                        remote resources and this is not True. \
                                                        For disconnected environments the remote \
                                                        internal mirror.
+`output-passthrough`           | No        | False   | True to have `oscap-chroot` write its \
+                                                       stdout directly to the `stdout-report` \
+                                                       file, which is read back to parse it, \
+                                                       rather than through this process.
 
 Expected Previous Step Results
 ------------------------------
@@ -60,10 +64,13 @@ import sh
 from ploigos_step_runner import StepResult, StepRunnerException
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.utils.file import download_and_decompress_source_to_destination
-from ploigos_step_runner.utils.io import create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.io import (
+    create_sh_redirect_to_multiple_streams_fn_callback, get_current_stream)
+from ploigos_step_runner.utils.sh_output import sh_output_to_file
 
 DEFAULT_CONFIG = {
-    'oscap-fetch-remote-resources': True
+    'oscap-fetch-remote-resources': True,
+    'output-passthrough': False
 }
 
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
@@ -331,7 +338,8 @@ class OpenSCAPGeneric(StepImplementer):
                 container_mount_path=container_mount_path,
                 oscap_profile=oscap_profile,
                 oscap_tailoring_file=oscap_tailoring_file,
-                oscap_fetch_remote_resources=oscap_fetch_remote_resources
+                oscap_fetch_remote_resources=oscap_fetch_remote_resources,
+                output_passthrough=self.get_value('output-passthrough')
             )
             print(f"OpenSCAP scan completed with eval success: {oscap_eval_success}")
 
@@ -386,8 +394,8 @@ class OpenSCAPGeneric(StepImplementer):
                 '--storage-driver', 'vfs',
                 '--name', container_name,
                 f"docker-archive:{image_tar_file}",
-                _out=sys.stdout,
-                _err=sys.stderr,
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr),
                 _tee='err'
             )
         except sh.ErrorReturnCode as error:
@@ -431,7 +439,7 @@ class OpenSCAPGeneric(StepImplementer):
                 '--storage-driver', 'vfs',
                 container_id,
                 _out=buildah_mount_out_callback,
-                _err=sys.stderr,
+                _err=get_current_stream(sys.stderr),
                 _tee='err'
             )
             mount_path = buildah_mount_out_buff.getvalue().rstrip()
@@ -521,7 +529,8 @@ class OpenSCAPGeneric(StepImplementer):
             container_mount_path,
             oscap_profile=None,
             oscap_tailoring_file=None,
-            oscap_fetch_remote_resources=True
+            oscap_fetch_remote_resources=True,
+            output_passthrough=False
     ):
         """Run an oscap scan in the context of a buildah unshare to run "rootless".
 
@@ -552,6 +561,9 @@ class OpenSCAPGeneric(StepImplementer):
         oscap_profile : str
             OpenSCAP profile to evaluate. Must be a valid profile in the given oscap_input_file.
             EX: if you perform an `oscap info oscap_input_file` the profile must be listed.
+        output_passthrough : bool
+            True to have oscap write its stdout directly to oscap_out_file_path.
+            False to have the output of oscap pass through this process.
 
         Returns
         -------
@@ -588,15 +600,12 @@ class OpenSCAPGeneric(StepImplementer):
         oscap_eval_fails = None
         try:
             oscap_chroot_command = buildah_unshare_command.bake("oscap-chroot")
-            with open(oscap_out_file_path, 'w') as oscap_out_file:
-                out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    oscap_eval_out_buff,
-                    oscap_out_file
-                ])
-                err_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    oscap_eval_out_buff,
-                    oscap_out_file
-                ])
+            with sh_output_to_file(
+                output_file_path=oscap_out_file_path,
+                stdout=oscap_eval_out_buff,
+                stderr=oscap_eval_out_buff,
+                passthrough=output_passthrough
+            ) as oscap_sh_output:
                 oscap_chroot_command(
                     container_mount_path,
                     oscap_eval_type,
@@ -607,8 +616,7 @@ class OpenSCAPGeneric(StepImplementer):
                     f'--results={oscap_xml_results_file_path}',
                     f'--report={oscap_html_report_path}',
                     oscap_input_file,
-                    _out=out_callback,
-                    _err=err_callback,
+                    **oscap_sh_output,
                     _tee='err'
                 )
                 oscap_eval_success = True
@@ -64,6 +64,7 @@ from ploigos_step_runner import StepImplementer, StepResult
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.utils.file import upload_file
 from ploigos_step_runner.utils.pgp import import_pgp_key
+from ploigos_step_runner.utils.io import get_current_stream
 
 DEFAULT_CONFIG = {
 }
@@ -215,7 +216,7 @@ class PodmanSign(StepImplementer):
                 f"--sign-by={pgp_private_key_fingerprint}",
                 f"--directory={image_signatures_directory}",
                 f"docker://{container_image_tag}",
-                _out=sys.stdout,
+                _out=get_current_stream(sys.stdout),
                 _err_to_out=True,
                 _tee='out'
             )
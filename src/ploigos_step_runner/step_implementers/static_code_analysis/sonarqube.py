@@ -11,16 +11,23 @@ Could come from:
   * runtime configuration
   * previous step results
 
-Key               | Required | Default                     | Description
-------------------|----------|-----------------------------|------------
-`properties`      | Yes      | `./sonar-project.proerties` | Existing properties file for SonarQube
-`url`             | Yes      |                             | SonarQube host url (sonar.host.url)
-`username`        | No       |                             | SonarQube username id (sonar.login)
-`password`        | No       |                             | SonarQube password
-`version`         | Yes      |                             | Version to use for the SonarQube \
-                                                             project version (sonar.projectVersion)
-`java-truststore` | No       | `/etc/pki/java/cacerts`     | Location of Java TrustStore. Defaults \
-                                                             to System.
+Key                  | Required | Default                     | Description
+---------------------|----------|-----------------------------|------------
+`properties`         | Yes      | `./sonar-project.proerties` | Existing properties file for \
+                                                                SonarQube
+`url`                | Yes      |                             | SonarQube host url (sonar.host.url)
+`username`           | No       |                             | SonarQube username id (sonar.login)
+`password`           | No       |                             | SonarQube password
+`version`            | Yes      |                             | Version to use for the SonarQube \
+                                                                project version \
+                                                                (sonar.projectVersion)
+`java-truststore`    | No       | `/etc/pki/java/cacerts`     | Location of Java TrustStore. \
+                                                                Defaults to System.
+`output-passthrough` | No       | `False`                     | True to have `sonar-scanner` \
+                                                                write its output directly to a \
+                                                                file in the working directory \
+                                                                which is tailed to show it, \
+                                                                rather than through this process.
 
 Result Artifacts
 ----------------
@@ -85,15 +92,19 @@ Example: Existing Sonar Properties File (minimal)
 
 import os
 import sys
+from contextlib import ExitStack
 
 import sh
 from ploigos_step_runner import StepImplementer
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner import StepResult
+from ploigos_step_runner.utils.io import get_current_stream
+from ploigos_step_runner.utils.sh_output import sh_output_to_file
 
 DEFAULT_CONFIG = {
     'properties': './sonar-project.properties',
-    'java-truststore': '/etc/pki/java/cacerts'
+    'java-truststore': '/etc/pki/java/cacerts',
+    'output-passthrough': False
 }
 
 AUTHENTICATION_CONFIG = {
@@ -114,6 +125,9 @@ class SonarQube(StepImplementer):
     StepImplementer for the tag-source step for SonarQube.
     """
 
+    # NOTE: target directories are build output, written by other steps
+    STEP_RESULT_FINGERPRINT_IGNORED_NAMES = ['.git', 'target']
+
     @staticmethod
     def step_implementer_config_defaults():
         """
@@ -147,6 +161,32 @@ class SonarQube(StepImplementer):
         """
         return REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS
 
+    @staticmethod
+    def is_step_result_cacheable():
+        """Getter for whether the StepResult of this step can be reused when this step is run
+        again with the same inputs.
+
+        Returns
+        -------
+        bool
+            True since the analysis only depends on the project sources and configuration.
+        """
+        return True
+
+    def _get_step_result_fingerprint_input_paths(self):
+        """Getter for the files and directories this step reads.
+
+        Returns
+        -------
+        list of str
+            The project directory, containing the sonar properties file, to analyze.
+        """
+        properties_file = self.get_value('properties')
+        if properties_file is None:
+            return []
+
+        return [os.path.dirname(properties_file) or os.curdir]
+
     def _validate_required_config_or_previous_step_result_artifact_keys(self):
         """Validates that the required configuration keys or previous step result artifacts
         are set and have valid values.
@@ -176,7 +216,7 @@ class SonarQube(StepImplementer):
                 "Either 'username' or 'password 'is not set. Neither or both must be set."
             )
 
-    def _run_step(self):
+    def _run_step(self): # pylint: disable=too-many-locals
         """Runs the step implemented by this StepImplementer.
 
         Returns
@@ -213,30 +253,48 @@ class SonarQube(StepImplementer):
             # Hint:  Call sonar-scanner with sh.sonar_scanner
             #    https://amoffat.github.io/sh/sections/faq.html
             working_directory = self.work_dir_path
-            if username:
-                sh.sonar_scanner(  # pylint: disable=no-member
-                    f'-Dproject.settings={properties_file}',
-                    f'-Dsonar.host.url={url}',
-                    f'-Dsonar.projectVersion={version}',
-                    f'-Dsonar.projectKey={project_key}',
-                    f'-Dsonar.login={username}',
-                    f'-Dsonar.password={password}',
-                    f'-Dsonar.working.directory={working_directory}',
-                    _env={"SONAR_SCANNER_OPTS": f'-Djavax.net.ssl.trustStore={java_truststore}'},
-                    _out=sys.stdout,
-                    _err=sys.stderr
-                )
-            else:
-                sh.sonar_scanner(  # pylint: disable=no-member
-                    f'-Dproject.settings={properties_file}',
-                    f'-Dsonar.host.url={url}',
-                    f'-Dsonar.projectVersion={version}',
-                    f'-Dsonar.projectKey={project_key}',
-                    f'-Dsonar.working.directory={working_directory}',
-                    _env={"SONAR_SCANNER_OPTS": f'-Djavax.net.ssl.trustStore={java_truststore}'},
-                    _out=sys.stdout,
-                    _err=sys.stderr
-                )
+            with ExitStack() as sonar_scanner_sh_output_stack:
+                if self.get_value('output-passthrough'):
+                    sonar_scanner_sh_kwargs = sonar_scanner_sh_output_stack.enter_context(
+                        sh_output_to_file(
+                            output_file_path=self.write_working_file('sonar_scanner_output.txt'),
+                            stdout=sys.stdout,
+                            stderr=sys.stderr,
+                            passthrough=True
+                        )
+                    )
+                else:
+                    sonar_scanner_sh_kwargs = {
+                        '_out': get_current_stream(sys.stdout),
+                        '_err': get_current_stream(sys.stderr)
+                    }
+
+                if username:
+                    sh.sonar_scanner(  # pylint: disable=no-member
+                        f'-Dproject.settings={properties_file}',
+                        f'-Dsonar.host.url={url}',
+                        f'-Dsonar.projectVersion={version}',
+                        f'-Dsonar.projectKey={project_key}',
+                        f'-Dsonar.login={username}',
+                        f'-Dsonar.password={password}',
+                        f'-Dsonar.working.directory={working_directory}',
+                        _env={
+                            "SONAR_SCANNER_OPTS": f'-Djavax.net.ssl.trustStore={java_truststore}'
+                        },
+                        **sonar_scanner_sh_kwargs
+                    )
+                else:
+                    sh.sonar_scanner(  # pylint: disable=no-member
+                        f'-Dproject.settings={properties_file}',
+                        f'-Dsonar.host.url={url}',
+                        f'-Dsonar.projectVersion={version}',
+                        f'-Dsonar.projectKey={project_key}',
+                        f'-Dsonar.working.directory={working_directory}',
+                        _env={
+                            "SONAR_SCANNER_OPTS": f'-Djavax.net.ssl.trustStore={java_truststore}'
+                        },
+                        **sonar_scanner_sh_kwargs
+                    )
 
             sonarqube_success = True
         except sh.ErrorReturnCode_1 as error: # pylint: disable=no-member
@@ -46,6 +46,7 @@ import sh
 from ploigos_step_runner import StepImplementer
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner import StepResult
+from ploigos_step_runner.utils.io import get_current_stream
 
 DEFAULT_CONFIG = {}
 
@@ -200,7 +201,7 @@ class Git(StepImplementer):
                     _encoding='UTF-8',
                     _decode_errors='ignore',
                     _out=out,
-                    _err=sys.stderr,
+                    _err=get_current_stream(sys.stderr),
                     _tee='err'
                 )
                 git_url = out.getvalue().rstrip()
@@ -234,8 +235,8 @@ class Git(StepImplementer):
             sh.git.tag(  # pylint: disable=no-member
                 git_tag_value,
                 '-f',
-                _out=sys.stdout,
-                _err=sys.stderr,
+                _out=get_current_stream(sys.stdout),
+                _err=get_current_stream(sys.stderr),
                 _tee='err'
             )
         except sh.ErrorReturnCode as error:  # pylint: disable=undefined-variable
@@ -250,15 +251,15 @@ class Git(StepImplementer):
                 sh.git.push(
                     url,
                     '--tag',
-                    _out=sys.stdout,
-                    _err=sys.stderr,
+                    _out=get_current_stream(sys.stdout),
+                    _err=get_current_stream(sys.stderr),
                     _tee='err'
                 )
             else:
                 sh.git.push(
                     '--tag',
-                    _out=sys.stdout,
-                    _err=sys.stderr,
+                    _out=get_current_stream(sys.stdout),
+                    _err=get_current_stream(sys.stderr),
                     _tee='err'
                 )
         except sh.ErrorReturnCode as error:  # pylint: disable=undefined-variable
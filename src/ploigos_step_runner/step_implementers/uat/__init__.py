@@ -1,4 +1,25 @@
 """`StepImplementers` for the `uat` (User Acceptance Tests) step.
 """
 
-from ploigos_step_runner.step_implementers.uat.maven_selenium_cucumber import MavenSeleniumCucumber
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.uat.maven_selenium_cucumber import \
+        MavenSeleniumCucumber
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'MavenSeleniumCucumber': 'ploigos_step_runner.step_implementers.uat.maven_selenium_cucumber'
+}
+
+__all__ = ['MavenSeleniumCucumber']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
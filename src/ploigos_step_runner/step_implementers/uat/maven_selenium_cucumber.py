@@ -26,6 +26,10 @@ Configuration Key    | Required? | Default            | Description
 `uat-maven-profile`  | Yes       | `integration-test` | Maven profile to use to invoke \
                                                         Selenium tests.
 `tls-verify`         | No        | True               | Disables TLS Verification if set to False
+`output-passthrough` | No        | False              | True to have `mvn` write its output \
+                                                        directly to the `maven-output` file which \
+                                                        is tailed to show it, rather than through \
+                                                        this process.
 
 Result Artifacts
 ----------------
@@ -47,14 +51,15 @@ from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.step_implementers.shared.maven_generic import MavenGeneric
 from ploigos_step_runner import StepResult
-from ploigos_step_runner.utils.io import create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.sh_output import sh_output_to_file
 from ploigos_step_runner.utils.xml import aggregate_xml_element_attribute_values
 
 DEFAULT_CONFIG = {
     'tls-verify': True,
     'fail-on-no-tests': True,
     'pom-file': 'pom.xml',
-    'uat-maven-profile': 'integration-test'
+    'uat-maven-profile': 'integration-test',
+    'output-passthrough': False
 }
 
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
@@ -196,15 +201,12 @@ class MavenSeleniumCucumber(MavenGeneric):
         cucumber_json_report_path = os.path.join(self.work_dir_path, 'cucumber.json')
         mvn_output_file_path = self.write_working_file('mvn_test_output.txt')
         try:
-            with open(mvn_output_file_path, 'w') as mvn_output_file:
-                out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    sys.stdout,
-                    mvn_output_file
-                ])
-                err_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    sys.stderr,
-                    mvn_output_file
-                ])
+            with sh_output_to_file(
+                output_file_path=mvn_output_file_path,
+                stdout=sys.stdout,
+                stderr=sys.stderr,
+                passthrough=self.get_value('output-passthrough')
+            ) as mvn_sh_output:
                 sh.mvn( # pylint: disable=no-member
                     'clean',
                     'test',
@@ -217,8 +219,7 @@ class MavenSeleniumCucumber(MavenGeneric):
                     '-f', pom_file,
                     '-s', settings_file,
                     *mvn_additional_options,
-                    _out=out_callback,
-                    _err=err_callback
+                    **mvn_sh_output
                 )
 
             # if not results
@@ -1,3 +1,23 @@
 """`StepImplementers` for the `unit-test` step.
 """
-from ploigos_step_runner.step_implementers.unit_test.maven import Maven
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.unit_test.maven import Maven
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'Maven': 'ploigos_step_runner.step_implementers.unit_test.maven'
+}
+
+__all__ = ['Maven']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
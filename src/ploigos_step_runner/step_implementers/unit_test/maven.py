@@ -8,13 +8,17 @@ Could come from:
 * runtime configuration
 * previous step results
 
-Configuration Key  | Required? | Default     | Description
--------------------|-----------|-------------|-----------
-`fail-on-no-tests` | True      | True        | Value to specify whether unit-test \
-                                               step can succeed when no tests are defined
-`pom-file`         | True      | `'pom.xml'` | pom used to run tests and check \
-                                               for existence of custom reportsDirectory
-`tls-verify`       | No        | True        | Disables TLS Verification if set to False
+Configuration Key    | Required? | Default     | Description
+---------------------|-----------|-------------|-----------
+`fail-on-no-tests`   | True      | True        | Value to specify whether unit-test \
+                                                 step can succeed when no tests are defined
+`pom-file`           | True      | `'pom.xml'` | pom used to run tests and check \
+                                                 for existence of custom reportsDirectory
+`tls-verify`         | No        | True        | Disables TLS Verification if set to False
+`output-passthrough` | No        | False       | True to have `mvn` write its output \
+                                                 directly to the `maven-output` file which is \
+                                                 tailed to show it, rather than through this \
+                                                 process.
 
 Result Artifacts
 ----------------
@@ -31,12 +35,13 @@ import sys
 import sh
 from ploigos_step_runner import StepResult
 from ploigos_step_runner.step_implementers.shared.maven_generic import MavenGeneric
-from ploigos_step_runner.utils.io import create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.sh_output import sh_output_to_file
 
 DEFAULT_CONFIG = {
     'tls-verify': True,
     'fail-on-no-tests': True,
-    'pom-file': 'pom.xml'
+    'pom-file': 'pom.xml',
+    'output-passthrough': False
 }
 
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
@@ -82,7 +87,19 @@ class Maven(MavenGeneric):
         """
         return REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS
 
-    def _run_step(self):
+    @staticmethod
+    def is_step_result_cacheable():
+        """Getter for whether the StepResult of this step can be reused when this step is run
+        again with the same inputs.
+
+        Returns
+        -------
+        bool
+            True since the test results only depend on the project and configuration.
+        """
+        return True
+
+    def _run_step(self): # pylint: disable=too-many-locals
         """Runs the step implemented by this StepImplementer.
 
         Returns
@@ -129,15 +146,12 @@ class Maven(MavenGeneric):
         settings_file = self._generate_maven_settings()
         mvn_output_file_path = self.write_working_file('mvn_test_output.txt')
         try:
-            with open(mvn_output_file_path, 'w') as mvn_output_file:
-                out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    sys.stdout,
-                    mvn_output_file
-                ])
-                err_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    sys.stderr,
-                    mvn_output_file
-                ])
+            with sh_output_to_file(
+                output_file_path=mvn_output_file_path,
+                stdout=sys.stdout,
+                stderr=sys.stderr,
+                passthrough=self.get_value('output-passthrough')
+            ) as mvn_sh_output:
 
                 sh.mvn( # pylint: disable=no-member
                     'clean',
@@ -145,8 +159,7 @@ class Maven(MavenGeneric):
                     '-f', pom_file,
                     '-s', settings_file,
                     *mvn_additional_options,
-                    _out=out_callback,
-                    _err=err_callback
+                    **mvn_sh_output
                 )
 
             if not os.path.isdir(test_results_dir) or len(os.listdir(test_results_dir)) == 0:
@@ -1,6 +1,31 @@
 """`StepImplementers` for the `validate-environment-configuration` step.
 """
-from ploigos_step_runner.step_implementers.validate_environment_configuration.\
-    configlint import Configlint
-from ploigos_step_runner.step_implementers.validate_environment_configuration.\
-    configlint_from_argocd import ConfiglintFromArgocd
+from typing import TYPE_CHECKING
+
+from ploigos_step_runner.utils.reflection import enable_module_getattr, import_lazy_attribute
+
+if TYPE_CHECKING:
+    from ploigos_step_runner.step_implementers.validate_environment_configuration.\
+        configlint import Configlint
+    from ploigos_step_runner.step_implementers.validate_environment_configuration.\
+        configlint_from_argocd import ConfiglintFromArgocd
+
+# NOTE: StepImplementers are only imported when used so that running one does not import
+#       every other StepImplementer for the step, and their dependencies, as well
+_LAZY_ATTRIBUTES = {
+    'Configlint':
+        'ploigos_step_runner.step_implementers.validate_environment_configuration.'
+        'configlint',
+    'ConfiglintFromArgocd':
+        'ploigos_step_runner.step_implementers.validate_environment_configuration.'
+        'configlint_from_argocd'
+}
+
+__all__ = ['Configlint', 'ConfiglintFromArgocd']
+
+
+def __getattr__(name):
+    return import_lazy_attribute(__name__, name, _LAZY_ATTRIBUTES)
+
+
+enable_module_getattr(__name__)
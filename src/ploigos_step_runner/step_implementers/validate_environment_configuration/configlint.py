@@ -74,7 +74,8 @@ import sys
 import sh
 from ploigos_step_runner import StepImplementer
 from ploigos_step_runner import StepResult
-from ploigos_step_runner.utils.io import create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.io import (TextIOBufferedTee,
+                                          create_sh_redirect_to_multiple_streams_fn_callback)
 
 DEFAULT_CONFIG = {
     'rules': './config-lint.rules'
@@ -152,15 +153,17 @@ class Configlint(StepImplementer):
         try:
             # run config-lint writing stdout and stderr to the standard streams
             # as well as to a results file.
-            with open(configlint_results_file_path, 'w') as configlint_results_file:
-                out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    sys.stdout,
-                    configlint_results_file
-                ])
-                err_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    sys.stderr,
-                    configlint_results_file
-                ])
+            with open(configlint_results_file_path, 'w') as configlint_results_file, \
+                    TextIOBufferedTee(
+                        [sys.stdout, configlint_results_file],
+                        background=True
+                    ) as out_tee, \
+                    TextIOBufferedTee(
+                        [sys.stderr, configlint_results_file],
+                        background=True
+                    ) as err_tee:
+                out_callback = create_sh_redirect_to_multiple_streams_fn_callback([out_tee])
+                err_callback = create_sh_redirect_to_multiple_streams_fn_callback([err_tee])
 
                 sh.config_lint(  # pylint: disable=no-member
                     "-verbose",
@@ -1,11 +1,17 @@
 """Constructs a given named StepImplementer using a given configuration, and runs it.
 """
+import io
 import os
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from ploigos_step_runner.config.config import Config
 from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.implementer_registry import ImplementerRegistry
 from ploigos_step_runner.results import WorkflowResult
 from ploigos_step_runner.step_implementer import StepImplementer
+from ploigos_step_runner.utils.io import redirect_sys_output, sys_output_context_routers
 from ploigos_step_runner.utils.reflection import import_and_get_class
 
 
@@ -29,6 +35,13 @@ class StepRunner:
     work_dir_path : str, optional
         Path to the working folder for step_implementers for runtime files
         Default: step-runner-working
+    step_result_cache : StepResultCache, optional
+        Cache to reuse the StepResults of cacheable sub steps from, when run again with
+        unchanged inputs, rather than running them again.
+        Default: None, every sub step is always run.
+    max_parallel_sub_steps : int, optional
+        Maximum number of sub steps of a parallel step to run at the same time.
+        Default is the ThreadPoolExecutor default.
 
     Raises
     ------
@@ -50,7 +63,9 @@ class StepRunner:
         self,
         config,
         results_file_name='step-runner-results.yml',
-        work_dir_path='step-runner-working'
+        work_dir_path='step-runner-working',
+        step_result_cache=None,
+        max_parallel_sub_steps=None
     ):
         if isinstance(config, Config):
             self.__config = config
@@ -59,8 +74,11 @@ class StepRunner:
 
         self.__results_file_name = results_file_name
         self.__work_dir_path = work_dir_path
+        self.__step_result_cache = step_result_cache
+        self.__max_parallel_sub_steps = max_parallel_sub_steps
 
         self.__workflow_result = None
+        self.__workflow_result_lock = threading.RLock()
 
     @property
     def config(self):
@@ -83,13 +101,31 @@ class StepRunner:
         """
         return os.path.join(self.__work_dir_path, self.__results_file_name)
 
+    @property
+    def workflow_result_file_path(self):
+        """
+        Get the full path to the workflow result file.
+        (The workflow result file contains the serialized list of step results,
+        see StepResultStore.)
+        The name of the workflow result file is the basename of the results_file_name.
+
+        Returns
+        -------
+        str
+           Full path to the workflow result (serialized) file.
+        """
+        workflow_result_filename = os.path.splitext(self.__results_file_name)[0] + '.psr'
+        return os.path.join(self.__work_dir_path, workflow_result_filename)
+
     @property
     def workflow_result_pickle_file_path(self):
         """
-        Get the full path to the workflow result pickle file.
+        Get the full path to the legacy workflow result pickle file.
         (The 'pickle' file contains the serialized list of step results.)
         The name of the pickle file is the basename of the results_file_name.
 
+        Only used to migrate existing pickle files to the workflow result file.
+
         Returns
         -------
         str
@@ -98,6 +134,22 @@ class StepRunner:
         pickle_filename = os.path.splitext(self.__results_file_name)[0] + '.pkl'
         return os.path.join(self.__work_dir_path, pickle_filename)
 
+    @property
+    def workflow_result_journal_file_path(self):
+        """
+        Get the full path to the workflow result journal file.
+        (The journal file contains the step results added since the workflow result file was
+        last written, one record per step result.)
+        The name of the journal file is the basename of the results_file_name.
+
+        Returns
+        -------
+        str
+           Full path to the workflow result journal file.
+        """
+        journal_filename = os.path.splitext(self.__results_file_name)[0] + '.journal'
+        return os.path.join(self.__work_dir_path, journal_filename)
+
     @property
     def workflow_result(self):
         """
@@ -107,11 +159,17 @@ class StepRunner:
             Object containing a list of dictionary of step results
             from previous steps.
         """
-        if not self.__workflow_result:
-            self.__workflow_result = WorkflowResult.load_from_pickle_file(
-                pickle_filename=self.workflow_result_pickle_file_path
-            )
-        return self.__workflow_result
+        with self.__workflow_result_lock:
+            if not self.__workflow_result:
+                if not os.path.exists(self.workflow_result_file_path) and \
+                        os.path.exists(self.workflow_result_pickle_file_path):
+                    self.__migrate_workflow_result_pickle_file()
+
+                self.__workflow_result = WorkflowResult.load_from_file(
+                    filename=self.workflow_result_file_path,
+                    journal_filename=self.workflow_result_journal_file_path
+                )
+            return self.__workflow_result
 
     def run_step(self, step_name, environment=None):
         """
@@ -144,42 +202,358 @@ class StepRunner:
         assert len(sub_step_configs) != 0, \
             f"Can not run step ({step_name}) because no step configuration provided."
 
-        # for each sub step in the step config get the step implementer and run it
-        for sub_step_config in sub_step_configs:
-            sub_step_implementer_name = sub_step_config.sub_step_implementer_name
-
-            step_implementer_class = StepRunner.__get_step_implementer_class(
+        # NOTE: each sub step result is appended to the journal as soon as it is available
+        #       and then only once the step is done, successfully or not, is the journal
+        #       compacted into the workflow result file and the results file written
+        has_new_step_results = False
+        step_config = self.config.get_step_config(step_name)
+        if step_config.parallel and len(sub_step_configs) > 1:
+            sub_step_results = self.__run_sub_steps_in_parallel(
                 step_name,
-                sub_step_implementer_name)
-
-            # create the StepImplementer instance
-            sub_step = step_implementer_class(
-                parent_work_dir_path=self.__work_dir_path,
-                config=sub_step_config,
-                environment=environment,
-                workflow_result=self.workflow_result
+                sub_step_configs,
+                environment
+            )
+        else:
+            sub_step_results = (
+                self.__run_sub_step(step_name, sub_step_config, environment)
+                for sub_step_config in sub_step_configs
             )
 
-            # run the step
-            step_result = sub_step.run_step()
+        try:
+            # for each sub step in the step config, in order, get the result of running it
+            for step_result in sub_step_results:
+                # save the step results
+                with self.__workflow_result_lock:
+                    self.workflow_result.add_step_result(
+                        step_result=step_result
+                    )
+                    WorkflowResult.write_step_result_to_journal_file(
+                        step_result=step_result,
+                        journal_filename=self.workflow_result_journal_file_path
+                    )
+                has_new_step_results = True
+
+                # bail out if one of the sub steps fails
+                if not step_result.success:
+                    return False
+        finally:
+            sub_step_results.close()
+            if has_new_step_results:
+                self.__write_workflow_result()
 
-            # save the step results
-            self.workflow_result.add_step_result(
-                step_result=step_result
-            )
-            self.workflow_result.write_to_pickle_file(
-                pickle_filename=self.workflow_result_pickle_file_path
+        return True
+
+    def __run_sub_step(self, step_name, sub_step_config, environment):
+        """Creates the StepImplementer for the given sub step and runs it.
+
+        Parameters
+        ----------
+        step_name : str
+            Name of the step the sub step is part of.
+        sub_step_config : SubStepConfig
+            Configuration of the sub step to run.
+        environment : str, optional
+            Name of the environment the sub step is being run in.
+
+        Returns
+        -------
+        StepResult
+            Result of running the sub step.
+        """
+        step_implementer_class = StepRunner.__get_step_implementer_class(
+            step_name,
+            sub_step_config.sub_step_implementer_name
+        )
+
+        # create the StepImplementer instance
+        sub_step = step_implementer_class(
+            parent_work_dir_path=self.__work_dir_path,
+            config=sub_step_config,
+            environment=environment,
+            workflow_result=self.workflow_result
+        )
+
+        # run the step
+        return sub_step.run_step(step_result_cache=self.__step_result_cache)
+
+    def __run_sub_steps_in_parallel(self, step_name, sub_step_configs, environment):
+        """Runs the given sub steps at the same time, up to max_parallel_sub_steps at once,
+        each with its own captured stdout and stderr.
+
+        Notes
+        -----
+        Each sub step's captured output is written to sys.stdout and sys.stderr, and its
+        result yielded, in the order the sub steps were given, so that the output and
+        results are the same as if the sub steps had been run one after the other.
+
+        Sub steps are started in the order they were given as running sub steps finish.
+        Once any sub step fails, or this generator is closed, such as when the caller stops
+        after a failed sub step, no more sub steps are started. Sub steps already running
+        at that point are waited on, but their output and results are discarded.
+
+        Parameters
+        ----------
+        step_name : str
+            Name of the step the sub steps are part of.
+        sub_step_configs : list of SubStepConfig
+            Configurations of the sub steps to run.
+        environment : str, optional
+            Name of the environment the sub steps are being run in.
+
+        Yields
+        ------
+        StepResult
+            Result of running each sub step in the order the sub steps were given.
+
+        Raises
+        ------
+        Exception
+            Any exception raised while running a sub step, once the results of all of the
+            sub steps before it have been yielded.
+        """
+        max_workers = len(sub_step_configs)
+        if self.__max_parallel_sub_steps is not None:
+            max_workers = min(max_workers, self.__max_parallel_sub_steps)
+
+        stop_starting_sub_steps = threading.Event()
+
+        def run_sub_step(sub_step_config, captured_stdout, captured_stderr):
+            if stop_starting_sub_steps.is_set():
+                return None
+
+            try:
+                step_result = self.__run_sub_step_with_captured_output(
+                    step_name,
+                    sub_step_config,
+                    environment,
+                    captured_stdout,
+                    captured_stderr
+                )
+            except Exception:
+                stop_starting_sub_steps.set()
+                raise
+
+            if not step_result.success:
+                stop_starting_sub_steps.set()
+
+            return step_result
+
+        with sys_output_context_routers(), \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            sub_step_runs = []
+            for sub_step_config in sub_step_configs:
+                captured_stdout = io.StringIO()
+                captured_stderr = io.StringIO()
+                future = executor.submit(
+                    run_sub_step,
+                    sub_step_config,
+                    captured_stdout,
+                    captured_stderr
+                )
+                sub_step_runs.append((future, captured_stdout, captured_stderr))
+
+            try:
+                for future, captured_stdout, captured_stderr in sub_step_runs:
+                    wait([future])
+                    step_result = future.result()
+
+                    # NOTE: sub steps are started in order so a sub step that was not started
+                    #       is always after the sub step that failed
+                    if step_result is None:
+                        return
+
+                    sys.stdout.write(captured_stdout.getvalue())
+                    sys.stderr.write(captured_stderr.getvalue())
+                    yield step_result
+            finally:
+                stop_starting_sub_steps.set()
+                for future, _, _ in sub_step_runs:
+                    future.cancel()
+
+    def __run_sub_step_with_captured_output( # pylint: disable=too-many-arguments
+        self,
+        step_name,
+        sub_step_config,
+        environment,
+        captured_stdout,
+        captured_stderr
+    ):
+        """Runs the given sub step with sys.stdout and sys.stderr for the current context
+        redirected to the given streams.
+
+        Parameters
+        ----------
+        step_name : str
+            Name of the step the sub step is part of.
+        sub_step_config : SubStepConfig
+            Configuration of the sub step to run.
+        environment : str, optional
+            Name of the environment the sub step is being run in.
+        captured_stdout : IOBase
+            Stream to capture the sub step's stdout to.
+        captured_stderr : IOBase
+            Stream to capture the sub step's stderr to.
+
+        Returns
+        -------
+        StepResult
+            Result of running the sub step.
+        """
+        with redirect_sys_output(captured_stdout, captured_stderr):
+            return self.__run_sub_step(step_name, sub_step_config, environment)
+
+    def run_workflow(self, workflow, environment=None, max_parallel_steps=None):
+        """Run many steps in this process, sharing this StepRunner's Config and WorkflowResult,
+        running each step once all of the steps it depends on have completed successfully.
+
+        Results are persisted at the end of each step, see run_step.
+
+        Parameters
+        ----------
+        workflow : list of str or dict of str: list of str
+            Either a list of step names to run one after the other in the given order,
+            or a dictionary where key is a step name and value is the list of step names
+            that step depends on. Steps whose dependencies have all completed are run in
+            parallel with each other.
+        environment : str, optional
+            Name of the environment the steps are being run in.
+        max_parallel_steps : int, optional
+            Maximum number of steps to run at the same time.
+            Default is the ThreadPoolExecutor default.
+
+        Raises
+        ------
+        StepRunnerException
+            If a step depends on a step that is not in the workflow.
+            If the step dependencies contain a cycle.
+            Any exception raised by run_step for any of the steps, once all already running
+            steps have finished.
+
+        Returns
+        -------
+        Bool
+           True if all of the steps completed successfully.
+           False if any step was not successful, in which case no further steps are started.
+        """
+        step_dependencies = StepRunner.__get_workflow_step_dependencies(workflow)
+
+        pending_steps = dict(step_dependencies)
+        completed_steps = set()
+        running_steps = {}
+        success = True
+
+        # NOTE: steps redirect sys.stdout and sys.stderr while they run, so route them per
+        #       thread so that steps running in parallel do not swap each others streams
+        with sys_output_context_routers(), \
+                ThreadPoolExecutor(max_workers=max_parallel_steps) as executor:
+            while pending_steps or running_steps:
+                if success:
+                    for step_name, dependencies in list(pending_steps.items()):
+                        if completed_steps.issuperset(dependencies):
+                            del pending_steps[step_name]
+                            future = executor.submit(self.run_step, step_name, environment)
+                            running_steps[future] = step_name
+
+                if not running_steps:
+                    break
+
+                done, _ = wait(running_steps, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_name = running_steps.pop(future)
+                    if future.result():
+                        completed_steps.add(step_name)
+                    else:
+                        success = False
+
+        return success
+
+    @staticmethod
+    def __get_workflow_step_dependencies(workflow):
+        """Normalizes and validates the steps of a workflow.
+
+        Parameters
+        ----------
+        workflow : list of str or dict of str: list of str
+            See run_workflow.
+
+        Returns
+        -------
+        dict of str: list of str
+            Key is step name, value is list of step names that step depends on,
+            in the order the steps were given.
+
+        Raises
+        ------
+        StepRunnerException
+            If a step depends on a step that is not in the workflow.
+            If the step dependencies contain a cycle.
+        """
+        if isinstance(workflow, dict):
+            step_dependencies = {
+                step_name: list(dependencies or [])
+                for step_name, dependencies in workflow.items()
+            }
+        else:
+            step_dependencies = {}
+            previous_step_name = None
+            for step_name in workflow:
+                step_dependencies[step_name] = [previous_step_name] if previous_step_name else []
+                previous_step_name = step_name
+
+        for step_name, dependencies in step_dependencies.items():
+            for dependency in dependencies:
+                if dependency not in step_dependencies:
+                    raise StepRunnerException(
+                        f"Workflow step ({step_name}) depends on step ({dependency})"
+                        " which is not in the workflow."
+                    )
+
+        # remove steps with no unresolved dependencies until none are left,
+        # if any are left that can not be removed there is a cycle
+        unresolved_steps = dict(step_dependencies)
+        while unresolved_steps:
+            resolvable_steps = [
+                step_name for step_name, dependencies in unresolved_steps.items()
+                if not any(dependency in unresolved_steps for dependency in dependencies)
+            ]
+            if not resolvable_steps:
+                raise StepRunnerException(
+                    "Workflow step dependencies contain a cycle between steps"
+                    f" ({', '.join(unresolved_steps)})."
+                )
+            for step_name in resolvable_steps:
+                del unresolved_steps[step_name]
+
+        return step_dependencies
+
+    def __migrate_workflow_result_pickle_file(self):
+        """Converts a workflow result pickle file written by a previous version into a
+        workflow result file and removes the pickle file.
+
+        Raises
+        ------
+        StepRunnerException
+            If the pickle file can not be loaded.
+        """
+        workflow_result = WorkflowResult.load_from_pickle_file(
+            pickle_filename=self.workflow_result_pickle_file_path
+        )
+        workflow_result.write_to_file(self.workflow_result_file_path)
+        os.remove(self.workflow_result_pickle_file_path)
+
+    def __write_workflow_result(self):
+        """Compacts the workflow result journal into the workflow result file and
+        writes the results file.
+        """
+        with self.__workflow_result_lock:
+            self.workflow_result.compact_journal_file(
+                filename=self.workflow_result_file_path,
+                journal_filename=self.workflow_result_journal_file_path
             )
             self.workflow_result.write_results_to_yml_file(
                 yml_filename=self.results_file_path
             )
 
-            # bail out if one of the sub steps fails
-            if not step_result.success:
-                return False
-
-        return True
-
     @staticmethod
     def __get_step_implementer_class(step_name, step_implementer_name):
         """Given a step name and a step implementer name dynamically loads the Class.
@@ -191,7 +565,8 @@ class StepRunner:
             This is only used if the given step_implementer_name does not include
             a module path.
         step_implementer_name : str
-            Either the short name of a StepImplementer class which will be dynamically
+            Either the short name of a StepImplementer class registered for the given step
+            in the ImplementerRegistry or, if not registered, which will be dynamically
             loaded from the 'ploigos_step_runner.step_implementers.{step_name}' module or
             A class name that includes a dot seperated module name to load the Class from.
 
@@ -207,13 +582,20 @@ class StepRunner:
             If could not find class to load
             If loaded class is not a subclass of StepImplementer
         """
-        parts = step_implementer_name.split('.')
-        class_name = parts.pop()
-        module_name = '.'.join(parts)
+        registered_step_implementer = ImplementerRegistry.resolve_step_implementer(
+            step_name,
+            step_implementer_name
+        )
+        if registered_step_implementer is not None:
+            module_name, class_name = registered_step_implementer
+        else:
+            parts = step_implementer_name.split('.')
+            class_name = parts.pop()
+            module_name = '.'.join(parts)
 
-        if not module_name:
-            step_module_part = step_name.replace('-', '_')
-            module_name = f"{StepRunner.__DEFAULT_MODULE}.{step_module_part}"
+            if not module_name:
+                step_module_part = step_name.replace('-', '_')
+                module_name = f"{StepRunner.__DEFAULT_MODULE}.{step_module_part}"
 
         clazz = import_and_get_class(module_name, class_name)
         if not clazz:
@@ -0,0 +1,346 @@
+"""Long lived step runner server, and the client for it, communicating over a Unix socket.
+
+Notes
+-----
+Every message is a JSON object on its own line. A client sends a single request to run a step,
+
+    {"step": "unit-test", "environment": "DEV", "step-config": {"key": "value"}}
+
+and the server replies with any number of output messages, as the step writes output,
+
+    {"stdout": "..."}
+    {"stderr": "..."}
+
+followed by the exit code of running the step, the same as the psr exit code would be,
+
+    {"exit-code": 0}
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+
+from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.step_runner import StepRunner
+from ploigos_step_runner.utils.io import TextIOSelectiveObfuscator, redirect_sys_output
+
+
+class StepRunnerServer(socketserver.ThreadingUnixStreamServer):
+    """Long lived server, listening on a Unix socket, that runs steps for clients, see
+    run_step_on_server, keeping the Config, decrypted values, and WorkflowResult in memory
+    between steps rather than loading them again for every step.
+
+    Notes
+    -----
+    Steps are run one at a time, in the order requested, the same as running psr once per step.
+    The output of each step is obfuscated and sent to the client that requested it.
+
+    Only the user running the server can connect to the socket since steps have access to
+    decrypted values.
+
+    Parameters
+    ----------
+    socket_path : str
+        Path to the Unix socket to listen on.
+        If a socket already exists at that path that no server is listening on it is replaced.
+    config : Config, dict, list, str (file or directory)
+        Configuration to run the steps with, see StepRunner.
+    results_file_name : str, optional
+        Path to the file for steps to write their results to, see StepRunner.
+    work_dir_path : str, optional
+        Path to the working folder for step_implementers for runtime files, see StepRunner.
+
+    Raises
+    ------
+    StepRunnerException
+        If another server is already listening on the given socket.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path,
+        config,
+        results_file_name='step-runner-results.yml',
+        work_dir_path='step-runner-working'
+    ):
+        self.__step_runner = StepRunner(
+            config,
+            results_file_name=results_file_name,
+            work_dir_path=work_dir_path
+        )
+        self.__run_step_lock = threading.Lock()
+
+        StepRunnerServer.__remove_stale_socket(socket_path)
+
+        # NOTE: create the socket so that only the current user can connect to it
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, StepRunnerRequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    @property
+    def step_runner(self):
+        """
+        Returns
+        -------
+        StepRunner
+            StepRunner running the steps requested of this server.
+        """
+        return self.__step_runner
+
+    @property
+    def socket_path(self):
+        """
+        Returns
+        -------
+        str
+            Path to the Unix socket this server listens on.
+        """
+        return self.server_address
+
+    def run_step(self, step_name, environment=None, step_config_overrides=None):
+        """Runs a step once any other step being run by this server is done.
+
+        Parameters
+        ----------
+        step_name : str
+            Name of the step to run.
+        environment : str, optional
+            Name of the environment to run the step against.
+        step_config_overrides : dict, optional
+            Step configuration overrides for the step, replacing any given for previous runs.
+
+        Returns
+        -------
+        int
+            0 if the step was successful,
+            200 if the step completed with unsuccessful results,
+            300 if the step failed completion because of an exception.
+        """
+        with self.__run_step_lock:
+            self.step_runner.config.set_step_config_overrides(step_name, step_config_overrides)
+
+            try:
+                if not self.step_runner.run_step(step_name, environment):
+                    print(f"Step {step_name} not successful", file=sys.stderr)
+                    return 200
+            except Exception as error:  # pylint: disable=broad-except
+                print(f"Fatal error calling step ({step_name}): {str(error)}", file=sys.stderr)
+                print(traceback.format_exc())
+                return 300
+
+        return 0
+
+    def server_close(self):
+        """Stops listening and removes the socket.
+        """
+        super().server_close()
+        try:
+            os.remove(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __remove_stale_socket(socket_path):
+        """Removes a socket left behind by a server that is no longer running.
+
+        Parameters
+        ----------
+        socket_path : str
+            Path to the Unix socket to remove if no server is listening on it.
+
+        Raises
+        ------
+        StepRunnerException
+            If a server is listening on the given socket.
+        """
+        if not os.path.exists(socket_path):
+            return
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            try:
+                client_socket.connect(socket_path)
+            except ConnectionRefusedError:
+                os.remove(socket_path)
+                return
+
+        raise StepRunnerException(
+            f"Another step runner server is already listening on socket ({socket_path})"
+        )
+
+
+class StepRunnerRequestHandler(socketserver.StreamRequestHandler):
+    """Handles a request, from run_step_on_server, to a StepRunnerServer to run a step.
+    """
+
+    def handle(self):
+        """Runs the requested step, sending its obfuscated output and then its exit code.
+        """
+        message_lock = threading.Lock()
+
+        try:
+            request = json.loads(self.rfile.readline())
+            step_name = request['step']
+            environment = request.get('environment')
+            step_config_overrides = request.get('step-config')
+        except (ValueError, TypeError, KeyError, AttributeError) as error:
+            send_message(self.wfile, message_lock, {'stderr': f"Invalid request: {error}\n"})
+            send_message(self.wfile, message_lock, {'exit-code': 2})
+            return
+
+        stdout = TextIOSelectiveObfuscator(
+            parent_stream=TextIOMessageWriter(self.wfile, message_lock, 'stdout'),
+            streaming=True
+        )
+        stderr = TextIOSelectiveObfuscator(
+            parent_stream=TextIOMessageWriter(self.wfile, message_lock, 'stderr'),
+            streaming=True
+        )
+        DecryptionUtils.register_obfuscation_stream(stdout)
+        DecryptionUtils.register_obfuscation_stream(stderr)
+        try:
+            with redirect_sys_output(stdout, stderr):
+                exit_code = self.server.run_step(step_name, environment, step_config_overrides)
+        finally:
+            stdout.flush()
+            stderr.flush()
+            DecryptionUtils.unregister_obfuscation_stream(stdout)
+            DecryptionUtils.unregister_obfuscation_stream(stderr)
+
+        send_message(self.wfile, message_lock, {'exit-code': exit_code})
+
+
+class TextIOMessageWriter(io.TextIOBase):
+    """Writes everything written to it as output messages, see step_runner_server,
+    to a client of a StepRunnerServer.
+
+    Notes
+    -----
+    If the client has disconnected output is discarded so that the step still completes.
+
+    Parameters
+    ----------
+    wfile : io.BufferedIOBase
+        Stream to the client to write the messages to.
+    message_lock : threading.Lock
+        Lock held while writing a message to the client, shared by all writers to the client.
+    message_key : str
+        Key of the messages to write, either `stdout` or `stderr`.
+    """
+
+    def __init__(self, wfile, message_lock, message_key):
+        self.__wfile = wfile
+        self.__message_lock = message_lock
+        self.__message_key = message_key
+        super().__init__()
+
+    def write(self, given):
+        """Writes the given string to the client as an output message.
+
+        Parameters
+        ----------
+        given : str
+            String to write to the client.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+
+        See Also
+        --------
+        io.TextIOBase.write
+        """
+        if given:
+            send_message(self.__wfile, self.__message_lock, {self.__message_key: given})
+
+        return len(given)
+
+
+def send_message(wfile, message_lock, message):
+    """Sends a message to the other end of a step runner server connection.
+
+    Parameters
+    ----------
+    wfile : io.BufferedIOBase
+        Stream to the other end of the connection.
+    message_lock : threading.Lock
+        Lock held while sending the message.
+    message : dict
+        Message to send.
+    """
+    data = (json.dumps(message) + '\n').encode('utf-8')
+    with message_lock:
+        try:
+            wfile.write(data)
+            wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def run_step_on_server(socket_path, step_name, environment=None, step_config_overrides=None):
+    """Runs a step on a StepRunnerServer, writing the output of the step to sys.stdout and
+    sys.stderr as it is received.
+
+    Parameters
+    ----------
+    socket_path : str
+        Path to the Unix socket the StepRunnerServer is listening on.
+    step_name : str
+        Name of the step to run.
+    environment : str, optional
+        Name of the environment to run the step against.
+    step_config_overrides : dict, optional
+        Step configuration overrides for the step.
+
+    Returns
+    -------
+    int
+        Exit code of running the step, see StepRunnerServer.run_step.
+
+    Raises
+    ------
+    StepRunnerException
+        If can not connect to the server or the server closes the connection before
+        the step completes.
+    """
+    request = {
+        'step': step_name,
+        'environment': environment,
+        'step-config': step_config_overrides
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect(socket_path)
+            client_socket.sendall((json.dumps(request) + '\n').encode('utf-8'))
+
+            with client_socket.makefile('r', encoding='utf-8') as messages:
+                for line in messages:
+                    message = json.loads(line)
+                    if 'stdout' in message:
+                        sys.stdout.write(message['stdout'])
+                        sys.stdout.flush()
+                    elif 'stderr' in message:
+                        sys.stderr.write(message['stderr'])
+                        sys.stderr.flush()
+                    elif 'exit-code' in message:
+                        return message['exit-code']
+    except (OSError, ValueError) as error:
+        raise StepRunnerException(
+            f"Error running step ({step_name}) on step runner server ({socket_path}): {error}"
+        ) from error
+
+    raise StepRunnerException(
+        f"Step runner server ({socket_path}) closed the connection before step ({step_name})"
+        " completed"
+    )
@@ -5,6 +5,7 @@ import sys
 
 import sh
 from ploigos_step_runner.config.config_value import ConfigValue
+from ploigos_step_runner.utils.io import get_current_stream
 
 
 def container_registries_login(  #pylint: disable=too-many-branches
@@ -245,8 +246,8 @@ def container_registry_login(
         login_comnmand(
             container_registry_uri,
             _in=container_registry_password,
-            _out=sys.stdout,
-            _err=sys.stderr,
+            _out=get_current_stream(sys.stdout),
+            _err=get_current_stream(sys.stderr),
             _tee='err'
         )
     except sh.ErrorReturnCode as error:
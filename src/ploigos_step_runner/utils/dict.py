@@ -1,6 +1,9 @@
 """Shared utils for dealing with dictionaries.
 """
 
+from collections.abc import Mapping
+
+
 def deep_merge(dest, source, overwrite_duplicate_keys=False, _path=None):
     """"deep merges source dictionary into destination dictionary.
 
@@ -79,3 +82,181 @@ def deep_merge(dest, source, overwrite_duplicate_keys=False, _path=None):
         else:
             dest[key] = source[key]
     return dest
+
+class FrozenDict(Mapping):
+    """Immutable dictionary.
+
+    Notes
+    -----
+    Since a FrozenDict, and every FrozenDict created by freeze, can never change,
+    copying one, shallow or deep, returns the same FrozenDict. This allows trees of them to share
+    any unchanged sub trees, see frozen_deep_merge, and to be handed out as read only views
+    without ever being copied.
+
+    Parameters
+    ----------
+    *args
+        Same as for dict.
+    **kwargs
+        Same as for dict.
+    """
+
+    __slots__ = ('__items',)
+
+    def __init__(self, *args, **kwargs):
+        self.__items = dict(*args, **kwargs)
+
+    def __getitem__(self, key):
+        return self.__items[key]
+
+    def __contains__(self, key):
+        return key in self.__items
+
+    def __iter__(self):
+        return iter(self.__items)
+
+    def __len__(self):
+        return len(self.__items)
+
+    def get(self, key, default=None):
+        return self.__items.get(key, default)
+
+    def keys(self):
+        return self.__items.keys()
+
+    def items(self):
+        return self.__items.items()
+
+    def values(self):
+        return self.__items.values()
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenDict):
+            return self.__items == other.__items # pylint: disable=protected-access
+        if isinstance(other, Mapping):
+            return self.__items == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (self.__items,)
+
+    def __repr__(self):
+        return f'FrozenDict({self.__items!r})'
+
+def freeze(value):
+    """Recursively convert a value to an immutable value.
+
+    Parameters
+    ----------
+    value : dict, list, tuple, or obj
+        Value to convert.
+
+    Returns
+    -------
+    FrozenDict, tuple, or obj
+        Given value with all dictionaries converted to FrozenDict and all lists to tuples.
+        Any other objects, including leaf objects, are returned as is.
+    """
+    if isinstance(value, FrozenDict): # pylint: disable=no-else-return
+        return value
+    elif isinstance(value, Mapping):
+        return FrozenDict((key, freeze(child_value)) for key, child_value in value.items())
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze(child_value) for child_value in value)
+    else:
+        return value
+
+def thaw(value):
+    """Recursively convert a value created by freeze back to a mutable value.
+
+    Parameters
+    ----------
+    value : FrozenDict, tuple, or obj
+        Value to convert.
+
+    Returns
+    -------
+    dict, list, or obj
+        New mutable copy of the given value with all mappings converted to dict and all tuples
+        to lists. Any other objects, including leaf objects, are returned as is.
+    """
+    if isinstance(value, Mapping): # pylint: disable=no-else-return
+        return {key: thaw(child_value) for key, child_value in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [thaw(child_value) for child_value in value]
+    else:
+        return value
+
+def frozen_deep_merge(dest, source, overwrite_duplicate_keys=False, _path=None):
+    """Deep merges source dictionary into destination dictionary without modifying either.
+
+    Notes
+    -----
+    Same semantics as deep_merge but rather then modifying the destination returns a new
+    FrozenDict which shares every sub tree of the destination and source that did not change.
+    So only the dictionaries along the paths to changed keys are allocated.
+
+    Parameters
+    ----------
+    dest : Mapping
+        Destination dictionary to deep merge source into.
+    source : Mapping
+        Source dictionary to deep merge into dest.
+    overwrite_duplicate_keys : bool
+        True to overwite duplicate leaf keys in destination with source dictionary values.
+        False to raise ValueError if any duplicate leaf values.
+
+    Returns
+    -------
+    FrozenDict
+        Result of merging the given source into the given destination.
+
+    Raises
+    ------
+    ValueError
+        If source and destination contain a duplicate leaf key and
+        overwrite_duplicate_keys is False.
+    """
+    if _path is None:
+        _path = []
+
+    merged = None
+    for key, source_value in source.items():
+        if key in dest:
+            dest_value = dest[key]
+            if isinstance(dest_value, Mapping) and isinstance(source_value, Mapping):
+                value = frozen_deep_merge(
+                    dest=dest_value,
+                    source=source_value,
+                    overwrite_duplicate_keys=overwrite_duplicate_keys,
+                    _path=_path + [str(key)]
+                )
+                if value is dest_value:
+                    continue
+            elif dest_value == source_value:
+                continue # same leaf value
+            elif overwrite_duplicate_keys:
+                value = freeze(source_value)
+            else:
+                raise ValueError('Conflict at %s' % '.'.join(_path + [str(key)]))
+        else:
+            value = freeze(source_value)
+
+        if merged is None:
+            merged = {
+                dest_key: freeze(unchanged_value) for dest_key, unchanged_value in dest.items()
+            }
+        merged[key] = value
+
+    if merged is None:
+        return freeze(dest)
+
+    return FrozenDict(merged)
@@ -8,17 +8,33 @@ import json
 import os
 import re
 import shutil
-import urllib.request
 from pathlib import Path
 from urllib.parse import urlparse
 
 import yaml
 
 
+# NOTE: use the libyaml based loader and dumper when PyYAML was built with libyaml since they
+#       are many times faster than the pure python implementations.
+#       The dumper is the full, rather than the safe, dumper since that is what yaml.dump
+#       has always written the step runner results with.
+YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YamlDumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
+JSON_FILE_EXTENSIONS = ('.json',)
+YAML_FILE_EXTENSIONS = ('.yml', '.yaml')
+
 def parse_yaml_or_json_file(yaml_or_json_file):
     """
     Parse YAML or JSON config files.
 
+    Notes
+    -----
+    Files with a YAML extension are only parsed as YAML.
+    Files with a JSON extension are parsed as JSON and, since JSON is mostly a subset of YAML,
+    then as YAML if they are not valid JSON.
+    Files with any other extension are parsed as JSON and then as YAML.
+
     Parameters
     ----------
     yaml_or_json_files : string
@@ -41,22 +57,29 @@ def parse_yaml_or_json_file(yaml_or_json_file):
     with open(yaml_or_json_file, 'r') as open_yaml_or_json_file:
         file_contents = open_yaml_or_json_file.read()
 
-    try:
-        parsed_file = json.loads(file_contents)
-    except ValueError as err:
-        json_parse_error = err
+    file_extension = os.path.splitext(yaml_or_json_file)[1].lower()
+
+    if file_extension not in YAML_FILE_EXTENSIONS:
+        try:
+            parsed_file = json.loads(file_contents)
+        except ValueError as err:
+            json_parse_error = err
 
     if not parsed_file:
         try:
-            parsed_file = yaml.safe_load(file_contents)
+            parsed_file = yaml.load(file_contents, Loader=YamlSafeLoader)
         except (yaml.scanner.ScannerError, yaml.parser.ParserError, ValueError) as err:
             yaml_parse_error = err
 
-    if json_parse_error and yaml_parse_error:
+    if yaml_parse_error and json_parse_error:
         raise ValueError(
             f"Error parsing file ({yaml_or_json_file}) as YAML or JSON: " +
             f"\n  JSON error: {str(json_parse_error)}" +
             f"\n  YAML error: {str(yaml_parse_error)}")
+    if yaml_parse_error:
+        raise ValueError(
+            f"Error parsing file ({yaml_or_json_file}) as YAML or JSON: " +
+            f"\n  YAML error: {str(yaml_parse_error)}")
 
     return parsed_file
 
@@ -121,6 +144,9 @@ def download_and_decompress_source_to_destination(
         source_file_name = os.path.basename(source_uri)
         destination_path = os.path.join(destination_dir, source_file_name)
 
+        # NOTE: imported here since urllib.request is slow to import and only needed for http(s)
+        import urllib.request # pylint: disable=import-outside-toplevel
+
         try:
             urllib.request.urlretrieve(
                 url=source_uri,
@@ -191,6 +217,62 @@ def get_file_hash(file_path):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
+def get_file_tree_hash(path, ignored_names=(), ignored_paths=()):
+    """Returns a hash of the contents of the given file, or of every file under the given
+    directory along with their paths relative to it.
+
+    Notes
+    -----
+    Files are hashed in sorted path order so the hash only changes if a file is added, removed,
+    renamed, or its contents change. Symbolic links are not followed, the path they point to is
+    hashed instead.
+
+    Parameters
+    ----------
+    path : str
+        File or directory to hash.
+    ignored_names : list of str, optional
+        Names of files and directories, at any depth under the given directory, to not hash.
+    ignored_paths : list of str, optional
+        Files and directories under the given directory to not hash.
+
+    Returns
+    -------
+    str
+        Hex encoded sha256 hash of the given file or directory,
+        or of the fact it does not exist if it does not.
+    """
+    tree_hash = hashlib.sha256()
+    if os.path.isfile(path):
+        tree_hash.update(f'file:{get_file_hash(path)}'.encode('utf-8'))
+        return tree_hash.hexdigest()
+    if not os.path.isdir(path):
+        tree_hash.update(b'missing')
+        return tree_hash.hexdigest()
+
+    ignored_names = set(ignored_names)
+    ignored_real_paths = {os.path.realpath(ignored_path) for ignored_path in ignored_paths}
+    for dir_path, dir_names, file_names in os.walk(path):
+        dir_names[:] = sorted(
+            dir_name for dir_name in dir_names
+            if dir_name not in ignored_names and \
+                os.path.realpath(os.path.join(dir_path, dir_name)) not in ignored_real_paths
+        )
+        for file_name in sorted(file_names):
+            file_path = os.path.join(dir_path, file_name)
+            if file_name in ignored_names or os.path.realpath(file_path) in ignored_real_paths:
+                continue
+
+            relative_path = Path(os.path.relpath(file_path, path)).as_posix()
+            if os.path.islink(file_path):
+                entry = f'link:{relative_path}:{os.readlink(file_path)}'
+            else:
+                entry = f'file:{relative_path}:{get_file_hash(file_path)}'
+            tree_hash.update(entry.encode('utf-8'))
+            tree_hash.update(b'\0')
+
+    return tree_hash.hexdigest()
+
 def upload_file(file_path, destination_uri, username=None, password=None): # pylint: disable=too-many-locals
     """Uploads a given file to a given destination.
 
@@ -256,6 +338,9 @@ def upload_file(file_path, destination_uri, username=None, password=None): # pyl
 
         upload_result = destination_path
     elif re.match(r'^http://|^https://', destination_uri):
+        # NOTE: imported here since urllib.request is slow to import and only needed for http(s)
+        import urllib.request # pylint: disable=import-outside-toplevel
+
         password_mgr = urllib.request.HTTPPasswordMgrWithDefaultRealm()
 
         if username:
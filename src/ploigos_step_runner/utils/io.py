@@ -1,9 +1,21 @@
+# pylint: disable=too-many-lines
 """Shared utilities for dealing with IO
 """
 
+import codecs
 import io
 import random
 import re
+import sys
+import threading
+import time
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+
+try:
+    import contextvars
+except ImportError: # pragma: no cover
+    # NOTE: python < 3.7 has no contextvars, TextIOContextRouter then routes per thread
+    contextvars = None
 
 
 def create_sh_redirect_to_multiple_streams_fn_callback(streams):
@@ -32,12 +44,21 @@ def create_sh_redirect_to_multiple_streams_fn_callback(streams):
     ...     sh.echo('hello world')
     hello world
 
+    Notes
+    -----
+    Any given TextIOContextRouter, such as sys.stdout while running a sub step, is resolved
+    to the stream it routes to when the callback is created, see get_current_stream.
+
     Returns
     -------
     function(data)
         Function that takes one parameter, data, and writes that value to all the given streams.
     """
 
+    # NOTE: sh calls the callback from its own threads, which do not share the context of
+    #       the thread creating the callback, so resolve any TextIOContextRouter now
+    streams = [get_current_stream(stream) for stream in streams]
+
     def sh_redirect_to_multiple_streams(data):
         for stream in streams:
             stream.write(data)
@@ -45,7 +66,7 @@ def create_sh_redirect_to_multiple_streams_fn_callback(streams):
     return sh_redirect_to_multiple_streams
 
 
-class TextIOSelectiveObfuscator(io.TextIOBase):
+class TextIOSelectiveObfuscator(io.TextIOBase): # pylint: disable=too-many-instance-attributes
     """Extends the base class for text streams to allow the obfuscation of given patterns.
 
     This is useful to prevent accidentally writing "sensitive" information to stdout/stderr.
@@ -59,20 +80,49 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
         False to use the same length replacement for any obfuscated text in the stream.
     replacement_char : char
         Character to replace the target strings to obfuscate with.
+    streaming : bool, optional
+        True to hold back the end of each write, up to one less than the length of the longest
+        obfuscation target, until the next write, newline, or flush so that targets split
+        across writes are still obfuscated.
+        False to obfuscate each write on its own.
 
     Attributes
     ----------
     __parent_stream : IOBase
-    __obfuscation_patterns : list
+    __obfuscation_targets : dict
+        Normalized obfuscation targets as keys, to de-duplicate them while keeping their order.
+    __obfuscation_pattern : re.Pattern
+        Single pattern matching any of the obfuscation targets, or None if no targets.
+    __obfuscation_holdback_length : int
+        Number of characters to hold back at the end of a write when streaming.
+    __streaming : bool
+    __pending : str
+        Text written when streaming but not yet written to the parent stream.
+    __pending_lock : threading.Lock
+        Lock held while updating the pending text, and writing what it holds back to the parent
+        stream, since a stream such as sys.stdout is written to by many threads at once.
     __replacement_char : char
     __randomize_replacement_length : bool
     __random_replacement_length_min : int
     __random_replacement_length_max : int
     """
 
-    def __init__(self, parent_stream, randomize_replacment_length=True, replacement_char='*'):
+    __OBFUSCATION_TARGET_GAP_PATTERN = r"""(?:[\s'"]|\\+[nrt])+"""
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        parent_stream,
+        randomize_replacment_length=True,
+        replacement_char='*',
+        streaming=False
+    ):
         self.__parent_stream = parent_stream
-        self.__obfuscation_patterns = []
+        self.__obfuscation_targets = {}
+        self.__obfuscation_pattern = None
+        self.__obfuscation_holdback_length = 0
+        self.__streaming = streaming
+        self.__pending = ''
+        self.__pending_lock = threading.Lock()
         self.__replacement_char = replacement_char
         self.__randomize_replacement_length = randomize_replacment_length
         self.__random_replacement_length_min = 5
@@ -120,6 +170,18 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
         """
         return self.__randomize_replacement_length
 
+    @property
+    def streaming(self):
+        """
+        Returns
+        -------
+        bool
+            True if this stream holds back the end of each write so that targets split across
+            writes are still obfuscated.
+            False if this stream obfuscates each write on its own.
+        """
+        return self.__streaming
+
     def add_obfuscation_targets(self, targets):
         """Adds a target pattern to be obfuscated whenever writing to this stream.
 
@@ -129,6 +191,13 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
         can be printed. so the regex gets pretty involved to escape the right things and ignore
         whitespace, so forth and so on.
 
+        Any run of whitespace in a target matches any run of whitespace, quotes, and escaped
+        whitespace (ex: '\\n' as printed by json.dumps) in the written text.
+
+        Targets are de-duplicated and then all compiled into one pattern, structured as a trie
+        so that targets sharing a prefix share the work of matching it, so that obfuscating any
+        number of targets only takes a single pass over the written text.
+
         There are unit tests covering the scenarios this is dealing with, if you are messing in
         here be sure you don't break any of the existing unit tests.
 
@@ -140,29 +209,118 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
         if not isinstance(targets, list):
             targets = [targets]
 
+        has_new_targets = False
         for target in targets:
-            target_pattern = target
+            # replace any amount of whitespace with a single space and
+            # strip off leading and trialing whitespace
+            normalized_target = re.sub(r'\s+', ' ', target).strip()
 
-            # replace any amount of whitespace with a single space
-            target_pattern = re.sub(r'\s+', ' ', target_pattern)
+            # ignore empty and already added targets
+            if not normalized_target or normalized_target in self.__obfuscation_targets:
+                continue
 
-            # strip off leading and trialing whitespace
-            target_pattern = target_pattern.strip()
+            self.__obfuscation_targets[normalized_target] = True
+            self.__obfuscation_holdback_length = max(
+                self.__obfuscation_holdback_length,
+                len(normalized_target) - 1
+            )
+            has_new_targets = True
+
+        if has_new_targets:
+            self.__obfuscation_pattern = re.compile(
+                TextIOSelectiveObfuscator.__create_obfuscation_pattern(
+                    self.__obfuscation_targets.keys()
+                )
+            )
+
+    @staticmethod
+    def __create_obfuscation_pattern(normalized_targets):
+        """Creates a single regex pattern matching any of the given targets.
+
+        Parameters
+        ----------
+        normalized_targets : iterable of str
+            Targets with all whitespace already normalized to single spaces.
+
+        Returns
+        -------
+        str
+            Regex pattern matching the longest of the given targets at any given position,
+            allowing any whitespace like characters where there is a space in a target.
+        """
+        # build trie of the targets, where the empty string key marks the end of a target
+        trie = {}
+        for normalized_target in normalized_targets:
+            node = trie
+            for char in normalized_target:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        return TextIOSelectiveObfuscator.__create_trie_pattern(trie)
+
+    @staticmethod
+    def __create_trie_pattern(node):
+        """Creates the regex pattern for the given trie node.
+
+        Notes
+        -----
+        Only recurses where the trie branches, since targets such as private keys can be far
+        longer than the recursion limit.
+
+        Parameters
+        ----------
+        node : dict
+            Trie node to create the pattern for.
+
+        Returns
+        -------
+        str
+            Regex pattern matching any of the target suffixes below the given trie node.
+        """
+        pattern = ''
+        while True:
+            is_end_of_target = '' in node
+            children = [(char, child) for char, child in node.items() if char != '']
+
+            if not children:
+                return pattern
+
+            if len(children) == 1 and not is_end_of_target:
+                char, node = children[0]
+                pattern += TextIOSelectiveObfuscator.__create_trie_char_pattern(char)
+                continue
+
+            branches = '|'.join(
+                TextIOSelectiveObfuscator.__create_trie_char_pattern(char) +
+                TextIOSelectiveObfuscator.__create_trie_pattern(child)
+                for char, child in children
+            )
 
-            # escape for use in regex pattern
-            target_pattern = re.escape(target_pattern)
+            # NOTE: optional, greedy, group so that the longest matching target is obfuscated
+            #       when one target is the prefix of another
+            if is_end_of_target:
+                return f'{pattern}(?:{branches})?'
 
-            # the spaces we added in now got escaped, so unescape them and turn them into .*
-            target_pattern = re.sub(r'\\ ', r'.*', target_pattern)
+            return f'{pattern}(?:{branches})'
 
-            # eat up pre and post newlines
-            # target_pattern = f"(\s*)({target_pattern})(\s*)"
+    @staticmethod
+    def __create_trie_char_pattern(char):
+        """
+        Parameters
+        ----------
+        char : str
+            Single character from a normalized target.
 
-            # compile the pattern for re-use and make sure that .* matches accross lines
-            target_compiled_pattern = re.compile(target_pattern, re.DOTALL)
+        Returns
+        -------
+        str
+            Regex pattern for the given character, where a space matches any run of
+            whitespace, quotes, and escaped whitespace.
+        """
+        if char == ' ':
+            return TextIOSelectiveObfuscator.__OBFUSCATION_TARGET_GAP_PATTERN
 
-            # add the pattern
-            self.__obfuscation_patterns.append(target_compiled_pattern)
+        return re.escape(char)
 
     def __obfuscator(self, match):
         """Given a regex match returns a corresponding obfuscated string.
@@ -211,24 +369,78 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
         """
 
         if isinstance(given, bytes):
-            obfuscated = given.decode('utf-8')
-        else:
-            obfuscated = given
+            given = given.decode('utf-8')
+
+        if not self.streaming:
+            return self.parent_stream.write(self.__obfuscate(given))
+
+        with self.__pending_lock:
+            text = self.__pending + given
+
+            # hold back as much of the end of the text as could be the start of a target,
+            # but never hold back a complete line
+            flush_end = max(
+                len(text) - self.__obfuscation_holdback_length,
+                text.rfind('\n') + 1
+            )
+            if flush_end <= 0:
+                self.__pending = text
+                return len(given)
+
+            obfuscated = []
+            written_end = 0
+            if self.__obfuscation_pattern is not None:
+                for match in self.__obfuscation_pattern.finditer(text):
+                    if match.start() >= flush_end:
+                        break
+
+                    # never split a target that starts before the end of what is being flushed
+                    obfuscated.append(text[written_end:match.start()])
+                    obfuscated.append(self.__obfuscator(match))
+                    written_end = match.end()
+                    flush_end = max(flush_end, written_end)
 
-        for obfuscation_pattern in self.__obfuscation_patterns:
-            obfuscated = obfuscation_pattern.sub(self.__obfuscator, obfuscated)
+            obfuscated.append(text[written_end:flush_end])
+            self.__pending = text[flush_end:]
 
-        return self.parent_stream.write(obfuscated)
+            # NOTE: written while holding the lock so that text from different writes reaches
+            #       the parent stream in the order it was written
+            self.parent_stream.write(''.join(obfuscated))
+
+        return len(given)
 
     def flush(self):
-        """Flush the parent stream.
+        """Write any text held back when streaming and flush the parent stream.
 
         See Also
         --------
         io.TextIOBase.flush
         """
+        with self.__pending_lock:
+            if self.__pending:
+                pending = self.__pending
+                self.__pending = ''
+                self.parent_stream.write(self.__obfuscate(pending))
+
         self.parent_stream.flush()
 
+    def __obfuscate(self, text):
+        """
+        Parameters
+        ----------
+        text : str
+            Text to obfuscate.
+
+        Returns
+        -------
+        str
+            Given text with all obfuscation targets obfuscated.
+        """
+        if self.__obfuscation_pattern is None:
+            return text
+
+        return self.__obfuscation_pattern.sub(self.__obfuscator, text)
+
 
 class TextIOIndenter(io.TextIOBase):
     """Adds an indent to the first string written and after every new line written to this stream.
@@ -253,13 +465,26 @@ class TextIOIndenter(io.TextIOBase):
         Character to use for indent.
         Will be multiplied by the indent_size and the ident_level and prepended before
         each line written to this stream.
+
+    Attributes
+    ----------
+    __indent : str
+        Indent to write at the start of every line, created once since the indent
+        level, size, and character can not change.
+    __new_line_replacement : str
+        Replacement for new lines matched by __NEW_LINE_PATTERN, the matched new line
+        followed by the indent.
     """
 
+    __NEW_LINE_PATTERN = re.compile(r"(\r\n|\r|\n)")
+
     def __init__(self, parent_stream, indent_level=0, indent_size=4, indent_char=' '):
         self.__parent_stream = parent_stream
         self.__indent_level = indent_level
         self.__indent_size = indent_size
         self.__indent_char = indent_char
+        self.__indent = indent_char * (indent_size * indent_level)
+        self.__new_line_replacement = "\\1" + self.__indent.replace('\\', '\\\\')
         self.__unwritten_to = True
         super().__init__()
 
@@ -401,20 +626,25 @@ class TextIOIndenter(io.TextIOBase):
         io.TextIOBase.write
         """
         if isinstance(given, bytes):
-            indented = given.decode('utf-8')
+            given = given.decode('utf-8')
+
+        # fast path, nothing to indent
+        if not self.__indent:
+            self.__unwritten_to = False
+            return self.parent_stream.write(given)
+
+        # add indent after every new line
+        if '\r' in given:
+            # NOTE: \1 is capture group one and contains the original new line character
+            indented = TextIOIndenter.__NEW_LINE_PATTERN.sub(self.__new_line_replacement, given)
+        elif '\n' in given:
+            indented = given.replace('\n', '\n' + self.__indent)
         else:
             indented = given
 
-        # create the indent to insert at begining of given text and every new line in that text
-        indent_chars = self.indent_char * (self.indent_size * self.indent_level)
-
         if self.__unwritten_to:
             self.__unwritten_to = False
-            indented = f"{indent_chars}{indented}"
-
-        # add indent after every new line
-        # NOTE: \1 is capture group one and contains the original new line character
-        indented = re.sub(r"(\r\n|\r|\n)", r"\1" + indent_chars, indented)
+            indented = self.__indent + indented
 
         return self.parent_stream.write(indented)
 
@@ -426,3 +656,597 @@ class TextIOIndenter(io.TextIOBase):
         io.TextIOBase.flush
         """
         self.parent_stream.flush()
+
+
+class TextIOTee(io.TextIOBase):
+    """Writes everything written to this stream to all of the given streams.
+
+    Parameters
+    ----------
+    streams : list of IOBase
+        Streams to write to.
+    """
+
+    def __init__(self, streams):
+        self.__streams = list(streams)
+        super().__init__()
+
+    @property
+    def streams(self):
+        """
+        Returns
+        -------
+        list of IOBase
+            Streams everything written to this stream is written to.
+        """
+        return self.__streams
+
+    def write(self, given):
+        """Writes the given string to all of the streams.
+
+        Parameters
+        ----------
+        given : str
+            Given string to write to all of the streams.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+
+        See Also
+        --------
+        io.TextIOBase.write
+        """
+        for stream in self.__streams:
+            stream.write(given)
+
+        return len(given)
+
+    def flush(self):
+        """Flush all of the streams.
+
+        See Also
+        --------
+        io.TextIOBase.flush
+        """
+        for stream in self.__streams:
+            stream.flush()
+
+
+class TextIOBufferedTee(TextIOTee): # pylint: disable=too-many-instance-attributes
+    """Writes everything written to this stream to all of the given streams in batches.
+
+    Rather than every write to this stream being a write to every one of the streams,
+    writes are buffered and written to all of the streams together once the buffered writes
+    reach the buffer size or the flush interval has passed since the last batch was written.
+    This makes it cheap to write the many small chunks of output sh hands to its callbacks.
+
+    Notes
+    -----
+    Any given TextIOContextRouter, such as sys.stdout while running a sub step, is resolved
+    to the stream it routes to when this stream is created, see get_current_stream.
+
+    Writes are buffered in one ordered queue per stream, shared by all TextIOBufferedTee
+    writing to that stream, so that TextIOBufferedTee sharing a stream, ex: one for stdout and
+    one for stderr both writing to the same file, write to it in the order they were written to
+    rather than in batches from one and then the other.
+
+    Buffering a write only waits for other writes to be appended to, or taken from, the queues,
+    never for a stream to be written to, so a slow stream, such as a console, only holds up the
+    writing of batches by the TextIOBufferedTee writing to it and never the writers.
+
+    Closing this stream writes any buffered writes and flushes, but does not close,
+    all of the streams. Any error writing to the streams is raised when closing, unless
+    closed when leaving a with statement because of another error, which is not replaced.
+
+    Parameters
+    ----------
+    streams : list of IOBase
+        Streams to write to.
+    buffer_size : int, optional
+        Number of buffered characters at which they are written to the streams.
+    flush_interval : float, optional
+        Maximum number of seconds writes are buffered before being written to the streams.
+    background : bool, optional
+        True to write to the streams from a background thread, so that writers, such as
+        sh reading from a subprocess pipe, never wait on slow streams.
+        False to write to the streams from the writing thread.
+
+    Attributes
+    ----------
+    __STREAM_QUEUES_LOCK : threading.Lock
+        Lock held while using the stream queues, but never while writing to the streams.
+    __STREAM_QUEUES : dict
+        Key is the id of a stream, value is a dict with the `stream`, the ordered `chunks`
+        written to it but not yet written to the stream, the number of open
+        TextIOBufferedTee writing to it, `tees`, and the `write_lock` held while taking the
+        chunks and writing them to the stream so that batches are written in order.
+
+    Examples
+    --------
+    >>> with open('/tmp/results_file', 'w') as results_file, \\
+    ...         TextIOBufferedTee([sys.stdout, results_file], background=True) as out_tee:
+    ...     sh.echo(
+    ...         'hello world',
+    ...         _out=create_sh_redirect_to_multiple_streams_fn_callback([out_tee])
+    ...     )
+    hello world
+    """
+
+    DEFAULT_BUFFER_SIZE = 64 * 1024
+    DEFAULT_FLUSH_INTERVAL = 0.1
+
+    __STREAM_QUEUES_LOCK = threading.Lock()
+    __STREAM_QUEUES = {}
+
+    def __init__(
+        self,
+        streams,
+        buffer_size=DEFAULT_BUFFER_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+        background=False
+    ):
+        super().__init__([get_current_stream(stream) for stream in streams])
+        self.__buffer_size = buffer_size
+        self.__flush_interval = flush_interval
+        self.__buffer_length = 0
+        self.__last_write_time = time.monotonic()
+        self.__condition = threading.Condition()
+        self.__closing = False
+        self.__writer_error = None
+
+        with TextIOBufferedTee.__STREAM_QUEUES_LOCK:
+            self.__stream_queues = []
+            for stream in self.streams:
+                stream_queue = TextIOBufferedTee.__STREAM_QUEUES.get(id(stream))
+                if stream_queue is None:
+                    stream_queue = {
+                        'stream': stream,
+                        'chunks': [],
+                        'tees': 0,
+                        'write_lock': threading.Lock()
+                    }
+                    TextIOBufferedTee.__STREAM_QUEUES[id(stream)] = stream_queue
+                stream_queue['tees'] += 1
+                self.__stream_queues.append(stream_queue)
+
+        self.__writer_thread = None
+        if background:
+            self.__writer_thread = threading.Thread(
+                target=self.__write_in_background,
+                name='TextIOBufferedTee',
+                daemon=True
+            )
+            self.__writer_thread.start()
+
+    @property
+    def background(self):
+        """
+        Returns
+        -------
+        bool
+            True if writing to the streams from a background thread.
+            False if writing to the streams from the writing thread.
+        """
+        return self.__writer_thread is not None
+
+    def write(self, given):
+        """Buffers the given string to be written to all of the streams.
+
+        Parameters
+        ----------
+        given : str or bytes (utf-8)
+            Given string to write to all of the streams.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+
+        Raises
+        ------
+        Exception
+            Any error the background thread got writing to the streams.
+
+        See Also
+        --------
+        io.TextIOBase.write
+        """
+        if isinstance(given, bytes):
+            given = given.decode('utf-8')
+
+        with self.__condition:
+            self.__raise_writer_error()
+
+        with TextIOBufferedTee.__STREAM_QUEUES_LOCK:
+            for stream_queue in self.__stream_queues:
+                stream_queue['chunks'].append(given)
+
+        with self.__condition:
+            self.__buffer_length += len(given)
+            is_batch_ready = self.__buffer_length >= self.__buffer_size or \
+                time.monotonic() - self.__last_write_time >= self.__flush_interval
+
+            if is_batch_ready and self.background:
+                self.__condition.notify()
+
+        if is_batch_ready and not self.background:
+            self.__write_buffer()
+
+        return len(given)
+
+    def flush(self):
+        """Write any buffered writes to, and then flush, all of the streams.
+
+        Raises
+        ------
+        Exception
+            Any error the background thread got writing to the streams.
+
+        See Also
+        --------
+        io.TextIOBase.flush
+        """
+        with self.__condition:
+            self.__raise_writer_error()
+
+        self.__write_buffer()
+        for stream_queue in self.__stream_queues:
+            with stream_queue['write_lock']:
+                stream_queue['stream'].flush()
+
+    def close(self):
+        """Stop the background thread, if there is one, and write any buffered writes to,
+        and then flush, all of the streams.
+
+        Raises
+        ------
+        Exception
+            Any error the background thread got writing to the streams.
+
+        See Also
+        --------
+        io.TextIOBase.close
+        """
+        if self.closed:
+            return
+
+        try:
+            if self.background:
+                with self.__condition:
+                    self.__closing = True
+                    self.__condition.notify()
+                self.__writer_thread.join()
+
+            # NOTE: io.TextIOBase.close will flush
+            super().close()
+        finally:
+            with TextIOBufferedTee.__STREAM_QUEUES_LOCK:
+                for stream_queue in self.__stream_queues:
+                    stream_queue['tees'] -= 1
+                    if stream_queue['tees'] == 0:
+                        TextIOBufferedTee.__STREAM_QUEUES.pop(id(stream_queue['stream']), None)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close this stream, raising any error writing to the streams unless leaving the
+        with statement because of another error, which would otherwise be replaced.
+
+        See Also
+        --------
+        io.IOBase.__exit__
+        """
+        try:
+            self.close()
+        except Exception: # pylint: disable=broad-except
+            if exc_type is None:
+                raise
+
+    def __write_buffer(self):
+        """Write any buffered writes to all of the streams, in the order they were written by
+        any TextIOBufferedTee sharing the streams, as one batch per stream.
+        """
+        with self.__condition:
+            self.__buffer_length = 0
+            self.__last_write_time = time.monotonic()
+
+        for stream_queue in self.__stream_queues:
+            # NOTE: the chunks are taken while holding the write lock of the stream so that
+            #       batches taken by different TextIOBufferedTee are written in the order taken
+            with stream_queue['write_lock']:
+                with TextIOBufferedTee.__STREAM_QUEUES_LOCK:
+                    batch = ''.join(stream_queue['chunks'])
+                    stream_queue['chunks'].clear()
+
+                if batch:
+                    stream_queue['stream'].write(batch)
+
+    def __write_in_background(self):
+        """Writes batches of buffered writes to all of the streams until closing.
+        """
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: self.__closing or self.__buffer_length >= self.__buffer_size,
+                    timeout=self.__flush_interval
+                )
+                closing = self.__closing
+
+            try:
+                self.__write_buffer()
+            except Exception as error: # pylint: disable=broad-except
+                with self.__condition:
+                    self.__writer_error = error
+
+            if closing:
+                return
+
+    def __raise_writer_error(self):
+        """Raises, once, any error the background thread got writing to the streams.
+
+        Notes
+        -----
+        Must be called while holding __condition.
+        """
+        if self.__writer_error is not None:
+            error = self.__writer_error
+            self.__writer_error = None
+            raise error
+
+
+@contextmanager
+def tail_file(file_path, stream, poll_interval=0.1, chunk_size=64 * 1024):
+    """Context manager that writes everything appended to the given file while in the context
+    to the given stream.
+
+    Useful for showing the output of a process writing directly to a file, without that output
+    having to pass through this process on its way to the file.
+
+    Notes
+    -----
+    The file is read from a background thread, polling for new content, and the rest of the
+    file is written to the stream before leaving the context.
+
+    Any given TextIOContextRouter, such as sys.stdout while running a sub step, is resolved
+    to the stream it routes to when entering the context, see get_current_stream.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the existing file to tail.
+        Only content appended after entering the context is written to the stream.
+    stream : IOBase
+        Stream to write what is appended to the file to.
+    poll_interval : float, optional
+        Seconds to wait before reading the file again once reaching the end of it.
+    chunk_size : int, optional
+        Maximum number of bytes to read from the file at once.
+
+    Examples
+    --------
+    >>> with open('/tmp/output_file', 'w') as output_file, \\
+    ...         tail_file('/tmp/output_file', sys.stdout):
+    ...     sh.echo('hello world', _out=output_file)
+    hello world
+    """
+    stream = get_current_stream(stream)
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    stop = threading.Event()
+
+    with open(file_path, 'rb') as file:
+        file.seek(0, io.SEEK_END)
+
+        def write_to_stream(final=False):
+            while True:
+                data = file.read(chunk_size)
+                text = decoder.decode(data, final=final and not data)
+                if text:
+                    stream.write(text)
+                if not data:
+                    return
+
+        def tail():
+            while not stop.is_set():
+                write_to_stream()
+                stop.wait(poll_interval)
+
+        tail_thread = threading.Thread(target=tail, name='tail_file', daemon=True)
+        tail_thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            tail_thread.join()
+            write_to_stream(final=True)
+            stream.flush()
+
+
+class TextIOContextRouter(io.TextIOBase):
+    """Routes everything written to this stream to the stream routed to for the current context,
+    see contextvars, or if none, to the default stream.
+
+    Unlike contextlib.redirect_stdout, which swaps the process global sys.stdout, routing is
+    specific to the current thread or asyncio task, allowing concurrently running code
+    to each write to their own streams.
+
+    Notes
+    -----
+    Python < 3.7 has no contextvars, so routing is then only specific to the current thread,
+    which is all that is needed since steps and sub steps run concurrently in threads.
+
+    Parameters
+    ----------
+    default_stream : IOBase
+        Stream to write to if no stream has been routed to for the current context.
+    """
+
+    def __init__(self, default_stream):
+        self.__default_stream = default_stream
+        if contextvars is not None:
+            self.__routed_stream_var = contextvars.ContextVar(
+                f'TextIOContextRouter-{id(self)}',
+                default=None
+            )
+            self.__routed_stream_thread_local = None
+        else:
+            self.__routed_stream_var = None
+            self.__routed_stream_thread_local = threading.local()
+        super().__init__()
+
+    @property
+    def default_stream(self):
+        """
+        Returns
+        -------
+        IOBase
+            Stream to write to if no stream has been routed to for the current context.
+        """
+        return self.__default_stream
+
+    @property
+    def current_stream(self):
+        """
+        Returns
+        -------
+        IOBase
+            Stream routed to for the current context, or if none, the default stream.
+        """
+        routed_stream = self.__get_routed_stream()
+        if routed_stream is None:
+            return self.default_stream
+
+        return routed_stream
+
+    @contextmanager
+    def route(self, stream):
+        """Context manager to route everything written to this stream in the current context
+        to the given stream.
+
+        Parameters
+        ----------
+        stream : IOBase
+            Stream to route to.
+        """
+        previous_routed_stream = self.__get_routed_stream()
+        self.__set_routed_stream(stream)
+        try:
+            yield stream
+        finally:
+            self.__set_routed_stream(previous_routed_stream)
+
+    def write(self, given):
+        """Writes to the stream routed to for the current context.
+
+        Parameters
+        ----------
+        given : str
+            Given string to write to the stream routed to for the current context.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+
+        See Also
+        --------
+        io.TextIOBase.write
+        """
+        return self.current_stream.write(given)
+
+    def flush(self):
+        """Flush the stream routed to for the current context.
+
+        See Also
+        --------
+        io.TextIOBase.flush
+        """
+        self.current_stream.flush()
+
+    def __get_routed_stream(self):
+        """
+        Returns
+        -------
+        IOBase or None
+            Stream routed to for the current context or None if none.
+        """
+        if self.__routed_stream_var is not None:
+            return self.__routed_stream_var.get()
+
+        return getattr(self.__routed_stream_thread_local, 'stream', None)
+
+    def __set_routed_stream(self, stream):
+        """
+        Parameters
+        ----------
+        stream : IOBase or None
+            Stream to route to for the current context or None to route to the default stream.
+        """
+        if self.__routed_stream_var is not None:
+            self.__routed_stream_var.set(stream)
+        else:
+            self.__routed_stream_thread_local.stream = stream
+
+
+def get_current_stream(stream):
+    """Gets the stream that writes to the given stream currently end up in.
+
+    Parameters
+    ----------
+    stream : IOBase
+        Stream to resolve.
+
+    Returns
+    -------
+    IOBase
+        If given stream is a TextIOContextRouter then the stream it currently routes to,
+        else the given stream.
+    """
+    if isinstance(stream, TextIOContextRouter):
+        return stream.current_stream
+
+    return stream
+
+
+@contextmanager
+def sys_output_context_routers():
+    """Context manager to replace sys.stdout and sys.stderr with TextIOContextRouters, which
+    default to the existing sys.stdout and sys.stderr, for the duration of the context.
+
+    Notes
+    -----
+    Should be entered before starting any threads that redirect sys.stdout or sys.stderr using
+    redirect_sys_output.
+
+    If sys.stdout and sys.stderr are already TextIOContextRouters they are left as is.
+    """
+    if isinstance(sys.stdout, TextIOContextRouter) and \
+            isinstance(sys.stderr, TextIOContextRouter):
+        yield
+    else:
+        with redirect_stdout(TextIOContextRouter(sys.stdout)), \
+                redirect_stderr(TextIOContextRouter(sys.stderr)):
+            yield
+
+
+@contextmanager
+def redirect_sys_output(stdout, stderr):
+    """Context manager to redirect sys.stdout and sys.stderr to the given streams.
+
+    If sys.stdout and sys.stderr are TextIOContextRouters, see sys_output_context_routers,
+    then only writes from the current context are redirected, otherwise falls back to
+    contextlib.redirect_stdout and contextlib.redirect_stderr.
+
+    Parameters
+    ----------
+    stdout : IOBase
+        Stream to redirect sys.stdout to.
+    stderr : IOBase
+        Stream to redirect sys.stderr to.
+    """
+    if isinstance(sys.stdout, TextIOContextRouter) and \
+            isinstance(sys.stderr, TextIOContextRouter):
+        with sys.stdout.route(stdout), sys.stderr.route(stderr): # pylint: disable=no-member
+            yield
+    else:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            yield
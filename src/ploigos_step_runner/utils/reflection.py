@@ -2,6 +2,10 @@
 Shared utilities for dealing with Python reflection.
 """
 
+import importlib
+import sys
+import types
+
 def import_and_get_class(module_name, class_name):
     """Dynamically loads a class from a given module.
 
@@ -25,3 +29,83 @@ def import_and_get_class(module_name, class_name):
         clazz = None
 
     return clazz
+
+
+def import_lazy_attribute(module_name, attribute_name, attribute_modules):
+    """Imports an attribute of a module from the module that defines it the first time it is
+    accessed, for use by a module level `__getattr__` (PEP 562).
+
+    Notes
+    -----
+    The imported attribute is set on the given module so later accesses do not
+    go through the module level `__getattr__` again.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module to get the attribute of.
+    attribute_name : str
+        Name of the attribute to get.
+    attribute_modules : dict of str to str
+        Names of the lazily imported attributes of the given module to the names of the modules
+        that define them.
+
+    Returns
+    -------
+    object
+        The attribute imported from the module that defines it.
+
+    Raises
+    ------
+    AttributeError
+        If the given attribute is not one of the lazily imported attributes.
+
+    Examples
+    --------
+    >>> def __getattr__(name):
+    ...     return import_lazy_attribute(__name__, name, {'Git': 'my_package.git'})
+    >>> enable_module_getattr(__name__)
+    """
+    if attribute_name not in attribute_modules:
+        raise AttributeError(f"module '{module_name}' has no attribute '{attribute_name}'")
+
+    attribute = getattr(
+        importlib.import_module(attribute_modules[attribute_name]),
+        attribute_name
+    )
+    setattr(sys.modules[module_name], attribute_name, attribute)
+
+    return attribute
+
+
+class ModuleWithGetattr(types.ModuleType): # pylint: disable=too-few-public-methods
+    """Module that supports a module level `__getattr__` (PEP 562) on Python versions before 3.7,
+    see enable_module_getattr.
+    """
+
+    def __getattr__(self, name):
+        module_getattr = self.__dict__.get('__getattr__')
+        if module_getattr is None:
+            raise AttributeError(f"module '{self.__name__}' has no attribute '{name}'")
+
+        return module_getattr(name)
+
+
+def enable_module_getattr(module_name):
+    """Makes the module level `__getattr__` (PEP 562) of the given module work on Python versions
+    before 3.7, which do not support it, by making the module a ModuleWithGetattr.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module, which must already be in sys.modules, to enable the
+        module level `__getattr__` of.
+
+    Examples
+    --------
+    >>> def __getattr__(name):
+    ...     return import_lazy_attribute(__name__, name, {'Git': 'my_package.git'})
+    >>> enable_module_getattr(__name__)
+    """
+    if sys.version_info < (3, 7):
+        sys.modules[module_name].__class__ = ModuleWithGetattr
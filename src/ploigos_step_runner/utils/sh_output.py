@@ -0,0 +1,93 @@
+"""Shared utilities for writing the output of sh commands to files.
+"""
+
+import os
+from contextlib import contextmanager
+
+from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.utils.io import (TextIOBufferedTee, TextIOSelectiveObfuscator,
+                                          create_sh_redirect_to_multiple_streams_fn_callback,
+                                          tail_file)
+
+
+@contextmanager
+def sh_output_to_file(output_file_path, stdout, stderr, passthrough=False, append=False):
+    """Context manager providing the sh special keyword arguments to write the stdout and stderr
+    of a sh command to both the given file and the given streams.
+
+    Notes
+    -----
+    By default the output of the command passes through this process, which writes it to
+    both the given file and the given streams using a TextIOBufferedTee for each of stdout
+    and stderr.
+
+    With passthrough the command writes its stdout and stderr directly to the given file, without
+    the output passing through this process, and this process only tails that file to write the
+    output to the given stdout stream. This greatly reduces the CPU used by this process for long
+    running commands with a lot of output. When leaving the context any decrypted values
+    are obfuscated in the file, streaming it through a TextIOSelectiveObfuscator.
+
+    Parameters
+    ----------
+    output_file_path : str
+        Path to the file to write the stdout and stderr of the command to.
+    stdout : IOBase
+        Stream to write the stdout of the command to.
+    stderr : IOBase
+        Stream to write the stderr of the command to.
+        Ignored with passthrough since the stdout and stderr of the command are then merged.
+    passthrough : bool, optional
+        True to have the command write directly to the given file.
+        False to have the output of the command pass through this process.
+    append : bool, optional
+        True to append to the given file.
+        False to replace the given file.
+
+    Yields
+    ------
+    dict
+        sh special keyword arguments, `_out` and `_err`, to pass to the sh command.
+
+    Examples
+    --------
+    >>> with sh_output_to_file('/tmp/output_file', sys.stdout, sys.stderr, True) as sh_output:
+    ...     sh.echo('hello world', **sh_output)
+    hello world
+    """
+    mode = 'a' if append else 'w'
+
+    if not passthrough:
+        with open(output_file_path, mode, encoding='utf-8') as output_file, \
+                TextIOBufferedTee([stdout, output_file], background=True) as out_tee, \
+                TextIOBufferedTee([stderr, output_file], background=True) as err_tee:
+            yield {
+                '_out': create_sh_redirect_to_multiple_streams_fn_callback([out_tee]),
+                '_err': create_sh_redirect_to_multiple_streams_fn_callback([err_tee])
+            }
+        return
+
+    # NOTE: register the obfuscator before running the command so that it is given
+    #       every value decrypted up to when the file is obfuscated
+    obfuscated_output_file_path = f'{output_file_path}.obfuscated'
+    try:
+        with open(obfuscated_output_file_path, 'w', encoding='utf-8') as obfuscated_output_file:
+            obfuscated_output = TextIOSelectiveObfuscator(
+                parent_stream=obfuscated_output_file,
+                streaming=True
+            )
+            DecryptionUtils.register_obfuscation_stream(obfuscated_output)
+            try:
+                with open(output_file_path, mode, encoding='utf-8') as output_file, \
+                        tail_file(output_file_path, stdout):
+                    yield {
+                        '_out': output_file,
+                        '_err': output_file
+                    }
+            finally:
+                with open(output_file_path, encoding='utf-8', errors='replace') as output_file:
+                    for chunk in iter(lambda: output_file.read(64 * 1024), ''):
+                        obfuscated_output.write(chunk)
+                obfuscated_output.flush()
+                DecryptionUtils.unregister_obfuscation_stream(obfuscated_output)
+    finally:
+        os.replace(obfuscated_output_file_path, output_file_path)
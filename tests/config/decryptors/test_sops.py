@@ -9,7 +9,7 @@ from unittest.mock import patch
 
 from tests.helpers.base_test_case import BaseTestCase
 from tests.helpers.sops_integration_test_case import SOPSIntegrationTestCase
-from tests.helpers.test_utils import Any
+from tests.helpers.test_utils import Any, create_sops_side_effect
 
 from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner.config.decryptors.sops import SOPS
@@ -223,6 +223,116 @@ class TestSOPSConfigValueDecryptor(BaseTestCase):
             sops_value_path,
             '["step-runner-config"]["step-foo"][0]["config"]["test1"]')
 
+    def test_decrypt_bulk_decrypt_parent_source_file(self, sops_mock):
+        encrypted_config_file_path = os.path.join(
+            os.path.dirname(__file__),
+            'files',
+            'step-runner-config-secret-stuff.yml'
+        )
+
+        sops_mock.side_effect = create_sops_side_effect(json.dumps({
+            'step-runner-config': {
+                'global-environment-defaults': {
+                    'DEV': {
+                        'kube-api-token': 'dev-token',
+                        'port': 8080
+                    },
+                    'TEST': {
+                        'kube-api-token': 'test-token'
+                    }
+                }
+            }
+        }))
+
+        sops_decryptor = SOPS(bulk_decrypt=True)
+        self.assertTrue(sops_decryptor.bulk_decrypt)
+
+        dev_token = sops_decryptor.decrypt(ConfigValue(
+            value='ENC[AES256_GCM,data:UGKfnzsSrciR7GXZJhOCMmFrz3Y6V3pZsd3P,iv:yuReqA+n+rRXVHMc+2US5t7yPx54sooZSXWV4KLjDIs=,tag:jueP7/ZWLfYrEuhh+4eS8g==,type:str]',
+            parent_source=encrypted_config_file_path,
+            path_parts=['step-runner-config', 'global-environment-defaults', 'DEV', 'kube-api-token']
+        ))
+        test_token = sops_decryptor.decrypt(ConfigValue(
+            value='ENC[AES256_GCM,data:foo,type:str]',
+            parent_source=encrypted_config_file_path,
+            path_parts=['step-runner-config', 'global-environment-defaults', 'TEST', 'kube-api-token']
+        ))
+        dev_port = sops_decryptor.decrypt(ConfigValue(
+            value='ENC[AES256_GCM,data:bar,type:int]',
+            parent_source=encrypted_config_file_path,
+            path_parts=['step-runner-config', 'global-environment-defaults', 'DEV', 'port']
+        ))
+        does_not_exist = sops_decryptor.decrypt(ConfigValue(
+            value='ENC[AES256_GCM,data:bar,type:str]',
+            parent_source=encrypted_config_file_path,
+            path_parts=['step-runner-config', 'global-environment-defaults', 'PROD', 'port']
+        ))
+
+        self.assertEqual(dev_token, 'dev-token')
+        self.assertEqual(test_token, 'test-token')
+        self.assertEqual(dev_port, '8080')
+        self.assertIsNone(does_not_exist)
+        sops_mock.assert_called_once_with(
+            '--decrypt',
+            '--output-type=json',
+            None,
+            encrypted_config_file_path,
+            _in=None,
+            _out=Any(StringIO),
+            _err=Any(StringIO)
+        )
+
+    def test_decrypt_bulk_decrypt_clear_cache(self, sops_mock):
+        encrypted_config = {
+            'step-runner-config': {
+                'kube-api-token': 'ENC[AES256_GCM,data:UGKfnzsSrciR7GXZJhOCMmFrz3Y6V3pZsd3P,type:str]'
+            }
+        }
+        config_value = ConfigValue(
+            value=encrypted_config['step-runner-config']['kube-api-token'],
+            parent_source=encrypted_config,
+            path_parts=['step-runner-config', 'kube-api-token']
+        )
+
+        sops_mock.side_effect = create_sops_side_effect(json.dumps({
+            'step-runner-config': {
+                'kube-api-token': 'secret-token'
+            }
+        }))
+
+        sops_decryptor = SOPS(bulk_decrypt=True)
+        self.assertEqual(sops_decryptor.decrypt(config_value), 'secret-token')
+        self.assertEqual(sops_decryptor.decrypt(config_value), 'secret-token')
+        sops_decryptor.clear_cache()
+        self.assertEqual(sops_decryptor.decrypt(config_value), 'secret-token')
+
+        self.assertEqual(sops_mock.call_count, 2)
+        sops_mock.assert_called_with(
+            '--decrypt',
+            '--output-type=json',
+            '--input-type=json',
+            '/dev/stdin',
+            _in=json.dumps(encrypted_config),
+            _out=Any(StringIO),
+            _err=Any(StringIO)
+        )
+
+    def test_decrypt_bulk_decrypt_invalid_sops_output(self, sops_mock):
+        config_value = ConfigValue(
+            value='ENC[AES256_GCM,data:UGKfnzsSrciR7GXZJhOCMmFrz3Y6V3pZsd3P,type:str]',
+            parent_source={'step-runner-config': {}},
+            path_parts=['step-runner-config', 'kube-api-token']
+        )
+
+        sops_mock.side_effect = create_sops_side_effect('not: json')
+
+        sops_decryptor = SOPS(bulk_decrypt=True)
+        with self.assertRaisesRegex(
+            RuntimeError,
+            r"Error parsing sops output as json when trying to decrypt config value"
+        ):
+            sops_decryptor.decrypt(config_value)
+
 class TestSOPSConfigValueDecryptorSOPSIntegrationTests(SOPSIntegrationTestCase):
     def test_can_decrypt_true(self):
         encrypted_config_file_path = os.path.join(
@@ -7,6 +7,7 @@ from tests.helpers.base_test_case import BaseTestCase
 from ploigos_step_runner.decryption_utils import DecryptionUtils
 from ploigos_step_runner.config import Config, ConfigValue
 from ploigos_step_runner.config.decryptors.sops import SOPS
+from tests.test_decryption_utils import SampleConfigValueDecryptor
 
 class TestConfig(BaseTestCase):
     def test_add_config_invalid_type(self):
@@ -672,6 +673,57 @@ class TestConfig(BaseTestCase):
             }
         )
 
+    def test_parallel_sub_steps(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'step-foo': {
+                    'parallel': True,
+                    'sub-steps': [
+                        {
+                            'implementer': 'foo1'
+                        },
+                        {
+                            'implementer': 'foo2'
+                        }
+                    ]
+                },
+                'step-bar': {
+                    'sub-steps': [
+                        {
+                            'implementer': 'bar1'
+                        }
+                    ]
+                },
+                'step-baz': {
+                    'implementer': 'baz1'
+                }
+            }
+        })
+
+        step_config = config.get_step_config('step-foo')
+        self.assertTrue(step_config.parallel)
+        self.assertEqual(
+            [sub_step.sub_step_name for sub_step in step_config.sub_steps],
+            ['foo1', 'foo2']
+        )
+        self.assertFalse(config.get_step_config('step-bar').parallel)
+        self.assertEqual(len(config.get_step_config('step-bar').sub_steps), 1)
+        self.assertFalse(config.get_step_config('step-baz').parallel)
+
+    def test_invalid_sub_steps_key(self):
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Expected step \(step-foo\) to have sub steps .* of type list"
+        ):
+            Config({
+                Config.CONFIG_KEY: {
+                    'step-foo': {
+                        'parallel': True,
+                        'sub-steps': 'bad-sub-steps'
+                    }
+                }
+            })
+
     def test_sub_step_with_name(self):
         config = Config({
             Config.CONFIG_KEY: {
@@ -830,3 +882,70 @@ class TestConfig(BaseTestCase):
             sops_decryptor._SOPS__additional_sops_args,
             ['--aws-profile=foo']
         )
+
+    def test_encrypted_config_values(self):
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+        config = Config({
+            'step-runner-config': {
+                'global-defaults': {
+                    'plain': 'foo',
+                    'secret': 'TEST_ENC[global secret]'
+                },
+                'step-foo': {
+                    'implementer': 'foo1',
+                    'config': {
+                        'secrets': ['bar', 'TEST_ENC[step secret]']
+                    }
+                }
+            }
+        })
+
+        self.assertEqual(
+            [config_value.path_parts for config_value in config.encrypted_config_values],
+            [
+                ('step-runner-config', 'global-defaults', 'secret'),
+                ('step-runner-config', 'step-foo', 'config', 'secrets', 1)
+            ]
+        )
+
+    def test_encrypted_config_values_decryptor_registered_later(self):
+        config = Config({
+            'step-runner-config': {
+                'global-defaults': {
+                    'secret': 'TEST_ENC[global secret]'
+                }
+            }
+        })
+        self.assertEqual(config.encrypted_config_values, ())
+
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+
+        self.assertEqual(
+            [config_value.value for config_value in config.encrypted_config_values],
+            ['global secret']
+        )
+
+    def test_encrypted_config_values_multiple_configs(self):
+        config = Config()
+        config.add_config({
+            'step-runner-config': {
+                'global-defaults': {
+                    'secret': 'TEST_ENC[first secret]'
+                }
+            }
+        })
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+        config.add_config({
+            'step-runner-config': {
+                'global-environment-defaults': {
+                    'DEV': {
+                        'secret': 'TEST_ENC[second secret]'
+                    }
+                }
+            }
+        })
+
+        self.assertEqual(
+            [config_value.value for config_value in config.encrypted_config_values],
+            ['first secret', 'second secret']
+        )
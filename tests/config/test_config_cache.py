@@ -0,0 +1,198 @@
+import json
+import os
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from ploigos_step_runner.config import Config
+from ploigos_step_runner.config.config_cache import ConfigCache
+from tests.helpers.base_test_case import BaseTestCase
+
+
+class TestConfigCache(BaseTestCase):
+    def __write_config_file(self, temp_dir, contents):
+        temp_dir.write('config/step-runner-config.yml', bytes(contents, 'utf-8'))
+        return os.path.join(temp_dir.path, 'config', 'step-runner-config.yml')
+
+    def __get_entry_paths(self, temp_dir):
+        cache_dir_path = os.path.join(temp_dir.path, 'cache')
+        return [
+            os.path.join(cache_dir_path, entry) for entry in os.listdir(cache_dir_path)
+        ]
+
+    def test_cache_dir(self):
+        config_cache = ConfigCache('/tmp/cache')
+        self.assertEqual(config_cache.cache_dir, '/tmp/cache')
+
+    def test_parse_yaml_or_json_file_cached(self):
+        with TempDirectory() as temp_dir:
+            config_file_path = self.__write_config_file(temp_dir, 'foo: bar\n')
+            config_cache = ConfigCache(os.path.join(temp_dir.path, 'cache'))
+
+            self.assertEqual(config_cache.parse_yaml_or_json_file(config_file_path), {'foo': 'bar'})
+            self.assertEqual(len(self.__get_entry_paths(temp_dir)), 1)
+
+            with patch(
+                'ploigos_step_runner.config.config_cache.parse_yaml_or_json_file'
+            ) as parse_mock:
+                self.assertEqual(
+                    config_cache.parse_yaml_or_json_file(config_file_path),
+                    {'foo': 'bar'}
+                )
+                parse_mock.assert_not_called()
+
+    def test_parse_yaml_or_json_file_changed(self):
+        with TempDirectory() as temp_dir:
+            config_file_path = self.__write_config_file(temp_dir, 'foo: bar\n')
+            config_cache = ConfigCache(os.path.join(temp_dir.path, 'cache'))
+            config_cache.parse_yaml_or_json_file(config_file_path)
+
+            # NOTE: same size and modification time so only the content hash differs
+            file_stat = os.stat(config_file_path)
+            self.__write_config_file(temp_dir, 'foo: baz\n')
+            os.utime(config_file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+            self.assertEqual(config_cache.parse_yaml_or_json_file(config_file_path), {'foo': 'baz'})
+            self.assertEqual(len(self.__get_entry_paths(temp_dir)), 1)
+
+    def test_parse_yaml_or_json_file_touched(self):
+        with TempDirectory() as temp_dir:
+            config_file_path = self.__write_config_file(temp_dir, 'foo: bar\n')
+            config_cache = ConfigCache(os.path.join(temp_dir.path, 'cache'))
+            config_cache.parse_yaml_or_json_file(config_file_path)
+
+            file_stat = os.stat(config_file_path)
+            os.utime(config_file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000))
+
+            with patch(
+                'ploigos_step_runner.config.config_cache.parse_yaml_or_json_file',
+                return_value={'foo': 'reparsed'}
+            ) as parse_mock:
+                self.assertEqual(
+                    config_cache.parse_yaml_or_json_file(config_file_path),
+                    {'foo': 'reparsed'}
+                )
+                parse_mock.assert_called_once()
+
+    def test_parse_yaml_or_json_file_corrupt_entry(self):
+        with TempDirectory() as temp_dir:
+            config_file_path = self.__write_config_file(temp_dir, 'foo: bar\n')
+            config_cache = ConfigCache(os.path.join(temp_dir.path, 'cache'))
+            config_cache.parse_yaml_or_json_file(config_file_path)
+
+            entry_path = self.__get_entry_paths(temp_dir)[0]
+            with open(entry_path, 'r', encoding='utf-8') as entry_file:
+                entry = json.load(entry_file)
+            entry['payload'] = json.dumps({'foo': 'tampered'})
+            with open(entry_path, 'w', encoding='utf-8') as entry_file:
+                json.dump(entry, entry_file)
+
+            self.assertEqual(config_cache.parse_yaml_or_json_file(config_file_path), {'foo': 'bar'})
+
+            with open(entry_path, 'r', encoding='utf-8') as entry_file:
+                self.assertEqual(json.loads(json.load(entry_file)['payload']), {'foo': 'bar'})
+
+    def test_parse_yaml_or_json_file_truncated_entry(self):
+        with TempDirectory() as temp_dir:
+            config_file_path = self.__write_config_file(temp_dir, 'foo: bar\n')
+            config_cache = ConfigCache(os.path.join(temp_dir.path, 'cache'))
+            config_cache.parse_yaml_or_json_file(config_file_path)
+
+            entry_path = self.__get_entry_paths(temp_dir)[0]
+            with open(entry_path, 'r+', encoding='utf-8') as entry_file:
+                entry_file.truncate(10)
+
+            self.assertEqual(config_cache.parse_yaml_or_json_file(config_file_path), {'foo': 'bar'})
+
+    def test_parse_yaml_or_json_file_not_json_serializable(self):
+        with TempDirectory() as temp_dir:
+            config_file_path = self.__write_config_file(temp_dir, 'foo: 2021-01-01\n1: bar\n')
+            config_cache = ConfigCache(os.path.join(temp_dir.path, 'cache'))
+
+            parsed_file = config_cache.parse_yaml_or_json_file(config_file_path)
+
+            self.assertEqual(str(parsed_file['foo']), '2021-01-01')
+            self.assertEqual(parsed_file[1], 'bar')
+            self.assertFalse(os.path.exists(os.path.join(temp_dir.path, 'cache')))
+
+    def test_parse_yaml_or_json_file_invalid(self):
+        with TempDirectory() as temp_dir:
+            config_file_path = self.__write_config_file(temp_dir, 'foo: [bar\n')
+            config_cache = ConfigCache(os.path.join(temp_dir.path, 'cache'))
+
+            with self.assertRaisesRegex(ValueError, r'Error parsing file'):
+                config_cache.parse_yaml_or_json_file(config_file_path)
+
+    def test_parse_yaml_or_json_file_unwritable_cache_dir(self):
+        with TempDirectory() as temp_dir:
+            config_file_path = self.__write_config_file(temp_dir, 'foo: bar\n')
+            temp_dir.write('cache', b'not a directory')
+            config_cache = ConfigCache(os.path.join(temp_dir.path, 'cache', 'nested'))
+
+            self.assertEqual(config_cache.parse_yaml_or_json_file(config_file_path), {'foo': 'bar'})
+
+    def test_config_with_cache_dir(self):
+        with TempDirectory() as temp_dir:
+            self.__write_config_file(temp_dir, '''---
+step-runner-config:
+  global-defaults:
+    foo: bar
+  write-hello:
+    implementer: 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
+''')
+            cache_dir_path = os.path.join(temp_dir.path, 'cache')
+            config_dir_path = os.path.join(temp_dir.path, 'config')
+
+            config = Config(config_dir_path, cache_dir=cache_dir_path)
+            cached_config = Config(config_dir_path, cache_dir=cache_dir_path)
+
+            self.assertEqual(len(self.__get_entry_paths(temp_dir)), 1)
+            self.assertEqual(
+                cached_config.global_defaults['foo'].value,
+                config.global_defaults['foo'].value
+            )
+            self.assertEqual(
+                cached_config.global_defaults['foo'].parent_source,
+                os.path.join(config_dir_path, 'step-runner-config.yml')
+            )
+            self.assertEqual(
+                cached_config.get_sub_step_configs('write-hello')[0].sub_step_implementer_name,
+                'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
+            )
+
+    def test_config_many_files_cached(self):
+        with TempDirectory() as temp_dir:
+            for file_index in range(150):
+                steps = ''.join(
+                    f'''
+  step-{file_index}-{step_index}:
+    implementer: 'tests.helpers.sample_step_implementers.FooStepImplementer'
+    config:
+      values:
+''' + ''.join(f'        - value-{value_index}\n' for value_index in range(20))
+                    for step_index in range(5)
+                )
+                temp_dir.write(
+                    f'config/config-{file_index}.yml',
+                    bytes(f'---\nstep-runner-config:{steps}', 'utf-8')
+                )
+            config_dir_path = os.path.join(temp_dir.path, 'config')
+            cache_dir_path = os.path.join(temp_dir.path, 'cache')
+
+            Config(config_dir_path, cache_dir=cache_dir_path)
+            self.assertEqual(len(self.__get_entry_paths(temp_dir)), 150)
+
+            with patch(
+                'ploigos_step_runner.config.config_cache.parse_yaml_or_json_file'
+            ) as parse_mock:
+                cached_config = Config(config_dir_path, cache_dir=cache_dir_path)
+
+            parse_mock.assert_not_called()
+            self.assertEqual(len(cached_config.step_configs), 150 * 5)
+            self.assertEqual(
+                [
+                    config_value.value for config_value in
+                    cached_config.get_sub_step_configs('step-149-4')[0].get_config_value('values')
+                ],
+                [f'value-{value_index}' for value_index in range(20)]
+            )
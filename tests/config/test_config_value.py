@@ -1,5 +1,8 @@
+import copy
+import hashlib
 from io import StringIO
 import os.path
+import pickle
 
 import unittest
 from testfixtures import TempDirectory
@@ -9,8 +12,20 @@ from tests.helpers.base_test_case import BaseTestCase
 from tests.helpers.test_utils import Any, create_sops_side_effect
 
 from ploigos_step_runner.config import Config, ConfigValue
+from ploigos_step_runner.config.config_value import ConfigValueParentSource
 from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.utils.dict import FrozenDict, freeze, thaw
 from ploigos_step_runner.config.decryptors.sops import SOPS
+from tests.test_decryption_utils import SampleConfigValueDecryptor
+
+
+class CanDecryptCountingConfigValueDecryptor(SampleConfigValueDecryptor):
+    def __init__(self):
+        self.can_decrypt_count = 0
+
+    def can_decrypt(self, config_value):
+        self.can_decrypt_count += 1
+        return super().can_decrypt(config_value)
 
 class TestConfigValue(BaseTestCase):
     def test__eq__is_equal_basic(self):
@@ -203,7 +218,7 @@ class TestConfigValue(BaseTestCase):
 
         self.assertEqual(
             source[Config.CONFIG_KEY]['step-foo'][0]['config']['test1'].path_parts,
-            ['step-runner-config', 'step-foo', 0, 'config', 'test1'])
+            ('step-runner-config', 'step-foo', 0, 'config', 'test1'))
 
     def test_value_path_given_no_inital_value_path_parts(self):
         source = {
@@ -226,7 +241,109 @@ class TestConfigValue(BaseTestCase):
 
         self.assertEqual(
             source[Config.CONFIG_KEY]['step-foo'][0]['config']['test1'].path_parts,
-            ['step-runner-config', 'step-foo', 0, 'config', 'test1'])
+            ('step-runner-config', 'step-foo', 0, 'config', 'test1'))
+
+    def test_convert_leaves_to_config_values_shares_parent_source(self):
+        source = {
+            Config.CONFIG_KEY: {
+                'test1': 'foo',
+                'test2': ['bar']
+            }
+        }
+
+        ConfigValue.convert_leaves_to_config_values(
+            values=source[Config.CONFIG_KEY],
+            parent_source=source,
+            path_parts=[Config.CONFIG_KEY]
+        )
+
+        test1 = source[Config.CONFIG_KEY]['test1']
+        test2 = source[Config.CONFIG_KEY]['test2'][0]
+        self.assertIs(test1.parent_source, test2.parent_source)
+        self.assertEqual(
+            test1.parent_source,
+            {Config.CONFIG_KEY: {'test1': 'foo', 'test2': ('bar',)}}
+        )
+        self.assertIsNotNone(test1.parent_source_key)
+        self.assertEqual(test1.parent_source_key, test2.parent_source_key)
+        self.assertIs(test1.path_parts[0], test2.path_parts[0])
+
+    def test_immutable(self):
+        config_value = ConfigValue('foo', 'file.yml', ['step-runner-config', 'foo'])
+
+        with self.assertRaises(AttributeError):
+            config_value.foo = 'bar'
+        with self.assertRaises(AttributeError):
+            config_value.raw_value = 'bar'
+        self.assertEqual(config_value.raw_value, 'foo')
+
+    def test_container_value_frozen(self):
+        config_value = ConfigValue({'foo': ['bar']})
+
+        self.assertIsInstance(config_value.raw_value, FrozenDict)
+        self.assertEqual(config_value.value, {'foo': ('bar',)})
+        self.assertIs(config_value.raw_value, config_value.raw_value)
+
+    def test_copy_returns_self(self):
+        config_value = ConfigValue('foo', {'foo': 'bar'}, ['foo'])
+
+        self.assertIs(copy.copy(config_value), config_value)
+        self.assertIs(copy.deepcopy(config_value), config_value)
+
+    def test_pickle(self):
+        config_value = ConfigValue('foo', {'foo': 'bar'}, ['foo'])
+
+        unpickled_config_value = pickle.loads(pickle.dumps(config_value))
+
+        self.assertEqual(unpickled_config_value, config_value)
+        self.assertEqual(unpickled_config_value.parent_source, {'foo': 'bar'})
+        self.assertEqual(unpickled_config_value.path_parts, ('foo',))
+
+    def test_parent_source_handle(self):
+        parent_source = ConfigValueParentSource({'foo': 'bar'})
+
+        config_value1 = ConfigValue('bar', parent_source, ['foo'])
+        config_value2 = ConfigValue('bar', parent_source, ['foo'])
+
+        self.assertIs(config_value1.parent_source, config_value2.parent_source)
+        self.assertEqual(config_value1.parent_source_key, parent_source.key)
+        self.assertIsNone(ConfigValueParentSource(None).key)
+        self.assertEqual(ConfigValueParentSource('file.yml').key, 'file.yml')
+
+    def test_convert_leaves_to_config_values_dict_parent_source_shared(self):
+        # NOTE: config from a dict so every leaf has the whole dict as its parent source
+        source = {
+            Config.CONFIG_KEY: {
+                f'key-{i}': {f'leaf-{j}': f'value-{j}' for j in range(10)} for i in range(200)
+            }
+        }
+
+        values = ConfigValue.convert_leaves_to_config_values(
+            values=copy.deepcopy(source[Config.CONFIG_KEY]),
+            parent_source=source,
+            path_parts=[Config.CONFIG_KEY]
+        )
+        config_values = [
+            config_value
+            for child_values in values.values()
+            for config_value in child_values.values()
+        ]
+
+        with patch(
+            'ploigos_step_runner.config.config_value.hashlib.sha256',
+            wraps=hashlib.sha256
+        ) as sha256_mock:
+            parent_source_keys = {
+                config_value.parent_source_key for config_value in config_values
+            }
+
+        self.assertEqual(len(config_values), 2000)
+        self.assertEqual(parent_source_keys, {config_values[0].parent_source_key})
+        sha256_mock.assert_called_once()
+        for config_value in config_values:
+            self.assertIs(config_value.parent_source, config_values[0].parent_source)
+            self.assertIs(config_value.path_parts[0], config_values[0].path_parts[0])
+        self.assertEqual(thaw(config_values[0].parent_source), source)
 
     def test_convert_leaves_to_values_all_config_value_leaves(self):
         source_values = {
@@ -260,6 +377,21 @@ class TestConfigValue(BaseTestCase):
             }
         )
 
+    def test_convert_leaves_to_values_frozen(self):
+        frozen = freeze({
+            'key1': ConfigValue('value1'),
+            'key2': [ConfigValue('value2'), {'key3': ConfigValue('value3')}]
+        })
+
+        self.assertEqual(
+            ConfigValue.convert_leaves_to_values(frozen),
+            {
+                'key1': 'value1',
+                'key2': ['value2', {'key3': 'value3'}]
+            }
+        )
+        self.assertIsInstance(frozen['key1'], ConfigValue)
+
     def test_convert_leaves_to_values_mixed_leaves(self):
         source_values = {
             Config.CONFIG_KEY: {
@@ -326,3 +458,94 @@ class TestConfigValue(BaseTestCase):
             decrypted_value,
             'mock decrypted value'
         )
+
+    @patch('sh.sops', create=True)
+    def test_convert_leaves_to_values_lazy(self, sops_mock):
+        encrypted_config_file_path = os.path.join(
+            os.path.dirname(__file__),
+            'decryptors',
+            'files',
+            'step-runner-config-secret-stuff.yml'
+        )
+
+        encrypted_value = 'ENC[AES256_GCM,data:UGKfnzsSrciR7GXZJhOCMmFrz3Y6V3pZsd3P,iv:yuReqA+n+rRXVHMc+2US5t7yPx54sooZSXWV4KLjDIs=,tag:jueP7/ZWLfYrEuhh+4eS8g==,type:str]'
+        config_values = {
+            'plain': ConfigValue(
+                value='not encrypted',
+                parent_source=encrypted_config_file_path,
+                path_parts=['step-runner-config', 'global-defaults', 'plain']
+            ),
+            'secret': ConfigValue(
+                value=encrypted_value,
+                parent_source=encrypted_config_file_path,
+                path_parts=['step-runner-config', 'global-environment-defaults', 'DEV', 'kube-api-token']
+            )
+        }
+
+        DecryptionUtils.register_config_value_decryptor(SOPS())
+        sops_mock.side_effect=create_sops_side_effect('mock decrypted value')
+
+        self.assertTrue(config_values['secret'].is_encrypted)
+        self.assertFalse(config_values['secret'].is_decrypted)
+        self.assertFalse(config_values['plain'].is_encrypted)
+
+        self.assertEqual(
+            ConfigValue.convert_leaves_to_values(dict(config_values), lazy=True),
+            {
+                'plain': 'not encrypted',
+                'secret': ConfigValue.ENCRYPTED_VALUE_PLACEHOLDER
+            }
+        )
+        sops_mock.assert_not_called()
+
+        self.assertEqual(config_values['secret'].value, 'mock decrypted value')
+        self.assertTrue(config_values['secret'].is_decrypted)
+
+        self.assertEqual(
+            ConfigValue.convert_leaves_to_values(dict(config_values), lazy=True),
+            {
+                'plain': 'not encrypted',
+                'secret': 'mock decrypted value'
+            }
+        )
+        sops_mock.assert_called_once()
+
+    def test_decryptor_checked_once(self):
+        decryptor = CanDecryptCountingConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+        plain_config_value = ConfigValue('plain')
+        encrypted_config_value = ConfigValue('TEST_ENC[secret]')
+
+        for _ in range(3):
+            self.assertEqual(plain_config_value.value, 'plain')
+            self.assertFalse(plain_config_value.is_encrypted)
+            self.assertEqual(encrypted_config_value.value, 'secret')
+            self.assertTrue(encrypted_config_value.is_encrypted)
+
+        self.assertIsNone(plain_config_value.decryptor)
+        self.assertIs(encrypted_config_value.decryptor, decryptor)
+        self.assertEqual(decryptor.can_decrypt_count, 2)
+
+    def test_decryptor_checked_again_when_decryptor_registered(self):
+        config_value = ConfigValue('TEST_ENC[secret]')
+        self.assertFalse(config_value.is_encrypted)
+        self.assertEqual(config_value.value, 'TEST_ENC[secret]')
+
+        decryptor = SampleConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        self.assertIs(config_value.decryptor, decryptor)
+        self.assertEqual(config_value.value, 'secret')
+
+    def test_value_not_encrypted_decryptors_checked_once(self):
+        decryptors = [CanDecryptCountingConfigValueDecryptor() for _ in range(5)]
+        for decryptor in decryptors:
+            DecryptionUtils.register_config_value_decryptor(decryptor)
+        config_values = [ConfigValue(f'value-{index}') for index in range(100)]
+
+        for _ in range(3):
+            for index, config_value in enumerate(config_values):
+                self.assertEqual(config_value.value, f'value-{index}')
+
+        for decryptor in decryptors:
+            self.assertEqual(decryptor.can_decrypt_count, 100)
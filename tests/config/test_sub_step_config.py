@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from testfixtures import TempDirectory
 
 import os.path
@@ -6,6 +7,7 @@ import os.path
 from tests.helpers.base_test_case import BaseTestCase
 
 from ploigos_step_runner.config import Config, StepConfig, SubStepConfig, ConfigValue
+from ploigos_step_runner.utils.dict import FrozenDict
 
 class TestSubStepConfig(BaseTestCase):
     def test_constructor_no_sub_step_config_or_step_env_config(self):
@@ -626,3 +628,239 @@ class TestSubStepConfig(BaseTestCase):
             "step-foo-foo-env2")
 
         self.assertIsNone(sub_step.get_config_value('does-not-exist'))
+
+    def test_get_config_value_cache_invalidated_by_merge_sub_step_config(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'step-foo': [
+                    {
+                        'implementer': 'foo1',
+                        'config': {
+                            'test1': 'foo'
+                        }
+                    }
+                ]
+            }
+        })
+        sub_step = config.get_step_config('step-foo').get_sub_step('foo1')
+        defaults = {'test2': 'default'}
+
+        self.assertEqual(sub_step.get_config_value('test1', None, defaults), 'foo')
+        self.assertEqual(sub_step.get_config_value('test2', None, defaults), 'default')
+
+        sub_step.merge_sub_step_config({'test2': ConfigValue('bar')})
+        self.assertEqual(sub_step.get_config_value('test2', None, defaults), 'bar')
+
+        sub_step.merge_sub_step_env_config({'env1': {'test2': ConfigValue('env1-bar')}})
+        self.assertEqual(sub_step.get_config_value('test2', 'env1', defaults), 'env1-bar')
+        self.assertEqual(sub_step.get_config_value('test2', None, defaults), 'bar')
+
+    def test_get_config_value_cache_invalidated_by_step_config_overrides(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'step-foo': [
+                    {
+                        'implementer': 'foo1',
+                        'config': {
+                            'test1': 'foo'
+                        }
+                    }
+                ]
+            }
+        })
+        sub_step = config.get_step_config('step-foo').get_sub_step('foo1')
+
+        self.assertEqual(sub_step.get_config_value('test1'), 'foo')
+
+        config.set_step_config_overrides('step-foo', {'test1': 'override'})
+        self.assertEqual(sub_step.get_config_value('test1'), 'override')
+
+    def test_get_config_value_cache_invalidated_by_global_defaults(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'step-foo': [
+                    {
+                        'implementer': 'foo1'
+                    }
+                ]
+            }
+        })
+        sub_step = config.get_step_config('step-foo').get_sub_step('foo1')
+
+        self.assertIsNone(sub_step.get_config_value('test1'))
+        self.assertIsNone(sub_step.get_config_value('test2', 'env1'))
+
+        config.add_config({
+            Config.CONFIG_KEY: {
+                'global-defaults': {
+                    'test1': 'global-default'
+                },
+                'global-environment-defaults': {
+                    'env1': {
+                        'test2': 'global-env-default'
+                    }
+                }
+            }
+        })
+        self.assertEqual(sub_step.get_config_value('test1'), 'global-default')
+        self.assertEqual(sub_step.get_config_value('test2', 'env1'), 'global-env-default')
+
+    def test_get_config_value_cache_different_defaults(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'step-foo': [
+                    {
+                        'implementer': 'foo1'
+                    }
+                ]
+            }
+        })
+        sub_step = config.get_step_config('step-foo').get_sub_step('foo1')
+
+        self.assertEqual(sub_step.get_config_value('test1', None, {'test1': 'a'}), 'a')
+        self.assertEqual(sub_step.get_config_value('test1', None, {'test1': 'b'}), 'b')
+        self.assertIsNone(sub_step.get_config_value('test1'))
+
+    def test_get_config_value_cache_hit(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'global-environment-defaults' : {
+                    'env1': {
+                        f'global-env-default-{i}': f'value-{i}' for i in range(20)
+                    }
+                },
+                'step-foo': [
+                    {
+                        'implementer': 'foo1',
+                        'config': {
+                            f'step-foo-{i}': f'value-{i}' for i in range(20)
+                        }
+                    }
+                ]
+            }
+        })
+        sub_step = config.get_step_config('step-foo').get_sub_step('foo1')
+        defaults = {'default-1': 'value'}
+
+        with patch.object(
+            sub_step,
+            'get_global_environment_defaults',
+            wraps=sub_step.get_global_environment_defaults
+        ) as get_global_environment_defaults_mock:
+            for i in range(20):
+                self.assertEqual(
+                    sub_step.get_config_value(f'step-foo-{i}', 'env1', defaults),
+                    f'value-{i}'
+                )
+            self.assertEqual(get_global_environment_defaults_mock.call_count, 1)
+
+            sub_step.clear_runtime_step_config_cache()
+            self.assertEqual(sub_step.get_config_value('step-foo-0', 'env1', defaults), 'value-0')
+            self.assertEqual(get_global_environment_defaults_mock.call_count, 2)
+
+            self.assertIsNone(sub_step.get_config_value('default-1', 'env1', {}))
+            self.assertEqual(get_global_environment_defaults_mock.call_count, 3)
+
+    def test_get_runtime_step_config_read_only_view(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'global-defaults': {
+                    'global-default-1': {'nested': 'value'}
+                },
+                'step-foo': {
+                    'implementer': 'foo1',
+                    'config': {
+                        'step-foo-list': ['a', 'b']
+                    }
+                },
+                'step-bar': {
+                    'implementer': 'bar1'
+                }
+            }
+        })
+        sub_step = config.get_step_config('step-foo').get_sub_step('foo1')
+
+        runtime_step_config = sub_step.get_runtime_step_config('env1')
+
+        self.assertIsInstance(runtime_step_config, FrozenDict)
+        self.assertIs(sub_step.get_runtime_step_config('env1'), runtime_step_config)
+        self.assertIs(
+            runtime_step_config['global-default-1'],
+            config.global_defaults['global-default-1']
+        )
+        self.assertIs(
+            config.get_step_config('step-bar').get_sub_step('bar1').get_runtime_step_config(
+                'env1'
+            )['global-default-1'],
+            runtime_step_config['global-default-1']
+        )
+        with self.assertRaises(TypeError):
+            runtime_step_config['step-foo-list'] = []
+        with self.assertRaises(TypeError):
+            sub_step.sub_step_config['step-foo-list'] = []
+
+    def test_get_copy_of_runtime_step_config_deep_copy(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'global-defaults': {
+                    'global-default-1': {'nested': 'value'}
+                },
+                'step-foo': {
+                    'implementer': 'foo1',
+                    'config': {
+                        'step-foo-list': ['a', 'b']
+                    }
+                }
+            }
+        })
+        sub_step = config.get_step_config('step-foo').get_sub_step('foo1')
+
+        runtime_step_config = sub_step.get_copy_of_runtime_step_config('env1')
+
+        self.assertIs(type(runtime_step_config), dict)
+        self.assertIs(type(runtime_step_config['global-default-1']), dict)
+        self.assertIs(type(runtime_step_config['step-foo-list']), list)
+
+        runtime_step_config['global-default-1']['nested'] = ConfigValue('changed')
+        runtime_step_config['step-foo-list'].append(ConfigValue('c'))
+        del runtime_step_config['step-foo-list']
+
+        self.assertEqual(
+            ConfigValue.convert_leaves_to_values(sub_step.get_copy_of_runtime_step_config('env1')),
+            {
+                'global-default-1': {'nested': 'value'},
+                'step-foo-list': ['a', 'b']
+            }
+        )
+        self.assertEqual(
+            ConfigValue.convert_leaves_to_values(sub_step.get_config_value('step-foo-list', 'env1')),
+            ['a', 'b']
+        )
+
+    def test_get_config_value_returns_mutable_copy(self):
+        config = Config({
+            Config.CONFIG_KEY: {
+                'step-foo': {
+                    'implementer': 'foo1',
+                    'config': {
+                        'step-foo-list': ['a', 'b'],
+                        'step-foo-dict': {'c': 'd'}
+                    }
+                }
+            }
+        })
+        sub_step = config.get_step_config('step-foo').get_sub_step('foo1')
+
+        step_foo_list = sub_step.get_config_value('step-foo-list')
+        step_foo_list.append(ConfigValue('e'))
+        step_foo_dict = sub_step.get_config_value('step-foo-dict')
+        step_foo_dict['f'] = ConfigValue('g')
+
+        self.assertEqual(
+            ConfigValue.convert_leaves_to_values(sub_step.get_config_value('step-foo-list')),
+            ['a', 'b']
+        )
+        self.assertEqual(
+            ConfigValue.convert_leaves_to_values(sub_step.get_config_value('step-foo-dict')),
+            {'c': 'd'}
+        )
@@ -71,7 +71,7 @@ class BaseStepImplementerTestCase(BaseTestCase):
             )
         workflow_result = WorkflowResult()
         workflow_result.add_step_result(step_result=step_result)
-        pickle_filename = os.path.join(work_dir_path, 'step-runner-results.pkl')
-        workflow_result.write_to_pickle_file(pickle_filename=pickle_filename)
+        workflow_result_filename = os.path.join(work_dir_path, 'step-runner-results.psr')
+        workflow_result.write_to_file(filename=workflow_result_filename)
 
         return workflow_result
@@ -2,6 +2,7 @@ import unittest
 import shutil
 
 from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.implementer_registry import ImplementerRegistry
 
 class BaseTestCase(unittest.TestCase):
     def setUp(self):
@@ -14,6 +15,9 @@ class BaseTestCase(unittest.TestCase):
     def tearDown(self):
         DecryptionUtils._DecryptionUtils__config_value_decryptors = []
         DecryptionUtils._DecryptionUtils__obfuscation_streams = []
+        DecryptionUtils._DecryptionUtils__decryption_cache_enabled = True
+        DecryptionUtils._DecryptionUtils__decryption_cache = {}
+        ImplementerRegistry.set_cache_dir(None)
 
         try:
             shutil.rmtree("./step-runner-working")
@@ -1,3 +1,6 @@
+import sys
+import time
+
 from ploigos_step_runner import StepImplementer, StepResult
 from ploigos_step_runner.config.config_value import ConfigValue
 
@@ -92,5 +95,72 @@ class WriteConfigAsResultsStepImplementer(StepImplementer):
         return step_result
 
 
+class SleepThenPrintStepImplementer(StepImplementer):
+    # NOTE: sub steps configured to wait-on-barrier only get past it if they run in parallel
+    barrier = None
+    # NOTE: if a list, the name of every sub step that ran is appended to it
+    ran_sub_steps = None
+
+    @staticmethod
+    def step_implementer_config_defaults():
+        return {
+            'sleep-seconds': 0,
+            'wait-on-barrier': False,
+            'success': True
+        }
+
+    @staticmethod
+    def _required_config_or_result_keys():
+        return []
+
+    def _run_step(self):
+        if SleepThenPrintStepImplementer.ran_sub_steps is not None:
+            SleepThenPrintStepImplementer.ran_sub_steps.append(self.sub_step_name)
+        if self.get_value('wait-on-barrier'):
+            SleepThenPrintStepImplementer.barrier.wait()
+        time.sleep(self.get_value('sleep-seconds'))
+        if self.get_value('message'):
+            print(self.get_value('message'))
+        print(f'stdout from {self.sub_step_name}')
+        print(f'stderr from {self.sub_step_name}', file=sys.stderr)
+
+        step_result = StepResult.from_step_implementer(self)
+        step_result.success = self.get_value('success')
+        return step_result
+
+
+class CacheableStepImplementer(StepImplementer):
+    run_count = 0
+
+    @staticmethod
+    def step_implementer_config_defaults():
+        return {
+            'success': True
+        }
+
+    @staticmethod
+    def _required_config_or_result_keys():
+        return []
+
+    @staticmethod
+    def is_step_result_cacheable():
+        return True
+
+    def _get_step_result_fingerprint_input_paths(self):
+        return [self.get_value('input-path')]
+
+    def _run_step(self):
+        CacheableStepImplementer.run_count += 1
+        print(f'running {self.step_name}')
+
+        step_result = StepResult.from_step_implementer(self)
+        step_result.success = self.get_value('success')
+        if self.get_value('version'):
+            step_result.add_artifact('upstream-version', self.get_value('version'))
+        if self.get_value('output-path'):
+            step_result.add_artifact('output', {'path': self.get_value('output-path')})
+        return step_result
+
+
 class NotSubClassOfStepImplementer():
     pass
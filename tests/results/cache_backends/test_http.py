@@ -0,0 +1,198 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+import base64
+import os
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from ploigos_step_runner import StepResult, WorkflowResult
+from ploigos_step_runner.results import StepResultCache
+from ploigos_step_runner.results.cache_backends import HTTPBackend
+from testfixtures import TempDirectory
+from tests.helpers.base_test_case import BaseTestCase
+
+KEY_A = 'aa' + '0' * 62
+KEY_B = 'bb' + '0' * 62
+
+
+class StandInCacheServer(socketserver.ThreadingMixIn, HTTPServer):
+    """Stands in for an HTTP cache server, such as nginx with WebDAV enabled, storing data in
+    memory.
+    """
+
+    # NOTE: the same as http.server.ThreadingHTTPServer, which is only in python 3.7 and later
+    daemon_threads = True
+
+    def __init__(self, credentials=None, fail=False):
+        super().__init__(('127.0.0.1', 0), StandInCacheRequestHandler)
+        self.store = {}
+        self.requests = []
+        self.credentials = credentials
+        self.fail = fail
+        self.__thread = threading.Thread(
+            target=self.serve_forever,
+            kwargs={'poll_interval': 0.01},
+            daemon=True
+        )
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/cache'
+
+    def __enter__(self):
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+        self.__thread.join()
+
+
+class StandInCacheRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self): # pylint: disable=invalid-name
+        if self.__authorized():
+            self.__respond(self.server.store.get(self.path))
+
+    def do_HEAD(self): # pylint: disable=invalid-name
+        if self.__authorized():
+            self.__respond(self.server.store.get(self.path), body=False)
+
+    def do_PUT(self): # pylint: disable=invalid-name
+        if self.__authorized():
+            data = self.rfile.read(int(self.headers['Content-Length']))
+            self.server.store[self.path] = data
+            self.__respond(b'')
+
+    def log_message(self, format, *args): # pylint: disable=redefined-builtin
+        pass
+
+    def __authorized(self):
+        self.server.requests.append((self.command, self.path))
+        if self.server.fail:
+            self.send_error(500)
+            return False
+
+        if self.server.credentials is None:
+            return True
+
+        expected = 'Basic ' + base64.b64encode(
+            ':'.join(self.server.credentials).encode('utf-8')
+        ).decode('ascii')
+        if self.headers.get('Authorization') == expected:
+            return True
+
+        self.send_response(401)
+        self.send_header('WWW-Authenticate', 'Basic realm="cache"')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return False
+
+    def __respond(self, data, body=True):
+        if data is None:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if body:
+            self.wfile.write(data)
+
+
+class TestHTTPBackend(BaseTestCase):
+    def test_put_and_get(self):
+        with StandInCacheServer() as server:
+            backend = HTTPBackend(server.url + '/')
+            backend.put('entries', KEY_A, b'data')
+
+            self.assertEqual(backend.get('entries', KEY_A), b'data')
+            self.assertIsNone(backend.get('entries', KEY_B))
+            self.assertEqual(server.store, {f'/cache/entries/{KEY_A}': b'data'})
+
+    def test_contains(self):
+        with StandInCacheServer() as server:
+            backend = HTTPBackend(server.url)
+            backend.put('entries', KEY_A, b'data')
+
+            self.assertTrue(backend.contains('entries', KEY_A))
+            self.assertFalse(backend.contains('entries', KEY_B))
+            self.assertIn(('HEAD', f'/cache/entries/{KEY_A}'), server.requests)
+
+    def test_credentials_in_url(self):
+        with StandInCacheServer(credentials=('agent', 'secret')) as server:
+            backend = HTTPBackend(server.url.replace('http://', 'http://agent:secret@'))
+            backend.put('entries', KEY_A, b'data')
+
+            self.assertEqual(backend.url, server.url)
+            self.assertEqual(backend.get('entries', KEY_A), b'data')
+
+    def test_credentials(self):
+        with StandInCacheServer(credentials=('agent', 'secret')) as server:
+            backend = HTTPBackend(server.url, username='agent', password='secret')
+            backend.put('entries', KEY_A, b'data')
+
+            self.assertEqual(backend.get('entries', KEY_A), b'data')
+
+    def test_wrong_credentials(self):
+        with StandInCacheServer(credentials=('agent', 'secret')) as server:
+            backend = HTTPBackend(server.url, username='agent', password='wrong')
+
+            with self.assertRaises(OSError):
+                backend.get('entries', KEY_A)
+
+    def test_server_error(self):
+        with StandInCacheServer(fail=True) as server:
+            backend = HTTPBackend(server.url)
+
+            with self.assertRaises(OSError):
+                backend.put('entries', KEY_A, b'data')
+            with self.assertRaises(OSError):
+                backend.get('entries', KEY_A)
+
+    def test_server_unavailable(self):
+        with StandInCacheServer() as server:
+            url = server.url
+
+        with self.assertRaises(OSError):
+            HTTPBackend(url, timeout=1).get('entries', KEY_A)
+
+    def test_invalid_key(self):
+        with StandInCacheServer() as server:
+            backend = HTTPBackend(server.url)
+
+            with self.assertRaisesRegex(ValueError, r'Invalid step result cache key'):
+                backend.get('entries', '../' + KEY_A)
+            self.assertEqual(server.requests, [])
+
+    def test_step_result_cache_shared_between_agents(self):
+        with StandInCacheServer() as server, TempDirectory() as temp_dir:
+            step_result = StepResult('package', 'Maven', 'Maven')
+            step_result.add_artifact(
+                'package-artifacts',
+                [{'path': temp_dir.write('agent-1/target/app.jar', b'jar')}]
+            )
+            StepResultCache(
+                HTTPBackend(server.url),
+                workspace_path=os.path.join(temp_dir.path, 'agent-1')
+            ).add_step_result(KEY_A, step_result, {})
+
+            # NOTE: other agent has the same absolute workspace path but none of its files
+            os.remove(os.path.join(temp_dir.path, 'agent-1', 'target', 'app.jar'))
+            cached_step_result = StepResultCache(
+                HTTPBackend(server.url),
+                workspace_path=os.path.join(temp_dir.path, 'agent-1')
+            ).get_step_result(KEY_A, WorkflowResult())
+
+            self.assertEqual(cached_step_result, step_result)
+            with open(os.path.join(temp_dir.path, 'agent-1', 'target', 'app.jar'), 'rb') as jar:
+                self.assertEqual(jar.read(), b'jar')
+
+    def test_step_result_cache_server_error(self):
+        with StandInCacheServer(fail=True) as server:
+            cache = StepResultCache(HTTPBackend(server.url))
+            cache.add_step_result(KEY_A, StepResult('package', 'Maven', 'Maven'), {})
+
+            self.assertIsNone(cache.get_step_result(KEY_A, WorkflowResult()))
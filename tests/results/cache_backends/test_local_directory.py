@@ -0,0 +1,108 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+import os
+
+from ploigos_step_runner.results.cache_backends import LocalDirectoryBackend
+from testfixtures import TempDirectory
+from tests.helpers.base_test_case import BaseTestCase
+
+KEY_A = 'aa' + '0' * 62
+KEY_B = 'bb' + '0' * 62
+KEY_C = 'cc' + '0' * 62
+
+
+def set_last_used(backend, namespace, key, last_used):
+    path = os.path.join(backend.cache_dir, namespace, key[:2], key)
+    os.utime(path, ns=(last_used, last_used))
+
+
+class TestLocalDirectoryBackend(BaseTestCase):
+    def test_put_and_get(self):
+        with TempDirectory() as temp_dir:
+            backend = LocalDirectoryBackend(temp_dir.path)
+            backend.put('entries', KEY_A, b'data')
+
+            self.assertEqual(backend.get('entries', KEY_A), b'data')
+            self.assertIsNone(backend.get('blobs', KEY_A))
+            self.assertIsNone(backend.get('entries', KEY_B))
+            self.assertEqual(
+                os.listdir(os.path.join(temp_dir.path, 'entries', 'aa')),
+                [KEY_A]
+            )
+
+    def test_put_replaces(self):
+        with TempDirectory() as temp_dir:
+            backend = LocalDirectoryBackend(temp_dir.path)
+            backend.put('entries', KEY_A, b'old')
+            backend.put('entries', KEY_A, b'new')
+
+            self.assertEqual(backend.get('entries', KEY_A), b'new')
+            self.assertEqual(
+                os.listdir(os.path.join(temp_dir.path, 'entries', 'aa')),
+                [KEY_A]
+            )
+
+    def test_contains(self):
+        with TempDirectory() as temp_dir:
+            backend = LocalDirectoryBackend(temp_dir.path)
+            backend.put('entries', KEY_A, b'data')
+
+            self.assertTrue(backend.contains('entries', KEY_A))
+            self.assertFalse(backend.contains('entries', KEY_B))
+
+    def test_invalid_key(self):
+        with TempDirectory() as temp_dir:
+            backend = LocalDirectoryBackend(temp_dir.path)
+
+            with self.assertRaisesRegex(ValueError, r'Invalid step result cache key'):
+                backend.get('entries', '../' + KEY_A)
+            with self.assertRaisesRegex(ValueError, r'Invalid step result cache namespace'):
+                backend.put('../entries', KEY_A, b'data')
+
+    def test_put_unwritable_cache_dir(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('cache', b'not a directory')
+            backend = LocalDirectoryBackend(os.path.join(temp_dir.path, 'cache'))
+
+            with self.assertRaises(OSError):
+                backend.put('entries', KEY_A, b'data')
+
+    def test_evict_least_recently_used(self):
+        with TempDirectory() as temp_dir:
+            backend = LocalDirectoryBackend(temp_dir.path, max_size=10)
+            backend.put('entries', KEY_A, b'aaaa')
+            set_last_used(backend, 'entries', KEY_A, 1_000_000_000)
+            backend.put('blobs', KEY_B, b'bbbb')
+            set_last_used(backend, 'blobs', KEY_B, 2_000_000_000)
+
+            self.assertTrue(backend.contains('entries', KEY_A))
+            backend.put('entries', KEY_C, b'cccc')
+
+            self.assertEqual(backend.get('entries', KEY_A), b'aaaa')
+            self.assertIsNone(backend.get('blobs', KEY_B))
+            self.assertEqual(backend.get('entries', KEY_C), b'cccc')
+
+    def test_get_marks_used(self):
+        with TempDirectory() as temp_dir:
+            backend = LocalDirectoryBackend(temp_dir.path, max_size=10)
+            backend.put('entries', KEY_A, b'aaaa')
+            set_last_used(backend, 'entries', KEY_A, 1_000_000_000)
+            backend.put('entries', KEY_B, b'bbbb')
+            set_last_used(backend, 'entries', KEY_B, 2_000_000_000)
+
+            backend.get('entries', KEY_A)
+            backend.put('entries', KEY_C, b'cccc')
+
+            self.assertTrue(backend.contains('entries', KEY_A))
+            self.assertFalse(backend.contains('entries', KEY_B))
+
+    def test_no_max_size(self):
+        with TempDirectory() as temp_dir:
+            backend = LocalDirectoryBackend(temp_dir.path)
+            for key in (KEY_A, KEY_B, KEY_C):
+                backend.put('entries', key, b'x' * 1024)
+
+            self.assertIsNone(backend.max_size)
+            for key in (KEY_A, KEY_B, KEY_C):
+                self.assertTrue(backend.contains('entries', key))
@@ -861,3 +861,43 @@ class TestStepResultTest(BaseTestCase):
         )
 
         self.assertNotEqual(step_result1, step_result2)
+
+    def test_as_dict_and_from_dict(self):
+        expected_step_result = StepResult('step1', 'sub1', 'implementer1', 'dev')
+        expected_step_result.success = False
+        expected_step_result.message = 'failure'
+        expected_step_result.add_artifact('artifact1', {'a': [1, 2]}, 'description1')
+        expected_step_result.add_artifact('artifact2', False)
+        expected_step_result.add_evidence('evidence1', 'value1', 'description1')
+
+        step_result_dict = expected_step_result.as_dict()
+        self.assertEqual(step_result_dict['step-name'], 'step1')
+        self.assertEqual(step_result_dict['environment'], 'dev')
+        self.assertEqual(StepResult.from_dict(step_result_dict), expected_step_result)
+
+    def test_from_dict_missing_key(self):
+        step_result_dict = StepResult('step1', 'sub1', 'implementer1').as_dict()
+        del step_result_dict['success']
+
+        with self.assertRaisesRegex(
+            StepRunnerException,
+            r'StepResult dictionary missing key \(success\)'
+        ):
+            StepResult.from_dict(step_result_dict)
+
+    def test_from_dict_invalid_type(self):
+        step_result_dict = StepResult('step1', 'sub1', 'implementer1').as_dict()
+        step_result_dict['artifacts'] = 'not a list'
+
+        with self.assertRaisesRegex(
+            StepRunnerException,
+            r'StepResult dictionary key \(artifacts\) has invalid type \(str\)'
+        ):
+            StepResult.from_dict(step_result_dict)
+
+    def test_from_dict_not_dict(self):
+        with self.assertRaisesRegex(
+            StepRunnerException,
+            r'expected StepResult dictionary but got \(list\)'
+        ):
+            StepResult.from_dict([])
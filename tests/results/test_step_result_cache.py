@@ -0,0 +1,242 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+import hashlib
+import os
+import shutil
+import stat
+import zlib
+
+from ploigos_step_runner import StepResult, WorkflowResult
+from ploigos_step_runner.results import StepResultCache
+from ploigos_step_runner.results.cache_backends import LocalDirectoryBackend
+from testfixtures import TempDirectory
+from tests.helpers.base_test_case import BaseTestCase
+
+FINGERPRINT = 'ab' + '0' * 62
+
+
+def setup_workflow_result():
+    workflow_result = WorkflowResult()
+    step_result = StepResult('generate-metadata', 'Maven', 'Maven')
+    step_result.add_artifact('version', '1.0.0')
+    workflow_result.add_step_result(step_result)
+
+    return workflow_result
+
+
+def setup_step_result(artifact_path=None):
+    step_result = StepResult('package', 'Maven', 'Maven')
+    step_result.add_artifact('packaged', True)
+    if artifact_path is not None:
+        step_result.add_artifact('package-artifacts', [{'path': artifact_path}])
+
+    return step_result
+
+
+def setup_step_result_cache(temp_dir):
+    return StepResultCache(
+        LocalDirectoryBackend(os.path.join(temp_dir.path, 'cache')),
+        workspace_path=os.path.join(temp_dir.path, 'workspace')
+    )
+
+
+def get_blob_path(temp_dir, contents):
+    digest = hashlib.sha256(contents).hexdigest()
+    return os.path.join(
+        temp_dir.path, 'cache', StepResultCache.BLOBS_NAMESPACE, digest[:2], digest
+    )
+
+
+class TestStepResultCache(BaseTestCase):
+    def test_add_and_get_step_result(self):
+        with TempDirectory() as temp_dir:
+            cache = setup_step_result_cache(temp_dir)
+            step_result = setup_step_result()
+            cache.add_step_result(
+                FINGERPRINT,
+                step_result,
+                {('version', None, None, None): '1.0.0'}
+            )
+
+            self.assertEqual(
+                cache.get_step_result(FINGERPRINT, setup_workflow_result()),
+                step_result
+            )
+            self.assertIsNotNone(
+                cache.backend.get(StepResultCache.ENTRIES_NAMESPACE, FINGERPRINT)
+            )
+
+    def test_workspace_path_default(self):
+        cache = StepResultCache(LocalDirectoryBackend('cache'))
+
+        self.assertEqual(cache.workspace_path, os.path.realpath(os.getcwd()))
+
+    def test_get_step_result_no_entry(self):
+        with TempDirectory() as temp_dir:
+            cache = setup_step_result_cache(temp_dir)
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, setup_workflow_result()))
+
+    def test_get_step_result_consumed_result_value_changed(self):
+        with TempDirectory() as temp_dir:
+            cache = setup_step_result_cache(temp_dir)
+            cache.add_step_result(
+                FINGERPRINT,
+                setup_step_result(),
+                {('version', None, None, None): '0.9.0'}
+            )
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, setup_workflow_result()))
+
+    def test_get_step_result_consumed_result_value_added(self):
+        with TempDirectory() as temp_dir:
+            cache = setup_step_result_cache(temp_dir)
+            cache.add_step_result(
+                FINGERPRINT,
+                setup_step_result(),
+                {('version', None, None, None): None}
+            )
+
+            self.assertIsNotNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, setup_workflow_result()))
+
+    def test_get_step_result_artifact_path_outside_workspace_removed(self):
+        with TempDirectory() as temp_dir:
+            artifact_path = temp_dir.write('target/app.jar', b'jar')
+            cache = setup_step_result_cache(temp_dir)
+            step_result = setup_step_result(artifact_path)
+            cache.add_step_result(FINGERPRINT, step_result, {})
+
+            self.assertEqual(cache.get_step_result(FINGERPRINT, WorkflowResult()), step_result)
+            self.assertFalse(os.path.exists(get_blob_path(temp_dir, b'jar')))
+
+            os.remove(artifact_path)
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+
+    def test_get_step_result_artifact_file_restored(self):
+        with TempDirectory() as temp_dir:
+            artifact_path = temp_dir.write('workspace/target/app.jar', b'jar')
+            os.chmod(artifact_path, 0o755)
+            cache = setup_step_result_cache(temp_dir)
+            step_result = setup_step_result(artifact_path)
+            cache.add_step_result(FINGERPRINT, step_result, {})
+
+            with open(get_blob_path(temp_dir, b'jar'), 'rb') as blob_file:
+                self.assertEqual(zlib.decompress(blob_file.read()), b'jar')
+
+            os.remove(artifact_path)
+            self.assertEqual(cache.get_step_result(FINGERPRINT, WorkflowResult()), step_result)
+            with open(artifact_path, 'rb') as artifact_file:
+                self.assertEqual(artifact_file.read(), b'jar')
+            self.assertTrue(os.stat(artifact_path).st_mode & stat.S_IXUSR)
+
+            temp_dir.write('workspace/target/app.jar', b'changed')
+            self.assertEqual(cache.get_step_result(FINGERPRINT, WorkflowResult()), step_result)
+            with open(artifact_path, 'rb') as artifact_file:
+                self.assertEqual(artifact_file.read(), b'jar')
+
+    def test_get_step_result_artifact_dir_restored(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('workspace/target/reports/a.xml', b'<a/>')
+            temp_dir.write('workspace/target/reports/nested/b.xml', b'<b/>')
+            temp_dir.makedir('workspace/target/reports/empty')
+            artifact_path = os.path.join(temp_dir.path, 'workspace', 'target', 'reports')
+            cache = setup_step_result_cache(temp_dir)
+            step_result = setup_step_result(artifact_path)
+            cache.add_step_result(FINGERPRINT, step_result, {})
+
+            shutil.rmtree(artifact_path)
+
+            self.assertEqual(cache.get_step_result(FINGERPRINT, WorkflowResult()), step_result)
+            with open(os.path.join(artifact_path, 'nested', 'b.xml'), 'rb') as artifact_file:
+                self.assertEqual(artifact_file.read(), b'<b/>')
+            self.assertTrue(os.path.isdir(os.path.join(artifact_path, 'empty')))
+
+    def test_get_step_result_artifact_file_blob_missing(self):
+        with TempDirectory() as temp_dir:
+            artifact_path = temp_dir.write('workspace/target/app.jar', b'jar')
+            cache = setup_step_result_cache(temp_dir)
+            cache.add_step_result(FINGERPRINT, setup_step_result(artifact_path), {})
+
+            os.remove(artifact_path)
+            os.remove(get_blob_path(temp_dir, b'jar'))
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+            self.assertFalse(os.path.exists(artifact_path))
+
+    def test_get_step_result_artifact_file_blob_corrupt(self):
+        with TempDirectory() as temp_dir:
+            artifact_path = temp_dir.write('workspace/target/app.jar', b'jar')
+            cache = setup_step_result_cache(temp_dir)
+            cache.add_step_result(FINGERPRINT, setup_step_result(artifact_path), {})
+
+            os.remove(artifact_path)
+            with open(get_blob_path(temp_dir, b'jar'), 'wb') as blob_file:
+                blob_file.write(zlib.compress(b'not a jar'))
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+            self.assertFalse(os.path.exists(artifact_path))
+
+    def test_get_step_result_artifact_file_outside_workspace_not_restored(self):
+        with TempDirectory() as temp_dir:
+            artifact_path = temp_dir.write('workspace/target/app.jar', b'jar')
+            step_result = setup_step_result(artifact_path)
+            setup_step_result_cache(temp_dir).add_step_result(FINGERPRINT, step_result, {})
+            os.remove(artifact_path)
+
+            cache = StepResultCache(
+                LocalDirectoryBackend(os.path.join(temp_dir.path, 'cache')),
+                workspace_path=os.path.join(temp_dir.path, 'other-workspace')
+            )
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+            self.assertFalse(os.path.exists(artifact_path))
+
+    def test_get_step_result_corrupt_entry(self):
+        with TempDirectory() as temp_dir:
+            cache = setup_step_result_cache(temp_dir)
+            cache.backend.put(StepResultCache.ENTRIES_NAMESPACE, FINGERPRINT, b'not compressed')
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+
+            cache.backend.put(
+                StepResultCache.ENTRIES_NAMESPACE,
+                FINGERPRINT,
+                zlib.compress(b'{"format-version": 2')
+            )
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+
+    def test_get_step_result_other_fingerprint(self):
+        with TempDirectory() as temp_dir:
+            cache = setup_step_result_cache(temp_dir)
+            other_fingerprint = 'ab' + '1' * 62
+            cache.add_step_result(other_fingerprint, setup_step_result(), {})
+            cache.backend.put(
+                StepResultCache.ENTRIES_NAMESPACE,
+                FINGERPRINT,
+                cache.backend.get(StepResultCache.ENTRIES_NAMESPACE, other_fingerprint)
+            )
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+
+    def test_add_step_result_unwritable_cache_dir(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('cache', b'not a directory')
+            cache = setup_step_result_cache(temp_dir)
+
+            cache.add_step_result(FINGERPRINT, setup_step_result(), {})
+
+            self.assertIsNone(cache.get_step_result(FINGERPRINT, WorkflowResult()))
+
+    def test_hash_value(self):
+        self.assertEqual(
+            StepResultCache.hash_value({'a': 1, 'b': [1, 2]}),
+            StepResultCache.hash_value({'b': [1, 2], 'a': 1})
+        )
+        self.assertNotEqual(
+            StepResultCache.hash_value({'a': 1}),
+            StepResultCache.hash_value({'a': '1'})
+        )
+        self.assertNotEqual(StepResultCache.hash_value(None), StepResultCache.hash_value(''))
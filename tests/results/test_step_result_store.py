@@ -0,0 +1,154 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+import os
+import struct
+
+from ploigos_step_runner import StepResult
+from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.results import StepResultStore
+from testfixtures import TempDirectory
+from tests.helpers.base_test_case import BaseTestCase
+
+
+def setup_step_results():
+    step_result1 = StepResult('step1', 'sub1', 'implementer1')
+    step_result1.add_artifact('artifact1', 'value1', 'description1')
+    step_result1.add_artifact('artifact2', {'nested': ['a', 1, True]})
+    step_result1.add_evidence('evidence1', False)
+
+    step_result2 = StepResult('step2', 'sub2', 'implementer2', 'dev')
+    step_result2.success = False
+    step_result2.message = 'failed'
+
+    return [step_result1, step_result2]
+
+
+class TestStepResultStore(BaseTestCase):
+    def test_write_and_read_step_results(self):
+        with TempDirectory() as temp_dir:
+            store = StepResultStore(os.path.join(temp_dir.path, 'results.psr'))
+            step_results = setup_step_results()
+            store.write_step_results(step_results)
+
+            self.assertTrue(store.exists())
+            self.assertEqual(store.read_step_results(), step_results)
+            self.assertFalse(os.path.exists(store.file_path + '.tmp'))
+
+    def test_read_step_results_no_file(self):
+        store = StepResultStore('does-not-exist.psr')
+        self.assertFalse(store.exists())
+        self.assertEqual(store.read_step_results(), [])
+        self.assertIsNone(store.read_index())
+
+    def test_read_index_and_read_step_result(self):
+        with TempDirectory() as temp_dir:
+            store = StepResultStore(os.path.join(temp_dir.path, 'results.psr'))
+            step_results = setup_step_results()
+            store.write_step_results(step_results)
+
+            index = store.read_index()
+            self.assertEqual(
+                [
+                    (
+                        entry['step-name'],
+                        entry['sub-step-name'],
+                        entry['environment'],
+                        entry['artifact-names'],
+                        entry['evidence-names']
+                    )
+                    for entry in index
+                ],
+                [
+                    ('step1', 'sub1', None, ['artifact1', 'artifact2'], ['evidence1']),
+                    ('step2', 'sub2', 'dev', [], [])
+                ]
+            )
+            self.assertEqual(store.read_step_result(index[1]), step_results[1])
+            self.assertEqual(store.read_step_result(index[0]), step_results[0])
+
+    def test_read_step_result_file_changed_since_index_read(self):
+        with TempDirectory() as temp_dir:
+            store = StepResultStore(os.path.join(temp_dir.path, 'results.psr'))
+            step_results = setup_step_results()
+            store.write_step_results(step_results)
+            index = store.read_index()
+
+            StepResultStore(store.file_path).write_step_results(list(reversed(step_results)))
+
+            with self.assertRaisesRegex(
+                StepRunnerException,
+                f'error {store.file_path} has changed since its index was read'
+            ):
+                store.read_step_result(index[0])
+
+    def test_append_step_result(self):
+        with TempDirectory() as temp_dir:
+            store = StepResultStore(os.path.join(temp_dir.path, 'results.journal'))
+            step_results = setup_step_results()
+            for step_result in step_results:
+                store.append_step_result(step_result)
+
+            self.assertEqual(store.read_step_results(), step_results)
+            self.assertIsNone(store.read_index())
+
+    def test_read_step_results_ignores_truncated_record(self):
+        with TempDirectory() as temp_dir:
+            store = StepResultStore(os.path.join(temp_dir.path, 'results.journal'))
+            step_results = setup_step_results()
+            for step_result in step_results:
+                store.append_step_result(step_result)
+
+            with open(store.file_path, 'rb') as file:
+                data = file.read()
+            with open(store.file_path, 'wb') as file:
+                file.write(data[:-5])
+
+            self.assertEqual(store.read_step_results(), step_results[:1])
+
+    def test_read_step_results_invalid_magic(self):
+        with TempDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir.path, 'results.psr')
+            with open(file_path, 'wb') as file:
+                file.write(b'not a step result store')
+
+            with self.assertRaisesRegex(
+                StepRunnerException,
+                f'error {file_path} has invalid data'
+            ):
+                StepResultStore(file_path).read_step_results()
+
+    def test_read_step_results_unsupported_version(self):
+        with TempDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir.path, 'results.psr')
+            with open(file_path, 'wb') as file:
+                file.write(struct.pack('>4sH', b'PSRR', StepResultStore.FORMAT_VERSION + 1))
+
+            with self.assertRaisesRegex(
+                StepRunnerException,
+                r'has unsupported format version \(2\), expected \(1\)'
+            ):
+                StepResultStore(file_path).read_step_results()
+
+    def test_read_step_results_invalid_record(self):
+        with TempDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir.path, 'results.journal')
+            record = b'{"step-name": "step1"}'
+            with open(file_path, 'wb') as file:
+                file.write(struct.pack('>4sH', b'PSRR', StepResultStore.FORMAT_VERSION))
+                file.write(struct.pack('>I', len(record)) + record)
+
+            with self.assertRaisesRegex(
+                StepRunnerException,
+                r'has invalid step result record: StepResult dictionary missing key'
+            ):
+                StepResultStore(file_path).read_step_results()
+
+    def test_write_step_results_not_json_serializable(self):
+        with TempDirectory() as temp_dir:
+            store = StepResultStore(os.path.join(temp_dir.path, 'results.psr'))
+            step_result = StepResult('step1', 'sub1', 'implementer1')
+            step_result.add_artifact('artifact1', object())
+
+            with self.assertRaisesRegex(RuntimeError, f'error writing {store.file_path}'):
+                store.write_step_results([step_result])
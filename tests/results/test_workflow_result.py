@@ -2,10 +2,15 @@
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
 import filecmp
+import json
+import os
 import pickle
+import struct
+from unittest.mock import patch
 
 from ploigos_step_runner import StepResult, WorkflowResult
 from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.results import StepResultStore
 from testfixtures import TempDirectory
 from tests.helpers.base_test_case import BaseTestCase
 
@@ -536,6 +541,32 @@ class TestStepWorkflowResultTest(BaseTestCase):
             with open(yml_file, 'r') as actual:
                 self.assertEqual(actual.read(), expected_yml_result)
 
+    def test_write_results_to_yml_file_python_value(self):
+        step_result = StepResult('step1', 'sub1', 'implementer1')
+        step_result.add_artifact('artifact1', ('value1', 'value2'))
+        wfr = WorkflowResult()
+        wfr.add_step_result(step_result)
+
+        with TempDirectory() as temp_dir:
+            yml_file = temp_dir.path + '/test-results.yml'
+            wfr.write_results_to_yml_file(yml_file)
+
+            with open(yml_file, 'r') as actual:
+                self.assertEqual(actual.read(), """step-runner-results:
+    step1:
+        sub1:
+            artifacts:
+            -   description: ''
+                name: artifact1
+                value: !!python/tuple
+                - value1
+                - value2
+            evidence: []
+            message: ''
+            sub-step-implementer-name: implementer1
+            success: true
+""")
+
     def test_write_results_to_yml_file_exception(self):
         wfr = setup_test()
 
@@ -840,3 +871,228 @@ class TestStepWorkflowResultTest(BaseTestCase):
         with self.assertRaises(
                 RuntimeError):
             wfr.write_to_pickle_file(None)
+
+    def test_load_from_pickle_file_rebuilds_indexes(self):
+        with TempDirectory() as temp_dir:
+            pickle_file = temp_dir.path + '/test.pkl'
+            expected_wfr = setup_test()
+            expected_wfr.write_to_pickle_file(pickle_file)
+            pickle_wfr = WorkflowResult.load_from_pickle_file(pickle_file)
+
+            self.assertEqual(pickle_wfr.get_artifact_value('artifact1'), 'value1')
+            self.assertEqual(
+                pickle_wfr.get_artifact_value('same-artifact-diff-env', environment='test'),
+                'value-test-env'
+            )
+            self.assertEqual(pickle_wfr.get_evidence_value('evidence5'), 'value5')
+            self.assertEqual(
+                pickle_wfr.get_step_result('deploy', 'deploy-sub', 'test'),
+                expected_wfr.get_step_result('deploy', 'deploy-sub', 'test')
+            )
+
+            step_result = StepResult('step3', 'sub3', 'implementer3')
+            step_result.add_artifact('artifact1', 'value-step3')
+            pickle_wfr.add_step_result(step_result)
+            self.assertEqual(pickle_wfr.get_artifact_value('artifact1'), 'value1')
+            self.assertEqual(
+                pickle_wfr.get_artifact_value('artifact1', step_name='step3'),
+                'value-step3'
+            )
+
+    def test_get_step_result(self):
+        wfr = setup_test()
+
+        self.assertEqual(wfr.get_step_result('step2').sub_step_name, 'sub2')
+        self.assertEqual(wfr.get_step_result('deploy').environment, 'dev')
+        self.assertEqual(wfr.get_step_result('deploy', environment='test').environment, 'test')
+        self.assertEqual(
+            wfr.get_step_result('deploy', 'deploy-sub', 'test').environment,
+            'test'
+        )
+        self.assertIsNone(wfr.get_step_result('deploy', 'deploy-sub', 'prod'))
+        self.assertIsNone(wfr.get_step_result('does-not-exist'))
+        self.assertEqual(wfr.get_step_result(None, 'sub2').step_name, 'step2')
+
+    def test_get_artifact_value_many_step_results_first_match(self):
+        wfr = WorkflowResult()
+        for i in range(500):
+            step_result = StepResult(f'step{i % 10}', f'sub{i}', 'implementer', f'env{i % 3}')
+            step_result.add_artifact(f'artifact{i}', f'value{i}')
+            step_result.add_artifact('common', f'common{i}')
+            wfr.add_step_result(step_result)
+
+        self.assertEqual(wfr.get_artifact_value('common'), 'common0')
+        self.assertEqual(wfr.get_artifact_value('common', environment='env2'), 'common2')
+        self.assertEqual(wfr.get_artifact_value('common', step_name='step7'), 'common7')
+        self.assertEqual(
+            wfr.get_artifact_value('common', step_name='step7', environment='env0'),
+            'common27'
+        )
+        self.assertEqual(wfr.get_artifact_value('artifact499'), 'value499')
+        self.assertIsNone(wfr.get_artifact_value('artifact499', environment='env0'))
+
+    def test_write_to_file_and_load_from_file(self):
+        with TempDirectory() as temp_dir:
+            results_file = temp_dir.path + '/test.psr'
+            expected_wfr = setup_test()
+            expected_wfr.write_to_file(results_file)
+
+            loaded_wfr = WorkflowResult.load_from_file(results_file)
+            self.assertEqual(loaded_wfr.workflow_list, expected_wfr.workflow_list)
+            self.assertEqual(
+                loaded_wfr.get_artifact_value('same-artifact-diff-env', environment='test'),
+                'value-test-env'
+            )
+
+    def test_load_from_file_reads_step_results_lazily(self):
+        with TempDirectory() as temp_dir:
+            results_file = temp_dir.path + '/test.psr'
+            expected_wfr = setup_test()
+            expected_wfr.write_to_file(results_file)
+
+            with patch.object(StepResult, 'from_dict', wraps=StepResult.from_dict) as from_dict:
+                loaded_wfr = WorkflowResult.load_from_file(results_file)
+                from_dict.assert_not_called()
+
+                self.assertEqual(
+                    loaded_wfr.get_artifact_value('same-artifact-diff-env', environment='test'),
+                    'value-test-env'
+                )
+                self.assertEqual(
+                    loaded_wfr.get_evidence_value('same-evidence-diff-env', environment='test'),
+                    'value-test-env'
+                )
+                self.assertEqual(
+                    loaded_wfr.get_step_result('deploy', 'deploy-sub', 'test'),
+                    expected_wfr.workflow_list[3]
+                )
+                self.assertEqual(from_dict.call_count, 1)
+
+                loaded_wfr.add_step_result(StepResult('step5', 'sub5', 'implementer5'))
+                self.assertEqual(from_dict.call_count, 1)
+
+                self.assertEqual(loaded_wfr.workflow_list[:4], expected_wfr.workflow_list)
+                self.assertEqual(from_dict.call_count, 4)
+
+    def test_load_from_file_pickle_unread_step_results(self):
+        with TempDirectory() as temp_dir:
+            results_file = temp_dir.path + '/test.psr'
+            expected_wfr = setup_test()
+            expected_wfr.write_to_file(results_file)
+
+            loaded_wfr = WorkflowResult.load_from_file(results_file)
+            unpickled_wfr = pickle.loads(pickle.dumps(loaded_wfr))
+            os.remove(results_file)
+
+            self.assertEqual(unpickled_wfr.workflow_list, expected_wfr.workflow_list)
+            self.assertEqual(unpickled_wfr.get_artifact_value('artifact5'), 'value5')
+
+    def test_load_from_file_results_file_removed_before_read(self):
+        with TempDirectory() as temp_dir:
+            results_file = temp_dir.path + '/test.psr'
+            setup_test().write_to_file(results_file)
+
+            loaded_wfr = WorkflowResult.load_from_file(results_file)
+            os.remove(results_file)
+
+            with self.assertRaisesRegex(StepRunnerException, f'error reading {results_file}'):
+                loaded_wfr.get_step_result('step1')
+
+    def test_load_from_file_no_file(self):
+        wfr = WorkflowResult.load_from_file('test.psr')
+        self.assertEqual(wfr.workflow_list, [])
+
+    def test_load_from_file_invalid_data(self):
+        with TempDirectory() as temp_dir:
+            results_file = temp_dir.path + '/test.psr'
+            with open(results_file, 'w') as file:
+                file.write("This is not a Workflow Result.")
+
+            with self.assertRaisesRegex(
+                StepRunnerException,
+                f'error loading {results_file}: error {results_file} has invalid data'
+            ):
+                WorkflowResult.load_from_file(results_file)
+
+    def test_write_step_result_to_journal_file_and_load(self):
+        with TempDirectory() as temp_dir:
+            results_file = temp_dir.path + '/test.psr'
+            journal_file = temp_dir.path + '/test.journal'
+
+            wfr = setup_test()
+            wfr.write_to_file(results_file)
+
+            step_result1 = StepResult('step3', 'sub3', 'implementer3')
+            step_result1.add_artifact('artifact1', 'value-step3')
+            step_result2 = StepResult('step4', 'sub4', 'implementer4', 'dev')
+            step_result2.add_artifact('artifact6', 'value6')
+            WorkflowResult.write_step_result_to_journal_file(step_result1, journal_file)
+            WorkflowResult.write_step_result_to_journal_file(step_result2, journal_file)
+
+            loaded_wfr = WorkflowResult.load_from_file(results_file, journal_file)
+            self.assertEqual(len(loaded_wfr.workflow_list), 6)
+            self.assertEqual(loaded_wfr.workflow_list[4], step_result1)
+            self.assertEqual(loaded_wfr.workflow_list[5], step_result2)
+            self.assertEqual(loaded_wfr.get_artifact_value('artifact6'), 'value6')
+
+            # without journal
+            self.assertEqual(
+                len(WorkflowResult.load_from_file(results_file).workflow_list),
+                4
+            )
+
+    def test_compact_journal_file(self):
+        with TempDirectory() as temp_dir:
+            results_file = temp_dir.path + '/test.psr'
+            journal_file = temp_dir.path + '/test.journal'
+
+            wfr = WorkflowResult.load_from_file(results_file, journal_file)
+            step_result = StepResult('step1', 'sub1', 'implementer1')
+            wfr.add_step_result(step_result)
+            WorkflowResult.write_step_result_to_journal_file(step_result, journal_file)
+
+            wfr.compact_journal_file(results_file, journal_file)
+            self.assertFalse(os.path.exists(journal_file))
+
+            loaded_wfr = WorkflowResult.load_from_file(results_file, journal_file)
+            self.assertEqual(loaded_wfr.workflow_list, [step_result])
+
+    def test_add_step_results_from_journal_file_skips_existing_and_partial_records(self):
+        with TempDirectory() as temp_dir:
+            journal_file = temp_dir.path + '/test.journal'
+
+            step_result1 = StepResult('step1', 'sub1', 'implementer1')
+            step_result2 = StepResult('step2', 'sub2', 'implementer2')
+            WorkflowResult.write_step_result_to_journal_file(step_result1, journal_file)
+            WorkflowResult.write_step_result_to_journal_file(step_result2, journal_file)
+            with open(journal_file, 'ab') as file:
+                file.write(struct.pack('>I', 100) + b'{"step-name": "step3"')
+
+            wfr = WorkflowResult()
+            wfr.add_step_result(step_result1)
+            wfr.add_step_results_from_journal_file(journal_file)
+
+            self.assertEqual(wfr.workflow_list, [step_result1, step_result2])
+
+    def test_add_step_results_from_journal_file_invalid_record(self):
+        with TempDirectory() as temp_dir:
+            journal_file = temp_dir.path + '/test.journal'
+            StepResultStore(journal_file).append_step_result(
+                StepResult('step1', 'sub1', 'implementer1')
+            )
+            with open(journal_file, 'ab') as file:
+                record = json.dumps({'not': 'a step result'}).encode('utf-8')
+                file.write(struct.pack('>I', len(record)) + record)
+
+            with self.assertRaisesRegex(
+                StepRunnerException,
+                f'error {journal_file} has invalid step result record'
+            ):
+                WorkflowResult().add_step_results_from_journal_file(journal_file)
+
+    def test_write_step_result_to_journal_file_exception(self):
+        with self.assertRaises(RuntimeError):
+            WorkflowResult.write_step_result_to_journal_file(
+                StepResult('step1', 'sub1', 'implementer1'),
+                None
+            )
@@ -39,7 +39,8 @@ class TestStepImplementerCreateContainerImageBuildah(BaseStepImplementerTestCase
             'imagespecfile': 'Dockerfile',
             'context': '.',
             'tls-verify': True,
-            'format': 'oci'
+            'format': 'oci',
+            'output-passthrough': False
         }
         self.assertEqual(defaults, expected_defaults)
 
@@ -39,6 +39,19 @@ class TestStepImplementerGenerateMetadataNpm(BaseStepImplementerTestCase):
         ]
         self.assertEqual(required_keys, expected_required_keys)
 
+    def test_is_step_result_cacheable(self):
+        self.assertTrue(Npm.is_step_result_cacheable())
+
+    def test__get_step_result_fingerprint_input_paths(self):
+        step_implementer = self.create_step_implementer(
+            step_config={'package-file': 'app/package.json'}
+        )
+
+        self.assertEqual(
+            step_implementer._get_step_result_fingerprint_input_paths(),
+            ['app/package.json']
+        )
+
     def test__validate_required_config_or_previous_step_result_artifact_keys_valid(self):
         with TempDirectory() as temp_dir:
             parent_work_dir_path = os.path.join(temp_dir.path, 'working')
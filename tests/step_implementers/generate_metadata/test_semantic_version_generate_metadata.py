@@ -46,6 +46,9 @@ class TestStepImplementerSemanticVersionGenerateMetadata(BaseStepImplementerTest
         ]
         self.assertEqual(required_keys, expected_required_keys)
 
+    def test_is_step_result_cacheable(self):
+        self.assertTrue(SemanticVersion.is_step_result_cacheable())
+
     def test_run_step_pass(self):
         with TempDirectory() as temp_dir:
             parent_work_dir_path = os.path.join(temp_dir.path, 'working')
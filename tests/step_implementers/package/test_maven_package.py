@@ -39,7 +39,8 @@ class TestStepImplementerMavenPackageBase(BaseStepImplementerTestCase):
             'tls-verify': True,
             'pom-file': 'pom.xml',
             'artifact-extensions': ["jar", "war", "ear"],
-            'artifact-parent-dir': 'target'
+            'artifact-parent-dir': 'target',
+            'output-passthrough': False
         }
         self.assertEqual(defaults, expected_defaults)
 
@@ -50,6 +51,9 @@ class TestStepImplementerMavenPackageBase(BaseStepImplementerTestCase):
         ]
         self.assertEqual(required_keys, expected_required_keys)
 
+    def test_is_step_result_cacheable(self):
+        self.assertTrue(Maven.is_step_result_cacheable())
+
     def create_mvn_side_effect(pom_file, artifact_parent_dir, artifact_names):
         """simulates what mvn does by touching files.
         Notes
@@ -138,6 +142,55 @@ class TestStepImplementerMavenPackageBase(BaseStepImplementerTestCase):
 
             self.assertEqual(expected_step_result, result)
 
+    @patch('sh.mvn', create=True)
+    def test_run_step_pass_output_passthrough(self, mvn_mock):
+        with TempDirectory() as temp_dir:
+            parent_work_dir_path = os.path.join(temp_dir.path, 'working')
+            temp_dir.write('pom.xml', b'''<project>
+                <modelVersion>4.0.0</modelVersion>
+                <groupId>com.mycompany.app</groupId>
+                <artifactId>my-app</artifactId>
+                <version>1.0</version>
+                <package>war</package>
+            </project>''')
+            pom_file_path = os.path.join(temp_dir.path, 'pom.xml')
+
+            step_config = {
+                'pom-file': pom_file_path,
+                'output-passthrough': True
+            }
+
+            step_implementer = self.create_step_implementer(
+                step_config=step_config,
+                step_name='package',
+                implementer='Maven',
+                parent_work_dir_path=parent_work_dir_path,
+            )
+
+            create_artifacts = TestStepImplementerMavenPackageBase.create_mvn_side_effect(
+                pom_file_path,
+                'target',
+                ['my-app-1.0.war'])
+
+            def mvn_side_effect(*args, **kwargs):
+                # mvn writes directly to the output file rather than through a callback
+                self.assertIs(kwargs['_out'], kwargs['_err'])
+                self.assertIsNotNone(kwargs['_out'].fileno())
+                kwargs['_out'].write('mock mvn output\n')
+                kwargs['_out'].flush()
+                create_artifacts(*args, **kwargs)
+            mvn_mock.side_effect = mvn_side_effect
+
+            result = step_implementer._run_step()
+
+            self.assertTrue(result.success)
+            mvn_output_file_path = os.path.join(
+                step_implementer.work_dir_path,
+                'mvn_test_output.txt'
+            )
+            with open(mvn_output_file_path, encoding='utf-8') as mvn_output_file:
+                self.assertEqual(mvn_output_file.read(), 'mock mvn output\n')
+
     @patch('sh.mvn', create=True)
     def test_run_step_pass_no_package_in_pom(self, mvn_mock):
         with TempDirectory() as temp_dir:
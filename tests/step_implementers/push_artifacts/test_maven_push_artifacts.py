@@ -34,7 +34,8 @@ class TestStepImplementerMavenPushArtifacts(BaseStepImplementerTestCase):
     def test_step_implementer_config_defaults(self):
         actual_defaults = Maven.step_implementer_config_defaults()
         expected_defaults = {
-            'tls-verify': True
+            'tls-verify': True,
+            'output-passthrough': False
         }
         self.assertEqual(expected_defaults, actual_defaults)
 
@@ -48,6 +49,9 @@ class TestStepImplementerMavenPushArtifacts(BaseStepImplementerTestCase):
         ]
         self.assertEqual(expected_required_keys, actual_required_keys)
 
+    def test_is_step_result_cacheable(self):
+        self.assertFalse(Maven.is_step_result_cacheable())
+
     @patch('sh.mvn', create=True)
     def test_run_step_pass(self, mvn_mock):
         with TempDirectory() as temp_dir:
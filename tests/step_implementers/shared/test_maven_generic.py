@@ -40,6 +40,20 @@ class TestStepImplementerSharedMavenGeneric(BaseStepImplementerTestCase):
             parent_work_dir_path=parent_work_dir_path
         )
 
+    def test__get_step_result_fingerprint_input_paths(self):
+        step_implementer = self.create_step_implementer(
+            step_config={'pom-file': 'app/pom.xml'}
+        )
+
+        self.assertEqual(step_implementer._get_step_result_fingerprint_input_paths(), ['app'])
+
+    def test__get_step_result_fingerprint_input_paths_pom_file_in_current_dir(self):
+        step_implementer = self.create_step_implementer(
+            step_config={'pom-file': 'pom.xml'}
+        )
+
+        self.assertEqual(step_implementer._get_step_result_fingerprint_input_paths(), ['.'])
+
     @patch('ploigos_step_runner.step_implementers.shared.maven_generic.generate_maven_settings')
     def test__generate_maven_settings(self, utils_generate_maven_settings_mock):
         with TempDirectory() as test_dir:
@@ -38,7 +38,8 @@ class TestStepImplementerSharedOpenSCAPGeneric(BaseStepImplementerTestCase):
     def test_step_implementer_config_defaults(self):
         defaults = OpenSCAPGeneric.step_implementer_config_defaults()
         expected_defaults = {
-            'oscap-fetch-remote-resources': True
+            'oscap-fetch-remote-resources': True,
+            'output-passthrough': False
         }
         self.assertEqual(defaults, expected_defaults)
 
@@ -38,7 +38,8 @@ class TestStepImplementerSonarQubePackageBase(BaseStepImplementerTestCase):
         defaults = SonarQube.step_implementer_config_defaults()
         expected_defaults = {
             'properties': './sonar-project.properties',
-            'java-truststore': '/etc/pki/java/cacerts'
+            'java-truststore': '/etc/pki/java/cacerts',
+            'output-passthrough': False
         }
         self.assertEqual(defaults, expected_defaults)
 
@@ -52,6 +53,19 @@ class TestStepImplementerSonarQubePackageBase(BaseStepImplementerTestCase):
         ]
         self.assertEqual(required_keys, expected_required_keys)
 
+    def test_is_step_result_cacheable(self):
+        self.assertTrue(SonarQube.is_step_result_cacheable())
+
+    def test__get_step_result_fingerprint_input_paths(self):
+        step_implementer = self.create_step_implementer(
+            step_config={'properties': 'app/sonar-project.properties'}
+        )
+
+        self.assertEqual(
+            step_implementer._get_step_result_fingerprint_input_paths(),
+            ['app']
+        )
+
     def test__validate_required_config_or_previous_step_result_artifact_keys_valid(self):
         step_config = {
             'url' : 'https://sonarqube-sonarqube.apps.ploigos_step_runner.rht-set.com',
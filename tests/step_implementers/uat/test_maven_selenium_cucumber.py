@@ -115,7 +115,8 @@ class TestStepImplementerMavenSeleniumCucumber_Other(TestStepImplementerMavenSel
             'fail-on-no-tests': True,
             'pom-file': 'pom.xml',
             'tls-verify': True,
-            'uat-maven-profile': 'integration-test'
+            'uat-maven-profile': 'integration-test',
+            'output-passthrough': False
         }
         self.assertEqual(expected_defaults, actual_defaults)
 
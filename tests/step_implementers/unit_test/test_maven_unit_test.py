@@ -28,12 +28,16 @@ class TestStepImplementerMavenUnitTest(MaveStepImplementerTestCase):
             parent_work_dir_path=parent_work_dir_path
         )
 
+    def test_is_step_result_cacheable(self):
+        self.assertTrue(Maven.is_step_result_cacheable())
+
     def test_step_implementer_config_defaults(self):
         defaults = Maven.step_implementer_config_defaults()
         expected_defaults = {
             'fail-on-no-tests': True,
             'pom-file': 'pom.xml',
-            'tls-verify': True
+            'tls-verify': True,
+            'output-passthrough': False
         }
         self.assertEqual(defaults, expected_defaults)
 
@@ -48,6 +48,14 @@ class RequiredConstructorParamsConfigValueDecryptor(ConfigValueDecryptor):
             config_value.raw_value
         ).group(1)
 
+class CountingConfigValueDecryptor(SampleConfigValueDecryptor):
+    def __init__(self):
+        self.decrypt_count = 0
+
+    def decrypt(self, config_value):
+        self.decrypt_count += 1
+        return super().decrypt(config_value)
+
 class BadConfigValueDecryptor:
     pass
 
@@ -214,3 +222,140 @@ class TestDecryptionUtils(BaseTestCase):
             decrypted_value,
             secret_value
         )
+
+    def test_decrypt_cache_decrypts_once(self):
+        secret_value = "decrypt me"
+        decryptor = CountingConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        for _ in range(3):
+            decrypted_value = DecryptionUtils.decrypt(
+                ConfigValue(
+                    f'TEST_ENC[{secret_value}]',
+                    '/does/not/matter.yml',
+                    ['step-runner-config', 'foo']
+                )
+            )
+            self.assertEqual(decrypted_value, secret_value)
+
+        self.assertEqual(decryptor.decrypt_count, 1)
+
+    def test_decrypt_cache_different_path_parts(self):
+        secret_value = "decrypt me"
+        decryptor = CountingConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        DecryptionUtils.decrypt(
+            ConfigValue(f'TEST_ENC[{secret_value}]', {'a': 'b'}, ['step-runner-config', 'foo'])
+        )
+        DecryptionUtils.decrypt(
+            ConfigValue(f'TEST_ENC[{secret_value}]', {'a': 'b'}, ['step-runner-config', 'bar'])
+        )
+        DecryptionUtils.decrypt(
+            ConfigValue(f'TEST_ENC[{secret_value}]', {'a': 'c'}, ['step-runner-config', 'bar'])
+        )
+
+        self.assertEqual(decryptor.decrypt_count, 3)
+
+    def test_clear_decryption_cache(self):
+        config_value = ConfigValue('TEST_ENC[decrypt me]')
+        decryptor = CountingConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        DecryptionUtils.decrypt(config_value)
+        DecryptionUtils.clear_decryption_cache()
+        DecryptionUtils.decrypt(config_value)
+
+        self.assertEqual(decryptor.decrypt_count, 2)
+
+    def test_set_decryption_cache_enabled_false(self):
+        config_value = ConfigValue('TEST_ENC[decrypt me]')
+        decryptor = CountingConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        DecryptionUtils.set_decryption_cache_enabled(False)
+        self.assertFalse(DecryptionUtils.is_decryption_cache_enabled())
+
+        DecryptionUtils.decrypt(config_value)
+        DecryptionUtils.decrypt(config_value)
+
+        self.assertEqual(decryptor.decrypt_count, 2)
+
+    def test_unregister_obfuscation_stream(self):
+        secret_value = "decrypt me"
+        DecryptionUtils.register_config_value_decryptor(
+            SampleConfigValueDecryptor()
+        )
+
+        out = io.StringIO()
+        obfuscated_out = TextIOSelectiveObfuscator(out)
+        DecryptionUtils.register_obfuscation_stream(obfuscated_out)
+        DecryptionUtils.unregister_obfuscation_stream(obfuscated_out)
+        DecryptionUtils.unregister_obfuscation_stream(obfuscated_out)
+        DecryptionUtils.decrypt(ConfigValue(f'TEST_ENC[{secret_value}]'))
+
+        obfuscated_out.write(f"not registered ({secret_value})")
+        self.assertEqual(out.getvalue(), f"not registered ({secret_value})")
+
+    def test_register_obfuscation_stream_after_decrypt(self):
+        secret_value = "decrypt me"
+        DecryptionUtils.register_config_value_decryptor(
+            SampleConfigValueDecryptor()
+        )
+        DecryptionUtils.decrypt(ConfigValue(f'TEST_ENC[{secret_value}]'))
+
+        out = io.StringIO()
+        obfuscated_out = TextIOSelectiveObfuscator(out)
+        DecryptionUtils.register_obfuscation_stream(obfuscated_out)
+
+        obfuscated_out.write(f"ensure that I can't actually leak secret value ({secret_value})")
+        self.assertRegex(
+            out.getvalue(),
+            r"ensure that I can't actually leak secret value \(\*+\)"
+        )
+
+    def test_can_decrypt(self):
+        DecryptionUtils.register_config_value_decryptor(
+            SampleConfigValueDecryptor()
+        )
+
+        self.assertTrue(DecryptionUtils.can_decrypt(ConfigValue('TEST_ENC[decrypt me]')))
+        self.assertFalse(DecryptionUtils.can_decrypt(ConfigValue('attempt to decrypt me')))
+
+    def test_is_decrypted(self):
+        config_value = ConfigValue('TEST_ENC[decrypt me]')
+        DecryptionUtils.register_config_value_decryptor(
+            SampleConfigValueDecryptor()
+        )
+
+        self.assertFalse(DecryptionUtils.is_decrypted(config_value))
+        DecryptionUtils.decrypt(config_value)
+        self.assertTrue(DecryptionUtils.is_decrypted(config_value))
+
+    def test_get_config_value_decryptor(self):
+        sample_decryptor = SampleConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(sample_decryptor)
+
+        self.assertIs(
+            DecryptionUtils.get_config_value_decryptor(ConfigValue('TEST_ENC[decrypt me]')),
+            sample_decryptor
+        )
+        self.assertIsNone(
+            DecryptionUtils.get_config_value_decryptor(ConfigValue('attempt to decrypt me'))
+        )
+
+    def test_get_config_value_decryptors_version(self):
+        version = DecryptionUtils.get_config_value_decryptors_version()
+
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+
+        self.assertEqual(DecryptionUtils.get_config_value_decryptors_version(), version + 1)
+
+    def test_decrypt_given_decryptor(self):
+        counting_decryptor = CountingConfigValueDecryptor()
+
+        self.assertEqual(
+            DecryptionUtils.decrypt(ConfigValue('TEST_ENC[decrypt me]'), counting_decryptor),
+            'decrypt me'
+        )
+        self.assertEqual(counting_decryptor.decrypt_count, 1)
@@ -0,0 +1,170 @@
+import importlib
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+try:
+    from importlib.metadata import EntryPoint
+except ImportError: # python < 3.8
+    EntryPoint = None
+
+from testfixtures import TempDirectory
+
+from ploigos_step_runner.config.config_value import ConfigValue
+from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.implementer_registry import ImplementerRegistry
+from tests.helpers.base_test_case import BaseTestCase
+from tests.test_decryption_utils import SampleConfigValueDecryptor
+
+
+class MockEntryPoints:
+    def __init__(self, entry_points):
+        self.__entry_points = entry_points
+
+    def select(self, group):
+        return [entry_point for entry_point in self.__entry_points if entry_point.group == group]
+
+
+def create_mock_entry_points():
+    return MockEntryPoints([
+        EntryPoint(
+            name='foo/Foo',
+            value='tests.helpers.sample_step_implementers:FooStepImplementer',
+            group=ImplementerRegistry.STEP_IMPLEMENTERS_ENTRY_POINT_GROUP
+        ),
+        EntryPoint(
+            name='foo/Foo',
+            value='tests.helpers.sample_step_implementers:WriteConfigAsResultsStepImplementer',
+            group=ImplementerRegistry.STEP_IMPLEMENTERS_ENTRY_POINT_GROUP
+        ),
+        EntryPoint(
+            name='Sample',
+            value='tests.test_decryption_utils:SampleConfigValueDecryptor',
+            group=ImplementerRegistry.CONFIG_VALUE_DECRYPTORS_ENTRY_POINT_GROUP
+        ),
+        EntryPoint(
+            name='Other',
+            value='other.module:Other',
+            group='other.group'
+        )
+    ])
+
+
+@unittest.skipIf(sys.version_info < (3, 8), 'importlib.metadata requires python 3.8')
+@patch('importlib.metadata.entry_points', side_effect=create_mock_entry_points)
+class TestImplementerRegistry(BaseTestCase):
+    def test_get_step_implementers(self, entry_points_mock):
+        self.assertEqual(
+            ImplementerRegistry.get_step_implementers(),
+            {'foo/Foo': 'tests.helpers.sample_step_implementers:FooStepImplementer'}
+        )
+
+    def test_get_config_value_decryptors(self, entry_points_mock):
+        self.assertEqual(
+            ImplementerRegistry.get_config_value_decryptors(),
+            {'Sample': 'tests.test_decryption_utils:SampleConfigValueDecryptor'}
+        )
+
+    def test_resolve_step_implementer(self, entry_points_mock):
+        self.assertEqual(
+            ImplementerRegistry.resolve_step_implementer('foo', 'Foo'),
+            ('tests.helpers.sample_step_implementers', 'FooStepImplementer')
+        )
+        self.assertIsNone(ImplementerRegistry.resolve_step_implementer('bar', 'Foo'))
+        self.assertIsNone(ImplementerRegistry.resolve_step_implementer('foo', 'Bar'))
+
+    def test_resolve_config_value_decryptor(self, entry_points_mock):
+        self.assertEqual(
+            ImplementerRegistry.resolve_config_value_decryptor('Sample'),
+            ('tests.test_decryption_utils', 'SampleConfigValueDecryptor')
+        )
+        self.assertIsNone(ImplementerRegistry.resolve_config_value_decryptor('Other'))
+
+    def test_discovered_once(self, entry_points_mock):
+        ImplementerRegistry.resolve_step_implementer('foo', 'Foo')
+        ImplementerRegistry.resolve_config_value_decryptor('Sample')
+        ImplementerRegistry.get_step_implementers()
+
+        entry_points_mock.assert_called_once()
+
+    def test_manifest_cached(self, entry_points_mock):
+        with TempDirectory() as temp_dir:
+            ImplementerRegistry.set_cache_dir(temp_dir.path)
+            ImplementerRegistry.get_step_implementers()
+            self.assertTrue(
+                os.path.exists(os.path.join(temp_dir.path, ImplementerRegistry.MANIFEST_FILE_NAME))
+            )
+
+            ImplementerRegistry.set_cache_dir(temp_dir.path)
+            self.assertEqual(
+                ImplementerRegistry.resolve_step_implementer('foo', 'Foo'),
+                ('tests.helpers.sample_step_implementers', 'FooStepImplementer')
+            )
+            entry_points_mock.assert_called_once()
+
+    def test_manifest_sys_path_changed(self, entry_points_mock):
+        with TempDirectory() as temp_dir:
+            ImplementerRegistry.set_cache_dir(temp_dir.path)
+            ImplementerRegistry.get_step_implementers()
+
+            temp_dir.makedir('site-packages')
+            with patch(
+                'sys.path',
+                [os.path.join(temp_dir.path, 'site-packages')] + os.sys.path
+            ):
+                ImplementerRegistry.set_cache_dir(temp_dir.path)
+                ImplementerRegistry.get_step_implementers()
+
+            self.assertEqual(entry_points_mock.call_count, 2)
+
+    def test_manifest_corrupt(self, entry_points_mock):
+        with TempDirectory() as temp_dir:
+            manifest_path = os.path.join(temp_dir.path, ImplementerRegistry.MANIFEST_FILE_NAME)
+            ImplementerRegistry.set_cache_dir(temp_dir.path)
+            ImplementerRegistry.get_step_implementers()
+
+            with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+            manifest['entry-points'][ImplementerRegistry.STEP_IMPLEMENTERS_ENTRY_POINT_GROUP] = []
+            with open(manifest_path, 'w', encoding='utf-8') as manifest_file:
+                json.dump(manifest, manifest_file)
+
+            ImplementerRegistry.set_cache_dir(temp_dir.path)
+            self.assertEqual(
+                ImplementerRegistry.get_step_implementers(),
+                {'foo/Foo': 'tests.helpers.sample_step_implementers:FooStepImplementer'}
+            )
+            self.assertEqual(entry_points_mock.call_count, 2)
+
+    def test_manifest_unwritable_cache_dir(self, entry_points_mock):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('cache', b'not a directory')
+            ImplementerRegistry.set_cache_dir(os.path.join(temp_dir.path, 'cache', 'nested'))
+
+            self.assertEqual(
+                ImplementerRegistry.resolve_step_implementer('foo', 'Foo'),
+                ('tests.helpers.sample_step_implementers', 'FooStepImplementer')
+            )
+
+    def test_create_and_register_registered_config_value_decryptor(self, entry_points_mock):
+        DecryptionUtils.create_and_register_config_value_decryptor('Sample')
+
+        self.assertEqual(DecryptionUtils.decrypt(ConfigValue('TEST_ENC[secret]')), 'secret')
+        self.assertIsInstance(
+            DecryptionUtils._DecryptionUtils__config_value_decryptors[0],
+            SampleConfigValueDecryptor
+        )
+
+
+class TestImplementerRegistryNoEntryPointDiscovery(BaseTestCase):
+    def test_no_importlib_metadata(self):
+        # NOTE: python < 3.8 has no importlib.metadata
+        with patch.dict(sys.modules, {'importlib.metadata': None}), \
+                patch.dict(importlib.__dict__):
+            importlib.__dict__.pop('metadata', None)
+
+            self.assertEqual(ImplementerRegistry.get_step_implementers(), {})
+            self.assertEqual(ImplementerRegistry.get_config_value_decryptors(), {})
+            self.assertIsNone(ImplementerRegistry.resolve_step_implementer('foo', 'Foo'))
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+from tests.helpers.base_test_case import BaseTestCase
+
+
+class TestImportTime(BaseTestCase):
+    HEAVY_MODULES = ['git', 'sh', 'urllib.request']
+
+    @staticmethod
+    def __run_python(code):
+        src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [src_path] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+        )
+
+        return subprocess.run(
+            [sys.executable, '-c', code],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True
+        )
+
+    def test_psr_cold_start_does_not_import_heavy_modules(self):
+        result = self.__run_python(
+            'import sys\n'
+            'import ploigos_step_runner.__main__\n'
+            'print(" ".join(sys.modules))'
+        )
+
+        imported_modules = result.stdout.split()
+        for heavy_module in self.HEAVY_MODULES:
+            self.assertNotIn(heavy_module, imported_modules)
+
+    def test_loading_step_implementer_does_not_import_other_step_implementers(self):
+        result = self.__run_python(
+            'import sys\n'
+            'from ploigos_step_runner.utils.reflection import import_and_get_class\n'
+            'import_and_get_class(\n'
+            '    "ploigos_step_runner.step_implementers.generate_metadata",\n'
+            '    "SemanticVersion"\n'
+            ')\n'
+            'print(" ".join(sys.modules))'
+        )
+
+        imported_modules = result.stdout.split()
+        self.assertIn(
+            'ploigos_step_runner.step_implementers.generate_metadata.semantic_version',
+            imported_modules
+        )
+        self.assertNotIn(
+            'ploigos_step_runner.step_implementers.generate_metadata.git',
+            imported_modules
+        )
+        for heavy_module in self.HEAVY_MODULES:
+            self.assertNotIn(heavy_module, imported_modules)
@@ -1,11 +1,14 @@
 import os
 from contextlib import redirect_stdout
 from io import StringIO
+from unittest.mock import patch
 
 from ploigos_step_runner import StepResult, WorkflowResult
 from ploigos_step_runner.config import Config
+from ploigos_step_runner.decryption_utils import DecryptionUtils
 from ploigos_step_runner.exceptions import StepRunnerException
-from ploigos_step_runner.results import step_result_artifact
+from ploigos_step_runner.results import StepResultCache, step_result_artifact
+from ploigos_step_runner.results.cache_backends import LocalDirectoryBackend
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.step_runner import StepRunner
 from testfixtures import TempDirectory
@@ -13,9 +16,10 @@ from testfixtures import TempDirectory
 from tests.helpers.base_step_implementer_test_case import \
     BaseStepImplementerTestCase
 from tests.helpers.sample_step_implementers import (
-    FailStepImplementer, FooStepImplementer,
+    CacheableStepImplementer, FailStepImplementer, FooStepImplementer,
     RequiredStepConfigMultipleOptionsStepImplementer,
-    WriteConfigAsResultsStepImplementer)
+    SleepThenPrintStepImplementer, WriteConfigAsResultsStepImplementer)
+from tests.test_decryption_utils import SampleConfigValueDecryptor
 
 
 class TestStepImplementer(BaseStepImplementerTestCase):
@@ -38,8 +42,8 @@ class TestStepImplementer(BaseStepImplementerTestCase):
             environment=environment
         )
 
-        pickle = f'{working_dir_path}/step-runner-results.pkl'
-        workflow_result = WorkflowResult.load_from_pickle_file(pickle)
+        workflow_result_file = f'{working_dir_path}/step-runner-results.psr'
+        workflow_result = WorkflowResult.load_from_file(workflow_result_file)
 
         step_result = workflow_result.get_step_result(
             step_name=step
@@ -138,6 +142,43 @@ class TestStepImplementer_run_step(TestStepImplementer):
                 test_dir
             )
 
+    def test_output_log_file(self):
+        config = Config({
+            'step-runner-config': {
+                'foo': {
+                    'name': 'sub-step-1',
+                    'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                    'config': {
+                        'message': 'TEST_ENC[my secret]'
+                    }
+                }
+            }
+        })
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+
+        with TempDirectory() as test_dir:
+            step_implementer = SleepThenPrintStepImplementer(
+                workflow_result=WorkflowResult(),
+                parent_work_dir_path=test_dir.path,
+                config=config.get_sub_step_configs('foo')[0]
+            )
+
+            stdout = StringIO()
+            with redirect_stdout(stdout):
+                step_result = step_implementer.run_step()
+            self.assertTrue(step_result.success)
+            self.assertIn('        stdout from sub-step-1', stdout.getvalue())
+
+            self.assertEqual(
+                step_implementer.output_log_file_path,
+                os.path.join(test_dir.path, 'foo', 'sub-step-1.output.log')
+            )
+            with open(step_implementer.output_log_file_path, encoding='utf-8') as output_log:
+                self.assertRegex(
+                    output_log.read(),
+                    r'^\*+\nstdout from sub-step-1\nstderr from sub-step-1\n$'
+                )
+
     def test_one_step_existing_results_file_bad_pickle(self):
         config = {
             'step-runner-config': {
@@ -1150,3 +1191,129 @@ class TestStepImplementer___print_data_string(TestStepImplementer):
             '                "service-name": "fruit"\n'
             '            }\n\n'
         )
+
+
+class TestStepImplementerStepResultFingerprint(BaseStepImplementerTestCase):
+    def __create_step_implementer(
+        self,
+        temp_dir,
+        step_config=None,
+        step_implementer=CacheableStepImplementer,
+        workflow_result=None
+    ):
+        return self.create_given_step_implementer(
+            step_implementer=step_implementer,
+            step_config={
+                'input-path': os.path.join(temp_dir.path, 'project'),
+                **(step_config or {})
+            },
+            step_name='package',
+            implementer='Cacheable',
+            workflow_result=workflow_result,
+            parent_work_dir_path=os.path.join(temp_dir.path, 'project', 'step-runner-working')
+        )
+
+    def test_is_step_result_cacheable_default(self):
+        self.assertFalse(StepImplementer.is_step_result_cacheable())
+        self.assertFalse(FooStepImplementer.is_step_result_cacheable())
+
+    def test_fingerprint_unchanged_inputs(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('project/pom.xml', b'<project/>')
+            fingerprint = self.__create_step_implementer(temp_dir).get_step_result_fingerprint()
+
+            temp_dir.write('project/step-runner-working/package/Cacheable.output.log', b'output')
+            temp_dir.write('project/.git/HEAD', b'ref: refs/heads/main')
+            self.assertEqual(
+                self.__create_step_implementer(temp_dir).get_step_result_fingerprint(),
+                fingerprint
+            )
+
+    def test_fingerprint_changed_inputs(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('project/pom.xml', b'<project/>')
+            fingerprint = self.__create_step_implementer(temp_dir).get_step_result_fingerprint()
+
+            self.assertNotEqual(
+                self.__create_step_implementer(
+                    temp_dir,
+                    step_config={'success': False}
+                ).get_step_result_fingerprint(),
+                fingerprint
+            )
+            self.assertNotEqual(
+                self.__create_step_implementer(
+                    temp_dir,
+                    step_implementer=WriteConfigAsResultsStepImplementer
+                ).get_step_result_fingerprint(),
+                fingerprint
+            )
+
+            temp_dir.write('project/pom.xml', b'<project></project>')
+            self.assertNotEqual(
+                self.__create_step_implementer(temp_dir).get_step_result_fingerprint(),
+                fingerprint
+            )
+
+    def test_fingerprint_does_not_decrypt(self):
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+        with TempDirectory() as temp_dir:
+            step_implementer = self.__create_step_implementer(
+                temp_dir,
+                step_config={'password': 'TEST_ENC[secret]'}
+            )
+            fingerprint = step_implementer.get_step_result_fingerprint()
+
+            self.assertFalse(DecryptionUtils.is_decrypted(
+                step_implementer.get_copy_of_runtime_step_config()['password']
+            ))
+            self.assertNotEqual(
+                self.__create_step_implementer(
+                    temp_dir,
+                    step_config={'password': 'TEST_ENC[other secret]'}
+                ).get_step_result_fingerprint(),
+                fingerprint
+            )
+
+    def test_consumed_result_values(self):
+        workflow_result = WorkflowResult()
+        step_result = StepResult('generate-metadata', 'Maven', 'Maven')
+        step_result.add_artifact('version', '1.0.0')
+        workflow_result.add_step_result(step_result)
+
+        with TempDirectory() as temp_dir:
+            step_implementer = self.__create_step_implementer(
+                temp_dir,
+                workflow_result=workflow_result
+            )
+            step_implementer.get_value('version')
+            step_implementer.get_result_value('does-not-exist', step_name='generate-metadata')
+
+            self.assertEqual(
+                step_implementer.consumed_result_values,
+                {
+                    ('version', None, None, None): '1.0.0',
+                    ('does-not-exist', 'generate-metadata', None, None): None
+                }
+            )
+
+    def test_run_step_input_path_unreadable(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('project/pom.xml', b'<project/>')
+            step_implementer = self.__create_step_implementer(temp_dir)
+            step_result_cache = StepResultCache(
+                LocalDirectoryBackend(os.path.join(temp_dir.path, 'cache'))
+            )
+
+            stdout = StringIO()
+            with redirect_stdout(stdout), \
+                    patch('ploigos_step_runner.step_implementer.get_file_tree_hash',
+                          side_effect=PermissionError('permission denied')):
+                step_result = step_implementer.run_step(step_result_cache=step_result_cache)
+
+            self.assertTrue(step_result.success)
+            self.assertIn(
+                'Not using step result cache, could not fingerprint step inputs: permission denied',
+                stdout.getvalue()
+            )
+            self.assertFalse(os.path.exists(os.path.join(temp_dir.path, 'cache')))
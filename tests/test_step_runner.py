@@ -3,13 +3,26 @@
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
 
+import io
+import os
 import re
+import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
 
 from testfixtures import TempDirectory
-from ploigos_step_runner import StepRunner, StepRunnerException
+from ploigos_step_runner import (StepResult, StepRunner, StepRunnerException,
+                                 WorkflowResult)
 from ploigos_step_runner.config import Config
+from ploigos_step_runner.implementer_registry import ImplementerRegistry
+from ploigos_step_runner.results import StepResultCache
+from ploigos_step_runner.results.cache_backends import LocalDirectoryBackend
 
 from tests.helpers.base_test_case import BaseTestCase
+from tests.helpers.sample_step_implementers import (CacheableStepImplementer,
+                                                    FooStepImplementer,
+                                                    SleepThenPrintStepImplementer)
 
 
 class TestStepRunner(BaseTestCase):
@@ -106,6 +119,408 @@ class TestStepRunner(BaseTestCase):
             factory = StepRunner(config)
             factory.run_step('foo')
 
+    def test_run_step_compacts_journal_and_writes_results(self):
+        config = {
+            'step-runner-config': {
+                'foo': [
+                    {
+                        'name': 'sub-step-1',
+                        'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                    },
+                    {
+                        'name': 'sub-step-2',
+                        'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                    }
+                ]
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+            self.assertTrue(factory.run_step('foo'))
+
+            self.assertFalse(os.path.exists(factory.workflow_result_journal_file_path))
+            self.assertTrue(os.path.exists(factory.results_file_path))
+
+            workflow_result = WorkflowResult.load_from_file(
+                factory.workflow_result_file_path
+            )
+            self.assertEqual(
+                [step_result.sub_step_name for step_result in workflow_result.workflow_list],
+                ['sub-step-1', 'sub-step-2']
+            )
+
+    def test_run_step_writes_results_of_completed_sub_steps_on_error(self):
+        config = {
+            'step-runner-config': {
+                'foo': [
+                    {
+                        'name': 'sub-step-1',
+                        'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                    },
+                    {
+                        'name': 'sub-step-2',
+                        'implementer': 'DoesNotExist'
+                    }
+                ]
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+            with self.assertRaises(StepRunnerException):
+                factory.run_step('foo')
+
+            self.assertFalse(os.path.exists(factory.workflow_result_journal_file_path))
+            workflow_result = WorkflowResult.load_from_file(
+                factory.workflow_result_file_path
+            )
+            self.assertEqual(
+                [step_result.sub_step_name for step_result in workflow_result.workflow_list],
+                ['sub-step-1']
+            )
+
+    def test_run_step_migrates_workflow_result_pickle_file(self):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+
+            previous_workflow_result = WorkflowResult()
+            previous_workflow_result.add_step_result(StepResult('bar', 'bar-sub', 'Bar'))
+            previous_workflow_result.write_to_pickle_file(
+                factory.workflow_result_pickle_file_path
+            )
+
+            self.assertTrue(factory.run_step('foo'))
+
+            self.assertFalse(os.path.exists(factory.workflow_result_pickle_file_path))
+            workflow_result = WorkflowResult.load_from_file(
+                factory.workflow_result_file_path
+            )
+            self.assertEqual(
+                [step_result.step_name for step_result in workflow_result.workflow_list],
+                ['bar', 'foo']
+            )
+
+    def test_run_step_parallel_sub_steps(self):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'parallel': True,
+                    'sub-steps': [
+                        {
+                            'name': 'sub-step-1',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                            'config': {
+                                'sleep-seconds': 0.2,
+                                'wait-on-barrier': True
+                            }
+                        },
+                        {
+                            'name': 'sub-step-2',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                            'config': {
+                                'wait-on-barrier': True
+                            }
+                        },
+                        {
+                            'name': 'sub-step-3',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                            'config': {
+                                'sleep-seconds': 0.1,
+                                'wait-on-barrier': True
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+
+            original_stdout = sys.stdout
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            # NOTE: every sub step waits until all of them are running, which only happens if
+            #       they run in parallel
+            SleepThenPrintStepImplementer.barrier = threading.Barrier(3, timeout=10)
+            try:
+                with redirect_stdout(stdout), redirect_stderr(stderr):
+                    self.assertTrue(factory.run_step('foo'))
+            finally:
+                SleepThenPrintStepImplementer.barrier = None
+
+            # output is captured per sub step and written in sub step order
+            stdout = stdout.getvalue()
+            self.assertLess(
+                stdout.index('stdout from sub-step-1'),
+                stdout.index('Step End - foo')
+            )
+            self.assertLess(
+                stdout.index('Step End - foo'),
+                stdout.index('stdout from sub-step-2')
+            )
+            self.assertLess(
+                stdout.index('stdout from sub-step-2'),
+                stdout.index('stdout from sub-step-3')
+            )
+            self.assertEqual(
+                re.findall(r'stderr from (sub-step-\d)', stderr.getvalue()),
+                ['sub-step-1', 'sub-step-2', 'sub-step-3']
+            )
+            self.assertIs(sys.stdout, original_stdout)
+
+            workflow_result = WorkflowResult.load_from_file(factory.workflow_result_file_path)
+            self.assertEqual(
+                [step_result.sub_step_name for step_result in workflow_result.workflow_list],
+                ['sub-step-1', 'sub-step-2', 'sub-step-3']
+            )
+
+    def test_run_step_parallel_sub_steps_fail_fast(self):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'parallel': True,
+                    'sub-steps': [
+                        {
+                            'name': 'sub-step-1',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                            'config': {
+                                'sleep-seconds': 0.1
+                            }
+                        },
+                        {
+                            'name': 'sub-step-2',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                            'config': {
+                                'success': False
+                            }
+                        },
+                        {
+                            'name': 'sub-step-3',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer'
+                        }
+                    ]
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+            self.assertFalse(factory.run_step('foo'))
+
+            workflow_result = WorkflowResult.load_from_file(factory.workflow_result_file_path)
+            self.assertEqual(
+                [step_result.sub_step_name for step_result in workflow_result.workflow_list],
+                ['sub-step-1', 'sub-step-2']
+            )
+
+    def test_run_step_parallel_sub_steps_fail_fast_later_sub_steps_not_started(self):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'parallel': True,
+                    'sub-steps': [
+                        {
+                            'name': 'sub-step-1',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                            'config': {
+                                'success': False
+                            }
+                        },
+                        {
+                            'name': 'sub-step-2',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                            'config': {
+                                'sleep-seconds': 0.2
+                            }
+                        },
+                        {
+                            'name': 'sub-step-3',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer'
+                        },
+                        {
+                            'name': 'sub-step-4',
+                            'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer'
+                        }
+                    ]
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path, max_parallel_sub_steps=2)
+
+            stdout = io.StringIO()
+            SleepThenPrintStepImplementer.ran_sub_steps = []
+            try:
+                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                    self.assertFalse(factory.run_step('foo'))
+                ran_sub_steps = SleepThenPrintStepImplementer.ran_sub_steps
+            finally:
+                SleepThenPrintStepImplementer.ran_sub_steps = None
+
+            # the already running sub step is waited on but its output and result discarded,
+            # the sub steps waiting for a free worker are never started
+            self.assertEqual(sorted(ran_sub_steps), ['sub-step-1', 'sub-step-2'])
+            self.assertNotIn('stdout from sub-step-2', stdout.getvalue())
+
+            workflow_result = WorkflowResult.load_from_file(factory.workflow_result_file_path)
+            self.assertEqual(
+                [step_result.sub_step_name for step_result in workflow_result.workflow_list],
+                ['sub-step-1']
+            )
+
+    def test_run_step_parallel_sub_steps_exception(self):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'parallel': True,
+                    'sub-steps': [
+                        {
+                            'name': 'sub-step-1',
+                            'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                        },
+                        {
+                            'name': 'sub-step-2',
+                            'implementer': 'DoesNotExist'
+                        }
+                    ]
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+            with self.assertRaises(StepRunnerException):
+                factory.run_step('foo')
+
+            workflow_result = WorkflowResult.load_from_file(factory.workflow_result_file_path)
+            self.assertEqual(
+                [step_result.sub_step_name for step_result in workflow_result.workflow_list],
+                ['sub-step-1']
+            )
+
+    def test_run_workflow_ordered(self):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                },
+                'bar': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+            self.assertTrue(factory.run_workflow(['bar', 'foo']))
+
+            workflow_result = WorkflowResult.load_from_file(factory.workflow_result_file_path)
+            self.assertEqual(
+                [step_result.step_name for step_result in workflow_result.workflow_list],
+                ['bar', 'foo']
+            )
+
+    def test_run_workflow_dag(self):
+        config = {
+            'step-runner-config': {
+                'generate-metadata': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                },
+                'package': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                },
+                'static-code-analysis': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                },
+                'push-artifacts': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+            self.assertTrue(factory.run_workflow(
+                workflow={
+                    'generate-metadata': [],
+                    'package': ['generate-metadata'],
+                    'static-code-analysis': ['generate-metadata'],
+                    'push-artifacts': ['package', 'static-code-analysis']
+                },
+                environment='DEV',
+                max_parallel_steps=2
+            ))
+
+            workflow_result = WorkflowResult.load_from_file(factory.workflow_result_file_path)
+            step_names = [step_result.step_name for step_result in workflow_result.workflow_list]
+            self.assertEqual(step_names[0], 'generate-metadata')
+            self.assertCountEqual(step_names[1:3], ['package', 'static-code-analysis'])
+            self.assertEqual(step_names[3], 'push-artifacts')
+            self.assertFalse(os.path.exists(factory.workflow_result_journal_file_path))
+
+    def test_run_workflow_does_not_start_dependent_steps_after_failure(self):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FailStepImplementer'
+                },
+                'bar': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+            self.assertFalse(factory.run_workflow({'foo': [], 'bar': ['foo']}))
+
+            workflow_result = WorkflowResult.load_from_file(factory.workflow_result_file_path)
+            self.assertEqual(
+                [step_result.step_name for step_result in workflow_result.workflow_list],
+                ['foo']
+            )
+
+    def test_run_workflow_step_exception(self):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'implementer': 'DoesNotExist'
+                }
+            }
+        }
+        with TempDirectory() as temp_dir:
+            work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+            factory = StepRunner(config, work_dir_path=work_dir_path)
+            with self.assertRaisesRegex(StepRunnerException, 'Could not dynamically load step'):
+                factory.run_workflow(['foo'])
+
+    def test_run_workflow_unknown_dependency(self):
+        factory = StepRunner({'step-runner-config': {}})
+        with self.assertRaisesRegex(
+            StepRunnerException,
+            r'Workflow step \(foo\) depends on step \(bar\) which is not in the workflow.'
+        ):
+            factory.run_workflow({'foo': ['bar']})
+
+    def test_run_workflow_cycle(self):
+        factory = StepRunner({'step-runner-config': {}})
+        with self.assertRaisesRegex(
+            StepRunnerException,
+            r'Workflow step dependencies contain a cycle between steps \(foo, bar\).'
+        ):
+            factory.run_workflow({'baz': [], 'foo': ['bar', 'baz'], 'bar': ['foo']})
+
     def test_init_with_config_object(self):
         config = {
             Config.CONFIG_KEY: {
@@ -174,3 +589,148 @@ class TestStepRunner(BaseTestCase):
                 'tests.helpers.sample_step_implementers.FooStepImplementer'
             )
         )
+
+    def test__get_step_implementer_class_registered(self):
+        with patch.object(
+            ImplementerRegistry,
+            'resolve_step_implementer',
+            return_value=('tests.helpers.sample_step_implementers', 'FooStepImplementer')
+        ) as resolve_step_implementer_mock:
+            self.assertIs(
+                StepRunner._StepRunner__get_step_implementer_class('foo', 'Foo'),
+                FooStepImplementer
+            )
+            resolve_step_implementer_mock.assert_called_once_with('foo', 'Foo')
+
+
+class TestStepRunnerStepResultCache(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        CacheableStepImplementer.run_count = 0
+
+    @staticmethod
+    def __run_steps(temp_dir, run_name, version='1.0.0', package_config=None):
+        config = {
+            'step-runner-config': {
+                'generate-metadata': {
+                    'implementer': 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer',
+                    'config': {
+                        'version': version
+                    }
+                },
+                'package': {
+                    'implementer': 'tests.helpers.sample_step_implementers.CacheableStepImplementer',
+                    'config': {
+                        'input-path': os.path.join(temp_dir.path, 'project'),
+                        **(package_config or {})
+                    }
+                }
+            }
+        }
+
+        # NOTE: each run has its own working directory, as a re-run of a pipeline would
+        factory = StepRunner(
+            config,
+            work_dir_path=os.path.join(temp_dir.path, run_name),
+            step_result_cache=StepResultCache(
+                LocalDirectoryBackend(os.path.join(temp_dir.path, 'cache')),
+                workspace_path=os.path.join(temp_dir.path, 'workspace')
+            )
+        )
+        stdout = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+            factory.run_step('generate-metadata')
+            success = factory.run_step('package')
+
+        return success, factory.workflow_result.get_step_result('package'), stdout.getvalue()
+
+    def test_step_result_reused(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('project/pom.xml', b'<project/>')
+
+            success, step_result, stdout = self.__run_steps(temp_dir, 'run-1')
+            self.assertTrue(success)
+            self.assertIn('running package', stdout)
+
+            success, cached_step_result, stdout = self.__run_steps(temp_dir, 'run-2')
+            self.assertTrue(success)
+            self.assertNotIn('running package', stdout)
+            self.assertIn('Reusing cached step result for unchanged step inputs', stdout)
+            self.assertEqual(cached_step_result, step_result)
+            self.assertEqual(cached_step_result.get_artifact_value('upstream-version'), '1.0.0')
+            self.assertEqual(CacheableStepImplementer.run_count, 1)
+
+    def test_input_path_changed(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('project/pom.xml', b'<project/>')
+            self.__run_steps(temp_dir, 'run-1')
+
+            temp_dir.write('project/src/App.java', b'class App {}')
+            self.__run_steps(temp_dir, 'run-2')
+
+            self.assertEqual(CacheableStepImplementer.run_count, 2)
+
+    def test_step_config_changed(self):
+        with TempDirectory() as temp_dir:
+            self.__run_steps(temp_dir, 'run-1')
+            self.__run_steps(temp_dir, 'run-2', package_config={'tls-verify': False})
+
+            self.assertEqual(CacheableStepImplementer.run_count, 2)
+
+    def test_consumed_result_value_changed(self):
+        with TempDirectory() as temp_dir:
+            self.__run_steps(temp_dir, 'run-1')
+            _, step_result, _ = self.__run_steps(temp_dir, 'run-2', version='2.0.0')
+
+            self.assertEqual(CacheableStepImplementer.run_count, 2)
+            self.assertEqual(step_result.get_artifact_value('upstream-version'), '2.0.0')
+
+    def test_artifact_path_missing(self):
+        with TempDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir.path, 'run-1', 'app.jar')
+            temp_dir.write('run-1/app.jar', b'jar')
+            self.__run_steps(temp_dir, 'run-1', package_config={'output-path': output_path})
+            self.__run_steps(temp_dir, 'run-2', package_config={'output-path': output_path})
+            self.assertEqual(CacheableStepImplementer.run_count, 1)
+
+            os.remove(output_path)
+            self.__run_steps(temp_dir, 'run-3', package_config={'output-path': output_path})
+            self.assertEqual(CacheableStepImplementer.run_count, 2)
+
+    def test_artifact_file_in_workspace_restored(self):
+        with TempDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir.path, 'workspace', 'target', 'app.jar')
+            temp_dir.write('workspace/target/app.jar', b'jar')
+            self.__run_steps(temp_dir, 'run-1', package_config={'output-path': output_path})
+
+            os.remove(output_path)
+            success, _, stdout = self.__run_steps(
+                temp_dir,
+                'run-2',
+                package_config={'output-path': output_path}
+            )
+
+            self.assertTrue(success)
+            self.assertIn('Reusing cached step result for unchanged step inputs', stdout)
+            self.assertEqual(CacheableStepImplementer.run_count, 1)
+            with open(output_path, 'rb') as output_file:
+                self.assertEqual(output_file.read(), b'jar')
+
+    def test_unsuccessful_step_result_not_cached(self):
+        with TempDirectory() as temp_dir:
+            success, _, _ = self.__run_steps(temp_dir, 'run-1', package_config={'success': False})
+            self.assertFalse(success)
+            self.__run_steps(temp_dir, 'run-2', package_config={'success': False})
+
+            self.assertEqual(CacheableStepImplementer.run_count, 2)
+
+    def test_not_cacheable_step_not_cached(self):
+        with TempDirectory() as temp_dir:
+            self.__run_steps(temp_dir, 'run-1')
+
+            cache_entries = [
+                file_name
+                for _, _, file_names in os.walk(os.path.join(temp_dir.path, 'cache'))
+                for file_name in file_names
+            ]
+            self.assertEqual(len(cache_entries), 1)
@@ -0,0 +1,221 @@
+import io
+import json
+import os
+import socket
+import stat
+import threading
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.step_runner_server import StepRunnerServer, run_step_on_server
+from ploigos_step_runner.utils.file import parse_yaml_or_json_file
+from ploigos_step_runner.utils.io import redirect_sys_output, sys_output_context_routers
+from tests.helpers.base_test_case import BaseTestCase
+from tests.test_decryption_utils import SampleConfigValueDecryptor
+
+
+class TestStepRunnerServer(BaseTestCase):
+    CONFIG = {
+        'step-runner-config': {
+            'foo': {
+                'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer'
+            },
+            'fail': {
+                'implementer': 'tests.helpers.sample_step_implementers.FailStepImplementer'
+            }
+        }
+    }
+
+    def __start_server(self, temp_dir, config=None):
+        socket_path = os.path.join(temp_dir.path, 'psr.sock')
+        server = StepRunnerServer(
+            socket_path,
+            config if config is not None else self.CONFIG,
+            work_dir_path=os.path.join(temp_dir.path, 'step-runner-working')
+        )
+
+        # NOTE: route sys.stdout and sys.stderr per context, as `psr serve` does, so that each
+        #       request gets its own output
+        routers = sys_output_context_routers()
+        routers.__enter__()
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.start()
+
+        def stop_server():
+            server.shutdown()
+            server_thread.join()
+            server.server_close()
+            routers.__exit__(None, None, None)
+        self.addCleanup(stop_server)
+
+        return server
+
+    @staticmethod
+    def __run_step_on_server(*args, **kwargs):
+        # NOTE: the client shares sys.stdout and sys.stderr with the server in this process so
+        #       only redirect the output of the client context
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_sys_output(stdout, stderr):
+            exit_code = run_step_on_server(*args, **kwargs)
+
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def test_run_step(self):
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir)
+
+            exit_code, stdout, stderr = self.__run_step_on_server(
+                server.socket_path,
+                'foo',
+                step_config_overrides={'message': 'hello world'}
+            )
+
+            self.assertEqual(exit_code, 0)
+            self.assertRegex(stdout, r'hello world\n')
+            self.assertRegex(stdout, r'stdout from tests.helpers.sample_step_implementers')
+            self.assertRegex(stderr, r'stderr from tests.helpers.sample_step_implementers')
+            self.assertTrue(os.path.exists(
+                os.path.join(temp_dir.path, 'step-runner-working', 'step-runner-results.yml')
+            ))
+
+    def test_run_step_keeps_workflow_result(self):
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir)
+
+            self.__run_step_on_server(server.socket_path, 'foo')
+            workflow_result = server.step_runner.workflow_result
+            self.__run_step_on_server(server.socket_path, 'foo', environment='DEV')
+
+            self.assertIs(server.step_runner.workflow_result, workflow_result)
+            self.assertIsNotNone(
+                workflow_result.get_step_result(step_name='foo', environment='DEV')
+            )
+
+    def test_run_step_overrides_replaced(self):
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir)
+
+            self.__run_step_on_server(
+                server.socket_path,
+                'foo',
+                step_config_overrides={'message': 'first message'}
+            )
+            _, stdout, _ = self.__run_step_on_server(server.socket_path, 'foo')
+
+            self.assertNotIn('first message', stdout)
+
+    def test_run_step_not_successful(self):
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir)
+
+            exit_code, _, stderr = self.__run_step_on_server(server.socket_path, 'fail')
+
+            self.assertEqual(exit_code, 200)
+            self.assertIn('Step fail not successful', stderr)
+
+    def test_run_step_exception(self):
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir)
+
+            exit_code, stdout, stderr = self.__run_step_on_server(server.socket_path, 'does-not-exist')
+
+            self.assertEqual(exit_code, 300)
+            self.assertIn('Fatal error calling step (does-not-exist)', stderr)
+            self.assertIn('Traceback', stdout)
+
+    def test_run_step_obfuscates_output(self):
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir, {
+                'step-runner-config': {
+                    'foo': {
+                        'implementer': 'tests.helpers.sample_step_implementers.SleepThenPrintStepImplementer',
+                        'config': {
+                            'message': 'TEST_ENC[server secret]'
+                        }
+                    }
+                }
+            })
+
+            exit_code, stdout, _ = self.__run_step_on_server(server.socket_path, 'foo')
+
+            self.assertEqual(exit_code, 0)
+            self.assertNotIn('server secret', stdout)
+            self.assertRegex(stdout, r'\*+\n')
+
+    def test_run_step_invalid_request(self):
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir)
+
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+                client_socket.connect(server.socket_path)
+                client_socket.sendall(b'{"environment": "DEV"}\n')
+                with client_socket.makefile('r', encoding='utf-8') as messages:
+                    responses = [json.loads(line) for line in messages]
+
+            self.assertIn('Invalid request', responses[0]['stderr'])
+            self.assertEqual(responses[-1], {'exit-code': 2})
+
+    def test_socket_only_accessible_by_user(self):
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir)
+
+            self.assertEqual(stat.S_IMODE(os.stat(server.socket_path).st_mode), 0o600)
+
+    def test_stale_socket_replaced(self):
+        with TempDirectory() as temp_dir:
+            socket_path = os.path.join(temp_dir.path, 'psr.sock')
+            stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stale_socket.bind(socket_path)
+            stale_socket.close()
+
+            server = StepRunnerServer(socket_path, self.CONFIG)
+            server.server_close()
+
+            self.assertFalse(os.path.exists(socket_path))
+
+    def test_socket_in_use(self):
+        with TempDirectory() as temp_dir:
+            server = self.__start_server(temp_dir)
+
+            with self.assertRaisesRegex(
+                StepRunnerException,
+                r'Another step runner server is already listening on socket'
+            ):
+                StepRunnerServer(server.socket_path, self.CONFIG)
+
+    def test_run_step_on_server_no_server(self):
+        with TempDirectory() as temp_dir:
+            with self.assertRaisesRegex(
+                StepRunnerException,
+                r'Error running step \(foo\) on step runner server'
+            ):
+                run_step_on_server(os.path.join(temp_dir.path, 'psr.sock'), 'foo')
+
+    def test_run_step_config_loaded_once(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write(
+                'config/step-runner-config.yml',
+                bytes(json.dumps(self.CONFIG), 'utf-8')
+            )
+            with patch(
+                'ploigos_step_runner.config.config.parse_yaml_or_json_file',
+                wraps=parse_yaml_or_json_file
+            ) as parse_mock:
+                server = self.__start_server(temp_dir, os.path.join(temp_dir.path, 'config'))
+                config = server.step_runner.config
+
+                for i in range(3):
+                    exit_code, _, _ = self.__run_step_on_server(
+                        server.socket_path,
+                        'foo',
+                        environment=f'env-{i}'
+                    )
+                    self.assertEqual(exit_code, 0)
+
+            parse_mock.assert_called_once()
+            self.assertIs(server.step_runner.config, config)
@@ -1,11 +1,14 @@
+import copy
 import os
+import pickle
 
 import unittest
 from testfixtures import TempDirectory
 
 from tests.helpers.base_test_case import BaseTestCase
 
-from ploigos_step_runner.utils.dict import deep_merge
+from ploigos_step_runner.utils.dict import (FrozenDict, deep_merge, freeze,
+                                            frozen_deep_merge, thaw)
 
 class TestDictUtils(BaseTestCase):
     def test_deep_merge_no_conflict(self):
@@ -126,3 +129,116 @@ class TestDictUtils(BaseTestCase):
                 }
             }
         })
+
+class TestFrozenDict(BaseTestCase):
+    def test_mapping(self):
+        frozen = FrozenDict({'a': 1}, b=2)
+
+        self.assertEqual(frozen['a'], 1)
+        self.assertEqual(frozen.get('b'), 2)
+        self.assertIsNone(frozen.get('c'))
+        self.assertIn('a', frozen)
+        self.assertEqual(len(frozen), 2)
+        self.assertEqual(list(frozen), ['a', 'b'])
+        self.assertEqual(list(frozen.items()), [('a', 1), ('b', 2)])
+        self.assertEqual({**frozen}, {'a': 1, 'b': 2})
+        self.assertEqual(repr(frozen), "FrozenDict({'a': 1, 'b': 2})")
+
+    def test_immutable(self):
+        frozen = FrozenDict({'a': 1})
+
+        with self.assertRaises(TypeError):
+            frozen['a'] = 2
+        with self.assertRaises(AttributeError):
+            frozen.update({'a': 2}) # pylint: disable=no-member
+        with self.assertRaises(TypeError):
+            hash(frozen)
+
+    def test_equality(self):
+        self.assertEqual(FrozenDict({'a': 1}), FrozenDict({'a': 1}))
+        self.assertEqual(FrozenDict({'a': 1}), {'a': 1})
+        self.assertEqual({'a': 1}, FrozenDict({'a': 1}))
+        self.assertNotEqual(FrozenDict({'a': 1}), {'a': 2})
+        self.assertNotEqual(FrozenDict({'a': 1}), [('a', 1)])
+
+    def test_copy_returns_self(self):
+        frozen = freeze({'a': {'b': [1, 2]}})
+
+        self.assertIs(copy.copy(frozen), frozen)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        self.assertIs(copy.deepcopy({'frozen': frozen})['frozen'], frozen)
+
+    def test_pickle(self):
+        frozen = freeze({'a': {'b': [1, 2]}})
+
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)), frozen)
+
+class TestFreezeAndThaw(BaseTestCase):
+    def test_freeze(self):
+        frozen = freeze({'a': {'b': [1, {'c': 2}]}, 'd': 'e'})
+
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertIsInstance(frozen['a'], FrozenDict)
+        self.assertEqual(frozen['a']['b'], (1, FrozenDict({'c': 2})))
+        self.assertEqual(frozen['d'], 'e')
+
+    def test_freeze_frozen(self):
+        frozen = freeze({'a': 1})
+
+        self.assertIs(freeze(frozen), frozen)
+
+    def test_thaw(self):
+        value = {'a': {'b': [1, {'c': 2}]}, 'd': 'e'}
+
+        thawed = thaw(freeze(value))
+
+        self.assertEqual(thawed, value)
+        self.assertIs(type(thawed), dict)
+        self.assertIs(type(thawed['a']['b']), list)
+        self.assertIs(type(thawed['a']['b'][1]), dict)
+
+class TestFrozenDeepMerge(BaseTestCase):
+    def test_no_conflict(self):
+        dest = freeze({'a': {'b': 1}, 'c': {'d': 2}})
+        source = {'a': {'e': 3}, 'f': 4}
+
+        merged = frozen_deep_merge(dest, source)
+
+        self.assertEqual(merged, {'a': {'b': 1, 'e': 3}, 'c': {'d': 2}, 'f': 4})
+        self.assertEqual(dest, {'a': {'b': 1}, 'c': {'d': 2}})
+        self.assertEqual(source, {'a': {'e': 3}, 'f': 4})
+
+    def test_shares_unchanged_sub_trees(self):
+        dest = freeze({'a': {'b': 1}, 'c': {'d': 2}})
+        source = freeze({'a': {'e': 3}, 'f': {'g': 4}})
+
+        merged = frozen_deep_merge(dest, source)
+
+        self.assertIsNot(merged['a'], dest['a'])
+        self.assertIs(merged['c'], dest['c'])
+        self.assertIs(merged['f'], source['f'])
+
+    def test_unchanged_returns_dest(self):
+        dest = freeze({'a': {'b': 1}})
+
+        self.assertIs(frozen_deep_merge(dest, {'a': {'b': 1}}), dest)
+        self.assertIs(frozen_deep_merge(dest, {}), dest)
+
+    def test_mutable_dest(self):
+        merged = frozen_deep_merge({'a': {'b': 1}, 'c': [1]}, {'d': 2})
+
+        self.assertIsInstance(merged['a'], FrozenDict)
+        self.assertEqual(merged['c'], (1,))
+
+    def test_conflict(self):
+        with self.assertRaisesRegex(ValueError, r'Conflict at a.b'):
+            frozen_deep_merge(freeze({'a': {'b': 1}}), {'a': {'b': 2}})
+
+    def test_conflict_overwrite(self):
+        merged = frozen_deep_merge(
+            freeze({'a': {'b': 1}}),
+            {'a': {'b': [2]}},
+            overwrite_duplicate_keys=True
+        )
+
+        self.assertEqual(merged, {'a': {'b': (2,)}})
@@ -1,13 +1,16 @@
 
 import http
+import importlib
 import os
-import urllib
+import urllib.request
 from unittest.mock import Mock, patch
 
+import yaml
+from ploigos_step_runner.utils import file as file_utils
 from ploigos_step_runner.utils.file import (
-    base64_encode, create_parent_dir,
+    YamlDumper, YamlSafeLoader, base64_encode, create_parent_dir,
     download_and_decompress_source_to_destination, get_file_hash,
-    parse_yaml_or_json_file, upload_file)
+    get_file_tree_hash, parse_yaml_or_json_file, upload_file)
 from testfixtures import TempDirectory
 from tests.helpers.base_test_case import BaseTestCase
 
@@ -52,6 +55,65 @@ class TestParseYAMLOrJASONFile(BaseTestCase):
         ):
             parse_yaml_or_json_file(sample_file_path)
 
+    def test_yaml_extension_not_parsed_as_json(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('sample.yml', b'{"foo": "bar"}')
+
+            with patch('ploigos_step_runner.utils.file.json.loads') as json_loads_mock:
+                sample_dict = parse_yaml_or_json_file(os.path.join(temp_dir.path, 'sample.yml'))
+
+            json_loads_mock.assert_not_called()
+            self.assertEqual(sample_dict, {'foo': 'bar'})
+
+    def test_yaml_extension_bad(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('bad.yml', b'foo: [bar')
+
+            with self.assertRaisesRegex(
+                ValueError,
+                r"Error parsing file \(.+\) as YAML or JSON: \n  YAML error:"
+            ):
+                parse_yaml_or_json_file(os.path.join(temp_dir.path, 'bad.yml'))
+
+    def test_json_extension_falls_back_to_yaml(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('sample.json', b"{'foo': 'bar'}")
+
+            sample_dict = parse_yaml_or_json_file(os.path.join(temp_dir.path, 'sample.json'))
+
+            self.assertEqual(sample_dict, {'foo': 'bar'})
+
+    def test_other_extension_json(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('sample.txt', b'{"foo": "bar"}')
+
+            with patch('ploigos_step_runner.utils.file.yaml.load') as yaml_load_mock:
+                sample_dict = parse_yaml_or_json_file(os.path.join(temp_dir.path, 'sample.txt'))
+
+            yaml_load_mock.assert_not_called()
+            self.assertEqual(sample_dict, {'foo': 'bar'})
+
+class TestYAMLSafeLoaderAndDumper(BaseTestCase):
+    def test_libyaml(self):
+        if yaml.__with_libyaml__:
+            self.assertIs(YamlSafeLoader, yaml.CSafeLoader)
+            self.assertIs(YamlDumper, yaml.CDumper)
+        else:
+            self.assertIs(YamlSafeLoader, yaml.SafeLoader)
+            self.assertIs(YamlDumper, yaml.Dumper)
+
+    def test_no_libyaml(self):
+        try:
+            with patch.dict(yaml.__dict__):
+                yaml.__dict__.pop('CSafeLoader', None)
+                yaml.__dict__.pop('CDumper', None)
+                importlib.reload(file_utils)
+
+                self.assertIs(file_utils.YamlSafeLoader, yaml.SafeLoader)
+                self.assertIs(file_utils.YamlDumper, yaml.Dumper)
+        finally:
+            importlib.reload(file_utils)
+
 class TestDownloadAndDecompressSourceToDestination(BaseTestCase):
     def test_https_bz2(self):
         with TempDirectory() as test_dir:
@@ -178,6 +240,76 @@ class TestDownloadAndDecompressSourceToDestination(BaseTestCase):
             result = get_file_hash(sample_file_path)
             self.assertEqual(result, '09daa01246aa5ee9c29f64f644627a0ea83247857dfea2665689e26b166eef47')
 
+class TestGetFileTreeHash(BaseTestCase):
+    def test_file(self):
+        with TempDirectory() as test_dir:
+            test_dir.write('pom.xml', b'<project/>')
+            file_hash = get_file_tree_hash(os.path.join(test_dir.path, 'pom.xml'))
+
+            test_dir.write('pom.xml', b'<project></project>')
+            self.assertNotEqual(
+                get_file_tree_hash(os.path.join(test_dir.path, 'pom.xml')),
+                file_hash
+            )
+
+    def test_missing(self):
+        with TempDirectory() as test_dir:
+            self.assertEqual(
+                get_file_tree_hash(os.path.join(test_dir.path, 'does-not-exist')),
+                get_file_tree_hash(os.path.join(test_dir.path, 'also-does-not-exist'))
+            )
+            test_dir.write('empty', b'')
+            self.assertNotEqual(
+                get_file_tree_hash(os.path.join(test_dir.path, 'does-not-exist')),
+                get_file_tree_hash(os.path.join(test_dir.path, 'empty'))
+            )
+
+    def test_directory(self):
+        with TempDirectory() as test_dir:
+            test_dir.write('src/main/App.java', b'class App {}')
+            test_dir.write('pom.xml', b'<project/>')
+            tree_hash = get_file_tree_hash(test_dir.path)
+
+            with TempDirectory() as other_dir:
+                other_dir.write('pom.xml', b'<project/>')
+                other_dir.write('src/main/App.java', b'class App {}')
+                self.assertEqual(get_file_tree_hash(other_dir.path), tree_hash)
+
+            test_dir.write('src/main/App.java', b'class App { }')
+            self.assertNotEqual(get_file_tree_hash(test_dir.path), tree_hash)
+
+    def test_directory_renamed_file(self):
+        with TempDirectory() as test_dir:
+            test_dir.write('src/App.java', b'class App {}')
+            tree_hash = get_file_tree_hash(test_dir.path)
+
+            os.rename(
+                os.path.join(test_dir.path, 'src', 'App.java'),
+                os.path.join(test_dir.path, 'src', 'Main.java')
+            )
+            self.assertNotEqual(get_file_tree_hash(test_dir.path), tree_hash)
+
+    def test_directory_ignored(self):
+        with TempDirectory() as test_dir:
+            test_dir.write('pom.xml', b'<project/>')
+            tree_hash = get_file_tree_hash(
+                test_dir.path,
+                ignored_names=['target'],
+                ignored_paths=[os.path.join(test_dir.path, 'step-runner-working')]
+            )
+
+            test_dir.write('target/app.jar', b'jar')
+            test_dir.write('module/target/classes/App.class', b'class')
+            test_dir.write('step-runner-working/package/package.output.log', b'output')
+            self.assertEqual(
+                get_file_tree_hash(
+                    test_dir.path,
+                    ignored_names=['target'],
+                    ignored_paths=[os.path.join(test_dir.path, 'step-runner-working')]
+                ),
+                tree_hash
+            )
+
 class TestUploadFile(BaseTestCase):
     def __create_http_response_side_effect(self, read_return):
         def http_response_side_effect(request):
@@ -1,15 +1,24 @@
 import copy
 import io
 import json
+import os
 import re
 import sys
+import threading
+import time
 from contextlib import redirect_stdout
 from io import StringIO
+from unittest.mock import patch
 
 import yaml
+from testfixtures import TempDirectory
 from tests.helpers.base_test_case import BaseTestCase
-from ploigos_step_runner.utils.io import (TextIOIndenter, TextIOSelectiveObfuscator,
-                           create_sh_redirect_to_multiple_streams_fn_callback)
+from ploigos_step_runner.utils.io import (TextIOBufferedTee, TextIOContextRouter,
+                                          TextIOIndenter, TextIOSelectiveObfuscator,
+                                          TextIOTee,
+                                          create_sh_redirect_to_multiple_streams_fn_callback,
+                                          get_current_stream, redirect_sys_output,
+                                          sys_output_context_routers, tail_file)
 
 class TestCreateSHRedirectToMultipleStreamsFNCallback(BaseTestCase):
     def test_one_stream(self):
@@ -37,6 +46,24 @@ class TestCreateSHRedirectToMultipleStreamsFNCallback(BaseTestCase):
         self.assertEqual('data1', stream_one.getvalue())
         self.assertEqual('data1', stream_two.getvalue())
 
+    def test_resolves_context_router(self):
+        default_stream = StringIO()
+        routed_stream = StringIO()
+        router = TextIOContextRouter(default_stream)
+        with router.route(routed_stream):
+            sh_redirect_to_multiple_streams_fn_callback = \
+                create_sh_redirect_to_multiple_streams_fn_callback([
+                    router
+                ])
+
+        # simulate sh calling the callback from another thread
+        thread = threading.Thread(target=sh_redirect_to_multiple_streams_fn_callback, args=['data1'])
+        thread.start()
+        thread.join()
+
+        self.assertEqual('data1', routed_stream.getvalue())
+        self.assertEqual('', default_stream.getvalue())
+
 class TestTextIOSelectiveObfuscator(BaseTestCase):
     def run_test(self, input, expected, randomize_replacment_length=False, obfuscation_targets=None, replacment_char=None):
         out = io.StringIO()
@@ -257,6 +284,194 @@ class TestTextIOSelectiveObfuscator(BaseTestCase):
             obfuscation_targets=private_key_block
         )
 
+    def test_duplicate_obfuscation_targets(self):
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(
+            parent_stream=out,
+            randomize_replacment_length=False
+        )
+        io_obfuscator.add_obfuscation_targets(['secret', 'secret'])
+        io_obfuscator.add_obfuscation_targets('secret')
+        io_obfuscator.add_obfuscation_targets('  secret\n')
+        io_obfuscator.add_obfuscation_targets('')
+
+        self.assertEqual(
+            list(io_obfuscator._TextIOSelectiveObfuscator__obfuscation_targets.keys()),
+            ['secret']
+        )
+
+        io_obfuscator.write('hello secret world')
+        self.assertEqual(out.getvalue(), 'hello ****** world')
+
+    def test_overlapping_obfuscation_targets_longest_first(self):
+        self.run_test(
+            input='the password is secret-password not secret',
+            expected=r'^the password is \*{15} not \*{6}$',
+            obfuscation_targets=['secret', 'secret-password']
+        )
+
+    def test_multi_word_obfuscation_target_does_not_span_other_text(self):
+        self.run_test(
+            input='top secret\n  value but not top of the secret',
+            expected=r'^\*{18} but not top of the secret$',
+            obfuscation_targets=['top secret value']
+        )
+
+    def test_many_obfuscation_targets_single_pass(self):
+        targets = [f'{index:02}-super-secret-value-{index:02}' for index in range(50)]
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(
+            parent_stream=out,
+            randomize_replacment_length=False
+        )
+        io_obfuscator.add_obfuscation_targets(targets)
+
+        obfuscation_pattern = io_obfuscator._TextIOSelectiveObfuscator__obfuscation_pattern
+        with patch.object(
+            io_obfuscator,
+            '_TextIOSelectiveObfuscator__obfuscation_pattern',
+            wraps=obfuscation_pattern
+        ) as obfuscation_pattern_mock:
+            for index in range(0, 49, 7):
+                io_obfuscator.write(f'INFO token {targets[index]} and {targets[index + 1]}\n')
+
+        self.assertEqual(obfuscation_pattern_mock.sub.call_count, 7)
+        self.assertEqual(
+            out.getvalue(),
+            f'INFO token {"*" * 24} and {"*" * 24}\n' * 7
+        )
+
+class TestTextIOSelectiveObfuscatorStreaming(BaseTestCase):
+    @staticmethod
+    def create_io_obfuscator(out, obfuscation_targets, streaming=True):
+        io_obfuscator = TextIOSelectiveObfuscator(
+            parent_stream=out,
+            randomize_replacment_length=False,
+            streaming=streaming
+        )
+        io_obfuscator.add_obfuscation_targets(obfuscation_targets)
+        return io_obfuscator
+
+    def test_streaming_property(self):
+        self.assertTrue(TextIOSelectiveObfuscator(io.StringIO(), streaming=True).streaming)
+        self.assertFalse(TextIOSelectiveObfuscator(io.StringIO()).streaming)
+
+    def test_target_split_across_writes_at_every_position(self):
+        text = 'before super-secret-value after\n'
+        for split in range(len(text) + 1):
+            out = io.StringIO()
+            io_obfuscator = self.create_io_obfuscator(out, ['super-secret-value'])
+
+            io_obfuscator.write(text[:split])
+            io_obfuscator.write(text[split:])
+
+            self.assertEqual(out.getvalue(), 'before ****************** after\n', split)
+
+    def test_target_split_across_single_character_writes(self):
+        out = io.StringIO()
+        io_obfuscator = self.create_io_obfuscator(out, ['secret', 'secret-password'])
+
+        for char in 'the password is secret-password not secret':
+            io_obfuscator.write(char)
+        io_obfuscator.flush()
+
+        self.assertEqual(out.getvalue(), 'the password is *************** not ******')
+
+    def test_any_chunk_size_matches_single_write(self):
+        targets = ['super-secret-value', 'hunter2', 'abc123xyz']
+        text = ''.join(
+            f'line {index} has {targets[index % len(targets)]} in it,' \
+            f' {"and a newline" if index % 4 == 0 else "but no newline"}' \
+            f'{chr(10) if index % 4 == 0 else " "}'
+            for index in range(64)
+        )
+
+        expected = io.StringIO()
+        self.create_io_obfuscator(expected, targets, streaming=False).write(text)
+
+        for chunk_size in [1, 2, 3, 5, 7, 11, 16, 64, len(text)]:
+            out = io.StringIO()
+            io_obfuscator = self.create_io_obfuscator(out, targets)
+            for index in range(0, len(text), chunk_size):
+                io_obfuscator.write(text[index:index + chunk_size])
+            io_obfuscator.flush()
+
+            self.assertEqual(out.getvalue(), expected.getvalue(), chunk_size)
+
+    def test_holds_back_at_most_longest_target_length_minus_one(self):
+        out = io.StringIO()
+        io_obfuscator = self.create_io_obfuscator(out, ['secret'])
+
+        self.assertEqual(io_obfuscator.write('hello world'), 11)
+        self.assertEqual(out.getvalue(), 'hello ')
+
+        io_obfuscator.write(' sec')
+        self.assertEqual(out.getvalue(), 'hello worl')
+
+        io_obfuscator.flush()
+        self.assertEqual(out.getvalue(), 'hello world sec')
+
+    def test_flushes_on_newline(self):
+        out = io.StringIO()
+        io_obfuscator = self.create_io_obfuscator(out, ['super-secret-value'])
+
+        io_obfuscator.write('short\n')
+        self.assertEqual(out.getvalue(), 'short\n')
+
+        io_obfuscator.write('super-secret-value\nnext')
+        self.assertEqual(out.getvalue(), 'short\n******************\n')
+
+    def test_flushes_on_close(self):
+        out = io.StringIO()
+        io_obfuscator = self.create_io_obfuscator(out, ['secret'])
+
+        io_obfuscator.write('my secret')
+        io_obfuscator.close()
+
+        self.assertEqual(out.getvalue(), 'my ******')
+
+    def test_without_targets_writes_everything(self):
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(parent_stream=out, streaming=True)
+
+        io_obfuscator.write(b'no targets')
+
+        self.assertEqual(out.getvalue(), 'no targets')
+
+    def test_writes_from_multiple_threads(self):
+        class SlowStr(str):
+            def __radd__(self, other):
+                # NOTE: give other threads a chance to write while this write is adding to the
+                #       held back text
+                time.sleep(0.0001)
+                return str(other) + str(self)
+
+        secrets = [f'{index}-super-secret-value-{index}' for index in range(4)]
+        out = io.StringIO()
+        io_obfuscator = self.create_io_obfuscator(out, secrets)
+        barrier = threading.Barrier(len(secrets))
+
+        def write_from_thread(secret):
+            barrier.wait()
+            for _ in range(50):
+                io_obfuscator.write(SlowStr(f'token={secret} '))
+
+        threads = [
+            threading.Thread(target=write_from_thread, args=(secret,)) for secret in secrets
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        io_obfuscator.flush()
+
+        output = out.getvalue()
+        for secret in secrets:
+            self.assertNotIn(secret, output)
+        self.assertEqual(output.count('token='), 50 * len(secrets))
+        self.assertEqual(len(output), sum(len(f'token={secret} ') * 50 for secret in secrets))
+        self.assertEqual(output.replace('token=', '').replace(' ', '').strip('*'), '')
+
 class TestTextIOIndenter(BaseTestCase):
     def __run_test(self, inputs, expected, indent_level=0, indent_size=4, indent_char=' '):
         out = io.StringIO()
@@ -409,3 +624,436 @@ class TestTextIOIndenter(BaseTestCase):
             expected=r"    hello world foo bar\n    this is a test, more testing\n    fortytwo\n",
             indent_level=1
         )
+
+
+    def test_carriage_returns(self):
+        self.__run_test(
+            inputs="hello\r\nworld\rfoo\nbar",
+            expected=r"^  hello\r\n  world\r  foo\n  bar$",
+            indent_level=1,
+            indent_size=2
+        )
+
+    def test_backslash_indent_char(self):
+        self.__run_test(
+            inputs=["hello\r\n", "world"],
+            expected=r"^\\hello\r\n\\world$",
+            indent_level=1,
+            indent_size=1,
+            indent_char='\\'
+        )
+
+    def test_new_line_pattern_only_used_for_carriage_returns(self):
+        new_line_pattern = re.compile(r"(\r\n|\r|\n)")
+        with patch.object(
+            TextIOIndenter,
+            '_TextIOIndenter__NEW_LINE_PATTERN',
+            wraps=new_line_pattern
+        ) as new_line_pattern_mock:
+            out = StringIO()
+            indenter = TextIOIndenter(parent_stream=out, indent_level=1)
+            indenter.write('no new line ')
+            indenter.write('new line\nafter\n')
+            self.assertEqual(new_line_pattern_mock.sub.call_count, 0)
+
+            indenter.write('carriage return\r\nafter')
+            self.assertEqual(new_line_pattern_mock.sub.call_count, 1)
+
+        self.assertEqual(
+            out.getvalue(),
+            '    no new line new line\n    after\n    carriage return\r\n    after'
+        )
+
+    def test_obfuscator_indenter_file_chain(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.log')
+            with open(output_file_path, 'w', encoding='utf-8') as output_file:
+                io_obfuscator = TextIOSelectiveObfuscator(
+                    parent_stream=TextIOIndenter(
+                        parent_stream=output_file,
+                        indent_level=2
+                    ),
+                    randomize_replacment_length=False,
+                    streaming=True
+                )
+                io_obfuscator.add_obfuscation_targets(['super-secret-value', 'hunter2'])
+
+                for chunk in ['Downloaded artifact-1.0.0.jar\n', 'password: hun', 'ter2\n', 'done']:
+                    io_obfuscator.write(chunk)
+                io_obfuscator.flush()
+
+            with open(output_file_path, encoding='utf-8') as output_file:
+                self.assertEqual(
+                    output_file.read(),
+                    '        Downloaded artifact-1.0.0.jar\n'
+                    '        password: *******\n'
+                    '        done'
+                )
+
+class TestTextIOTee(BaseTestCase):
+    def test_write_and_flush(self):
+        stream_one = StringIO()
+        stream_two = StringIO()
+        tee = TextIOTee([stream_one, stream_two])
+
+        self.assertEqual(tee.write('hello world'), 11)
+        tee.flush()
+
+        self.assertEqual(tee.streams, [stream_one, stream_two])
+        self.assertEqual(stream_one.getvalue(), 'hello world')
+        self.assertEqual(stream_two.getvalue(), 'hello world')
+
+
+class TestTextIOBufferedTee(BaseTestCase):
+    def test_batches_writes_until_buffer_size(self):
+        stream_one = StringIO()
+        stream_two = StringIO()
+        tee = TextIOBufferedTee([stream_one, stream_two], buffer_size=10, flush_interval=60)
+
+        self.assertEqual(tee.write('hello'), 5)
+        self.assertEqual(stream_one.getvalue(), '')
+
+        tee.write(b' world')
+        self.assertEqual(stream_one.getvalue(), 'hello world')
+        self.assertEqual(stream_two.getvalue(), 'hello world')
+        self.assertFalse(tee.background)
+
+    def test_writes_after_flush_interval(self):
+        stream = StringIO()
+        tee = TextIOBufferedTee([stream], buffer_size=1024, flush_interval=0)
+
+        tee.write('hello world')
+
+        self.assertEqual(stream.getvalue(), 'hello world')
+
+    def test_flush(self):
+        stream = StringIO()
+        tee = TextIOBufferedTee([stream], flush_interval=60)
+
+        tee.write('hello world')
+        self.assertEqual(stream.getvalue(), '')
+
+        tee.flush()
+        self.assertEqual(stream.getvalue(), 'hello world')
+
+    def test_close_writes_buffer_and_does_not_close_streams(self):
+        stream = StringIO()
+        with TextIOBufferedTee([stream], flush_interval=60) as tee:
+            tee.write('hello world')
+
+        self.assertTrue(tee.closed)
+        self.assertFalse(stream.closed)
+        self.assertEqual(stream.getvalue(), 'hello world')
+
+        tee.close()
+        self.assertEqual(stream.getvalue(), 'hello world')
+
+    def test_background(self):
+        stream = StringIO()
+        with TextIOBufferedTee([stream], buffer_size=16, flush_interval=60, background=True) \
+                as tee:
+            self.assertTrue(tee.background)
+            for index in range(1000):
+                tee.write(f'{index}\n')
+
+        self.assertEqual(
+            stream.getvalue(),
+            ''.join(f'{index}\n' for index in range(1000))
+        )
+
+    def test_background_writes_after_flush_interval(self):
+        stream = StringIO()
+        with TextIOBufferedTee([stream], flush_interval=0.01, background=True) as tee:
+            tee.write('hello world')
+            for _ in range(500):
+                if stream.getvalue():
+                    break
+                time.sleep(0.01)
+
+            self.assertEqual(stream.getvalue(), 'hello world')
+
+    def test_background_write_error_raised(self):
+        class BrokenStream(StringIO):
+            def write(self, given):
+                raise OSError('mock write error')
+
+        tee = TextIOBufferedTee(
+            [BrokenStream()],
+            buffer_size=1,
+            flush_interval=60,
+            background=True
+        )
+        tee.write('hello world')
+
+        with self.assertRaisesRegex(OSError, 'mock write error'):
+            for _ in range(500):
+                tee.write('more')
+                time.sleep(0.01)
+
+        tee.close()
+        self.assertTrue(tee.closed)
+
+    def test_shared_stream(self):
+        stream = StringIO()
+        with TextIOBufferedTee([StringIO(), stream], buffer_size=8, background=True) as out_tee, \
+                TextIOBufferedTee([StringIO(), stream], buffer_size=8, background=True) as err_tee:
+            for _ in range(100):
+                out_tee.write('out-line\n')
+                err_tee.write('err-line\n')
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines.count('out-line'), 100)
+        self.assertEqual(lines.count('err-line'), 100)
+
+    def test_shared_stream_keeps_write_order(self):
+        out_stream = StringIO()
+        err_stream = StringIO()
+        stream = StringIO()
+        with TextIOBufferedTee([out_stream, stream], buffer_size=64, flush_interval=60) \
+                as out_tee, \
+                TextIOBufferedTee([err_stream, stream], buffer_size=1024, flush_interval=60) \
+                as err_tee:
+            for index in range(100):
+                out_tee.write(f'out-{index}\n')
+                err_tee.write(f'err-{index}\n')
+
+        self.assertEqual(
+            stream.getvalue(),
+            ''.join(f'out-{index}\nerr-{index}\n' for index in range(100))
+        )
+        self.assertEqual(
+            out_stream.getvalue(),
+            ''.join(f'out-{index}\n' for index in range(100))
+        )
+        self.assertEqual(
+            err_stream.getvalue(),
+            ''.join(f'err-{index}\n' for index in range(100))
+        )
+
+    def test_slow_stream_does_not_block_writers(self):
+        writing = threading.Event()
+        release = threading.Event()
+
+        class SlowStream(StringIO):
+            def write(self, given):
+                writing.set()
+                release.wait(10)
+                return super().write(given)
+
+        slow_stream = SlowStream()
+        other_stream = StringIO()
+        slow_tee = TextIOBufferedTee([slow_stream], buffer_size=1, background=True)
+        other_tee = TextIOBufferedTee(
+            [slow_stream, other_stream],
+            buffer_size=1,
+            background=True
+        )
+        try:
+            slow_tee.write('a')
+            self.assertTrue(writing.wait(10))
+
+            # NOTE: while the background thread is stuck writing to the slow stream
+            writer_thread = threading.Thread(
+                target=lambda: (other_tee.write('b'), slow_tee.write('c'))
+            )
+            writer_thread.start()
+            writer_thread.join(10)
+            self.assertFalse(writer_thread.is_alive())
+        finally:
+            release.set()
+            slow_tee.close()
+            other_tee.close()
+
+        self.assertEqual(slow_stream.getvalue(), 'abc')
+        self.assertEqual(other_stream.getvalue(), 'b')
+
+    def test_close_write_error_raised(self):
+        class BrokenStream(StringIO):
+            def write(self, given):
+                raise OSError('mock write error')
+
+        with self.assertRaisesRegex(OSError, 'mock write error'):
+            with TextIOBufferedTee([BrokenStream()], flush_interval=60, background=True) \
+                    as tee:
+                tee.write('hello world')
+
+        self.assertTrue(tee.closed)
+
+    def test_close_write_error_does_not_replace_raised_error(self):
+        class BrokenStream(StringIO):
+            def write(self, given):
+                raise OSError('mock write error')
+
+        with self.assertRaisesRegex(ValueError, 'mock original error'):
+            with TextIOBufferedTee([BrokenStream()], flush_interval=60, background=True) \
+                    as tee:
+                tee.write('hello world')
+                raise ValueError('mock original error')
+
+        self.assertTrue(tee.closed)
+
+    def test_resolves_context_router(self):
+        default_stream = StringIO()
+        routed_stream = StringIO()
+        router = TextIOContextRouter(default_stream)
+        with router.route(routed_stream):
+            tee = TextIOBufferedTee([router], background=True)
+
+        with tee:
+            out_callback = create_sh_redirect_to_multiple_streams_fn_callback([tee])
+            out_callback('data1')
+
+        self.assertEqual(routed_stream.getvalue(), 'data1')
+        self.assertEqual(default_stream.getvalue(), '')
+
+
+class TestTailFile(BaseTestCase):
+    def test_tail_file(self):
+        with TempDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir.path, 'output.log')
+            temp_dir.write(file_path, b'written before tailing\n')
+
+            out = StringIO()
+            with open(file_path, 'a', encoding='utf-8') as file, \
+                    tail_file(file_path, out, poll_interval=0.01):
+                file.write('hello\n')
+                file.flush()
+                for _ in range(500):
+                    if out.getvalue():
+                        break
+                    time.sleep(0.01)
+                self.assertEqual(out.getvalue(), 'hello\n')
+
+                file.write('world\n')
+                file.flush()
+
+            self.assertEqual(out.getvalue(), 'hello\nworld\n')
+
+    def test_tail_file_multi_byte_characters_split_across_reads(self):
+        with TempDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir.path, 'output.log')
+            temp_dir.write(file_path, b'')
+
+            out = StringIO()
+            with open(file_path, 'a', encoding='utf-8') as file, \
+                    tail_file(file_path, out, chunk_size=1):
+                file.write('h\u00e9llo w\u00f6rld \u2713\n')
+                file.flush()
+
+            self.assertEqual(out.getvalue(), 'h\u00e9llo w\u00f6rld \u2713\n')
+
+    def test_tail_file_resolves_context_router(self):
+        with TempDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir.path, 'output.log')
+            temp_dir.write(file_path, b'')
+
+            default_stream = StringIO()
+            routed_stream = StringIO()
+            router = TextIOContextRouter(default_stream)
+            with router.route(routed_stream), \
+                    open(file_path, 'a', encoding='utf-8') as file, \
+                    tail_file(file_path, router):
+                file.write('hello world')
+                file.flush()
+
+            self.assertEqual(routed_stream.getvalue(), 'hello world')
+            self.assertEqual(default_stream.getvalue(), '')
+
+
+class TestTextIOContextRouter(BaseTestCase):
+    def test_write_default_stream(self):
+        default_stream = StringIO()
+        router = TextIOContextRouter(default_stream)
+        router.write('hello world')
+        router.flush()
+
+        self.assertIs(router.current_stream, default_stream)
+        self.assertEqual(default_stream.getvalue(), 'hello world')
+
+    def test_route(self):
+        default_stream = StringIO()
+        routed_stream = StringIO()
+        router = TextIOContextRouter(default_stream)
+        with router.route(routed_stream):
+            router.write('routed')
+            self.assertIs(get_current_stream(router), routed_stream)
+        router.write('default')
+
+        self.assertEqual(routed_stream.getvalue(), 'routed')
+        self.assertEqual(default_stream.getvalue(), 'default')
+
+    def test_route_is_per_thread(self):
+        self.__assert_route_is_per_thread(TextIOContextRouter(StringIO()))
+
+    def test_route_is_per_thread_without_contextvars(self):
+        with patch('ploigos_step_runner.utils.io.contextvars', None):
+            router = TextIOContextRouter(StringIO())
+
+        self.__assert_route_is_per_thread(router)
+
+        routed_stream = StringIO()
+        with router.route(routed_stream):
+            with router.route(StringIO()):
+                pass
+            self.assertIs(router.current_stream, routed_stream)
+        self.assertIs(router.current_stream, router.default_stream)
+
+    def __assert_route_is_per_thread(self, router):
+        thread_streams = [StringIO() for _ in range(4)]
+        barrier = threading.Barrier(len(thread_streams))
+
+        def write_from_thread(thread_stream, index):
+            with router.route(thread_stream):
+                barrier.wait()
+                for _ in range(100):
+                    router.write(str(index))
+
+        threads = [
+            threading.Thread(target=write_from_thread, args=(thread_stream, index))
+            for index, thread_stream in enumerate(thread_streams)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index, thread_stream in enumerate(thread_streams):
+            self.assertEqual(thread_stream.getvalue(), str(index) * 100)
+        self.assertEqual(router.default_stream.getvalue(), '')
+
+    def test_get_current_stream_not_router(self):
+        stream = StringIO()
+        self.assertIs(get_current_stream(stream), stream)
+
+
+class TestRedirectSysOutput(BaseTestCase):
+    def test_redirect_sys_output_without_routers(self):
+        stdout = StringIO()
+        stderr = StringIO()
+        with redirect_sys_output(stdout, stderr):
+            print('out')
+            print('err', file=sys.stderr)
+
+        self.assertEqual(stdout.getvalue(), 'out\n')
+        self.assertEqual(stderr.getvalue(), 'err\n')
+
+    def test_redirect_sys_output_with_routers(self):
+        original_stdout = sys.stdout
+        stdout = StringIO()
+        stderr = StringIO()
+        with sys_output_context_routers():
+            self.assertIsInstance(sys.stdout, TextIOContextRouter)
+            self.assertIsInstance(sys.stderr, TextIOContextRouter)
+            stdout_router = sys.stdout
+
+            with sys_output_context_routers():
+                self.assertIs(sys.stdout, stdout_router)
+
+            with redirect_sys_output(stdout, stderr):
+                self.assertIs(sys.stdout, stdout_router)
+                print('out')
+                print('err', file=sys.stderr)
+
+        self.assertIs(sys.stdout, original_stdout)
+        self.assertEqual(stdout.getvalue(), 'out\n')
+        self.assertEqual(stderr.getvalue(), 'err\n')
@@ -1,11 +1,16 @@
 import os
+import sys
+import types
 
 import unittest
+from unittest.mock import patch
 from testfixtures import TempDirectory
 
 from tests.helpers.base_test_case import BaseTestCase
 
-from ploigos_step_runner.utils.reflection import import_and_get_class
+from ploigos_step_runner.results import StepResult
+from ploigos_step_runner.utils.reflection import (ModuleWithGetattr, enable_module_getattr,
+                                                  import_and_get_class, import_lazy_attribute)
 
 class TestReflectionUtils(BaseTestCase):
     def test_import_and_get_class_module_does_not_exist(self):
@@ -22,3 +27,78 @@ class TestReflectionUtils(BaseTestCase):
         self.assertIsNotNone(
             import_and_get_class('ploigos_step_runner.step_implementers.container_image_static_compliance_scan', 'OpenSCAP')
         )
+
+    def test_import_lazy_attribute(self):
+        import tests.helpers as lazy_module
+        lazy_attributes = {'StepResult': 'ploigos_step_runner.results'}
+        self.assertFalse(hasattr(lazy_module, 'StepResult'))
+
+        try:
+            step_result_class = import_lazy_attribute(
+                'tests.helpers',
+                'StepResult',
+                lazy_attributes
+            )
+
+            self.assertIs(step_result_class, StepResult)
+            self.assertIs(lazy_module.StepResult, StepResult)
+        finally:
+            del lazy_module.StepResult
+
+    def test_import_lazy_attribute_not_lazy_attribute(self):
+        with self.assertRaisesRegex(
+            AttributeError,
+            r"module 'tests.helpers' has no attribute 'HelloWorld'"
+        ):
+            import_lazy_attribute('tests.helpers', 'HelloWorld', {})
+
+    def test_import_lazy_step_implementer(self):
+        import ploigos_step_runner.step_implementers.generate_metadata as generate_metadata
+        from ploigos_step_runner.step_implementers.generate_metadata.semantic_version import \
+            SemanticVersion
+
+        self.assertIs(generate_metadata.SemanticVersion, SemanticVersion)
+        self.assertIn('SemanticVersion', generate_metadata.__all__)
+
+    def test_enable_module_getattr_python_3_6(self):
+        lazy_module = types.ModuleType('tests.lazy_module')
+        lazy_module.__getattr__ = lambda name: import_lazy_attribute(
+            'tests.lazy_module',
+            name,
+            {'StepResult': 'ploigos_step_runner.results'}
+        )
+
+        with patch.dict(sys.modules, {'tests.lazy_module': lazy_module}):
+            with patch.object(sys, 'version_info', (3, 6, 15)):
+                enable_module_getattr('tests.lazy_module')
+
+            self.assertIs(type(lazy_module), ModuleWithGetattr)
+            self.assertIs(ModuleWithGetattr.__getattr__(lazy_module, 'StepResult'), StepResult)
+            self.assertIs(lazy_module.__dict__['StepResult'], StepResult)
+            with self.assertRaisesRegex(
+                AttributeError,
+                r"module 'tests.lazy_module' has no attribute 'HelloWorld'"
+            ):
+                ModuleWithGetattr.__getattr__(lazy_module, 'HelloWorld')
+
+    def test_enable_module_getattr_python_3_6_no_module_getattr(self):
+        module = types.ModuleType('tests.module')
+
+        with patch.dict(sys.modules, {'tests.module': module}):
+            with patch.object(sys, 'version_info', (3, 6, 15)):
+                enable_module_getattr('tests.module')
+
+            with self.assertRaisesRegex(
+                AttributeError,
+                r"module 'tests.module' has no attribute 'HelloWorld'"
+            ):
+                module.HelloWorld # pylint: disable=pointless-statement
+
+    def test_enable_module_getattr_python_3_7(self):
+        module = types.ModuleType('tests.module')
+
+        with patch.dict(sys.modules, {'tests.module': module}):
+            with patch.object(sys, 'version_info', (3, 7, 0)):
+                enable_module_getattr('tests.module')
+
+        self.assertIs(type(module), types.ModuleType)
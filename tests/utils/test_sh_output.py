@@ -0,0 +1,127 @@
+import os
+from io import StringIO
+
+import sh
+from testfixtures import TempDirectory
+
+from ploigos_step_runner.config.config_value import ConfigValue
+from ploigos_step_runner.decryption_utils import DecryptionUtils
+from ploigos_step_runner.utils.sh_output import sh_output_to_file
+from tests.helpers.base_test_case import BaseTestCase
+from tests.test_decryption_utils import SampleConfigValueDecryptor
+
+
+class TestShOutputToFile(BaseTestCase):
+    def test_not_passthrough(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt')
+            stdout = StringIO()
+            stderr = StringIO()
+
+            with sh_output_to_file(output_file_path, stdout, stderr) as sh_output:
+                self.assertTrue(callable(sh_output['_out']))
+                self.assertTrue(callable(sh_output['_err']))
+                sh_output['_out']('hello\n')
+                sh_output['_err'](b'world\n')
+
+            self.assertEqual(stdout.getvalue(), 'hello\n')
+            self.assertEqual(stderr.getvalue(), 'world\n')
+            # NOTE: stdout and stderr are written to the file independently so order is not kept
+            with open(output_file_path, encoding='utf-8') as output_file:
+                self.assertCountEqual(output_file.read().splitlines(), ['hello', 'world'])
+
+    def test_not_passthrough_append(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt')
+            temp_dir.write(output_file_path, b'first\n')
+
+            with sh_output_to_file(
+                output_file_path,
+                StringIO(),
+                StringIO(),
+                append=True
+            ) as sh_output:
+                sh_output['_out']('second\n')
+
+            with open(output_file_path, encoding='utf-8') as output_file:
+                self.assertEqual(output_file.read(), 'first\nsecond\n')
+
+    def test_passthrough(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt')
+            stdout = StringIO()
+
+            with sh_output_to_file(
+                output_file_path,
+                stdout,
+                StringIO(),
+                passthrough=True
+            ) as sh_output:
+                sh.sh('-c', 'echo hello; echo world >&2', **sh_output) # pylint: disable=no-member
+
+            self.assertEqual(stdout.getvalue(), 'hello\nworld\n')
+            with open(output_file_path, encoding='utf-8') as output_file:
+                self.assertEqual(output_file.read(), 'hello\nworld\n')
+            self.assertFalse(os.path.exists(f'{output_file_path}.obfuscated'))
+
+    def test_passthrough_append(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt')
+            temp_dir.write(output_file_path, b'first\n')
+            stdout = StringIO()
+
+            with sh_output_to_file(
+                output_file_path,
+                stdout,
+                StringIO(),
+                passthrough=True,
+                append=True
+            ) as sh_output:
+                sh.echo('second', **sh_output) # pylint: disable=no-member
+
+            self.assertEqual(stdout.getvalue(), 'second\n')
+            with open(output_file_path, encoding='utf-8') as output_file:
+                self.assertEqual(output_file.read(), 'first\nsecond\n')
+
+    def test_passthrough_obfuscates_output_file(self):
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+        secret_value = 'passthrough-secret'
+        DecryptionUtils.decrypt(ConfigValue(f'TEST_ENC[{secret_value}]'))
+
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt')
+
+            with sh_output_to_file(
+                output_file_path,
+                StringIO(),
+                StringIO(),
+                passthrough=True
+            ) as sh_output:
+                sh.echo(f'the secret is {secret_value}', **sh_output) # pylint: disable=no-member
+
+            with open(output_file_path, encoding='utf-8') as output_file:
+                self.assertRegex(output_file.read(), r'^the secret is \*+\n$')
+
+    def test_passthrough_obfuscates_output_file_on_error(self):
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+        secret_value = 'passthrough-error-secret'
+        DecryptionUtils.decrypt(ConfigValue(f'TEST_ENC[{secret_value}]'))
+
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt')
+
+            with self.assertRaises(sh.ErrorReturnCode):
+                with sh_output_to_file(
+                    output_file_path,
+                    StringIO(),
+                    StringIO(),
+                    passthrough=True
+                ) as sh_output:
+                    sh.sh( # pylint: disable=no-member
+                        '-c',
+                        f'echo {secret_value}; exit 1',
+                        **sh_output
+                    )
+
+            with open(output_file_path, encoding='utf-8') as output_file:
+                self.assertRegex(output_file.read(), r'^\*+\n$')